@@ -138,6 +138,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.log_queue import install_log_queue, stop_log_queue
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -161,7 +162,15 @@ def init_logging(conf_filename: str,
             for logger in config_dict["loggers"]:
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        # Write the records queued with the previous configuration before replacing its handlers
+        stop_log_queue()
         logging.config.dictConfig(config_dict)
+        log_queue_conf: Dict = config_dict.get("log_queue") or {}
+        if log_queue_conf.get("enabled", False):
+            install_log_queue(
+                logger_names=list(config_dict.get("loggers", {}).keys()),
+                **{key: value for key, value in log_queue_conf.items() if key != "enabled"},
+            )
 
 
 def get_strategy_list() -> List[str]:
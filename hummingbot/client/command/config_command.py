@@ -71,6 +71,7 @@ client_configs_to_display = ["autofill_import",
                              "gateway",
                              "gateway_api_host",
                              "gateway_api_port",
+                             "gateway_quote_ttls",
                              "rate_oracle_source",
                              "extra_tokens",
                              "fetch_pairs_from_all_exchanges",
@@ -81,6 +82,16 @@ client_configs_to_display = ["autofill_import",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
+                             "connection_pool",
+                             "max_connections",
+                             "max_connections_per_host",
+                             "keepalive_timeout",
+                             "dns_cache_ttl",
+                             "connector_overrides",
+                             "host_overrides",
+                             "order_book_workers",
+                             "order_book_workers_enabled",
+                             "order_book_workers_depth",
                              "tables_format",
                              "tick_size",
                              "market_data_collection",
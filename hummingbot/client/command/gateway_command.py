@@ -172,6 +172,7 @@ class GatewayCommand(GatewayChainApiManager):
                     self.notify("There are currently no connectors online.")
                 else:
                     self.notify(pd.DataFrame(status))
+                self._show_gateway_quote_cache_stats()
             except Exception:
                 self.notify(
                     "\nError: Unable to fetch status of connected Gateway server.")
@@ -179,6 +180,23 @@ class GatewayCommand(GatewayChainApiManager):
             self.notify(
                 "\nNo connection to Gateway server exists. Ensure Gateway server is running.")
 
+    def _show_gateway_quote_cache_stats(self,  # type: HummingbotApplication
+                                        ):
+        stats = self._get_gateway_instance().quote_cache.stats
+        if len(stats) > 0:
+            self.notify("\nPrice quotes:")
+            self.notify(pd.DataFrame([
+                {
+                    "chain": chain,
+                    "requests": chain_stats.requests,
+                    "cache hits": chain_stats.hits,
+                    "coalesced": chain_stats.coalesced,
+                    "gateway calls": chain_stats.misses,
+                    "hit ratio": f"{chain_stats.hit_ratio:.2%}",
+                }
+                for chain, chain_stats in stats.items()
+            ]))
+
     async def _update_gateway_configuration(self, key: str, value: Any):
         try:
             response = await self._get_gateway_instance().update_config(key, value)
@@ -3,7 +3,7 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -13,6 +13,7 @@ from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllCo
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 from hummingbot.user.user_balances import UserBalances
 
 s_float_0 = float(0)
@@ -41,17 +42,27 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        # Only the ledgers since the start of the session are kept, and updated as the fills are recorded
+        ledgers: List[TradeFillLedger] = self._get_trade_ledgers(start_time, persist=days == 0)
+        if not ledgers:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        safe_ensure_future(self.history_report(start_time, ledgers=ledgers, precision=precision))
+
+    def _get_trade_ledgers(self,  # type: HummingbotApplication
+                           start_time: float,
+                           persist: bool = True) -> List[TradeFillLedger]:
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            # The ledgers are used after the session is closed
+            session.expire_on_commit = False
+            with session.begin():
+                return TradeFillLedger.catch_up(
+                    session,
+                    config_file_path=self.strategy_file_name,
+                    start_timestamp=int(start_time * 1e3),
+                    persist=persist)
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -59,23 +70,48 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            return list([TradeFill.to_bounty_api_json(t) for t in trades])
+            return [TradeFill.to_bounty_api_json(fill) for fill in TradeFill.iter_config_fills(
+                session,
+                config_file_path=self.strategy_file_name,
+                start_time=int(start_time * 1e3))]
+
+    def get_history_trades_page(self,  # type: HummingbotApplication
+                                limit: int,
+                                cursor: Optional[str] = None,
+                                days: float = 0) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Returns a page of the trades since the start of the session (or in the last `days`) in the bounty API json
+        format, and the cursor of the next page (None if it is the last page)
+        """
+        if self.strategy_file_name is None:
+            return [], None
+        start_time = get_timestamp(days) if days > 0 else self.init_time
+        with self.trade_fill_db.get_new_session() as session:
+            fills, next_cursor = TradeFill.get_config_fills_page(
+                session,
+                config_file_path=self.strategy_file_name,
+                start_time=int(start_time * 1e3),
+                limit=limit,
+                cursor=cursor)
+            return [TradeFill.to_bounty_api_json(fill) for fill in fills], next_cursor
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]] = None,
                              precision: Optional[int] = None,
-                             display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                             display_report: bool = True,
+                             ledgers: Optional[List[TradeFillLedger]] = None) -> Decimal:
+        """
+        Reports the performance by market, from the list of trades or from the trade ledgers
+        """
+        if ledgers is not None:
+            market_info: List[Tuple[str, str]] = [(ledger.market, ledger.symbol) for ledger in ledgers]
+        else:
+            market_info: List[Tuple[str, str]] = list(set((t.market, t.symbol) for t in trades))
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for i, (market, symbol) in enumerate(market_info):
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -84,7 +120,15 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if ledgers is not None and not ledgers[i].are_derivatives:
+                perf = await PerformanceMetrics.create_from_ledger(symbol, ledgers[i], cur_balances)
+            else:
+                if ledgers is not None:
+                    # The PnL of derivatives is calculated by pairing the open and close orders
+                    cur_trades = self._get_market_trades(start_time, market, symbol)
+                else:
+                    cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -93,6 +137,17 @@ class HistoryCommand:
             self.notify(f"\nAveraged Return = {avg_return:.2%}")
         return avg_return
 
+    def _get_market_trades(self,  # type: HummingbotApplication
+                           start_time: float,
+                           market: str,
+                           symbol: str) -> List[TradeFill]:
+        with self.trade_fill_db.get_new_session() as session:
+            return TradeFill.get_trades(session,
+                                        market=market,
+                                        trading_pair=symbol,
+                                        start_time=int(start_time * 1e3),
+                                        config_file_path=self.strategy_file_name)
+
     async def get_current_balances(self,  # type: HummingbotApplication
                                    market: str):
         if market in self.markets and self.markets[market].ready:
@@ -208,12 +263,8 @@ class HistoryCommand:
 
         start_time = self.init_time
 
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        ledgers: List[TradeFillLedger] = self._get_trade_ledgers(start_time)
+        avg_return = await self.history_report(start_time, ledgers=ledgers, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -0,0 +1,42 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.latency_tracer import LatencyTracer
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class LatencyCommand:
+    def latency(self,  # type: HummingbotApplication
+                option: Optional[str] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.latency, option)
+            return
+        tracer = LatencyTracer.get_instance()
+        if option == "enable":
+            tracer.enable()
+            self.notify("Latency tracing is enabled.")
+        elif option == "disable":
+            tracer.disable()
+            self.notify("Latency tracing is disabled.")
+        elif option == "reset":
+            tracer.reset()
+            self.notify("Latency measurements have been reset.")
+        else:
+            self.show_latency()
+
+    def show_latency(self,  # type: HummingbotApplication
+                     ):
+        tracer = LatencyTracer.get_instance()
+        rows = tracer.summary()
+        if len(rows) == 0:
+            status = "enabled" if tracer.enabled else "disabled (use `latency enable` to start tracing)"
+            self.notify(f"No latency measurements. Latency tracing is {status}.")
+            return
+        df = pd.DataFrame(rows).round(3)
+        lines = ["    " + line for line in format_df_for_printout(df, self.client_config_map.tables_format).split("\n")]
+        self.notify("\n  Latencies (ms):\n" + "\n".join(lines))
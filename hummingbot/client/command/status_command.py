@@ -16,6 +16,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.application_warning import ApplicationWarning
@@ -76,9 +77,25 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status
+        status = paper_trade + "\n" + st_status + self.connection_pools_status()
         return status
 
+    def connection_pools_status(self,  # type: HummingbotApplication
+                                ) -> str:
+        lines = []
+        for name, market in self.markets.items():
+            if not isinstance(market, ExchangePyBase):
+                continue
+            stats = market.connection_pool_stats()
+            if stats is None:
+                continue
+            lines.append(f"    {name}: {stats.requests_in_flight} in flight, {stats.saturation:.0%} saturation, "
+                         f"{stats.reuse_ratio:.0%} reuse ratio ({stats.connections_created} connections created, "
+                         f"{stats.requests_queued} requests queued)")
+        if len(lines) == 0:
+            return ""
+        return "\n\n  Connection pools:\n" + "\n".join(lines)
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
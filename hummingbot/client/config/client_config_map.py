@@ -26,6 +26,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 
 if TYPE_CHECKING:
@@ -173,6 +174,38 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class OrderBookWorkersConfigMap(BaseClientModel):
+    order_book_workers_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maintain the order books of the exchange connectors in worker processes? (Yes/No)"
+            ),
+        ),
+    )
+    order_book_workers_depth: int = Field(
+        default=20,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of levels of each side of the order books shared by the worker processes (Default=20)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "order_book_workers"
+
+    @validator("order_book_workers_enabled", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -512,10 +545,28 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_quote_ttls: Dict[str, float] = Field(
+        default={},
+        description="The time in seconds the price quotes of each chain are reused, replacing the default ones",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the time to live in seconds of the price quotes by chain (Input must be valid json — "
+                "e.g. {\"ethereum\": 2, \"polygon\": 0.5})"
+            ),
+        ),
+    )
 
     class Config:
         title = "gateway"
 
+    @validator("gateway_quote_ttls", pre=True)
+    def validate_gateway_quote_ttls(cls, v: Union[str, Dict[str, float]]):
+        if isinstance(v, str):
+            v = json.loads(v)
+        if any(float(ttl) < 0 for ttl in v.values()):
+            raise ValueError("The time to live of the quotes cannot be negative.")
+        return v
+
 
 class GlobalTokenConfigMap(BaseClientModel):
     global_token_name: str = Field(
@@ -586,6 +637,106 @@ class CommandsTimeoutConfigMap(BaseClientModel):
         return super().validate_decimal(v, field)
 
 
+class ConnectionPoolConfigMap(BaseClientModel):
+    max_connections: int = Field(
+        default=100,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Maximum number of simultaneous connections of each connector (0 for no limit)",
+        ),
+    )
+    max_connections_per_host: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Maximum number of simultaneous connections to the same host (0 for no limit)",
+        ),
+    )
+    keepalive_timeout: Decimal = Field(
+        default=Decimal("30"),
+        gt=Decimal("0"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Time to keep the idle connections open to reuse them (in seconds)",
+        ),
+    )
+    dns_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Time to cache the resolved host names (in seconds, 0 to disable the cache)",
+        ),
+    )
+    connector_overrides: Dict[str, Dict[str, float]] = Field(
+        default={},
+        description="The pool settings of each connector (or gateway) replacing the ones above",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the pool settings of each connector replacing the default ones (Input must be valid json — "
+                "e.g. {\"binance\": {\"max_connections\": 20, \"keepalive_timeout\": 60}})"
+            ),
+        ),
+    )
+    host_overrides: Dict[str, Dict[str, float]] = Field(
+        default={},
+        description="The pool settings of the connections to each host, that get a pool of their own",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the pool settings of the connections to each host (Input must be valid json — "
+                "e.g. {\"api.binance.com\": {\"max_connections_per_host\": 10}})"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "connection_pool"
+
+    @validator("keepalive_timeout", pre=True)
+    def validate_decimals(cls, v: str, field: Field):
+        """Used for client-friendly error output."""
+        return super().validate_decimal(v, field)
+
+    @validator("connector_overrides", "host_overrides", pre=True)
+    def validate_overrides(cls, v: Union[str, Dict[str, Dict[str, float]]]):
+        if isinstance(v, str):
+            v = json.loads(v)
+        settings_names = {"max_connections", "max_connections_per_host", "keepalive_timeout", "dns_cache_ttl"}
+        for name, settings in v.items():
+            invalid_settings = set(settings) - settings_names
+            if len(invalid_settings) > 0:
+                raise ValueError(f"Invalid connection pool settings for {name}: {', '.join(sorted(invalid_settings))}")
+            if any(float(value) < 0 for value in settings.values()):
+                raise ValueError(f"The connection pool settings for {name} cannot be negative.")
+        return v
+
+    def build_pool_config(
+            self, connector_name: Optional[str] = None, host: Optional[str] = None) -> ConnectionPoolConfig:
+        """
+        Returns the pool settings of the connector, and of the connections to the host if it is given.
+        """
+        settings = {
+            "max_connections": self.max_connections,
+            "max_connections_per_host": self.max_connections_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "dns_cache_ttl": self.dns_cache_ttl,
+        }
+        settings.update(self.connector_overrides.get(connector_name, {}))
+        if host is not None:
+            settings.update(self.host_overrides.get(host, {}))
+        return ConnectionPoolConfig(
+            limit=int(settings["max_connections"]),
+            limit_per_host=int(settings["max_connections_per_host"]),
+            keepalive_timeout=float(settings["keepalive_timeout"]),
+            ttl_dns_cache=int(settings["dns_cache_ttl"]),
+            use_dns_cache=settings["dns_cache_ttl"] > 0,
+        )
+
+    def build_host_pool_configs(self, connector_name: Optional[str] = None) -> Dict[str, ConnectionPoolConfig]:
+        """
+        Returns the pool settings of the hosts with pools of their own.
+        """
+        return {host: self.build_pool_config(connector_name, host) for host in self.host_overrides}
+
+
 class AnonymizedMetricsMode(BaseClientModel, ABC):
     @abstractmethod
     def get_collector(
@@ -1049,6 +1200,14 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
+    connection_pool: ConnectionPoolConfigMap = Field(
+        default=ConnectionPoolConfigMap(),
+        description="Settings of the pools of connections of the connectors to the exchanges",
+    )
+    order_book_workers: OrderBookWorkersConfigMap = Field(
+        default=OrderBookWorkersConfigMap(),
+        description="Settings of the worker processes maintaining the order books of the exchange connectors",
+    )
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
         names={e: e for e in tabulate_formats},
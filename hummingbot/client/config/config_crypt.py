@@ -1,8 +1,10 @@
 import binascii
+import hmac
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from eth_account import Account
 from eth_keyfile.keyfile import (
     DKLEN,
     SCRYPT_P,
@@ -11,12 +13,14 @@ from eth_keyfile.keyfile import (
     _pbkdf2_hash,
     _scrypt_hash,
     big_endian_to_int,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
     int_to_big_endian,
     keccak,
 )
+from eth_utils import decode_hex
 from pydantic import SecretStr
 
 from hummingbot.client.settings import CONF_DIR_PATH
@@ -41,14 +45,35 @@ class BaseSecretsManager(ABC):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         pass
 
+    def derive_keys(self, encrypted_values: Iterable[str], executor: Optional[Executor] = None):
+        """
+        Prepares the decryption of the values, for managers with an expensive key derivation. Does nothing by default.
+        """
+        pass
+
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    """
+    Encrypts the secrets in the Ethereum key file (v3) format.
+
+    Deriving the encryption key from the password is what makes encrypting and decrypting slow, so the derived keys
+    are kept in memory for the session. All the values encrypted during the session share the same salt (each one
+    with its own random IV), and the values with a known salt are decrypted with the symmetric cipher only.
+    """
+
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._derived_keys: Dict[str, bytes] = {}
+        self._encryption_kdfparams: Optional[Dict[str, Any]] = None
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
-        password_bytes = self._password.encode()
+        if self._encryption_kdfparams is None:
+            self._encryption_kdfparams = _create_kdfparams(kdf="pbkdf2")
+        derived_key = self._get_derived_key(kdf="pbkdf2", kdfparams=self._encryption_kdfparams)
         value_bytes = value.encode()
-        keyfile_json = _create_v3_keyfile_json(value_bytes, password_bytes)
+        keyfile_json = _create_v3_keyfile_json(value_bytes, derived_key, "pbkdf2", self._encryption_kdfparams)
         json_str = json.dumps(keyfile_json)
         encrypted_value = binascii.hexlify(json_str.encode()).decode()
         return encrypted_value
@@ -56,10 +81,43 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
-        value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        crypto = json.loads(binascii.unhexlify(value).decode())["crypto"]
+        derived_key = self._get_derived_key(kdf=crypto["kdf"], kdfparams=crypto["kdfparams"])
+        decrypted_value = _decrypt_v3_keyfile_crypto(crypto, derived_key).decode()
         return decrypted_value
 
+    def derive_keys(self, encrypted_values: Iterable[str], executor: Optional[Executor] = None):
+        """
+        Derives the keys required to decrypt the values, using the executor (if provided) to derive them in
+        parallel. Values that are not encrypted secrets are ignored.
+        """
+        if self._password is None:
+            return
+        pending_keys: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for value in encrypted_values:
+            crypto = _keyfile_crypto_from_value(value)
+            if crypto is not None:
+                cache_key = _derived_key_cache_key(crypto["kdf"], crypto["kdfparams"])
+                if cache_key not in self._derived_keys:
+                    pending_keys[cache_key] = (crypto["kdf"], crypto["kdfparams"])
+        password_bytes = self._password.encode()
+        map_function = executor.map if executor is not None else map
+        derived_keys = map_function(
+            _derive_key,
+            [password_bytes] * len(pending_keys),
+            [kdf for kdf, _ in pending_keys.values()],
+            [kdfparams for _, kdfparams in pending_keys.values()],
+        )
+        self._derived_keys.update(zip(pending_keys.keys(), derived_keys))
+
+    def _get_derived_key(self, kdf: str, kdfparams: Dict[str, Any]) -> bytes:
+        cache_key = _derived_key_cache_key(kdf, kdfparams)
+        derived_key = self._derived_keys.get(cache_key)
+        if derived_key is None:
+            derived_key = _derive_key(self._password.encode(), kdf, kdfparams)
+            self._derived_keys[cache_key] = derived_key
+        return derived_key
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -80,24 +138,13 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
-def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
-    """
-    Encrypt message by a given password.
-    Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
-    """
+def _create_kdfparams(kdf: str = "pbkdf2", work_factor: Optional[int] = None) -> Dict[str, Any]:
     salt = Random.get_random_bytes(16)
 
     if work_factor is None:
         work_factor = get_default_work_factor_for_kdf(kdf)
 
     if kdf == 'pbkdf2':
-        derived_key = _pbkdf2_hash(
-            password,
-            hash_name='sha256',
-            salt=salt,
-            iterations=work_factor,
-            dklen=DKLEN,
-        )
         kdfparams = {
             'c': work_factor,
             'dklen': DKLEN,
@@ -105,14 +152,6 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
             'salt': encode_hex_no_prefix(salt),
         }
     elif kdf == 'scrypt':
-        derived_key = _scrypt_hash(
-            password,
-            salt=salt,
-            buflen=DKLEN,
-            r=SCRYPT_R,
-            p=SCRYPT_P,
-            n=work_factor,
-        )
         kdfparams = {
             'dklen': DKLEN,
             'n': work_factor,
@@ -122,7 +161,53 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
         }
     else:
         raise NotImplementedError("KDF not implemented: {0}".format(kdf))
+    return kdfparams
+
+
+def _derive_key(password: bytes, kdf: str, kdfparams: Dict[str, Any]) -> bytes:
+    salt = decode_hex(kdfparams['salt'])
+    if kdf == 'pbkdf2':
+        if kdfparams['prf'] != 'hmac-sha256':
+            raise ValueError("Unsupported pbkdf2 pseudo-random function: {0}".format(kdfparams['prf']))
+        derived_key = _pbkdf2_hash(
+            password,
+            hash_name='sha256',
+            salt=salt,
+            iterations=kdfparams['c'],
+            dklen=kdfparams['dklen'],
+        )
+    elif kdf == 'scrypt':
+        derived_key = _scrypt_hash(
+            password,
+            salt=salt,
+            buflen=kdfparams['dklen'],
+            r=kdfparams['r'],
+            p=kdfparams['p'],
+            n=kdfparams['n'],
+        )
+    else:
+        raise TypeError("Unsupported key derivation function: {0}".format(kdf))
+    return derived_key
+
+
+def _derived_key_cache_key(kdf: str, kdfparams: Dict[str, Any]) -> str:
+    return f"{kdf}:{json.dumps(kdfparams, sort_keys=True)}"
 
+
+def _keyfile_crypto_from_value(value: Any) -> Optional[Dict[str, Any]]:
+    try:
+        crypto = json.loads(binascii.unhexlify(value).decode())["crypto"]
+        crypto["kdf"], crypto["kdfparams"]
+    except Exception:
+        return None
+    return crypto
+
+
+def _create_v3_keyfile_json(message_to_encrypt: bytes, derived_key: bytes, kdf: str, kdfparams: Dict[str, Any]):
+    """
+    Encrypt message with a key derived from the password.
+    Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
+    """
     iv = big_endian_to_int(Random.get_random_bytes(16))
     encrypt_key = derived_key[:16]
     ciphertext = encrypt_aes_ctr(message_to_encrypt, encrypt_key, iv)
@@ -142,3 +227,18 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
         'version': 3,
         'alias': '',  # Add this line to include the 'alias' field with an empty string value
     }
+
+
+def _decrypt_v3_keyfile_crypto(crypto: Dict[str, Any], derived_key: bytes) -> bytes:
+    """
+    Decrypt the ciphertext of a key file with a key derived from the password.
+    Most of this code is copied from eth_key_file.key_file.
+    """
+    ciphertext = decode_hex(crypto['ciphertext'])
+    mac = keccak(derived_key[16:32] + ciphertext)
+    if not hmac.compare_digest(mac, decode_hex(crypto['mac'])):
+        raise ValueError("MAC mismatch")
+
+    encrypt_key = derived_key[:16]
+    iv = big_endian_to_int(decode_hex(crypto['cipherparams']['iv']))
+    return decrypt_aes_ctr(ciphertext, encrypt_key, iv)
@@ -1,7 +1,9 @@
 import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -11,6 +13,7 @@ from hummingbot.client.config.config_helpers import (
     get_connector_config_yml_path,
     list_connector_configs,
     load_connector_config_map_from_file,
+    read_yml_file,
     reset_connector_hb_config,
     save_to_yml,
     update_connector_hb_config,
@@ -24,6 +27,7 @@ class Security:
     __instance = None
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
+    _encrypted_config_files: Dict[str, Path] = {}
     _decryption_done = asyncio.Event()
 
     _logger: Optional[HummingbotLogger] = None
@@ -40,7 +44,7 @@ class Security:
 
     @classmethod
     def any_secure_configs(cls):
-        return len(cls._secure_configs) > 0
+        return len(cls._secure_configs) > 0 or len(cls._encrypted_config_files) > 0
 
     @staticmethod
     def connector_config_file_exists(connector_name: str) -> bool:
@@ -58,24 +62,54 @@ class Security:
 
     @classmethod
     def decrypt_all(cls):
+        """
+        Derives the decryption keys of all the connector configs in parallel, and registers the configs to be
+        decrypted on first use, which then only requires the symmetric cipher. The configs are registered by the name
+        of their file, which is the name of the connector (see get_connector_config_yml_path).
+        """
         cls._secure_configs.clear()
+        cls._encrypted_config_files.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
+        encrypted_values = []
         for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+            config_data = read_yml_file(file)
+            cls._encrypted_config_files[file.stem] = file
+            encrypted_values.extend(value for value in config_data.values() if isinstance(value, str))
+        cls._derive_keys(encrypted_values)
         cls._decryption_done.set()
 
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
+        cls._encrypted_config_files.pop(file_path.stem, None)
         connector_name = connector_name_from_file(file_path)
         cls._secure_configs[connector_name] = load_connector_config_map_from_file(file_path)
 
+    @classmethod
+    def _derive_keys(cls, encrypted_values: List[str]):
+        # PBKDF2, used to encrypt the configs, releases the GIL, so threads derive the keys in parallel without
+        # forking this (multithreaded) process or sending the password to other processes
+        if cls.secrets_manager is None:
+            return
+        max_workers = min(len(encrypted_values), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="derive_keys") as executor:
+                cls.secrets_manager.derive_keys(encrypted_values, executor=executor)
+        else:
+            cls.secrets_manager.derive_keys(encrypted_values)
+
+    @classmethod
+    def _decrypt_pending_configs(cls):
+        for file_path in list(cls._encrypted_config_files.values()):
+            cls.decrypt_connector_config(file_path)
+
     @classmethod
     def update_secure_config(cls, connector_config: ClientConfigAdapter):
         connector_name = connector_config.connector
         file_path = get_connector_config_yml_path(connector_name)
         save_to_yml(file_path, connector_config)
         update_connector_hb_config(connector_config)
+        cls._encrypted_config_files.pop(connector_name, None)
         cls._secure_configs[connector_name] = connector_config
 
     @classmethod
@@ -83,7 +117,8 @@ class Security:
         file_path = get_connector_config_yml_path(connector_name)
         file_path.unlink(missing_ok=True)
         reset_connector_hb_config(connector_name)
-        cls._secure_configs.pop(connector_name)
+        if cls._encrypted_config_files.pop(connector_name, None) is None:
+            cls._secure_configs.pop(connector_name)
 
     @classmethod
     def is_decryption_done(cls):
@@ -91,10 +126,14 @@ class Security:
 
     @classmethod
     def decrypted_value(cls, key: str) -> Optional[ClientConfigAdapter]:
+        file_path = cls._encrypted_config_files.get(key)
+        if file_path is not None:
+            cls.decrypt_connector_config(file_path)
         return cls._secure_configs.get(key, None)
 
     @classmethod
     def all_decrypted_values(cls) -> Dict[str, ClientConfigAdapter]:
+        cls._decrypt_pending_configs()
         return cls._secure_configs.copy()
 
     @classmethod
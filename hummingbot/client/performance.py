@@ -10,6 +10,7 @@ from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, Tok
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
@@ -71,6 +72,15 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_ledger(cls,
+                                 trading_pair: str,
+                                 ledger: TradeFillLedger,
+                                 current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_ledger(trading_pair, ledger, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +206,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +221,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -225,6 +238,10 @@ class PerformanceMetrics:
         return impact
 
     async def _calculate_fees(self, quote: str, trades: List[Any]):
+        self._accumulate_fees(quote, trades)
+        await self._calculate_fee_in_quote(quote)
+
+    def _accumulate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
             fee_percent = None
             trade_price = None
@@ -248,6 +265,7 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -302,15 +320,69 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_prices(trading_pair=trading_pair,
+                                                  current_balances=current_balances,
+                                                  first_price=Decimal(str(trades[0].price)),
+                                                  last_price=Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        self._accumulate_fees(quote, trades)
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_ledger(self,
+                                              trading_pair: str,
+                                              ledger: TradeFillLedger,
+                                              current_balances: Dict[str, Decimal]):
+        """
+        Calculates the same metrics as `_initialize_metrics`, from the running totals of the trades instead of the
+        list of trades. The ledger must not be of derivatives, for which the PnL is calculated by pairing the orders.
+        :param trading_pair: the trading market to get performance metrics
+        :param ledger: the running totals of the trades of the market
+        :param current_balances: current user account balance
+        """
+        quote = split_hb_trading_pair(trading_pair)[1]
+
+        self.num_buys = ledger.num_buys
+        self.num_sells = ledger.num_sells
+        self.num_trades = ledger.num_trades
+        self.b_vol_base = ledger.b_vol_base
+        self.b_vol_quote = ledger.b_vol_quote
+        self.s_vol_base = ledger.s_vol_base
+        self.s_vol_quote = ledger.s_vol_quote
+        self._calculate_volume_totals()
+
+        await self._calculate_balances_and_prices(trading_pair=trading_pair,
+                                                  current_balances=current_balances,
+                                                  first_price=ledger.first_price,
+                                                  last_price=ledger.last_price)
+        self.trade_pnl = self.cur_value - self.hold_value
+
+        for fee_token, fee_amount in ledger.fee_amounts.items():
+            self.fees[fee_token] += fee_amount
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_balances_and_prices(self,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             first_price: Decimal,
+                                             last_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
+
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = first_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +390,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
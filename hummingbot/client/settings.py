@@ -305,11 +305,14 @@ class ConnectorSetting(NamedTuple):
 
     def non_trading_connector_instance_with_default_configuration(
             self,
-            trading_pairs: Optional[List[str]] = None) -> 'ConnectorBase':
+            trading_pairs: Optional[List[str]] = None,
+            client_config_map: Optional["ClientConfigAdapter"] = None) -> 'ConnectorBase':
         from hummingbot.client.config.config_helpers import ClientConfigAdapter
-        from hummingbot.client.hummingbot_application import HummingbotApplication
 
         trading_pairs = trading_pairs or []
+        if client_config_map is None:
+            from hummingbot.client.hummingbot_application import HummingbotApplication
+            client_config_map = HummingbotApplication.main_application().client_config_map
         connector_class = getattr(importlib.import_module(self.module_path()), self.class_name())
         kwargs = {}
         if isinstance(self.config_keys, Dict):
@@ -327,7 +330,7 @@ class ConnectorSetting(NamedTuple):
             trading_pairs=trading_pairs,
             trading_required=False,
             api_keys=kwargs,
-            client_config_map=HummingbotApplication.main_application().client_config_map,
+            client_config_map=client_config_map,
         )
         kwargs = self.add_domain_parameter(kwargs)
         connector = connector_class(**kwargs)
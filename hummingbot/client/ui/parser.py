@@ -142,6 +142,11 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    latency_parser = subparsers.add_parser("latency", help="Show or manage the latency measurements of the bot")
+    latency_parser.add_argument("option", nargs="?", choices=("enable", "disable", "reset"), default=None,
+                                help="Enable, disable or reset latency tracing")
+    latency_parser.set_defaults(func=hummingbot.latency)
+
     previous_strategy_parser = subparsers.add_parser("previous", help="Imports the last strategy used")
     previous_strategy_parser.add_argument("option", nargs="?", choices=["Yes,No"], default=None)
     previous_strategy_parser.set_defaults(func=hummingbot.previous_strategy)
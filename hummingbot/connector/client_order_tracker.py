@@ -21,6 +21,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.logger.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -197,8 +198,13 @@ class ClientOrderTracker:
 
         return found_order
 
-    def process_order_update(self, order_update: OrderUpdate):
-        return safe_ensure_future(self._process_order_update(order_update))
+    def process_order_update(self, order_update: OrderUpdate, created_locally: bool = False):
+        """
+        :param order_update: the update to apply to the tracked order
+        :param created_locally: True for the updates built by the connector itself when an order is placed or fails
+            to be placed, instead of being reported by the exchange (through the user stream or a status request)
+        """
+        return safe_ensure_future(self._process_order_update(order_update, created_locally=created_locally))
 
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
@@ -266,7 +272,7 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({client_order_id})")
 
-    async def _process_order_update(self, order_update: OrderUpdate):
+    async def _process_order_update(self, order_update: OrderUpdate, created_locally: bool = False):
         if not order_update.client_order_id and not order_update.exchange_order_id:
             self.logger().error("OrderUpdate does not contain any client_order_id or exchange_order_id", exc_info=True)
             return
@@ -276,6 +282,15 @@ class ClientOrderTracker:
         )
 
         if tracked_order:
+            latency_tracer = LatencyTracer.get_instance()
+            if latency_tracer.enabled and not created_locally:
+                latency_tracer.record_span(
+                    span_id=tracked_order.client_order_id,
+                    stage=LatencyStage.ORDER_CREATE_TO_FIRST_UPDATE,
+                    connector=self._connector.name,
+                    trading_pair=tracked_order.trading_pair,
+                    finish=True,
+                )
             if order_update.new_state == OrderState.FILLED and not tracked_order.is_done:
                 try:
                     await asyncio.wait_for(
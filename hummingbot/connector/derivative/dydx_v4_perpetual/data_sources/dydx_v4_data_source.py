@@ -22,6 +22,7 @@ from v4_proto.dydxprotocol.subaccounts.subaccount_pb2 import SubaccountId
 from hummingbot.connector.derivative.dydx_v4_perpetual import dydx_v4_perpetual_constants as CONSTANTS
 from hummingbot.connector.derivative.dydx_v4_perpetual.data_sources.keypairs import PrivateKey
 from hummingbot.connector.derivative.dydx_v4_perpetual.data_sources.tx import SigningCfg, Transaction
+from hummingbot.core.utils.signing_service import SigningService
 
 
 class DydxPerpetualV4Client:
@@ -273,7 +274,9 @@ class DydxPerpetualV4Client:
                 gas_limit=CONSTANTS.TX_GAS_LIMIT,
                 memo=memo,
             )
-            tx.sign(self._private_key, CONSTANTS.CHAIN_ID, number)
+            await SigningService.get_instance().sign(
+                tx.sign, self._private_key, CONSTANTS.CHAIN_ID, number, connector=CONSTANTS.EXCHANGE_NAME
+            )
             tx.complete()
 
             broadcast_req = BroadcastTxRequest(
@@ -323,7 +323,7 @@ class DydxV4PerpetualDerivative(PerpetualDerivativePyBase):
             update_timestamp=update_timestamp,
             new_state=OrderState.OPEN,
         )
-        self._order_tracker.process_order_update(order_update)
+        self._order_tracker.process_order_update(order_update, created_locally=True)
 
         return exchange_order_id
 
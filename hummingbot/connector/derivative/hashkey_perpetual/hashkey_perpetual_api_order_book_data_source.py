@@ -1,6 +1,5 @@
 import asyncio
 import time
-from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
@@ -54,7 +53,6 @@ class HashkeyPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
             time_synchronizer=self._time_synchronizer,
             domain=self._domain,
         )
-        self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
         self._last_ws_message_sent_timestamp = 0
 
     async def get_last_traded_prices(self,
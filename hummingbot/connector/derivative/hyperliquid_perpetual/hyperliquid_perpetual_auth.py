@@ -1,6 +1,8 @@
+import asyncio
 import json
 import time
 from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 import eth_account
 import msgpack
@@ -11,6 +13,8 @@ from hummingbot.connector.derivative.hyperliquid_perpetual import hyperliquid_pe
 from hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_web_utils import (
     order_spec_to_order_wire,
 )
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.signing_service import SigningService
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
 
@@ -19,12 +23,15 @@ class HyperliquidPerpetualAuth(AuthBase):
     """
     Auth class required by Hyperliquid Perpetual API
     """
+    modifies_requests_in_place = False
 
     def __init__(self, api_key: str, api_secret: str, use_vault: bool):
         self._api_key: str = api_key
         self._api_secret: str = api_secret
         self._use_vault: bool = use_vault
         self.wallet = eth_account.Account.from_key(api_secret)
+        self._last_nonce: int = 0
+        self._pending_signatures: List[Tuple[tuple, asyncio.Future]] = []
 
     @classmethod
     def address_to_bytes(cls, address):
@@ -80,7 +87,15 @@ class HyperliquidPerpetualAuth(AuthBase):
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         base_url = request.url
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params_post(request.data, base_url)
+            # The L1 action signatures are CPU bound, they are computed out of the event loop. The requests
+            # authenticated in the same loop iteration (e.g. when cancelling all the orders) are signed together in one
+            # job of the signing pool. The nonce is taken before dispatching the signature, so that the requests get
+            # their nonces in the order they were sent
+            future = asyncio.get_running_loop().create_future()
+            if len(self._pending_signatures) == 0:
+                asyncio.get_running_loop().call_soon(self._sign_pending_payloads)
+            self._pending_signatures.append(((request.data, base_url, self._next_nonce()), future))
+            return request.replace(data=await future)
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -149,8 +164,8 @@ class HyperliquidPerpetualAuth(AuthBase):
         }
         return payload
 
-    def add_auth_to_params_post(self, params: str, base_url):
-        timestamp = int(self._get_timestamp() * 1e3)
+    def add_auth_to_params_post(self, params: str, base_url, nonce: Optional[int] = None):
+        timestamp = nonce if nonce is not None else self._next_nonce()
         payload = {}
         data = json.loads(params) if params is not None else {}
 
@@ -166,6 +181,36 @@ class HyperliquidPerpetualAuth(AuthBase):
         payload = json.dumps(payload)
         return payload
 
+    def _sign_pending_payloads(self):
+        pending_signatures, self._pending_signatures = self._pending_signatures, []
+        safe_ensure_future(self._sign_payloads(pending_signatures))
+
+    async def _sign_payloads(self, pending_signatures: List[Tuple[tuple, asyncio.Future]]):
+        calls = [(self.add_auth_to_params_post, args) for args, _ in pending_signatures]
+        try:
+            results = await SigningService.get_instance().sign_batch(
+                calls, connector=CONSTANTS.EXCHANGE_NAME, return_exceptions=True)
+        except asyncio.CancelledError:
+            for _, future in pending_signatures:
+                future.cancel()
+            raise
+        except Exception as exception:
+            results = [exception] * len(pending_signatures)
+        for (_, future), result in zip(pending_signatures, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _next_nonce(self) -> int:
+        """
+        Returns the timestamp in milliseconds to use as nonce, always greater than the previous one
+        """
+        self._last_nonce = max(int(self._get_timestamp() * 1e3), self._last_nonce + 1)
+        return self._last_nonce
+
     @staticmethod
     def _get_timestamp():
         return time.time()
@@ -11,14 +11,12 @@ from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFa
 
 
 class HyperliquidPerpetualRESTPreProcessor(RESTPreProcessorBase):
+    modifies_requests_in_place = False
 
     async def pre_process(self, request: RESTRequest) -> RESTRequest:
-        if request.headers is None:
-            request.headers = {}
-        request.headers["Content-Type"] = (
-            "application/json"
-        )
-        return request
+        if request.headers is not None and request.headers.get("Content-Type") == "application/json":
+            return request
+        return request.replace(headers={**(request.headers or {}), "Content-Type": "application/json"})
 
 
 def private_rest_url(*args, **kwargs) -> str:
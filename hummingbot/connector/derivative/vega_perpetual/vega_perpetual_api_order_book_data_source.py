@@ -1,6 +1,5 @@
 import asyncio
 import time
-from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -33,7 +32,6 @@ class VegaPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
         self._domain = domain
         self._ws_assistants: List[WSAssistant] = []
         self._trading_pairs: List[str] = trading_pairs
-        self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
         self._ws_total_count = 0
         self._ws_total_closed_count = 0
         self._ws_connected = True
@@ -105,6 +105,11 @@ class BinanceExchange(ExchangePyBase):
     def trading_pairs(self):
         return self._trading_pairs
 
+    @property
+    def connection_warm_up_path_urls(self) -> List[str]:
+        # The public and private endpoints share the same host
+        return [CONSTANTS.PING_PATH_URL]
+
     @property
     def is_cancel_request_in_exchange_synchronous(self) -> bool:
         return True
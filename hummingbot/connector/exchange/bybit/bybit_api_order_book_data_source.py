@@ -1,6 +1,5 @@
 import asyncio
 import time
-from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
 import hummingbot.connector.exchange.bybit.bybit_constants as CONSTANTS
@@ -45,7 +44,6 @@ class BybitAPIOrderBookDataSource(OrderBookTrackerDataSource):
             time_synchronizer=self._time_synchronizer,
             domain=self._domain,
         )
-        self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
         self._last_ws_message_sent_timestamp = 0
         self._category = "spot"
         self._depth = CONSTANTS.SPOT_ORDER_BOOK_DEPTH
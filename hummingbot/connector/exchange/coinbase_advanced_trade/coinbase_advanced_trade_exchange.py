@@ -408,7 +408,7 @@ class CoinbaseAdvancedTradeExchange(ExchangePyBase):
             update_timestamp=update_timestamp,
             new_state=OrderState.PENDING_CREATE if exchange_order_id != "UNKNOWN" else OrderState.FAILED,
         )
-        self._order_tracker.process_order_update(order_update)
+        self._order_tracker.process_order_update(order_update, created_locally=True)
 
         return exchange_order_id
 
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from eth_account import Account
 from eth_account.messages import encode_defunct
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.utils.signing_service import SigningService
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
 
@@ -12,6 +15,7 @@ class DexalotAuth(AuthBase):
         self.secret_key = secret_key
         self.time_provider = time_provider
         self.wallet = Account.from_key(secret_key)
+        self._signature: Optional[str] = None
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -19,10 +23,7 @@ class DexalotAuth(AuthBase):
         the required parameter in the request header.
         :param request: the request to be configured for authenticated interaction
         """
-
-        message = encode_defunct(text="dexalot")
-        signed_message = self.wallet.sign_message(signable_message=message)
-        headers = {"x-signature": f"{self.wallet.address}:{signed_message.signature.hex()}"}
+        headers = {"x-signature": await self._get_signature()}
         if request.headers is not None:
             headers.update(request.headers)
         request.headers = headers
@@ -34,7 +35,16 @@ class DexalotAuth(AuthBase):
         This method is intended to configure a websocket request to be authenticated. Dexalot does not use this
         functionality
         """
+        request.payload["signature"] = await self._get_signature()
+        return request
+
+    async def _get_signature(self) -> str:
+        # The signed message is always the same, and the signature is deterministic, so it is computed only once
+        if self._signature is None:
+            self._signature = await SigningService.get_instance().sign(self._sign, connector="dexalot")
+        return self._signature
+
+    def _sign(self) -> str:
         message = encode_defunct(text="dexalot")
         signed_message = self.wallet.sign_message(signable_message=message)
-        request.payload["signature"] = f"{self.wallet.address}:{signed_message.signature.hex()}"
-        return request
+        return f"{self.wallet.address}:{signed_message.signature.hex()}"
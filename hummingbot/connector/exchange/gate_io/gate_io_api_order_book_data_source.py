@@ -1,6 +1,5 @@
 import asyncio
 import json
-from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.gate_io import gate_io_constants as CONSTANTS, gate_io_web_utils as web_utils
@@ -30,8 +29,6 @@ class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._api_factory = api_factory
         self._trading_pairs: List[str] = trading_pairs
 
-        self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
-
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
                                      domain: Optional[str] = None) -> Dict[str, float]:
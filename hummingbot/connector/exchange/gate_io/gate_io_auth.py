@@ -17,6 +17,8 @@ class GateIoAuth(AuthBase):
     Auth Gate.io API
     https://www.gate.io/docs/apiv4/en/#authentication
     """
+    modifies_requests_in_place = False
+
     def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
         self.api_key = api_key
         self.secret_key = secret_key
@@ -27,12 +29,10 @@ class GateIoAuth(AuthBase):
         if request.headers is not None:
             headers.update(request.headers)
         headers.update(self._get_auth_headers(request))
-        request.headers = headers
-        return request
+        return request.replace(headers=headers)
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
-        request.payload["auth"] = self._get_auth_headers_ws(payload=request.payload)
-        return request
+        return request.replace(payload={**request.payload, "auth": self._get_auth_headers_ws(payload=request.payload)})
 
     def _get_auth_headers_ws(self, payload: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -92,6 +92,11 @@ class GateIoExchange(ExchangePyBase):
     def check_network_request_path(self):
         return CONSTANTS.NETWORK_CHECK_PATH_URL
 
+    @property
+    def connection_warm_up_path_urls(self) -> List[str]:
+        # The public and private endpoints share the same host
+        return [self.check_network_request_path]
+
     @property
     def trading_pairs(self):
         return self._trading_pairs
@@ -12,6 +12,8 @@ from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WS
 
 
 class KucoinAuth(AuthBase):
+    modifies_requests_in_place = False
+
     def __init__(self, api_key: str, passphrase: str, secret_key: str, time_provider: TimeSynchronizer):
         self.api_key: str = api_key
         self.passphrase: str = passphrase
@@ -34,9 +36,7 @@ class KucoinAuth(AuthBase):
         if request.headers is not None:
             headers.update(request.headers)
         headers.update(self.authentication_headers(request=request))
-        request.headers = headers
-
-        return request
+        return request.replace(headers=headers)
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
         """
@@ -89,6 +89,11 @@ class KucoinExchange(ExchangePyBase):
     def check_network_request_path(self):
         return CONSTANTS.SERVER_TIME_PATH_URL
 
+    @property
+    def connection_warm_up_path_urls(self) -> List[str]:
+        # The public and private endpoints share the same host
+        return [self.check_network_request_path]
+
     @property
     def orders_path_url(self):
         return CONSTANTS.ORDERS_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.ORDERS_PATH_URL
@@ -11,6 +11,8 @@ from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RES
 
 
 class MexcAuth(AuthBase):
+    modifies_requests_in_place = False
+
     def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
         self.api_key = api_key
         self.secret_key = secret_key
@@ -22,18 +24,16 @@ class MexcAuth(AuthBase):
         the required parameter in the request header.
         :param request: the request to be configured for authenticated interaction
         """
-        if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params(params=json.loads(request.data) if request.data is not None else {})
-        else:
-            request.params = self.add_auth_to_params(params=request.params)
-
         headers = {}
         if request.headers is not None:
             headers.update(request.headers)
         headers.update(self.header_for_authentication())
-        request.headers = headers
 
-        return request
+        if request.method == RESTMethod.POST:
+            return request.replace(
+                data=self.add_auth_to_params(params=json.loads(request.data) if request.data is not None else {}),
+                headers=headers)
+        return request.replace(params=self.add_auth_to_params(params=request.params), headers=headers)
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
         """
@@ -12,6 +12,7 @@ from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WS
 
 
 class OkxAuth(AuthBase):
+    modifies_requests_in_place = False
 
     def __init__(self, api_key: str, secret_key: str, passphrase: str, time_provider: TimeSynchronizer):
         self.api_key: str = api_key
@@ -33,9 +34,7 @@ class OkxAuth(AuthBase):
         if request.headers is not None:
             headers.update(request.headers)
         headers.update(self.authentication_headers(request=request))
-        request.headers = headers
-
-        return request
+        return request.replace(headers=headers)
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
         """
@@ -84,6 +84,11 @@ class OkxExchange(ExchangePyBase):
     def check_network_request_path(self):
         return CONSTANTS.OKX_SERVER_TIME_PATH
 
+    @property
+    def connection_warm_up_path_urls(self) -> List[str]:
+        # The public and private endpoints share the same host
+        return [self.check_network_request_path]
+
     @property
     def trading_pairs(self):
         return self._trading_pairs
@@ -1,9 +1,11 @@
 import json
 from collections import OrderedDict
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from eth_account import Account, messages
+from eth_account.signers.local import LocalAccount
 
+from hummingbot.core.utils.signing_service import SigningService
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
 
@@ -16,13 +18,16 @@ class TegroAuth(AuthBase):
     def __init__(self, api_key: str, api_secret: str):
         self._api_key: str = api_key
         self._api_secret: str = api_secret
+        self._wallet: Optional[LocalAccount] = None
+        self._address_signature: Optional[str] = None
 
     def sign_inner(self, data):
         """
         Sign the provided data using the API secret key.
         """
-        wallet = Account.from_key(self._api_secret)
-        signed_data = wallet.sign_message(data)
+        if self._wallet is None:
+            self._wallet = Account.from_key(self._api_secret)
+        signed_data = self._wallet.sign_message(data)
         # Convert signature components to bytes before returning
         return signed_data.signature.hex()
 
@@ -32,6 +37,8 @@ class TegroAuth(AuthBase):
         the required parameter in the request header.
         :param request: the request to be configured for authenticated interaction
         """
+        if self._address_signature is None:
+            self._address_signature = await SigningService.get_instance().sign(self._sign_address, connector="tegro")
         if request.method == RESTMethod.POST and request.data is not None:
             request.data = self.add_auth_to_params(params=json.loads(request.data) if request.data is not None else {})
         else:
@@ -52,13 +59,17 @@ class TegroAuth(AuthBase):
     def add_auth_to_params(self,
                            params: Dict[str, Any]):
         request_params = OrderedDict(params or {})
+        # The signed message is always the API key address, and the signature is deterministic
+        if self._address_signature is None:
+            self._address_signature = self._sign_address()
+        request_params["signature"] = self._address_signature
+        return request_params
 
+    def _sign_address(self) -> str:
         addr = self._api_key
         address = addr.lower()
         structured_data = messages.encode_defunct(text=address)
-        signature = self.sign_inner(structured_data)
-        request_params["signature"] = signature
-        return request_params
+        return self.sign_inner(structured_data)
 
     def header_for_authentication(self) -> Dict[str, Any]:
         return {
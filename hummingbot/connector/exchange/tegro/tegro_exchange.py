@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import eth_account
 from bidict import bidict
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
 
@@ -23,6 +24,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.signing_service import SigningService
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -52,6 +54,7 @@ class TegroExchange(ExchangePyBase):
         self.api_key = tegro_api_key
         self._chain = chain_name
         self.secret_key = tegro_api_secret
+        self._wallet: Optional[LocalAccount] = None
         self._api_factory = WebAssistantsFactory
         self._domain = domain
         self._trading_required = trading_required
@@ -233,7 +236,7 @@ class TegroExchange(ExchangePyBase):
         transaction_data = await self._generate_typed_data(amount, order_type, price, trade_type, trading_pair)
         s = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         symbol: str = s.replace('-', '_')
-        signature = self.sign_inner(transaction_data)
+        signature = await SigningService.get_instance().sign(self.sign_inner, transaction_data, connector=self.name)
         api_params = {
             "chain_id": self.chain,
             "base_asset": transaction_data["limit_order"]["base_asset"],
@@ -311,7 +314,7 @@ class TegroExchange(ExchangePyBase):
                 is_auth_required=False,
                 limit_id=CONSTANTS.GENERATE_ORDER_URL,
             )
-            return self.sign_inner(data)
+            return await SigningService.get_instance().sign(self.sign_inner, data, connector=self.name)
         except IOError as e:
             error_description = str(e)
             is_not_active = ("Orders not found" in error_description)
@@ -329,7 +332,9 @@ class TegroExchange(ExchangePyBase):
         message_types = {message: data["sign_data"]["types"][message]}
         # encode and sign
         structured_data = encode_typed_data(domain_data, message_types, message_data)
-        return eth_account.Account.from_key(self.secret_key).sign_message(structured_data).signature.hex()
+        if self._wallet is None:
+            self._wallet = eth_account.Account.from_key(self.secret_key)
+        return self._wallet.sign_message(structured_data).signature.hex()
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         ids = []
@@ -1,5 +1,4 @@
 import asyncio
-from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.vertex import (
@@ -35,7 +34,6 @@ class VertexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._api_factory = api_factory or web_utils.build_api_factory(
             throttler=self._throttler,
         )
-        self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
         self._last_ws_message_sent_timestamp = 0
         self._ping_interval = 0
 
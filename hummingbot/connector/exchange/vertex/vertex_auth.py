@@ -1,5 +1,5 @@
 import time
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import sha3
 from coincurve import PrivateKey
@@ -19,6 +19,7 @@ class VertexAuth(AuthBase):
     def __init__(self, vertex_arbitrum_address: str, vertex_arbitrum_private_key: str):
         self.sender_address = vertex_arbitrum_address
         self.private_key = vertex_arbitrum_private_key
+        self._signing_key: Optional[PrivateKey] = None
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -65,8 +66,9 @@ class VertexAuth(AuthBase):
         # Digest for order tracking in Hummingbot
         digest = self.generate_digest(signable_bytes)
 
-        pk = PrivateKey.from_hex(self.private_key)
-        signature = pk.sign_recoverable(signable_bytes, hasher=keccak_hash)
+        if self._signing_key is None:
+            self._signing_key = PrivateKey.from_hex(self.private_key)
+        signature = self._signing_key.sign_recoverable(signable_bytes, hasher=keccak_hash)
 
         v = signature[64] + 27
         r = big_endian_to_int(signature[0:32])
@@ -24,6 +24,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.estimate_fee import build_trade_fee
+from hummingbot.core.utils.signing_service import SigningService
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -228,7 +229,9 @@ class VertexExchange(ExchangePyBase):
             sender=sender, priceX18=int(price_str), amount=int(amount_str), expiration=int(expiration), nonce=nonce
         )
 
-        signature, digest = self.authenticator.sign_payload(order, contract, self._chain_id)
+        signature, digest = await SigningService.get_instance().sign(
+            self._auth.sign_payload, order, contract, self._chain_id, connector=self.name
+        )
 
         place_order = {
             "place_order": {
@@ -282,7 +285,9 @@ class VertexExchange(ExchangePyBase):
         cancel = vertex_eip712_structs.Cancellation(
             sender=sender, productIds=[int(product_id)], digests=[order_id_bytes], nonce=nonce
         )
-        signature, digest = self.authenticator.sign_payload(cancel, endpoint_contract, self._chain_id)
+        signature, digest = await SigningService.get_instance().sign(
+            self._auth.sign_payload, cancel, endpoint_contract, self._chain_id, connector=self.name
+        )
 
         cancel_orders = {
             "cancel_orders": {
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from websockets.exceptions import ConnectionClosed
+from xrpl.asyncio.clients import AsyncWebsocketClient
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
+from xrpl.models import Ping, Request
+from xrpl.models.response import Response
+
+from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+# Errors meaning that the connection to the node is not usable anymore
+CONNECTION_ERRORS = (ConnectionClosed, XRPLWebsocketException, OSError, asyncio.TimeoutError)
+
+
+class XRPLPooledClient:
+    """
+    A long-lived websocket client to one of the XRPL nodes, with its load and health status
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.client = AsyncWebsocketClient(url)
+        self.in_flight = 0
+        self.healthy = True
+        self.opened_timestamp = 0.0
+        # Serializes the opening, closing and recycling of the connection, which the requests and the health check
+        # may attempt at the same time
+        self.lock = asyncio.Lock()
+        self._discard_messages_task: Optional[asyncio.Task] = None
+
+    async def open(self, timeout: float):
+        await asyncio.wait_for(self.client.open(), timeout=timeout)
+        self.opened_timestamp = time.time()
+        self._discard_messages_task = safe_ensure_future(self._discard_messages())
+
+    async def close(self):
+        if self._discard_messages_task is not None:
+            self._discard_messages_task.cancel()
+            self._discard_messages_task = None
+        await self.client.close()
+
+    async def _discard_messages(self):
+        # The client also queues every response for the iteration on the messages, which nobody does in the pool
+        async for _ in self.client:
+            pass
+
+
+class XRPLClientPool:
+    """
+    A pool of long-lived websocket clients spread across the configured XRPL nodes.
+
+    Requests are sent through the least loaded healthy client. The XRPL clients match the responses with their requests
+    by id, so a single connection serves many concurrent requests without locking. When a connection fails the client
+    is marked unhealthy and the request fails over to the clients of the other nodes. A background task checks the
+    clients with a ping, reopens the unhealthy ones and recycles the connections periodically.
+
+    Only the public interface of the xrpl-py clients is used.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(
+        self,
+        node_urls: List[str],
+        clients_per_node: int = CONSTANTS.CLIENT_POOL_CLIENTS_PER_NODE,
+        health_check_interval: float = CONSTANTS.CLIENT_POOL_HEALTH_CHECK_INTERVAL,
+        recycle_interval: float = CONSTANTS.CLIENT_REFRESH_INTERVAL,
+        request_timeout: float = CONSTANTS.REQUEST_TIMEOUT,
+    ):
+        self._node_urls = list(dict.fromkeys(url for url in node_urls if url))
+        self._clients_per_node = clients_per_node
+        self._health_check_interval = health_check_interval
+        self._recycle_interval = recycle_interval
+        self._request_timeout = request_timeout
+        self._clients: List[XRPLPooledClient] = []
+        self._health_check_task: Optional[asyncio.Task] = None
+
+    @property
+    def node_urls(self) -> List[str]:
+        return self._node_urls
+
+    @property
+    def clients(self) -> List[XRPLPooledClient]:
+        if len(self._clients) == 0:
+            self._clients = [
+                XRPLPooledClient(url) for url in self._node_urls for _ in range(self._clients_per_node)
+            ]
+        return self._clients
+
+    def start(self):
+        if self._health_check_task is None:
+            self._health_check_task = safe_ensure_future(self._health_check_loop())
+
+    async def stop(self):
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+        for pooled_client in self._clients:
+            await self._close(pooled_client)
+        self._clients = []
+
+    @asynccontextmanager
+    async def client(self, url: Optional[str] = None) -> AsyncIterator[AsyncWebsocketClient]:
+        """
+        Provides an open client, to the node `url` if it is healthy. The client stays open when the context exits.
+        Connection errors raised in the context mark the client as unhealthy.
+        """
+        pooled_client = await self._acquire(url)
+        try:
+            yield pooled_client.client
+        except CONNECTION_ERRORS as e:
+            # Timeouts raised in the context may come from the caller's own waits (e.g. for a transaction validation)
+            if not isinstance(e, asyncio.TimeoutError):
+                await self._mark_unhealthy(pooled_client)
+            raise
+        finally:
+            pooled_client.in_flight -= 1
+
+    async def request(self, request: Request, url: Optional[str] = None, max_retries: int = 0) -> Response:
+        """
+        Sends the request through the client of the node `url` (or the least loaded client), failing over to the other
+        nodes if the connection fails
+
+        :param max_retries: the number of times all the nodes are tried again, after `REQUEST_RETRY_INTERVAL`
+        """
+        last_error: Optional[Exception] = None
+        for attempt in range(max_retries + 1):
+            if attempt > 0:
+                await self._sleep(CONSTANTS.REQUEST_RETRY_INTERVAL)
+            for pooled_client in self._candidates(url):
+                pooled_client.in_flight += 1
+                try:
+                    await self._open(pooled_client)
+                    return await asyncio.wait_for(pooled_client.client.request(request), timeout=self._request_timeout)
+                except CONNECTION_ERRORS as e:
+                    self.logger().debug(
+                        f"Request {request.method} to {pooled_client.url} failed ({e}). Failing over.")
+                    last_error = e
+                    await self._mark_unhealthy(pooled_client)
+                finally:
+                    pooled_client.in_flight -= 1
+        raise ConnectionError(f"No XRPL node could serve the request {request.method}") from last_error
+
+    def _candidates(self, url: Optional[str] = None) -> List[XRPLPooledClient]:
+        return sorted(
+            self.clients,
+            key=lambda pooled_client: (
+                not pooled_client.healthy,
+                url is not None and pooled_client.url != url,
+                pooled_client.in_flight,
+            ),
+        )
+
+    async def _acquire(self, url: Optional[str] = None) -> XRPLPooledClient:
+        """
+        Returns an open client, with its in flight count already incremented
+        """
+        last_error: Optional[Exception] = None
+        for pooled_client in self._candidates(url):
+            pooled_client.in_flight += 1
+            try:
+                await self._open(pooled_client)
+                return pooled_client
+            except CONNECTION_ERRORS as e:
+                pooled_client.in_flight -= 1
+                last_error = e
+                await self._mark_unhealthy(pooled_client)
+        raise ConnectionError("No XRPL node is reachable") from last_error
+
+    async def _open(self, pooled_client: XRPLPooledClient):
+        async with pooled_client.lock:
+            if not pooled_client.client.is_open():
+                await pooled_client.open(timeout=self._request_timeout)
+            pooled_client.healthy = True
+
+    async def _close(self, pooled_client: XRPLPooledClient):
+        async with pooled_client.lock:
+            await self._close_locked(pooled_client)
+
+    async def _close_locked(self, pooled_client: XRPLPooledClient):
+        try:
+            await pooled_client.close()
+        except Exception:
+            self.logger().debug(f"Error closing the XRPL client of {pooled_client.url}", exc_info=True)
+
+    async def _mark_unhealthy(self, pooled_client: XRPLPooledClient):
+        pooled_client.healthy = False
+        await self._close(pooled_client)
+
+    async def _check_client(self, pooled_client: XRPLPooledClient):
+        async with pooled_client.lock:
+            # Checked under the lock, a request may have started using the client while the previous check was running
+            if (pooled_client.in_flight == 0
+                    and pooled_client.client.is_open()
+                    and time.time() - pooled_client.opened_timestamp > self._recycle_interval):
+                await self._close_locked(pooled_client)
+        try:
+            await self._open(pooled_client)
+            if pooled_client.in_flight == 0:
+                await asyncio.wait_for(pooled_client.client.request(Ping()), timeout=self._request_timeout)
+        except CONNECTION_ERRORS as e:
+            if pooled_client.healthy:
+                self.logger().warning(f"The XRPL node {pooled_client.url} is not responding ({e}).")
+            await self._mark_unhealthy(pooled_client)
+
+    async def _health_check_loop(self):
+        while True:
+            try:
+                await asyncio.gather(*[self._check_client(pooled_client) for pooled_client in self.clients])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error checking the XRPL clients.")
+            await self._sleep(self._health_check_interval)
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay)
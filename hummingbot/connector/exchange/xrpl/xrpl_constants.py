@@ -102,6 +102,10 @@ REQUEST_ORDERBOOK_INTERVAL = 3
 # Client refresh interval
 CLIENT_REFRESH_INTERVAL = 60
 
+# Client pool parameters
+CLIENT_POOL_CLIENTS_PER_NODE = 1
+CLIENT_POOL_HEALTH_CHECK_INTERVAL = 10
+
 # Markets list
 MARKETS = {
     "XRP-USD": {
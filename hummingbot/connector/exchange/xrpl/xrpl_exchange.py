@@ -42,6 +42,7 @@ from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS, xrpl
 from hummingbot.connector.exchange.xrpl.xrpl_api_order_book_data_source import XRPLAPIOrderBookDataSource
 from hummingbot.connector.exchange.xrpl.xrpl_api_user_stream_data_source import XRPLAPIUserStreamDataSource
 from hummingbot.connector.exchange.xrpl.xrpl_auth import XRPLAuth
+from hummingbot.connector.exchange.xrpl.xrpl_client_pool import XRPLClientPool
 from hummingbot.connector.exchange.xrpl.xrpl_utils import (
     XRPLMarket,
     _wait_for_final_transaction_outcome,
@@ -59,6 +60,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.core.utils.tracking_nonce import NonceCreator
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -86,7 +88,10 @@ class XrplExchange(ExchangePyBase):
         self._wss_node_url = wss_node_url
         self._wss_second_node_url = wss_second_node_url
         self._wss_third_node_url = wss_third_node_url
-        # self._xrpl_place_order_client = AsyncWebsocketClient(self._wss_node_url)
+        # Long-lived clients used to place and cancel orders and to follow their transactions
+        self._xrpl_client_pool = XRPLClientPool(
+            node_urls=[self._wss_node_url, self._wss_second_node_url, self._wss_third_node_url]
+        )
         self._xrpl_query_client = AsyncWebsocketClient(self._wss_second_node_url)
         self._xrpl_order_book_data_client = AsyncWebsocketClient(self._wss_second_node_url)
         self._xrpl_user_stream_client = AsyncWebsocketClient(self._wss_third_node_url)
@@ -352,13 +357,15 @@ class XrplExchange(ExchangePyBase):
             o_id = None
 
             while retry < CONSTANTS.PLACE_ORDER_MAX_RETRY:
+                # The lock prevents concurrent transactions from being autofilled with the same account sequence
                 async with self._xrpl_place_order_client_lock:
-                    async with AsyncWebsocketClient(self._wss_node_url) as client:
+                    async with self._xrpl_client_pool.client(self._wss_node_url) as client:
                         filled_tx = await self.tx_autofill(request, client)
                         signed_tx = self.tx_sign(filled_tx, self._auth.get_wallet())
                         o_id = f"{signed_tx.sequence}-{signed_tx.last_ledger_sequence}"
                         submit_response = await self.tx_submit(signed_tx, client)
                         transact_time = time.time()
+                        submit_time_ns = time.perf_counter_ns()
                         prelim_result = submit_response.result["engine_result"]
 
                         submit_data = {"transaction": signed_tx, "prelim_result": prelim_result}
@@ -383,6 +390,14 @@ class XrplExchange(ExchangePyBase):
 
                 if verified:
                     retry = CONSTANTS.PLACE_ORDER_MAX_RETRY
+                    latency_tracer = LatencyTracer.get_instance()
+                    if latency_tracer.enabled:
+                        latency_tracer.record_since(
+                            stage=LatencyStage.ORDER_SUBMIT_TO_VALIDATED,
+                            start_ns=submit_time_ns,
+                            connector=self.name,
+                            trading_pair=trading_pair,
+                        )
                 else:
                     retry += 1
                     self.logger().info(
@@ -500,7 +515,7 @@ class XrplExchange(ExchangePyBase):
         try:
             # await self._client_health_check()
             async with self._xrpl_place_order_client_lock:
-                async with AsyncWebsocketClient(self._wss_node_url) as client:
+                async with self._xrpl_client_pool.client(self._wss_node_url) as client:
                     sequence, _ = exchange_order_id.split("-")
                     memo = Memo(
                         memo_data=convert_string_to_hex(order_id, padding=False),
@@ -1229,11 +1244,9 @@ class XrplExchange(ExchangePyBase):
                     forward=is_forward,
                 )
 
-                client_one = AsyncWebsocketClient(self._wss_node_url)
-                client_two = AsyncWebsocketClient(self._wss_second_node_url)
                 tasks = [
-                    self.request_with_retry(client_one, request, 5),
-                    self.request_with_retry(client_two, request, 5),
+                    self._xrpl_client_pool.request(request, url=self._wss_node_url, max_retries=5),
+                    self._xrpl_client_pool.request(request, url=self._wss_second_node_url, max_retries=5),
                 ]
                 task_results = await safe_gather(*tasks, return_exceptions=True)
 
@@ -1473,6 +1486,14 @@ class XrplExchange(ExchangePyBase):
         except Exception as e:
             self.logger().exception(f"There was an error requesting exchange info: {e}")
 
+    async def start_network(self):
+        await super().start_network()
+        self._xrpl_client_pool.start()
+
+    async def stop_network(self):
+        await super().stop_network()
+        await self._xrpl_client_pool.stop()
+
     async def _make_network_check_request(self):
         await self._xrpl_query_client.open()
 
@@ -1635,7 +1656,7 @@ class XrplExchange(ExchangePyBase):
         raise XRPLRequestFailureException(response.result)
 
     async def wait_for_final_transaction_outcome(self, transaction, prelim_result) -> Response:
-        async with AsyncWebsocketClient(self._wss_node_url) as client:
+        async with self._xrpl_client_pool.client(self._wss_node_url) as client:
             resp = await _wait_for_final_transaction_outcome(
                 transaction.get_hash(), client, prelim_result, transaction.last_ledger_sequence
             )
@@ -4,7 +4,7 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -13,13 +13,14 @@ from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.utils import ConnectorOrderBookDataSourceFactory, get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.multi_process_order_book_tracker import MultiProcessOrderBookTracker
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -28,8 +29,9 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolStats, RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
@@ -60,6 +62,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._connections_warm_up_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -70,13 +73,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        if self._web_assistants_factory is not None:
+            self._web_assistants_factory.set_connection_pool_config(
+                client_config_map.connection_pool.build_pool_config(self.name),
+                client_config_map.connection_pool.build_host_pool_configs(self.name))
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
-        self._set_order_book_tracker(OrderBookTracker(
-            data_source=self._orderbook_ds,
-            trading_pairs=self.trading_pairs,
-            domain=self.domain))
+        self._set_order_book_tracker(self._create_order_book_tracker(client_config_map))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -187,6 +191,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     def name_cap(self) -> str:
         return self.name.capitalize()
 
+    @property
+    def connection_warm_up_path_urls(self) -> List[str]:
+        """
+        Returns the path URLs of public endpoints in the hosts used to place and cancel orders. They are requested
+        (through the throttler) when the network is started, so that the first orders reuse the pooled connections and
+        do not pay the connection and TLS handshake costs.
+        """
+        return []
+
+    def connection_pool_stats(self) -> Optional[ConnectionPoolStats]:
+        """
+        Returns the usage of the connection pools of the connector (saturation and connection reuse), if it has any.
+        """
+        if self._web_assistants_factory is None:
+            return None
+        return self._web_assistants_factory.connection_pool_stats()
+
     @property
     def tracking_states(self) -> Dict[str, any]:
         """
@@ -407,6 +428,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        latency_tracer = LatencyTracer.get_instance()
+        if latency_tracer.enabled:
+            latency_tracer.start_span(order_id)
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -475,6 +499,14 @@ class ExchangePyBase(ExchangeBase, ABC):
             price=order.price,
             **kwargs,
         )
+        latency_tracer = LatencyTracer.get_instance()
+        if latency_tracer.enabled:
+            latency_tracer.record_span(
+                span_id=order.client_order_id,
+                stage=LatencyStage.ORDER_CREATE_TO_PLACED,
+                connector=self.name,
+                trading_pair=order.trading_pair,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -483,7 +515,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             update_timestamp=update_timestamp,
             new_state=OrderState.OPEN,
         )
-        self._order_tracker.process_order_update(order_update)
+        self._order_tracker.process_order_update(order_update, created_locally=True)
 
         return exchange_order_id
 
@@ -513,7 +545,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             update_timestamp=self.current_timestamp,
             new_state=OrderState.FAILED,
         )
-        self._order_tracker.process_order_update(order_update)
+        self._order_tracker.process_order_update(order_update, created_locally=True)
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
         try:
@@ -674,6 +706,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            if len(self.connection_warm_up_path_urls) > 0:
+                self._connections_warm_up_task = safe_ensure_future(self._warm_up_connections())
 
     async def stop_network(self):
         """
@@ -719,6 +753,21 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._connections_warm_up_task is not None:
+            self._connections_warm_up_task.cancel()
+            self._connections_warm_up_task = None
+
+    async def _warm_up_connections(self):
+        """
+        Requests the warm up endpoints to open the pooled connections to the exchange. Failures are ignored.
+        """
+        for path_url in self.connection_warm_up_path_urls:
+            try:
+                await self._api_get(path_url=path_url)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger().debug(f"Could not warm up the connection with {path_url} ({e})")
 
     # === loops and sync related methods ===
     #
@@ -1068,6 +1117,26 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def _create_order_book_tracker(
+            self, client_config_map: "ClientConfigAdapter") -> Union[OrderBookTracker, MultiProcessOrderBookTracker]:
+        """
+        Creates the order book tracker. When the order book workers are enabled the order books are maintained by a
+        worker process, that creates its own instance of the data source.
+        """
+        order_book_workers = client_config_map.order_book_workers
+        if order_book_workers.order_book_workers_enabled and len(self.trading_pairs) > 0:
+            return MultiProcessOrderBookTracker(
+                data_source_factory=ConnectorOrderBookDataSourceFactory(
+                    connector_name=self.name, trading_pairs=self.trading_pairs),
+                trading_pairs=self.trading_pairs,
+                domain=self.domain,
+                depth=order_book_workers.order_book_workers_depth,
+            )
+        return OrderBookTracker(
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain)
+
     async def _initialize_trading_pair_symbol_map(self):
         try:
             exchange_info = await self._make_trading_pairs_request()
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import math
 import os.path
 import threading
 import time
@@ -9,6 +10,7 @@ from shutil import move
 from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+from sqlalchemy import func
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
@@ -37,6 +39,7 @@ from hummingbot.core.event.events import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
+from hummingbot.model.executors_performance import ExecutorsPerformance
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.market_state import MarketState
@@ -46,8 +49,9 @@ from hummingbot.model.range_position_collected_fees import RangePositionCollecte
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
 
 
 class MarketsRecorder:
@@ -86,6 +90,8 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        # Serializes the updates of the executors performance aggregates, which can be rebuilt from another thread
+        self._executors_performance_lock = threading.Lock()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -193,20 +199,112 @@ class MarketsRecorder:
             self._market_data_collection_task.cancel()
 
     def store_or_update_executor(self, executor):
-        with self._sql_manager.get_new_session() as session:
+        with self._executors_performance_lock, self._sql_manager.get_new_session() as session:
             existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
+            executor_values = json.loads(executor.executor_info.json())
 
             if existing_executor:
                 # Update existing executor
-                for attr, value in vars(executor).items():
+                self._add_to_executors_performance(session, existing_executor, sign=-1)
+                for attr, value in executor_values.items():
                     setattr(existing_executor, attr, value)
             else:
                 # Insert new executor
-                serialized_config = executor.executor_info.json()
-                new_executor = Executors(**json.loads(serialized_config))
-                session.add(new_executor)
+                existing_executor = Executors(**executor_values)
+                session.add(existing_executor)
+            self._add_to_executors_performance(session, existing_executor)
             session.commit()
 
+    @staticmethod
+    def _add_to_executors_performance(session: Session, executor: Executors, sign: int = 1):
+        performance: Optional[ExecutorsPerformance] = session.get(
+            ExecutorsPerformance, ExecutorsPerformance.key(executor.controller_id))
+        if performance is None:
+            performance = ExecutorsPerformance.new(executor.controller_id)
+            session.add(performance)
+        performance.add_executor(net_pnl_quote=executor.net_pnl_quote,
+                                 filled_amount_quote=executor.filled_amount_quote,
+                                 close_type=executor.close_type,
+                                 sign=sign)
+
+    def get_executors_performance(self) -> Dict[Optional[str], PerformanceReport]:
+        """
+        Returns the aggregated performance of the stored executors by controller id
+        """
+        with self._sql_manager.get_new_session() as session:
+            return {
+                performance.controller_id or None: performance.to_performance_report()
+                for performance in session.query(ExecutorsPerformance).all()
+            }
+
+    def check_executors_performance(self) -> bool:
+        """
+        Checks that the executors performance aggregates match the stored executors, and rebuilds them if they don't
+        (e.g. for executors stored before the aggregates were introduced). It compares the number of executors, the
+        realized PnL and the traded volume of each controller, computed by the database, unless a rebuild is needed,
+        and can be run from a worker thread.
+
+        :return: True if the aggregates were rebuilt
+        """
+        with self._executors_performance_lock, self._sql_manager.get_new_session() as session:
+            executors_totals = {
+                ExecutorsPerformance.key(controller_id): (count, pnl or 0, volume or 0)
+                for controller_id, count, pnl, volume in (session
+                                                          .query(Executors.controller_id,
+                                                                 func.count(Executors.id),
+                                                                 func.sum(Executors.net_pnl_quote),
+                                                                 func.sum(Executors.filled_amount_quote))
+                                                          .group_by(Executors.controller_id))
+            }
+            aggregated_totals = {
+                performance.controller_id: (performance.num_executors,
+                                            performance.realized_pnl_quote,
+                                            performance.volume_traded)
+                for performance in (session
+                                    .query(ExecutorsPerformance)
+                                    .filter(ExecutorsPerformance.num_executors != 0))
+            }
+            if not self._executors_totals_match(executors_totals, aggregated_totals):
+                self.logger().info("Rebuilding the executors performance aggregates.")
+                self._rebuild_executors_performance(session)
+                session.commit()
+                return True
+            return False
+
+    @staticmethod
+    def _executors_totals_match(executors_totals: Dict[str, Tuple[int, float, float]],
+                                aggregated_totals: Dict[str, Tuple[int, Decimal, Decimal]]) -> bool:
+        if executors_totals.keys() != aggregated_totals.keys():
+            return False
+        for controller_id, (count, pnl, volume) in executors_totals.items():
+            aggregated_count, aggregated_pnl, aggregated_volume = aggregated_totals[controller_id]
+            # The database sums the float columns, so the totals are compared with a tolerance
+            if (count != aggregated_count
+                    or not math.isclose(pnl, float(aggregated_pnl), rel_tol=1e-9, abs_tol=1e-8)
+                    or not math.isclose(volume, float(aggregated_volume), rel_tol=1e-9, abs_tol=1e-8)):
+                return False
+        return True
+
+    @staticmethod
+    def _rebuild_executors_performance(session: Session):
+        performances: Dict[str, ExecutorsPerformance] = {}
+        columns = (session
+                   .query(Executors.controller_id,
+                          Executors.net_pnl_quote,
+                          Executors.filled_amount_quote,
+                          Executors.close_type)
+                   .yield_per(1000))
+        for controller_id, net_pnl_quote, filled_amount_quote, close_type in columns:
+            performance = performances.get(ExecutorsPerformance.key(controller_id))
+            if performance is None:
+                performance = performances[ExecutorsPerformance.key(controller_id)] = ExecutorsPerformance.new(
+                    controller_id)
+            performance.add_executor(net_pnl_quote=net_pnl_quote,
+                                     filled_amount_quote=filled_amount_quote,
+                                     close_type=close_type)
+        session.query(ExecutorsPerformance).delete(synchronize_session=False)
+        session.add_all(performances.values())
+
     def store_controller_config(self, controller_config: ControllerConfigBase):
         with self._sql_manager.get_new_session() as session:
             config = json.loads(controller_config.json())
@@ -389,6 +487,7 @@ class MarketsRecorder:
                 )
                 session.add(order_status)
                 session.add(trade_fill_record)
+                TradeFillLedger.record_fill(session, trade_fill_record)
                 self.save_market_states(self._config_file_path, market, session=session)
 
                 market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
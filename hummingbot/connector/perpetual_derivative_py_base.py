@@ -11,6 +11,7 @@ from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.events import (
@@ -163,6 +164,14 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     def _create_order_book_data_source(self) -> PerpetualAPIOrderBookDataSource:
         raise NotImplementedError
 
+    def _create_order_book_tracker(self, client_config_map: "ClientConfigAdapter") -> OrderBookTracker:
+        # The funding info is streamed by the order book data source, so the order books are not maintained by a
+        # worker process
+        return OrderBookTracker(
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain)
+
     @abstractmethod
     async def _place_order(
         self,
@@ -4,7 +4,7 @@ import os
 import platform
 from collections import namedtuple
 from hashlib import md5
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
@@ -15,6 +15,9 @@ from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBa
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 
+if TYPE_CHECKING:
+    from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
 TradeFillOrderDetails = namedtuple("TradeFillOrderDetails", "market exchange_trade_id symbol")
 
 
@@ -96,6 +99,7 @@ class TimeSynchronizerRESTPreProcessor(RESTPreProcessorBase):
     This pre processor is intended to be used in those connectors that require synchronization with the server time
     to accept API requests. It ensures the synchronizer has at least one server time sample before being used.
     """
+    modifies_requests_in_place = False
 
     def __init__(self, synchronizer: TimeSynchronizer, time_provider: Callable):
         super().__init__()
@@ -120,3 +124,27 @@ class GZipCompressionWSPostProcessor(WSPostProcessorBase):
         msg: Dict[str, Any] = json.loads(encoded_msg.decode("utf-8"))
 
         return WSResponse(data=msg)
+
+
+class ConnectorOrderBookDataSourceFactory:
+    """
+    Picklable factory of the order book data source of a connector, used by the order book worker processes. It
+    creates a non trading instance of the connector (with the default client configuration) inside the worker, and
+    returns its data source.
+    """
+
+    def __init__(self, connector_name: str, trading_pairs: List[str]):
+        self._connector_name = connector_name
+        self._trading_pairs = list(trading_pairs)
+
+    def __call__(self) -> "OrderBookTrackerDataSource":
+        from hummingbot.client.config.client_config_map import ClientConfigMap
+        from hummingbot.client.config.config_helpers import ClientConfigAdapter
+        from hummingbot.client.settings import AllConnectorSettings
+
+        connector_setting = AllConnectorSettings.get_connector_settings()[self._connector_name]
+        connector = connector_setting.non_trading_connector_instance_with_default_configuration(
+            trading_pairs=self._trading_pairs,
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        )
+        return connector.order_book_tracker.data_source
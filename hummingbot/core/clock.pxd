@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+from hummingbot.core.time_iterator cimport TimeIterator
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +12,11 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _wake_event
+        dict _pending_wakes
+        dict _min_wake_intervals
+        dict _last_wake_times
+        dict _tick_stats
+
+    cdef c_tick_iterator(self, TimeIterator child_iterator, double timestamp)
+    cdef double c_next_wake_time(self)
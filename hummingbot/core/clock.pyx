@@ -3,17 +3,45 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import Dict, List
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
+class IteratorTickStats:
+    """
+    Durations (in seconds) of the ticks of a time iterator in real time mode
+    """
+    __slots__ = ("count", "total_duration", "max_duration", "last_duration")
+
+    def __init__(self):
+        self.count = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration = 0.0
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.count if self.count > 0 else 0.0
+
+    def record(self, duration: float):
+        self.count += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+
 cdef class Clock:
+    # Ticks of a single iterator longer than this fraction of the tick size are logged
+    SLOW_TICK_WARNING_RATIO = 0.5
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global s_logger
@@ -36,6 +64,11 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._wake_event = None
+        self._pending_wakes = {}
+        self._min_wake_intervals = {}
+        self._last_wake_times = {}
+        self._tick_stats = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +90,10 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_stats(self) -> Dict[TimeIterator, IteratorTickStats]:
+        return self._tick_stats
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +118,33 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self.unregister_event_driven_iterator(iterator)
+        self._tick_stats.pop(iterator, None)
+
+    def register_event_driven_iterator(self, iterator: TimeIterator, min_wake_interval: float = 0.1):
+        """
+        Allows an iterator to be ticked between the regular ticks of the clock when it calls `wake_iterator`
+        (in real time mode only). The iterator keeps being ticked at every regular tick, and the ticks in between
+        receive the timestamp of the last regular tick.
+
+        :param min_wake_interval: minimum time in seconds between two wake ups of the iterator. Wake up requests
+        received in the meantime are coalesced and served when the interval has elapsed.
+        """
+        self._min_wake_intervals[iterator] = min_wake_interval
+
+    def unregister_event_driven_iterator(self, iterator: TimeIterator):
+        self._min_wake_intervals.pop(iterator, None)
+        self._last_wake_times.pop(iterator, None)
+        self._pending_wakes.pop(iterator, None)
+
+    def wake_iterator(self, iterator: TimeIterator):
+        """
+        Requests an immediate tick of an event driven iterator. Does nothing if the iterator is not registered.
+        """
+        if iterator in self._min_wake_intervals:
+            self._pending_wakes[iterator] = True
+            if self._wake_event is not None:
+                self._wake_event.set()
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +154,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            object latency_tracer = LatencyTracer.get_instance()
+            object tick_start_ns
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -107,26 +173,96 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                if len(self._min_wake_intervals) == 0:
+                    # Sleep until the next tick
+                    await asyncio.sleep(next_tick_time - now)
+                else:
+                    # Sleep until the next tick, unless an event driven iterator has to be woken up before
+                    await self._wait_for_wake_up(next_tick_time)
+                    now = time.time()
+                    if now < next_tick_time:
+                        self._tick_woken_iterators(now)
+                        continue
                 self._current_tick = next_tick_time
+                self._pending_wakes.clear()
+                tick_start_ns = latency_tracer.now() if latency_tracer.enabled else None
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(child_iterator, self._current_tick)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+
+                if tick_start_ns is not None:
+                    latency_tracer.record_since(stage=LatencyStage.CLOCK_TICK, start_ns=tick_start_ns)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef c_tick_iterator(self, TimeIterator child_iterator, double timestamp):
+        cdef:
+            double start = time.perf_counter()
+            double duration
+        try:
+            child_iterator.c_tick(timestamp)
+        finally:
+            duration = time.perf_counter() - start
+            stats = self._tick_stats.get(child_iterator)
+            if stats is None:
+                stats = self._tick_stats[child_iterator] = IteratorTickStats()
+            stats.record(duration)
+            if duration > self._tick_size * self.SLOW_TICK_WARNING_RATIO:
+                self.logger().warning(f"Slow tick: {type(child_iterator).__name__} took {duration:.3f} seconds, "
+                                      f"delaying the other iterators of the clock.")
+
+    cdef double c_next_wake_time(self):
+        cdef double next_wake_time = float("inf")
+        for iterator in self._pending_wakes:
+            next_wake_time = min(
+                next_wake_time,
+                self._last_wake_times.get(iterator, 0) + self._min_wake_intervals[iterator]
+            )
+        return next_wake_time
+
+    async def _wait_for_wake_up(self, next_tick_time: float):
+        if self._wake_event is None:
+            self._wake_event = asyncio.Event()
+        while True:
+            now = time.time()
+            deadline = min(next_tick_time, self.c_next_wake_time())
+            if deadline <= now:
+                return
+            self._wake_event.clear()
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=deadline - now)
+            except asyncio.TimeoutError:
+                return
+
+    def _tick_woken_iterators(self, now: float):
+        cdef:
+            TimeIterator child_iterator
+            # The iterators expect timestamps aligned to the tick size, so they get the one of the last regular tick
+            double timestamp = (now // self._tick_size) * self._tick_size
+        for iterator in list(self._pending_wakes):
+            if now < self._last_wake_times.get(iterator, 0) + self._min_wake_intervals[iterator]:
+                continue
+            del self._pending_wakes[iterator]
+            if iterator not in self._current_context:
+                continue
+            self._last_wake_times[iterator] = now
+            child_iterator = iterator
+            try:
+                self.c_tick_iterator(child_iterator, timestamp)
+            except Exception:
+                self.logger().error("Unexpected error running event driven clock tick.", exc_info=True)
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -0,0 +1,296 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_order_book_buffer import SharedOrderBookBuffer
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class OrderBookPublisher:
+    """
+    Copies the top levels and the public trades of the order books maintained by an `OrderBookTracker` into a
+    `SharedOrderBookBuffer`. It runs in the order book worker process.
+    """
+
+    def __init__(self, tracker: OrderBookTracker, buffer: SharedOrderBookBuffer):
+        self._tracker = tracker
+        self._buffer = buffer
+        self._published_update_ids: Dict[str, Tuple[int, int]] = {}
+        self._trade_forwarders: Dict[str, EventForwarder] = {}
+
+    def publish(self):
+        for trading_pair, order_book in self._tracker.order_books.items():
+            if trading_pair not in self._trade_forwarders:
+                forwarder = EventForwarder(to_function=self._buffer.write_trade)
+                order_book.add_listener(OrderBookEvent.TradeEvent, forwarder)
+                self._trade_forwarders[trading_pair] = forwarder
+            update_ids = (order_book.snapshot_uid, order_book.last_diff_uid)
+            if self._published_update_ids.get(trading_pair) != update_ids:
+                self._buffer.write_book(
+                    trading_pair=trading_pair,
+                    update_id=max(update_ids),
+                    timestamp=time.time(),
+                    bids=self._levels(order_book.bid_entries()),
+                    asks=self._levels(order_book.ask_entries()),
+                )
+                self._published_update_ids[trading_pair] = update_ids
+        self._buffer.beat()
+
+    def _levels(self, entries) -> np.ndarray:
+        levels = [(row.price, row.amount, row.update_id) for row in islice(entries, self._buffer.depth)]
+        return np.array(levels, dtype=np.float64).reshape(len(levels), SharedOrderBookBuffer.LEVEL_FIELDS)
+
+
+def run_order_book_worker(
+    data_source_factory: Callable[[], OrderBookTrackerDataSource],
+    trading_pairs: List[str],
+    buffer_name: str,
+    depth: int,
+    trades_capacity: int,
+    publish_interval: float,
+    domain: Optional[str] = None,
+):
+    """
+    Entry point of the order book worker process. It runs a regular `OrderBookTracker` for the data source created
+    by `data_source_factory` (which must be picklable) and publishes its order books in the shared memory buffer.
+    """
+    buffer = SharedOrderBookBuffer(
+        trading_pairs=trading_pairs, depth=depth, trades_capacity=trades_capacity, name=buffer_name, create=False
+    )
+    ev_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    tracker = OrderBookTracker(data_source=data_source_factory(), trading_pairs=trading_pairs, domain=domain)
+    publisher = OrderBookPublisher(tracker=tracker, buffer=buffer)
+
+    async def publish_loop():
+        tracker.start()
+        while True:
+            publisher.publish()
+            await asyncio.sleep(publish_interval)
+
+    try:
+        ev_loop.run_until_complete(publish_loop())
+    finally:
+        tracker.stop()
+        buffer.close()
+
+
+class MultiProcessOrderBookTracker:
+    """
+    An order book tracker that parses the exchange order book streams in a separate worker process.
+
+    The worker runs a regular `OrderBookTracker` and publishes the top `depth` levels of each book, and its public
+    trades, into a `SharedOrderBookBuffer`. This tracker refreshes local `OrderBook` instances from the buffer, so the
+    strategy process keeps the usual `OrderBook` interface (including trade events) without parsing any message.
+
+    The local books are only refreshed when the worker wrote something in the buffer since the previous refresh, and
+    only the books whose sequence number or trades count changed are read.
+
+    The worker is restarted when it dies or stops updating its heartbeat, and `is_order_book_stale` allows checking
+    whether a book has not been refreshed recently.
+
+    The connectors use it instead of `OrderBookTracker` when the `order_book_workers` client config is enabled. The
+    data source is created inside the worker by `data_source_factory`, which must be picklable (see
+    `ConnectorOrderBookDataSourceFactory`).
+    """
+    REFRESH_INTERVAL = 0.02
+    PUBLISH_INTERVAL = 0.005
+    WORKER_HEARTBEAT_TIMEOUT = 10.0
+    WORKER_STOP_TIMEOUT = 5.0
+    STALE_ORDER_BOOK_THRESHOLD = 30.0
+
+    _mpobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mpobt_logger is None:
+            cls._mpobt_logger = logging.getLogger(__name__)
+        return cls._mpobt_logger
+
+    def __init__(
+        self,
+        data_source_factory: Callable[[], OrderBookTrackerDataSource],
+        trading_pairs: List[str],
+        domain: Optional[str] = None,
+        depth: int = 20,
+        trades_capacity: int = 100,
+    ):
+        self._data_source_factory = data_source_factory
+        self._trading_pairs: List[str] = trading_pairs
+        self._domain = domain
+        self._depth = depth
+        self._trades_capacity = trades_capacity
+        self._order_books: Dict[str, OrderBook] = {trading_pair: OrderBook() for trading_pair in trading_pairs}
+        self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._buffer: Optional[SharedOrderBookBuffer] = None
+        self._worker: Optional[multiprocessing.Process] = None
+        self._worker_start_time: float = 0
+        self._worker_restarts: int = 0
+        self._applied_writes_count: int = 0
+        self._applied_sequences: Dict[str, int] = {}
+        self._last_refresh_timestamps: Dict[str, float] = {}
+        self._trades_counts: Dict[str, int] = {trading_pair: 0 for trading_pair in trading_pairs}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return self._order_books
+
+    @property
+    def ready(self) -> bool:
+        return self._order_books_initialized.is_set()
+
+    @property
+    def worker_restarts(self) -> int:
+        return self._worker_restarts
+
+    @property
+    def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
+        return {
+            trading_pair: order_book.snapshot
+            for trading_pair, order_book in self._order_books.items()
+        }
+
+    def is_order_book_stale(self, trading_pair: str, threshold: Optional[float] = None) -> bool:
+        """
+        Returns True if the order book has not been refreshed by the worker during the last `threshold` seconds
+        (`STALE_ORDER_BOOK_THRESHOLD` by default)
+        """
+        threshold = threshold if threshold is not None else self.STALE_ORDER_BOOK_THRESHOLD
+        last_refresh = self._last_refresh_timestamps.get(trading_pair)
+        return last_refresh is None or time.time() - last_refresh > threshold
+
+    def start(self):
+        self.stop()
+        self._buffer = SharedOrderBookBuffer(
+            trading_pairs=self._trading_pairs, depth=self._depth, trades_capacity=self._trades_capacity
+        )
+        self._start_worker()
+        self._refresh_task = safe_ensure_future(self._refresh_loop())
+
+    def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        self._stop_worker()
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer.unlink()
+            self._buffer = None
+        self._applied_writes_count = 0
+        self._applied_sequences.clear()
+        self._trades_counts = {trading_pair: 0 for trading_pair in self._trading_pairs}
+        self._order_books_initialized.clear()
+
+    async def wait_ready(self):
+        await self._order_books_initialized.wait()
+
+    def refresh_order_books(self):
+        """
+        Applies the latest published state of the order books that changed, and triggers the trade events published
+        since the previous refresh
+        """
+        writes_count = self._buffer.writes_count
+        if writes_count == self._applied_writes_count:
+            return
+        self._applied_writes_count = writes_count
+        for trading_pair, order_book in self._order_books.items():
+            sequence = self._buffer.book_sequence(trading_pair)
+            if sequence != self._applied_sequences.get(trading_pair):
+                state = self._buffer.read_book(trading_pair)
+                if state is not None:
+                    order_book.apply_numpy_snapshot(state.bids, state.asks)
+                    self._applied_sequences[trading_pair] = sequence
+                    self._last_refresh_timestamps[trading_pair] = state.timestamp
+            if self._buffer.trades_count(trading_pair) != self._trades_counts[trading_pair]:
+                self._trades_counts[trading_pair], trades = self._buffer.read_trades(
+                    trading_pair=trading_pair, since_count=self._trades_counts[trading_pair]
+                )
+                for trade in trades:
+                    order_book.apply_trade(trade)
+        if not self.ready and len(self._applied_sequences) == len(self._order_books):
+            self._order_books_initialized.set()
+
+    def _start_worker(self):
+        context = multiprocessing.get_context("spawn")
+        self._worker = context.Process(
+            target=run_order_book_worker,
+            kwargs={
+                "data_source_factory": self._data_source_factory,
+                "trading_pairs": self._trading_pairs,
+                "buffer_name": self._buffer.name,
+                "depth": self._depth,
+                "trades_capacity": self._trades_capacity,
+                "publish_interval": self.PUBLISH_INTERVAL,
+                "domain": self._domain,
+            },
+            daemon=True,
+        )
+        self._worker.start()
+        self._worker_start_time = time.time()
+
+    def _stop_worker(self):
+        if self._worker is not None:
+            if self._worker.is_alive():
+                self._worker.terminate()
+            self._worker.join(timeout=self.WORKER_STOP_TIMEOUT)
+            self._worker = None
+
+    async def _stop_worker_async(self):
+        """
+        Stops the worker without blocking the event loop while the process exits
+        """
+        worker = self._worker
+        self._worker = None
+        if worker is not None:
+            if worker.is_alive():
+                worker.terminate()
+            await asyncio.get_running_loop().run_in_executor(None, worker.join, self.WORKER_STOP_TIMEOUT)
+
+    def _is_worker_healthy(self) -> bool:
+        if self._worker is None or not self._worker.is_alive():
+            return False
+        last_beat = max(self._buffer.heartbeat, self._worker_start_time)
+        return time.time() - last_beat <= self.WORKER_HEARTBEAT_TIMEOUT
+
+    async def _restart_worker(self):
+        self.logger().warning("The order book worker process is not responding. Restarting it.")
+        await self._stop_worker_async()
+        for trading_pair in self._buffer.end_interrupted_writes():
+            # The levels written partially are not applied, the new worker publishes all the books when it starts
+            self._applied_sequences[trading_pair] = self._buffer.book_sequence(trading_pair)
+        self._start_worker()
+        self._worker_restarts += 1
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                self.refresh_order_books()
+                if not self._is_worker_healthy():
+                    await self._restart_worker()
+                await self._sleep(self.REFRESH_INTERVAL)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error refreshing order books from the worker process.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error refreshing order books. Retrying after 5 seconds."
+                )
+                await self._sleep(5.0)
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay=delay)
@@ -34,10 +34,12 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+cdef int64_t ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.OrderBookUpdateEvent.value
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.OrderBookUpdateEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -96,6 +98,10 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        # The listeners receive the order book itself. Most order books have none, so the event is not dispatched then
+        if self.c_has_listeners(ORDER_BOOK_UPDATE_EVENT_TAG):
+            self.c_trigger_event(ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -136,11 +142,21 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        if self.c_has_listeners(ORDER_BOOK_UPDATE_EVENT_TAG):
+            self.c_trigger_event(ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_apply_trades(self, list trade_events):
+        if len(trade_events) == 0:
+            return
+        self._last_trade_price = trade_events[-1].price
+        self._last_applied_trade = time.perf_counter()
+        self.c_trigger_events(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_events)
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -200,6 +216,12 @@ cdef class OrderBook(PubSub):
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
+    def apply_trades(self, trades: List[OrderBookTradeEvent]):
+        """
+        Applies a batch of trades, delivering them to the trade listeners as a batch.
+        """
+        self.c_apply_trades(list(trades))
+
     def apply_pandas_diffs(self, bids_df: pd.DataFrame, asks_df: pd.DataFrame):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id], and a UNIX timestamp index.
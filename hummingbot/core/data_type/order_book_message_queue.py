@@ -0,0 +1,95 @@
+import asyncio
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class QueueOverflowPolicy(Enum):
+    DROP_OLDEST = 1
+    DROP_NEWEST = 2
+
+
+class BoundedMessageQueue(asyncio.Queue):
+    """
+    An `asyncio.Queue` with a maximum size that never blocks or fails when adding messages.
+
+    When the queue is full the configured overflow policy decides which message is discarded: the oldest queued
+    message (`DROP_OLDEST`, the default, keeps the freshest data) or the message being added (`DROP_NEWEST`).
+    The discarded message is passed to the overflow callback, if any, so that the owner can react (for example by
+    requesting a new order book snapshot).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.DROP_OLDEST,
+        overflow_callback: Optional[Callable[[Any], None]] = None,
+    ):
+        super().__init__(maxsize=maxsize)
+        self._overflow_policy = overflow_policy
+        self._overflow_callback = overflow_callback
+        self._dropped_messages_count = 0
+
+    @property
+    def dropped_messages_count(self) -> int:
+        return self._dropped_messages_count
+
+    async def put(self, item: Any):
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any):
+        if self.full():
+            if self._overflow_policy is QueueOverflowPolicy.DROP_OLDEST:
+                dropped_item = self.get_nowait()
+                self.task_done()
+                super().put_nowait(item)
+            else:
+                dropped_item = item
+            self._dropped_messages_count += 1
+            if self._overflow_callback is not None:
+                self._overflow_callback(dropped_item)
+        else:
+            super().put_nowait(item)
+
+
+class ConflatingOrderBookMessageQueue(BoundedMessageQueue):
+    """
+    A bounded queue of `OrderBookMessage`s for a single trading pair.
+
+    When a snapshot is added, the queued diffs it already includes (those with an update id not greater than the
+    snapshot update id) are discarded, since applying them after the snapshot would be wasted work.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow_callback: Optional[Callable[[Any], None]] = None,
+    ):
+        super().__init__(
+            maxsize=maxsize, overflow_policy=QueueOverflowPolicy.DROP_OLDEST, overflow_callback=overflow_callback
+        )
+        self._conflated_messages_count = 0
+
+    @property
+    def conflated_messages_count(self) -> int:
+        return self._conflated_messages_count
+
+    def put_nowait(self, item: OrderBookMessage):
+        if item.type is OrderBookMessageType.SNAPSHOT and not self.empty():
+            self._conflate_diffs(snapshot_update_id=item.update_id)
+        super().put_nowait(item)
+
+    def _conflate_diffs(self, snapshot_update_id: int):
+        queued_messages_count = len(self._queue)
+        remaining_messages = [
+            message for message in self._queue
+            if not (message.type is OrderBookMessageType.DIFF and message.update_id <= snapshot_update_id)
+        ]
+        conflated_count = queued_messages_count - len(remaining_messages)
+        if conflated_count > 0:
+            self._queue.clear()
+            self._queue.extend(remaining_messages)
+            for _ in range(conflated_count):
+                self.task_done()
+            self._conflated_messages_count += conflated_count
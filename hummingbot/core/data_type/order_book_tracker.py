@@ -10,9 +10,11 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import BoundedMessageQueue, ConflatingOrderBookMessageQueue
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +25,9 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    STREAM_QUEUE_MAX_SIZE: int = 10000
+    TRACKING_QUEUE_MAX_SIZE: int = 1000
+    TRADE_EVENTS_BATCH_SIZE: int = 100
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -40,11 +45,17 @@ class OrderBookTracker:
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
+        self._order_book_diff_stream: asyncio.Queue = BoundedMessageQueue(
+            maxsize=self.STREAM_QUEUE_MAX_SIZE,
+            overflow_callback=lambda message: self._request_order_book_resync(message.trading_pair))
+        self._order_book_snapshot_stream: asyncio.Queue = BoundedMessageQueue(maxsize=self.STREAM_QUEUE_MAX_SIZE)
+        self._order_book_trade_stream: asyncio.Queue = BoundedMessageQueue(maxsize=self.STREAM_QUEUE_MAX_SIZE)
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._last_applied_message_timestamps: Dict[str, float] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._data_source.order_book_resync_function = self._request_all_order_books_resync
+        self._latency_tracer: LatencyTracer = LatencyTracer.get_instance()
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +79,32 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        Returns the number of messages waiting to be applied to each order book
+        """
+        return {trading_pair: queue.qsize() for trading_pair, queue in self._tracking_message_queues.items()}
+
+    @property
+    def dropped_messages_count(self) -> Dict[str, int]:
+        """
+        Returns the number of messages discarded for each order book because its queue was full
+        """
+        return {
+            trading_pair: queue.dropped_messages_count
+            for trading_pair, queue in self._tracking_message_queues.items()
+            if isinstance(queue, BoundedMessageQueue)
+        }
+
+    def order_book_lag(self, trading_pair: str) -> float:
+        """
+        Returns the time in seconds between now and the timestamp of the last message applied to the order book
+        (`nan` if no message has been applied yet). A growing lag means the order book is stale.
+        """
+        last_timestamp = self._last_applied_message_timestamps.get(trading_pair)
+        return time.time() - last_timestamp if last_timestamp is not None else float("nan")
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -137,6 +174,9 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
         self._order_books_initialized.clear()
 
     async def wait_ready(self):
@@ -178,13 +218,48 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
+            self._tracking_message_queues[trading_pair] = self._create_tracking_message_queue(trading_pair)
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
                                f"{index + 1}/{len(self._trading_pairs)} completed.")
             await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    def _create_tracking_message_queue(self, trading_pair: str) -> asyncio.Queue:
+        return ConflatingOrderBookMessageQueue(
+            maxsize=self.TRACKING_QUEUE_MAX_SIZE,
+            overflow_callback=lambda _: self._request_order_book_resync(trading_pair),
+        )
+
+    def _request_order_book_resync(self, trading_pair: str):
+        """
+        Requests a new snapshot for the order book, because some of its diff messages had to be discarded.
+        The snapshot conflates the diffs still waiting in the order book queue.
+        """
+        if trading_pair not in self._order_books:
+            return
+        resync_task = self._resync_tasks.get(trading_pair)
+        if resync_task is None or resync_task.done():
+            self.logger().warning(f"The {trading_pair} order book is falling behind. Resynchronizing it.")
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    def _request_all_order_books_resync(self):
+        for trading_pair in self._trading_pairs:
+            self._request_order_book_resync(trading_pair)
+
+    async def _resync_order_book(self, trading_pair: str):
+        try:
+            snapshot_message: OrderBookMessage = await self._data_source._order_book_snapshot(trading_pair=trading_pair)
+            self._order_book_snapshot_stream.put_nowait(snapshot_message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Unexpected error requesting a new order book snapshot for {trading_pair}.",
+                exc_info=True,
+                app_warning_msg=f"Could not resynchronize the {trading_pair} order book.",
+            )
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -272,7 +347,10 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
+                    apply_start_ns = self._latency_tracer.now() if self._latency_tracer.enabled else None
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if apply_start_ns is not None:
+                        self._record_book_apply_latency(trading_pair, message, apply_start_ns)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -285,6 +363,8 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                if message.timestamp is not None:
+                    self._last_applied_message_timestamps[trading_pair] = message.timestamp
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +375,20 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _record_book_apply_latency(self, trading_pair: str, message: OrderBookMessage, apply_start_ns: int):
+        source = type(self._data_source).__name__
+        self._latency_tracer.record_since(
+            stage=LatencyStage.BOOK_APPLY, start_ns=apply_start_ns, connector=source, trading_pair=trading_pair
+        )
+        if message.timestamp is not None:
+            # The exchange timestamp is only comparable with the wall clock
+            self._latency_tracer.record(
+                stage=LatencyStage.EXCHANGE_TO_BOOK_APPLY,
+                duration_ns=int((time.time() - message.timestamp) * 1e9),
+                connector=source,
+                trading_pair=trading_pair,
+            )
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -302,25 +396,34 @@ class OrderBookTracker:
         await self._order_books_initialized.wait()
         while True:
             try:
-                trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
-                trading_pair: str = trade_message.trading_pair
-
-                if trading_pair not in self._order_books:
-                    messages_rejected += 1
-                    continue
-
-                order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    trade_id=trade_message.trade_id,
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
-
-                messages_accepted += 1
+                trade_messages: List[OrderBookMessage] = [await self._order_book_trade_stream.get()]
+                # The trades already queued are delivered to the listeners of each order book as a batch
+                while len(trade_messages) < self.TRADE_EVENTS_BATCH_SIZE and not self._order_book_trade_stream.empty():
+                    trade_messages.append(self._order_book_trade_stream.get_nowait())
+
+                trade_events: Dict[str, List[OrderBookTradeEvent]] = {}
+                for trade_message in trade_messages:
+                    trading_pair: str = trade_message.trading_pair
+                    if trading_pair not in self._order_books:
+                        messages_rejected += 1
+                        continue
+                    trade_events.setdefault(trading_pair, []).append(OrderBookTradeEvent(
+                        trading_pair=trade_message.trading_pair,
+                        timestamp=trade_message.timestamp,
+                        price=float(trade_message.content["price"]),
+                        amount=float(trade_message.content["amount"]),
+                        trade_id=trade_message.trade_id,
+                        type=TradeType.SELL if
+                        trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+                    ))
+                    messages_accepted += 1
+
+                for trading_pair, events in trade_events.items():
+                    order_book: OrderBook = self._order_books[trading_pair]
+                    if len(events) == 1:
+                        order_book.apply_trade(events[0])
+                    else:
+                        order_book.apply_trades(events)
 
                 # Log some statistics.
                 now: float = time.time()
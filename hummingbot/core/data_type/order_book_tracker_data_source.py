@@ -2,17 +2,35 @@ import asyncio
 import logging
 import time
 from abc import ABCMeta, abstractmethod
-from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message_queue import BoundedMessageQueue
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
+class MessageQueues(dict):
+    """
+    A dictionary of message queues that creates the queue for a key the first time the key is accessed
+    (like a `defaultdict`, but passing the key to the queue factory).
+    """
+
+    def __init__(self, queue_factory: Callable[[str], asyncio.Queue]):
+        super().__init__()
+        self._queue_factory = queue_factory
+
+    def __missing__(self, key: str) -> asyncio.Queue:
+        queue = self._queue_factory(key)
+        self[key] = queue
+        return queue
+
+
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    MESSAGE_QUEUE_MAX_SIZE = 10000
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -23,7 +41,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
-        self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._order_book_resync_function: Callable[[], None] = lambda: None
+        self._message_queue: Dict[str, asyncio.Queue] = MessageQueues(queue_factory=self._create_message_queue)
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,6 +58,29 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def order_book_resync_function(self) -> Callable[[], None]:
+        """
+        Function called when order book diff events had to be discarded because the processing fell behind,
+        and the order books have to be resynchronized with a new snapshot
+        """
+        return self._order_book_resync_function
+
+    @order_book_resync_function.setter
+    def order_book_resync_function(self, func: Callable[[], None]):
+        self._order_book_resync_function = func
+
+    @property
+    def dropped_messages_count(self) -> Dict[str, int]:
+        """
+        Returns the number of websocket events discarded by each message queue because the queue was full
+        """
+        return {
+            key: queue.dropped_messages_count
+            for key, queue in self._message_queue.items()
+            if isinstance(queue, BoundedMessageQueue)
+        }
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -237,11 +279,33 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
                 valid_channels = self._get_messages_queue_keys()
                 if channel in valid_channels:
                     self._message_queue[channel].put_nowait(data)
+                    if ws_response.received_ns is not None:
+                        LatencyTracer.get_instance().record_since(
+                            stage=LatencyStage.WS_RECEIVE_TO_QUEUE,
+                            start_ns=ws_response.received_ns,
+                            connector=type(self).__name__,
+                        )
                 else:
                     await self._process_message_for_unknown_channel(
                         event_message=data, websocket_assistant=websocket_assistant
                     )
 
+    def _create_message_queue(self, key: str) -> asyncio.Queue:
+        return BoundedMessageQueue(
+            maxsize=self.MESSAGE_QUEUE_MAX_SIZE,
+            overflow_callback=lambda _: self._on_message_queue_overflow(key=key),
+        )
+
+    def _on_message_queue_overflow(self, key: str):
+        """
+        Called every time a websocket event is discarded because its queue is full.
+        Discarding diff events leaves gaps in the order books, so a resync is requested in that case.
+
+        :param key: the key of the queue that overflowed
+        """
+        if key == self._diff_messages_queue_key:
+            self._order_book_resync_function()
+
     def _get_messages_queue_keys(self) -> List[str]:
         return [self._snapshot_messages_queue_key, self._diff_messages_queue_key, self._trade_messages_queue_key]
 
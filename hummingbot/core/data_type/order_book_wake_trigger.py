@@ -0,0 +1,70 @@
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class OrderBookWakeTrigger(EventListener):
+    """
+    Calls `wake_function` when one of the watched order books is updated, to wake up an event driven component
+    (e.g. `Clock.wake_iterator` or `RunnableBase.wake`) instead of waiting for its next scheduled tick.
+
+    If `top_of_book_threshold` is set, only the updates that move the best bid or the best ask by more than that
+    relative amount (e.g. 0.0001 for 1 bps) since the last wake up trigger it.
+
+    The order books only keep weak references to their listeners, so the trigger must be kept alive by its owner.
+    """
+
+    def __init__(self, wake_function: Callable[[], None], top_of_book_threshold: Optional[float] = None):
+        super().__init__()
+        self._wake_function = wake_function
+        self._top_of_book_threshold = top_of_book_threshold
+        self._watched_order_books: List[OrderBook] = []
+        self._last_top_of_book: Dict[int, Tuple[float, float]] = {}
+
+    @property
+    def watched_order_books(self) -> List[OrderBook]:
+        return self._watched_order_books
+
+    def watch(self, order_book: OrderBook):
+        if order_book not in self._watched_order_books:
+            order_book.add_listener(OrderBookEvent.OrderBookUpdateEvent, self)
+            self._watched_order_books.append(order_book)
+
+    def unwatch_all(self):
+        for order_book in self._watched_order_books:
+            order_book.remove_listener(OrderBookEvent.OrderBookUpdateEvent, self)
+        self._watched_order_books.clear()
+        self._last_top_of_book.clear()
+
+    def __call__(self, order_book: OrderBook):
+        if self._top_of_book_threshold is None or self._top_of_book_moved(order_book):
+            self._wake_function()
+
+    def _top_of_book_moved(self, order_book: OrderBook) -> bool:
+        top_of_book = (self._best_price(order_book, False), self._best_price(order_book, True))
+        last_top_of_book = self._last_top_of_book.get(id(order_book))
+        moved = last_top_of_book is None or any(
+            self._relative_change(last_price, price) > self._top_of_book_threshold
+            for last_price, price in zip(last_top_of_book, top_of_book)
+        )
+        if moved:
+            self._last_top_of_book[id(order_book)] = top_of_book
+        return moved
+
+    @staticmethod
+    def _best_price(order_book: OrderBook, is_buy: bool) -> float:
+        try:
+            return order_book.get_price(is_buy)
+        except EnvironmentError:  # empty side of the book
+            return math.nan
+
+    @staticmethod
+    def _relative_change(last_price: float, price: float) -> float:
+        if math.isnan(last_price) and math.isnan(price):
+            return 0.0
+        if math.isnan(last_price) or math.isnan(price) or last_price == 0:
+            return math.inf
+        return abs(price - last_price) / last_price
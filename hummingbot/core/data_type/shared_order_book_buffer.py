@@ -0,0 +1,248 @@
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class SharedOrderBookState(NamedTuple):
+    update_id: int
+    timestamp: float
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+class SharedOrderBookBuffer:
+    """
+    Stores the top levels of several order books, and a ring buffer of the latest public trades of each of them, in a
+    shared memory segment. It allows one process (the writer) to publish order books that other processes read
+    without any serialization.
+
+    There must be a single writer. Each order book is protected by a sequence lock: the writer makes the sequence
+    number odd while it updates the book and even when it is done, and readers retry when the sequence number is odd
+    or changed while they were copying the data. The writes count of the global header, and the sequence number and
+    trades count of each book, allow readers to skip the books that did not change since they last read them.
+
+    Segment layout:
+        - global header (float64): [heartbeat, writes count]
+        - per trading pair (float64): header [sequence, update_id, timestamp, bids count, asks count, trades count],
+          bids (depth x [price, amount, update_id]), asks (depth x [price, amount, update_id])
+          and trades (trades_capacity x [timestamp, price, amount, trade type])
+        - trade ids (trading pairs x trades_capacity x TRADE_ID_SIZE bytes), stored as UTF-8 strings because the
+          exchanges use non-numeric ids and integers that don't fit in a float64. Longer ids are read back as None.
+    """
+
+    GLOBAL_HEADER_SIZE = 2
+    BOOK_HEADER_SIZE = 6
+    LEVEL_FIELDS = 3
+    TRADE_FIELDS = 4
+    TRADE_ID_SIZE = 64
+    MAX_READ_ATTEMPTS = 100
+
+    _HEARTBEAT = 0
+    _WRITES_COUNT = 1
+
+    _SEQUENCE = 0
+    _UPDATE_ID = 1
+    _TIMESTAMP = 2
+    _BIDS_COUNT = 3
+    _ASKS_COUNT = 4
+    _TRADES_COUNT = 5
+
+    def __init__(
+        self,
+        trading_pairs: List[str],
+        depth: int = 20,
+        trades_capacity: int = 100,
+        name: Optional[str] = None,
+        create: bool = True,
+    ):
+        self._trading_pairs = list(trading_pairs)
+        self._depth = depth
+        self._trades_capacity = trades_capacity
+        self._book_size = (
+            self.BOOK_HEADER_SIZE + 2 * depth * self.LEVEL_FIELDS + trades_capacity * self.TRADE_FIELDS
+        )
+        data_size = self.GLOBAL_HEADER_SIZE + len(self._trading_pairs) * self._book_size
+        data_bytes = data_size * np.dtype(np.float64).itemsize
+        trade_ids_bytes = len(self._trading_pairs) * trades_capacity * self.TRADE_ID_SIZE
+        self._shared_memory = shared_memory.SharedMemory(
+            name=name, create=create, size=data_bytes + trade_ids_bytes)
+        self._data = np.ndarray(shape=(data_size,), dtype=np.float64, buffer=self._shared_memory.buf)
+        self._trade_ids = np.ndarray(
+            shape=(len(self._trading_pairs), trades_capacity),
+            dtype=f"S{self.TRADE_ID_SIZE}",
+            buffer=self._shared_memory.buf,
+            offset=data_bytes,
+        )
+        if create:
+            self._data[:] = 0
+            self._trade_ids[:] = b""
+        self._book_indexes: Dict[str, int] = {
+            trading_pair: index for index, trading_pair in enumerate(self._trading_pairs)
+        }
+        self._book_offsets: Dict[str, int] = {
+            trading_pair: self.GLOBAL_HEADER_SIZE + index * self._book_size
+            for trading_pair, index in self._book_indexes.items()
+        }
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def trades_capacity(self) -> int:
+        return self._trades_capacity
+
+    @property
+    def heartbeat(self) -> float:
+        return float(self._data[self._HEARTBEAT])
+
+    @property
+    def writes_count(self) -> int:
+        """
+        Returns the number of books and trades written in the buffer
+        """
+        return int(self._data[self._WRITES_COUNT])
+
+    def beat(self, timestamp: Optional[float] = None):
+        self._data[self._HEARTBEAT] = timestamp if timestamp is not None else time.time()
+
+    def book_sequence(self, trading_pair: str) -> int:
+        """
+        Returns the sequence number of the book, that changes every time the book is written
+        """
+        return int(self._data[self._book_offsets[trading_pair] + self._SEQUENCE])
+
+    def trades_count(self, trading_pair: str) -> int:
+        return int(self._data[self._book_offsets[trading_pair] + self._TRADES_COUNT])
+
+    def write_book(self, trading_pair: str, update_id: int, timestamp: float, bids: np.ndarray, asks: np.ndarray):
+        """
+        Publishes the top levels of an order book. Levels beyond the buffer depth are ignored.
+
+        :param bids: array of [price, amount, update_id] rows, best bid first
+        :param asks: array of [price, amount, update_id] rows, best ask first
+        """
+        offset = self._book_offsets[trading_pair]
+        header = self._data[offset:offset + self.BOOK_HEADER_SIZE]
+        bids_count = min(len(bids), self._depth)
+        asks_count = min(len(asks), self._depth)
+
+        header[self._SEQUENCE] += 1
+        header[self._UPDATE_ID] = update_id
+        header[self._TIMESTAMP] = timestamp
+        header[self._BIDS_COUNT] = bids_count
+        header[self._ASKS_COUNT] = asks_count
+        if bids_count > 0:
+            self._bids_view(offset)[:bids_count] = bids[:bids_count]
+        if asks_count > 0:
+            self._asks_view(offset)[:asks_count] = asks[:asks_count]
+        header[self._SEQUENCE] += 1
+        self._data[self._WRITES_COUNT] += 1
+
+    def read_book(self, trading_pair: str) -> Optional[SharedOrderBookState]:
+        """
+        Returns a consistent copy of the published order book, or None if it was never published or the writer kept
+        updating it during all read attempts.
+        """
+        offset = self._book_offsets[trading_pair]
+        header = self._data[offset:offset + self.BOOK_HEADER_SIZE]
+        for _ in range(self.MAX_READ_ATTEMPTS):
+            sequence = header[self._SEQUENCE]
+            if sequence == 0:
+                return None
+            if sequence % 2 == 1:
+                continue
+            update_id = int(header[self._UPDATE_ID])
+            timestamp = float(header[self._TIMESTAMP])
+            bids = self._bids_view(offset)[:int(header[self._BIDS_COUNT])].copy()
+            asks = self._asks_view(offset)[:int(header[self._ASKS_COUNT])].copy()
+            if header[self._SEQUENCE] == sequence:
+                return SharedOrderBookState(update_id=update_id, timestamp=timestamp, bids=bids, asks=asks)
+        return None
+
+    def end_interrupted_writes(self) -> List[str]:
+        """
+        Makes even the sequence numbers left odd by a writer stopped in the middle of a book write, so that a new
+        writer can use the buffer. The levels of those books may be inconsistent until they are written again.
+
+        :return: the trading pairs of the books whose write was interrupted
+        """
+        interrupted_trading_pairs = []
+        for trading_pair, offset in self._book_offsets.items():
+            if self._data[offset + self._SEQUENCE] % 2 == 1:
+                self._data[offset + self._SEQUENCE] += 1
+                interrupted_trading_pairs.append(trading_pair)
+        return interrupted_trading_pairs
+
+    def write_trade(self, trade: OrderBookTradeEvent):
+        offset = self._book_offsets[trade.trading_pair]
+        header = self._data[offset:offset + self.BOOK_HEADER_SIZE]
+        trades_count = int(header[self._TRADES_COUNT])
+        position = trades_count % self._trades_capacity
+        trade_id = str(trade.trade_id).encode() if trade.trade_id is not None else b""
+        self._trades_view(offset)[position] = (
+            trade.timestamp, float(trade.price), float(trade.amount), float(trade.type.value)
+        )
+        self._trade_ids[self._book_indexes[trade.trading_pair], position] = (
+            trade_id if len(trade_id) <= self.TRADE_ID_SIZE else b""
+        )
+        header[self._TRADES_COUNT] = trades_count + 1
+        self._data[self._WRITES_COUNT] += 1
+
+    def read_trades(self, trading_pair: str, since_count: int) -> Tuple[int, List[OrderBookTradeEvent]]:
+        """
+        Returns the trades published after the first `since_count` trades of the trading pair, and the new count.
+        If more than `trades_capacity` trades were published since then, only the latest ones are returned.
+        """
+        offset = self._book_offsets[trading_pair]
+        trades_count = int(self._data[offset + self._TRADES_COUNT])
+        first_count = max(since_count, trades_count - self._trades_capacity)
+        trades_view = self._trades_view(offset)
+        trade_ids = self._trade_ids[self._book_indexes[trading_pair]]
+        trades = []
+        for count in range(first_count, trades_count):
+            timestamp, price, amount, trade_type = trades_view[count % self._trades_capacity]
+            trade_id = trade_ids[count % self._trades_capacity]
+            trades.append(OrderBookTradeEvent(
+                trading_pair=trading_pair,
+                timestamp=float(timestamp),
+                type=TradeType(int(trade_type)),
+                price=float(price),
+                amount=float(amount),
+                trade_id=trade_id.decode() if trade_id else None,
+            ))
+        return trades_count, trades
+
+    def close(self):
+        self._data = None
+        self._trade_ids = None
+        self._shared_memory.close()
+
+    def unlink(self):
+        self._shared_memory.unlink()
+
+    def _bids_view(self, offset: int) -> np.ndarray:
+        start = offset + self.BOOK_HEADER_SIZE
+        return self._data[start:start + self._depth * self.LEVEL_FIELDS].reshape(self._depth, self.LEVEL_FIELDS)
+
+    def _asks_view(self, offset: int) -> np.ndarray:
+        start = offset + self.BOOK_HEADER_SIZE + self._depth * self.LEVEL_FIELDS
+        return self._data[start:start + self._depth * self.LEVEL_FIELDS].reshape(self._depth, self.LEVEL_FIELDS)
+
+    def _trades_view(self, offset: int) -> np.ndarray:
+        start = offset + self.BOOK_HEADER_SIZE + 2 * self._depth * self.LEVEL_FIELDS
+        return self._data[start:start + self._trades_capacity * self.TRADE_FIELDS].reshape(
+            self._trades_capacity, self.TRADE_FIELDS)
@@ -12,6 +12,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -65,6 +66,7 @@ class GatewayHttpClient:
         if GatewayHttpClient.__instance is None:
             self._base_url = f"https://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        self._quote_cache = GatewayQuoteCache(chain_ttls=client_config_map.gateway.gateway_quote_ttls)
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -84,7 +86,9 @@ class GatewayHttpClient:
             ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
                                     keyfile=f"{cert_path}/client_key.pem",
                                     password=Security.secrets_manager.password.get_secret_value())
-            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx)
+            pool_config = client_config_map.connection_pool.build_pool_config(
+                "gateway", client_config_map.gateway.gateway_api_host)
+            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx, **pool_config.connector_kwargs())
             cls._shared_client = aiohttp.ClientSession(connector=conn)
         return cls._shared_client
 
@@ -104,6 +108,10 @@ class GatewayHttpClient:
     def base_url(self, url: str):
         self._base_url = url
 
+    @property
+    def quote_cache(self) -> GatewayQuoteCache:
+        return self._quote_cache
+
     def log_error_codes(self, resp: Dict[str, Any]):
         """
         If the API returns an error code, interpret the code, log a useful
@@ -330,7 +338,15 @@ class GatewayHttpClient:
         if chain is not None and network is not None:
             req_data["chain"] = chain
             req_data["network"] = network
-        return await self.api_request("get", "chain/status", req_data, fail_silently=fail_silently)
+        response = await self.api_request("get", "chain/status", req_data, fail_silently=fail_silently)
+        for status in (response if isinstance(response, list) else [response]):
+            if isinstance(status, dict) and status.get("currentBlockNumber") is not None:
+                self._quote_cache.update_block_number(
+                    chain=status.get("chain", chain),
+                    network=status.get("network", network),
+                    block_number=int(status["currentBlockNumber"]),
+                )
+        return response
 
     async def approve_token(
             self,
@@ -409,11 +425,17 @@ class GatewayHttpClient:
             request_payload["poolId"] = pool_id
 
         # XXX(martin_kou): The amount is always output with 18 decimal places.
-        return await self.api_request(
-            "post",
-            "amm/price",
-            request_payload,
-            fail_silently=fail_silently,
+        # Identical quotes requested concurrently or within the same block share a single gateway call
+        return await self._quote_cache.get(
+            chain=chain,
+            network=network,
+            key=(fail_silently, *sorted(request_payload.items())),
+            fetch=lambda: self.api_request(
+                "post",
+                "amm/price",
+                request_payload,
+                fail_silently=fail_silently,
+            ),
         )
 
     async def get_transaction_status(
@@ -0,0 +1,155 @@
+import asyncio
+import copy
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class QuoteCacheStats:
+    """
+    Counters of the quote requests served by a `GatewayQuoteCache`
+    """
+    __slots__ = ("hits", "coalesced", "misses")
+
+    def __init__(self):
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.coalesced + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        The share of the requests that did not need their own call to the gateway (served from the cache, or
+        sharing a call already in progress)
+        """
+        return (self.hits + self.coalesced) / self.requests if self.requests > 0 else 0.0
+
+
+class GatewayQuoteCache:
+    """
+    Deduplicates the price quotes requested to the gateway.
+
+    Identical requests made while a call is in progress wait for the result of that call instead of sending their own
+    (single-flight). The call runs in its own task, so cancelling the request that started it doesn't cancel the other
+    ones. Successful results are then kept for a short time to live, configurable per chain, and until a new block is
+    reported for their chain and network, since the AMM pool reserves cannot change within a block. Every request
+    receives its own copy of the result.
+    """
+    DEFAULT_TTL = 1.0
+    MAX_ENTRIES = 1000
+    DEFAULT_CHAIN_TTLS: Dict[str, float] = {
+        "ethereum": 2.0,
+        "avalanche": 1.0,
+        "polygon": 1.0,
+        "binance-smart-chain": 1.0,
+        "cronos": 2.0,
+        "harmony": 1.0,
+        "near": 0.5,
+        "algorand": 1.5,
+        "tezos": 2.0,
+        "telos": 0.5,
+        "xdc": 1.0,
+    }
+
+    def __init__(
+        self,
+        chain_ttls: Optional[Dict[str, float]] = None,
+        time_function: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param chain_ttls: the time to live in seconds of the quotes by chain, replacing the default ones
+        :param time_function: the monotonic clock used to expire the quotes
+        """
+        self._time_function = time_function
+        self._chain_ttls: Dict[str, float] = {**self.DEFAULT_CHAIN_TTLS, **(chain_ttls or {})}
+        # key -> (chain, network, block number at recording time, expiration time, result), oldest first
+        self._entries: Dict[Hashable, Tuple[str, str, Optional[int], float, Any]] = {}
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._block_numbers: Dict[Tuple[str, str], int] = {}
+        self._stats: Dict[str, QuoteCacheStats] = {}
+
+    @property
+    def stats(self) -> Dict[str, QuoteCacheStats]:
+        """
+        The quote requests counters by chain
+        """
+        return self._stats
+
+    def ttl(self, chain: str) -> float:
+        return self._chain_ttls.get(chain, self.DEFAULT_TTL)
+
+    def set_ttl(self, chain: str, ttl: float):
+        """
+        Sets how long (in seconds) the quotes of a chain are reused. A TTL of 0 disables caching for the chain, but
+        identical concurrent requests still share a single call.
+        """
+        self._chain_ttls[chain] = ttl
+
+    def update_block_number(self, chain: str, network: str, block_number: int):
+        """
+        Records the latest block of a chain network. The quotes obtained at previous blocks are discarded.
+        """
+        if block_number > self._block_numbers.get((chain, network), -1):
+            self._block_numbers[(chain, network)] = block_number
+            for key in [key for key, (entry_chain, entry_network, *_) in self._entries.items()
+                        if entry_chain == chain and entry_network == network]:
+                del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+    async def get(self, chain: str, network: str, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns a copy of the cached result for `key`, or of the result of the call already in progress for it, or
+        calls `fetch`. Empty results (failed requests with `fail_silently`) are not cached.
+        """
+        stats = self._stats.get(chain)
+        if stats is None:
+            stats = self._stats[chain] = QuoteCacheStats()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._time_function() < entry[3]:
+                stats.hits += 1
+                return copy.deepcopy(entry[4])
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            stats.coalesced += 1
+        else:
+            stats.misses += 1
+            task = asyncio.ensure_future(self._fetch(chain=chain, network=network, key=key, fetch=fetch))
+            # Retrieves the exception of the calls whose requests were all cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._in_flight[key] = task
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    async def _fetch(self, chain: str, network: str, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        block_number = self._block_numbers.get((chain, network))
+        try:
+            result = await fetch()
+        finally:
+            del self._in_flight[key]
+        ttl = self.ttl(chain)
+        if result and ttl > 0 and block_number == self._block_numbers.get((chain, network)):
+            self._add_entry(key, (chain, network, block_number, self._time_function() + ttl, result))
+        return result
+
+    def _add_entry(self, key: Hashable, entry: Tuple[str, str, Optional[int], float, Any]):
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.MAX_ENTRIES:
+            self._purge_expired_entries()
+        # The entries are in insertion order, the oldest ones are evicted when the cache is still full
+        while len(self._entries) >= self.MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = entry
+
+    def _purge_expired_entries(self):
+        now = self._time_function()
+        for key in [key for key, entry in self._entries.items() if entry[3] <= now]:
+            del self._entries[key]
@@ -1,27 +1,26 @@
 # distutils: language=c++
 
 from libc.stdint cimport int64_t
-from libcpp.unordered_map cimport unordered_map
-from libcpp.unordered_set cimport unordered_set
-from libcpp.utility cimport pair
-from hummingbot.core.PyRef cimport PyRef
 from hummingbot.core.event.event_listener cimport EventListener
 
-ctypedef unordered_set[PyRef] EventListenersCollection
-ctypedef unordered_set[PyRef].iterator EventListenersIterator
-ctypedef unordered_map[int64_t, EventListenersCollection] Events
-ctypedef unordered_map[int64_t, EventListenersCollection].iterator EventsIterator
-ctypedef pair[int64_t, EventListenersCollection] EventsPair
-
 
 cdef class PubSub:
     cdef:
-        Events _events
+        # Event tag -> {listener weakref: None}, in the order the listeners were added
+        dict _events
+        # Event tag -> tuple of the listener weakrefs, rebuilt when the listeners change
+        dict _event_listeners
+        # Event tag -> callback of the listener weakrefs, removing the dead listeners
+        dict _dead_listener_callbacks
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
-    cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef c_remove_dead_listener(self, int64_t event_tag, object listener_weakref)
+    cdef c_update_event_listeners(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
+    cdef inline bint c_has_listeners(self, int64_t event_tag):
+        return event_tag in self._event_listeners
     cdef c_trigger_event(self, int64_t event_tag, object arg)
+    cdef c_trigger_events(self, int64_t event_tag, list args)
@@ -1,21 +1,9 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/PyRef.cpp
-
-from cpython cimport(
-    PyObject,
-    PyWeakref_NewRef,
-    PyWeakref_GetObject
-)
-from cython.operator cimport(
-    postincrement as inc,
-    dereference as deref,
-    address
-)
-from libcpp.vector cimport vector
+
 from enum import Enum
 import logging
-import random
 from typing import List
+import weakref
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
@@ -24,26 +12,34 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class DeadListenerCallback:
+    """
+    Weakref callback removing a dead listener from its event. It keeps a weak reference to the PubSub, so that the
+    listeners don't keep their PubSub alive.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    cdef:
+        object _pubsub_ref
+        int64_t _event_tag
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, PubSub pubsub, int64_t event_tag):
+        self._pubsub_ref = weakref.ref(pubsub)
+        self._event_tag = event_tag
 
-    Here's how the dead listener GC is performed:
+    def __call__(self, listener_weakref):
+        pubsub = self._pubsub_ref()
+        if pubsub is not None:
+            (<PubSub>pubsub).c_remove_dead_listener(self._event_tag, listener_weakref)
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem by removing the dead listeners when they are
+    garbage collected, with a callback of their weak references.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    The listeners of each event are kept in a tuple that is rebuilt only when a listener is added or removed, so
+    triggering an event doesn't copy the listeners or scan them for dead ones. Listeners added or removed while an
+    event is being triggered take effect from the next trigger.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,8 +48,13 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        self._events = {}
+        self._event_listeners = {}
+        self._dead_listener_callbacks = {}
+
     def __init__(self):
-        self._events = Events()
+        pass
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -67,99 +68,69 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def trigger_events(self, event_tag: Enum, messages: List[any]):
+        """
+        Triggers a batch of events of the same type. Each listener receives all the messages of the batch, in order,
+        before the next listener.
+        """
+        self.c_trigger_events(event_tag.value, list(messages))
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+            dict listeners = self._events.get(event_tag)
+            object callback = self._dead_listener_callbacks.get(event_tag)
+        if listeners is None:
+            listeners = self._events[event_tag] = {}
+        if callback is None:
+            callback = self._dead_listener_callbacks[event_tag] = DeadListenerCallback(self, event_tag)
+        listener_weakref = weakref.ref(listener, callback)
+        if listener_weakref not in listeners:
+            listeners[listener_weakref] = None
+            self.c_update_event_listeners(event_tag)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
-        cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
+        cdef dict listeners = self._events.get(event_tag)
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+        if listeners.pop(weakref.ref(listener), self) is not self:
+            self.c_update_event_listeners(event_tag)
 
-    cdef c_remove_dead_listeners(self, int64_t event_tag):
-        cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
+    cdef c_remove_dead_listener(self, int64_t event_tag, object listener_weakref):
+        cdef dict listeners = self._events.get(event_tag)
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+        if listeners.pop(listener_weakref, self) is not self:
+            self.c_update_event_listeners(event_tag)
+
+    cdef c_update_event_listeners(self, int64_t event_tag):
+        cdef dict listeners = self._events[event_tag]
+        if len(listeners) == 0:
+            del self._events[event_tag]
+            self._event_listeners.pop(event_tag, None)
+        else:
+            self._event_listeners[event_tag] = tuple(listeners)
 
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
-        cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
-        if it == self._events.end():
+        cdef tuple listeners = self._event_listeners.get(event_tag)
+        if listeners is None:
             return []
-
-        retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
-        return retval
+        return [listener for listener in (listener_weakref() for listener_weakref in listeners)
+                if listener is not None]
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple listeners = self._event_listeners.get(event_tag)
             EventListener typed_listener
-        if it == self._events.end():
+        if listeners is None:
             return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        for listener_weakref in listeners:
+            listener = listener_weakref()
+            if listener is None:
+                continue
+            typed_listener = <EventListener>listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +138,24 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+    cdef c_trigger_events(self, int64_t event_tag, list args):
+        cdef:
+            tuple listeners = self._event_listeners.get(event_tag)
+            EventListener typed_listener
+        if listeners is None:
+            return
+        for listener_weakref in listeners:
+            listener = listener_weakref()
+            if listener is None:
+                continue
+            typed_listener = <EventListener>listener
+            for arg in args:
+                try:
+                    typed_listener.c_set_event_info(event_tag, self)
+                    typed_listener.c_call(arg)
+                except Exception:
+                    self.c_log_exception(event_tag, arg)
+                finally:
+                    # The listeners must not keep a reference to the PubSub between events
+                    typed_listener.c_set_event_info(0, None)
@@ -0,0 +1,180 @@
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class LatencyStage:
+    WS_RECEIVE_TO_QUEUE = "ws_receive_to_queue"
+    EXCHANGE_TO_BOOK_APPLY = "exchange_to_book_apply"
+    BOOK_APPLY = "book_apply"
+    CLOCK_TICK = "clock_tick"
+    ORDER_CREATE_TO_PLACED = "order_create_to_placed"
+    ORDER_CREATE_TO_FIRST_UPDATE = "order_create_to_first_update"
+    SIGNING = "signing"
+    ORDER_SUBMIT_TO_VALIDATED = "order_submit_to_validated"
+
+
+class LatencyHistogram:
+    """
+    A histogram of durations in nanoseconds with log-linear buckets (in the style of HDR histograms).
+
+    Values are grouped by powers of two, and each power of two is split in `2 ** sub_bucket_bits` linear sub-buckets,
+    so the relative error of the reported percentiles is bounded (around 3% with the default 5 bits) whatever the
+    magnitude of the values, and recording a value is O(1).
+    """
+
+    def __init__(self, sub_bucket_bits: int = 5, max_value_bits: int = 48):
+        self._sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._counts: List[int] = [0] * (2 * self._sub_bucket_count + max_value_bits * self._sub_bucket_count)
+        self._max_index = len(self._counts) - 1
+        self._total_count = 0
+        self._total_sum = 0
+        self._min_value: Optional[int] = None
+        self._max_value: Optional[int] = None
+
+    @property
+    def count(self) -> int:
+        return self._total_count
+
+    @property
+    def min(self) -> int:
+        return self._min_value or 0
+
+    @property
+    def max(self) -> int:
+        return self._max_value or 0
+
+    @property
+    def mean(self) -> float:
+        return self._total_sum / self._total_count if self._total_count > 0 else 0.0
+
+    def record(self, value: int):
+        value = max(0, int(value))
+        self._counts[min(self._index_for(value), self._max_index)] += 1
+        self._total_count += 1
+        self._total_sum += value
+        if self._min_value is None or value < self._min_value:
+            self._min_value = value
+        if self._max_value is None or value > self._max_value:
+            self._max_value = value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Returns the (upper bound of the bucket of the) value below which `percentile` percent of the values fall
+        """
+        if self._total_count == 0:
+            return 0
+        target = max(1, math.ceil(self._total_count * percentile / 100))
+        accumulated = 0
+        for index, count in enumerate(self._counts):
+            accumulated += count
+            if accumulated >= target:
+                return min(self._highest_value_for(index), self.max)
+        return self.max
+
+    def _index_for(self, value: int) -> int:
+        if value < 2 * self._sub_bucket_count:
+            return value
+        exponent = value.bit_length() - self._sub_bucket_bits - 1
+        return self._sub_bucket_count * exponent + (value >> exponent)
+
+    def _highest_value_for(self, index: int) -> int:
+        if index < 2 * self._sub_bucket_count:
+            return index
+        exponent = index // self._sub_bucket_count - 1
+        sub_bucket = index - self._sub_bucket_count * exponent
+        return ((sub_bucket + 1) << exponent) - 1
+
+
+class LatencyTracer:
+    """
+    Collects latency measurements of the market data and order paths, aggregated in histograms by stage, connector
+    and trading pair.
+
+    Tracing is disabled by default. Instrumented code checks `enabled` before taking any timestamp, so the overhead
+    is a single attribute lookup when tracing is off. All timestamps come from the monotonic `time.perf_counter_ns`
+    clock, except for the latency between the exchange and the bot, which can only be measured with the wall clock.
+    """
+    MAX_OPEN_SPANS = 10000
+
+    _shared_instance: Optional["LatencyTracer"] = None
+
+    @classmethod
+    def get_instance(cls) -> "LatencyTracer":
+        if cls._shared_instance is None:
+            cls._shared_instance = LatencyTracer()
+        return cls._shared_instance
+
+    def __init__(self):
+        self.enabled: bool = False
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._open_spans: OrderedDict[str, int] = OrderedDict()
+
+    @staticmethod
+    def now() -> int:
+        return time.perf_counter_ns()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        self._open_spans.clear()
+
+    def reset(self):
+        self._histograms.clear()
+        self._open_spans.clear()
+
+    def record(self, stage: str, duration_ns: int, connector: str = "", trading_pair: str = ""):
+        key = (stage, connector, trading_pair)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram()
+        histogram.record(duration_ns)
+
+    def record_since(self, stage: str, start_ns: int, connector: str = "", trading_pair: str = ""):
+        self.record(stage=stage, duration_ns=self.now() - start_ns, connector=connector, trading_pair=trading_pair)
+
+    def start_span(self, span_id: str):
+        """
+        Registers the start time of an operation that finishes in a different part of the code (e.g. an order that
+        is created and then acknowledged by the exchange). The oldest spans are discarded if they are never finished.
+        """
+        self._open_spans[span_id] = self.now()
+        if len(self._open_spans) > self.MAX_OPEN_SPANS:
+            self._open_spans.popitem(last=False)
+
+    def record_span(self, span_id: str, stage: str, connector: str = "", trading_pair: str = "", finish: bool = False):
+        """
+        Records the time elapsed since the span was started. Does nothing if the span is unknown.
+
+        :param finish: if True the span is discarded after recording it
+        """
+        start_ns = self._open_spans.pop(span_id, None) if finish else self._open_spans.get(span_id)
+        if start_ns is not None:
+            self.record_since(stage=stage, start_ns=start_ns, connector=connector, trading_pair=trading_pair)
+
+    def histogram(self, stage: str, connector: str = "", trading_pair: str = "") -> Optional[LatencyHistogram]:
+        return self._histograms.get((stage, connector, trading_pair))
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Returns one entry per stage, connector and trading pair with the count and the latency percentiles in
+        milliseconds
+        """
+        rows = []
+        for (stage, connector, trading_pair), histogram in sorted(self._histograms.items()):
+            rows.append({
+                "stage": stage,
+                "connector": connector,
+                "trading_pair": trading_pair,
+                "count": histogram.count,
+                "mean_ms": histogram.mean / 1e6,
+                "p50_ms": histogram.percentile(50) / 1e6,
+                "p90_ms": histogram.percentile(90) / 1e6,
+                "p99_ms": histogram.percentile(99) / 1e6,
+                "max_ms": histogram.max / 1e6,
+            })
+        return rows
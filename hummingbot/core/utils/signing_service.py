@@ -0,0 +1,106 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
+
+SigningCall = Tuple[Callable[..., Any], Sequence[Any]]
+
+
+class SigningService:
+    """
+    Runs the CPU bound signing functions of the connectors (EIP-712 or secp256k1 signatures, transaction signing) in a
+    pool of worker threads, so that a burst of orders does not block the event loop. The payloads of a burst can be
+    signed together with `sign_batch`, as a single job of the pool.
+
+    The signing functions are usually bound methods of the connectors' auth classes, which keep their wallet or
+    private key objects created once and shared by all the workers. The time spent signing each payload is reported
+    to the `LatencyTracer` under the `signing` stage when tracing is enabled.
+    """
+    DEFAULT_MAX_WORKERS = 4
+
+    _shared_instance: Optional["SigningService"] = None
+
+    @classmethod
+    def get_instance(cls) -> "SigningService":
+        if cls._shared_instance is None:
+            cls._shared_instance = SigningService()
+        return cls._shared_instance
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._signatures_count = 0
+
+    @property
+    def signatures_count(self) -> int:
+        return self._signatures_count
+
+    async def sign(self, function: Callable[..., Any], *args, connector: str = "") -> Any:
+        """
+        Runs `function(*args)` in the worker pool and returns its result
+
+        :param connector: the name of the connector, used to report the signing latency
+        """
+        loop = asyncio.get_running_loop()
+        result, duration = await loop.run_in_executor(self._get_executor(), self._run_call, function, args)
+        self._signatures_count += 1
+        latency_tracer = LatencyTracer.get_instance()
+        if latency_tracer.enabled:
+            latency_tracer.record(stage=LatencyStage.SIGNING, duration_ns=duration, connector=connector)
+        return result
+
+    async def sign_batch(
+            self, calls: List[SigningCall], connector: str = "", return_exceptions: bool = False) -> List[Any]:
+        """
+        Runs all the signing calls in a single job of the worker pool, and returns their results in the same order
+
+        :param calls: a list of (function, args) tuples
+        :param connector: the name of the connector, used to report the signing latency
+        :param return_exceptions: if True the errors of the calls are returned in place of their results, otherwise
+            the first error is raised and the other results are discarded
+        """
+        if len(calls) == 0:
+            return []
+        loop = asyncio.get_running_loop()
+        results, durations = await loop.run_in_executor(
+            self._get_executor(), self._run_calls, calls, return_exceptions)
+        self._signatures_count += len(calls)
+        latency_tracer = LatencyTracer.get_instance()
+        if latency_tracer.enabled:
+            for duration in durations:
+                latency_tracer.record(stage=LatencyStage.SIGNING, duration_ns=duration, connector=connector)
+        return results
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="signing")
+        return self._executor
+
+    @staticmethod
+    def _run_call(function: Callable[..., Any], args: Sequence[Any]) -> Tuple[Any, int]:
+        start = time.perf_counter_ns()
+        result = function(*args)
+        return result, time.perf_counter_ns() - start
+
+    @classmethod
+    def _run_calls(cls, calls: List[SigningCall], return_exceptions: bool) -> Tuple[List[Any], List[int]]:
+        results = []
+        durations = []
+        for function, args in calls:
+            try:
+                result, duration = cls._run_call(function, args)
+            except Exception as exception:
+                if not return_exceptions:
+                    raise
+                results.append(exception)
+                continue
+            results.append(result)
+            durations.append(duration)
+        return results, durations
@@ -10,6 +10,8 @@ class AuthBase(ABC):
     server that is required in the message signature, this class can be passed a `RESTConnection`
     object that it can use to that end.
     """
+    # Set to False when the requests are never modified in place, only replaced (see `RESTAssistant`)
+    modifies_requests_in_place: bool = True
 
     @abstractmethod
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
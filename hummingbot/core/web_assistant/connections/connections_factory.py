@@ -1,9 +1,12 @@
-from typing import Optional
+import logging
+from typing import Dict, Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig, ConnectionPoolStats
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.logger import HummingbotLogger
 
 
 class ConnectionsFactory:
@@ -12,21 +15,61 @@ class ConnectionsFactory:
     The purpose of the class is to isolate the general `web_assistant` infrastructure from the underlying library
     (in this case, `aiohttp`) to enable dependency change with minimal refactoring of the code.
 
+    The shared client session uses a connection pool configured by `ConnectionPoolConfig` (connection limits, keep-alive
+    and DNS caching). Hosts with settings of their own in `host_pool_configs` get a client session with a separate
+    pool, used by the REST connections for the requests to that host. Connection reuse and pool saturation are tracked
+    across all the pools and can be read with `pool_stats`.
+
     Note: One future possibility is to enable injection of a specific connection factory implementation in the
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_config: Optional[ConnectionPoolConfig] = None,
+        host_pool_configs: Optional[Dict[str, ConnectionPoolConfig]] = None,
+    ):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._host_clients: Dict[str, aiohttp.ClientSession] = {}
+        self._pool_config = pool_config or ConnectionPoolConfig()
+        self._host_pool_configs = host_pool_configs or {}
+        self._pool_stats = ConnectionPoolStats(limit=self._total_limit())
+
+    @property
+    def pool_config(self) -> ConnectionPoolConfig:
+        return self._pool_config
+
+    @property
+    def host_pool_configs(self) -> Dict[str, ConnectionPoolConfig]:
+        return self._host_pool_configs
+
+    def pool_stats(self) -> ConnectionPoolStats:
+        return ConnectionPoolStats(
+            connections_created=self._pool_stats.connections_created,
+            connections_reused=self._pool_stats.connections_reused,
+            requests_queued=self._pool_stats.requests_queued,
+            requests_in_flight=self._pool_stats.requests_in_flight,
+            limit=self._pool_stats.limit,
+        )
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(
+            aiohttp_client_session=shared_client,
+            host_client_sessions=await self._get_host_clients(),
+        )
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
@@ -34,6 +77,65 @@ class ConnectionsFactory:
         connection = WSConnection(aiohttp_client_session=shared_client)
         return connection
 
+    def set_pool_config(
+        self,
+        pool_config: ConnectionPoolConfig,
+        host_pool_configs: Optional[Dict[str, ConnectionPoolConfig]] = None,
+    ):
+        """
+        Sets the connection pool settings. They are applied when the client sessions are created.
+        """
+        if self._shared_client is not None or len(self._host_clients) > 0:
+            self.logger().warning("The connection pool settings are not applied to the client sessions already created.")
+        self._pool_config = pool_config
+        self._host_pool_configs = host_pool_configs or {}
+        self._pool_stats.limit = self._total_limit()
+
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        if self._shared_client is None:
+            self._shared_client = self._create_client(self._pool_config)
         return self._shared_client
+
+    async def _get_host_clients(self) -> Optional[Dict[str, aiohttp.ClientSession]]:
+        if len(self._host_pool_configs) == 0:
+            return None
+        for host, pool_config in self._host_pool_configs.items():
+            if host not in self._host_clients:
+                self._host_clients[host] = self._create_client(pool_config)
+        return self._host_clients
+
+    def _create_client(self, pool_config: ConnectionPoolConfig) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(**pool_config.connector_kwargs())
+        return aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config()])
+
+    def _total_limit(self) -> int:
+        limits = [self._pool_config.limit] + [config.limit for config in self._host_pool_configs.values()]
+        # a limit of 0 means the pool is not limited
+        return 0 if 0 in limits else sum(limits)
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        stats = self._pool_stats
+
+        async def on_request_start(session, context, params):
+            stats.requests_in_flight += 1
+
+        async def on_request_finished(session, context, params):
+            stats.requests_in_flight = max(0, stats.requests_in_flight - 1)
+
+        async def on_connection_queued_start(session, context, params):
+            stats.requests_queued += 1
+
+        async def on_connection_create_end(session, context, params):
+            stats.connections_created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            stats.connections_reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_finished)
+        trace_config.on_request_exception.append(on_request_finished)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
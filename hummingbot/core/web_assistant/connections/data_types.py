@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from copy import copy
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
 
 import aiohttp
 import ujson
@@ -24,6 +25,46 @@ class RESTMethod(Enum):
         return self.value
 
 
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    """Settings for the `aiohttp` connection pool shared by the connections of a `ConnectionsFactory`.
+
+    `TCP_NODELAY` is always enabled by `aiohttp` on its transports, so it is not configurable here.
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: Optional[int] = 300
+    use_dns_cache: bool = True
+
+    def connector_kwargs(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "ttl_dns_cache": self.ttl_dns_cache,
+            "use_dns_cache": self.use_dns_cache,
+        }
+
+
+@dataclass
+class ConnectionPoolStats:
+    connections_created: int = 0
+    connections_reused: int = 0
+    requests_queued: int = 0
+    requests_in_flight: int = 0
+    limit: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total > 0 else 0.0
+
+    @property
+    def saturation(self) -> float:
+        return min(1.0, self.requests_in_flight / self.limit) if self.limit > 0 else 0.0
+
+
 @dataclass
 class RESTRequest:
     method: RESTMethod
@@ -35,6 +76,16 @@ class RESTRequest:
     is_auth_required: bool = False
     throttler_limit_id: Optional[str] = None
 
+    def replace(self, **changes) -> "RESTRequest":
+        """Returns a shallow copy of the request with the given fields changed.
+
+        Unlike `dataclasses.replace`, the fields of the copy are not processed again by `__post_init__`.
+        """
+        request = copy(self)
+        for name, value in changes.items():
+            setattr(request, name, value)
+        return request
+
 
 @dataclass
 class EndpointRESTRequest(RESTRequest, ABC):
@@ -122,6 +173,13 @@ class WSRequest(ABC):
     async def send_with_connection(self, connection: "WSConnection"):
         return NotImplemented
 
+    def replace(self, **changes) -> "WSRequest":
+        """Returns a shallow copy of the request with the given fields changed."""
+        request = copy(self)
+        for name, value in changes.items():
+            setattr(request, name, value)
+        return request
+
 
 @dataclass
 class WSJSONRequest(WSRequest):
@@ -156,3 +214,5 @@ class WSBinaryRequest(WSRequest):
 @dataclass
 class WSResponse:
     data: Any
+    # perf_counter_ns timestamp of the reception of the message, only set when latency tracing is enabled
+    received_ns: Optional[int] = field(default=None, compare=False)
@@ -1,13 +1,29 @@
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
 import aiohttp
+
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
 
 
 class RESTConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(
+        self,
+        aiohttp_client_session: aiohttp.ClientSession,
+        host_client_sessions: Optional[Dict[str, aiohttp.ClientSession]] = None,
+    ):
+        """
+        :param aiohttp_client_session: the session of the requests
+        :param host_client_sessions: the sessions of the requests to the hosts with connection pools of their own
+        """
         self._client_session = aiohttp_client_session
+        self._host_client_sessions = host_client_sessions
 
     async def call(self, request: RESTRequest) -> RESTResponse:
-        aiohttp_resp = await self._client_session.request(
+        client_session = self._client_session
+        if self._host_client_sessions:
+            client_session = self._host_client_sessions.get(urlsplit(request.url).hostname, client_session)
+        aiohttp_resp = await client_session.request(
             method=request.method.value,
             url=request.url,
             params=request.params,
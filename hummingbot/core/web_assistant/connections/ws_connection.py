@@ -6,6 +6,7 @@ from typing import Any, Dict, Mapping, Optional
 import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
+from hummingbot.core.utils.latency_tracer import LatencyTracer
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 
 
@@ -62,11 +63,14 @@ class WSConnection:
     async def receive(self) -> Optional[WSResponse]:
         self._ensure_connected()
         response = None
+        latency_tracer = LatencyTracer.get_instance()
         while self._connected:
             msg = await self._read_message()
+            received_ns = latency_tracer.now() if latency_tracer.enabled else None
             msg = await self._process_message(msg)
             if msg is not None:
                 response = self._build_resp(msg)
+                response.received_ns = received_ns
                 break
         return response
 
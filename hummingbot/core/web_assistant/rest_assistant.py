@@ -1,7 +1,7 @@
 import json
 from asyncio import wait_for
-from copy import deepcopy
-from typing import Any, Dict, List, Optional, Union
+from copy import copy, deepcopy
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
@@ -10,6 +10,11 @@ from hummingbot.core.web_assistant.connections.rest_connection import RESTConnec
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
+_DEFAULT_HEADERS: Dict[RESTMethod, Dict[str, str]] = {
+    method: {"Content-Type": "application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded"}
+    for method in RESTMethod
+}
+
 
 class RESTAssistant:
     """A helper class to contain all REST-related logic.
@@ -17,6 +22,17 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    Requests passed to `call` are never modified. The pre-processors and authenticators declare with
+    `modifies_requests_in_place` whether they change the requests they get. The ones that set it to False must
+    return a modified copy of the request when they change something (with `RESTRequest.replace` or
+    `WSRequest.replace`), and never modify the request passed or its `headers`, `params`, `data` or `payload`; they
+    get the requests as they are. The request is only copied when one of the pre-processors, or the authenticator,
+    modifies the requests in place: the request and its `headers` are copied shallowly, and the `params` and `data`
+    (that can hold nested containers) are deep-copied.
+
+    The headers of the requests built by `execute_request` are kept as templates per endpoint (throttler limit id)
+    and method, that are reused while the headers passed for the endpoint don't change.
     """
     def __init__(
         self,
@@ -31,6 +47,9 @@ class RESTAssistant:
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._pre_processors_modify_requests = any(
+            pre_processor.modifies_requests_in_place for pre_processor in self._rest_pre_processors)
+        self._header_templates: Dict[Tuple[RESTMethod, str], Tuple[Optional[Dict[str, Any]], Dict[str, Any]]] = {}
 
     async def execute_request(
         self,
@@ -71,13 +90,6 @@ class RESTAssistant:
             headers: Optional[Dict[str, Any]] = None,
     ) -> RESTResponse:
 
-        headers = headers or {}
-
-        local_headers = {
-            "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
-
-        local_headers.update(headers)
-
         data = json.dumps(data) if data is not None else data
 
         request = RESTRequest(
@@ -85,12 +97,13 @@ class RESTAssistant:
             url=url,
             params=params,
             data=data,
-            headers=local_headers,
+            headers=self._headers_template(method, throttler_limit_id, headers),
             is_auth_required=is_auth_required,
             throttler_limit_id=throttler_limit_id
         )
 
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
+            # The params and the headers template are not owned by this call, the request is copied as in `call`
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
@@ -102,13 +115,45 @@ class RESTAssistant:
             return response
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
+        if self._pre_processors_modify_requests or (
+                request.is_auth_required and self._auth is not None and self._auth.modifies_requests_in_place):
+            request = self._copy_request(request)
+        return await self._call(request=request, timeout=timeout)
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
         resp = await self._post_process_response(resp)
         return resp
 
+    def _headers_template(
+            self, method: RESTMethod, throttler_limit_id: str, headers: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Returns the headers of the requests to the endpoint, the template must not be modified.
+        """
+        headers = headers or None
+        key = (method, throttler_limit_id)
+        template = self._header_templates.get(key)
+        if template is None or template[0] != headers:
+            local_headers = dict(_DEFAULT_HEADERS[method])
+            if headers:
+                local_headers.update(headers)
+            template = (dict(headers) if headers else None, local_headers)
+            self._header_templates[key] = template
+        return template[1]
+
+    @staticmethod
+    def _copy_request(request: RESTRequest) -> RESTRequest:
+        request = copy(request)
+        if request.headers is not None:
+            request.headers = dict(request.headers)
+        if request.params is not None:
+            request.params = deepcopy(request.params)
+        if isinstance(request.data, (dict, list)):
+            request.data = deepcopy(request.data)
+        return request
+
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
         for pre_processor in self._rest_pre_processors:
             request = await pre_processor.pre_process(request)
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import AsyncGenerator, Dict, List, Optional
 
 from hummingbot.core.web_assistant.auth import AuthBase
@@ -14,6 +14,10 @@ class WSAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `WSPreProcessorBase` and `WSPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    Requests passed to `send` are never modified. The assistant only copies the request (with a deep copy of its
+    payload) when one of the pre-processors, or the authenticator, modifies the requests in place (see the
+    `modifies_requests_in_place` contract described in `RESTAssistant`).
     """
 
     def __init__(
@@ -27,6 +31,8 @@ class WSAssistant:
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
+        self._pre_processors_modify_requests = any(
+            pre_processor.modifies_requests_in_place for pre_processor in self._ws_pre_processors)
 
     @property
     def last_recv_time(self) -> float:
@@ -57,7 +63,10 @@ class WSAssistant:
         await self.send(request)
 
     async def send(self, request: WSRequest):
-        request = deepcopy(request)
+        if self._pre_processors_modify_requests or (
+                getattr(request, "is_auth_required", False) and self._auth is not None and
+                self._auth.modifies_requests_in_place):
+            request = self._copy_request(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         await self._connection.send(request)
@@ -80,6 +89,14 @@ class WSAssistant:
             response = await self._post_process_response(response)
         return response
 
+    @staticmethod
+    def _copy_request(request: WSRequest) -> WSRequest:
+        request = copy(request)
+        payload = getattr(request, "payload", None)
+        if isinstance(payload, (dict, list)):
+            request.payload = deepcopy(payload)
+        return request
+
     async def _pre_process_request(self, request: WSRequest) -> WSRequest:
         for pre_processor in self._ws_pre_processors:
             request = await pre_processor.pre_process(request)
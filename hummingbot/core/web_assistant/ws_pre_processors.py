@@ -9,6 +9,8 @@ class WSPreProcessorBase(abc.ABC):
     The logic provided by a class implementing this interface is applied to a request
     before it is sent out to the server.
     """
+    # Set to False when the requests are never modified in place, only replaced (see `RESTAssistant`)
+    modifies_requests_in_place: bool = True
 
     @abc.abstractmethod
     async def pre_process(self, request: WSRequest) -> WSRequest:
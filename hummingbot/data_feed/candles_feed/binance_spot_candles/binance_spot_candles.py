@@ -85,10 +85,24 @@ class BinanceSpotCandles(CandlesBase):
         ]
 
     def ws_subscription_payload(self):
-        candle_params = [f"{self._ex_trading_pair.lower()}@kline_{self.interval}"]
+        return self.ws_streams_subscription_payload([self.ws_stream_name])
+
+    @property
+    def ws_max_streams_per_connection(self) -> Optional[int]:
+        return CONSTANTS.MAX_STREAMS_PER_CONNECTION
+
+    @property
+    def ws_stream_name(self) -> str:
+        return f"{self._ex_trading_pair.lower()}@kline_{self.interval}"
+
+    def ws_stream_name_from_message(self, data: dict) -> Optional[str]:
+        if data is not None and data.get("e") == "kline":
+            return f"{data['s'].lower()}@kline_{data['k']['i']}"
+
+    def ws_streams_subscription_payload(self, stream_names: List[str], subscribe: bool = True) -> dict:
         payload = {
-            "method": "SUBSCRIBE",
-            "params": candle_params,
+            "method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+            "params": stream_names,
             "id": 1
         }
         return payload
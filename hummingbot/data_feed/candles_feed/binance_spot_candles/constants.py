@@ -7,6 +7,8 @@ HEALTH_CHECK_ENDPOINT = "/api/v3/ping"
 CANDLES_ENDPOINT = "/api/v3/klines"
 
 WSS_URL = "wss://stream.binance.com:9443/ws"
+# Maximum number of streams a single websocket connection can subscribe to
+MAX_STREAMS_PER_CONNECTION = 1024
 
 INTERVALS = bidict({
     "1s": "1s",
@@ -2,7 +2,7 @@ import asyncio
 import os
 import time
 from collections import deque
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -17,6 +17,9 @@ from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFa
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+
 
 class CandlesBase(NetworkBase):
     """
@@ -57,6 +60,7 @@ class CandlesBase(NetworkBase):
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
         self._ping_timeout = None
+        self._candles_hub: Optional["CandlesHub"] = None
         if interval in self.intervals.keys():
             self.interval = interval
         else:
@@ -70,7 +74,10 @@ class CandlesBase(NetworkBase):
         """
         await self.stop_network()
         await self.initialize_exchange_data()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self._uses_shared_websocket:
+            self._candles_hub.subscribe(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
@@ -79,6 +86,19 @@ class CandlesBase(NetworkBase):
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        if self._uses_shared_websocket:
+            self._candles_hub.unsubscribe(self)
+
+    def set_candles_hub(self, candles_hub: "CandlesHub"):
+        """
+        Makes the feed use the throttler and the connections of the hub, and its shared websockets if supported.
+        """
+        self._candles_hub = candles_hub
+        self._api_factory = candles_hub.get_api_factory(self.rate_limits)
+
+    @property
+    def _uses_shared_websocket(self) -> bool:
+        return self._candles_hub is not None and self.ws_max_streams_per_connection is not None
 
     async def initialize_exchange_data(self):
         """
@@ -398,36 +418,69 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    @property
+    def ws_max_streams_per_connection(self) -> Optional[int]:
+        """
+        The maximum number of streams a websocket can be subscribed to, for the exchanges whose candles feeds can
+        share websockets (see CandlesHub). None if each feed must use its own websocket.
+
+        The exchanges that support it must also implement ws_stream_name, ws_stream_name_from_message and
+        ws_streams_subscription_payload.
+        """
+        return None
+
+    @property
+    def ws_stream_name(self) -> str:
+        """
+        The name of the websocket stream of the trading pair and interval of the feed.
+        """
+        raise NotImplementedError
+
+    def ws_stream_name_from_message(self, data: dict) -> Optional[str]:
+        """
+        This method returns the name of the stream a websocket message belongs to, or None if it is not a candle
+        message.
+        """
+        raise NotImplementedError
+
+    def ws_streams_subscription_payload(self, stream_names: List[str], subscribe: bool = True) -> dict:
+        """
+        This method returns the payload to subscribe (or unsubscribe) a websocket to several streams.
+        """
+        raise NotImplementedError
+
     async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
         # TODO: Isolate ping pong logic
         async for ws_response in websocket_assistant.iter_messages():
-            data = ws_response.data
-            parsed_message = self._parse_websocket_message(data)
-            # parsed messages may be ping or pong messages
-            if isinstance(parsed_message, WSJSONRequest):
-                await websocket_assistant.send(request=parsed_message)
-            elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
-                if len(self._candles) == 0:
+            await self._process_websocket_message(websocket_assistant=websocket_assistant, data=ws_response.data)
+
+    async def _process_websocket_message(self, websocket_assistant: WSAssistant, data):
+        parsed_message = self._parse_websocket_message(data)
+        # parsed messages may be ping or pong messages
+        if isinstance(parsed_message, WSJSONRequest):
+            await websocket_assistant.send(request=parsed_message)
+        elif isinstance(parsed_message, dict):
+            candles_row = np.array([parsed_message["timestamp"],
+                                    parsed_message["open"],
+                                    parsed_message["high"],
+                                    parsed_message["low"],
+                                    parsed_message["close"],
+                                    parsed_message["volume"],
+                                    parsed_message["quote_asset_volume"],
+                                    parsed_message["n_trades"],
+                                    parsed_message["taker_buy_base_volume"],
+                                    parsed_message["taker_buy_quote_volume"]]).astype(float)
+            if len(self._candles) == 0:
+                self._candles.append(candles_row)
+                self._ws_candle_available.set()
+                safe_ensure_future(self.fill_historical_candles())
+            else:
+                latest_timestamp = int(self._candles[-1][0])
+                current_timestamp = int(parsed_message["timestamp"])
+                if current_timestamp > latest_timestamp:
                     self._candles.append(candles_row)
-                    self._ws_candle_available.set()
-                    safe_ensure_future(self.fill_historical_candles())
-                else:
-                    latest_timestamp = int(self._candles[-1][0])
-                    current_timestamp = int(parsed_message["timestamp"])
-                    if current_timestamp > latest_timestamp:
-                        self._candles.append(candles_row)
-                    elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                elif current_timestamp == latest_timestamp:
+                    self._candles[-1] = candles_row
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
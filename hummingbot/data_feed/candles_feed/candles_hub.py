@@ -0,0 +1,219 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class CandlesHubConnection:
+    """
+    A websocket shared by the candles feeds of one exchange. The streams are subscribed all together when connecting,
+    and the streams added or removed while connected are subscribed or unsubscribed in batches, since the exchanges
+    limit the number of messages per second.
+    """
+    SUBSCRIPTIONS_UPDATE_DELAY = 0.5
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, hub: "CandlesHub", reference_feed: "CandlesBase", max_streams: int):
+        self._hub = hub
+        # Any feed of the exchange, used to build and parse the exchange specific websocket messages
+        self._reference_feed = reference_feed
+        self.max_streams = max_streams
+        self.streams: Set[str] = set()
+        self._subscribed_streams: Set[str] = set()
+        self._ws: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._update_subscriptions_task: Optional[asyncio.Task] = None
+
+    @property
+    def full(self) -> bool:
+        return len(self.streams) >= self.max_streams
+
+    def start(self):
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self._listen())
+
+    def stop(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        if self._update_subscriptions_task is not None:
+            self._update_subscriptions_task.cancel()
+            self._update_subscriptions_task = None
+
+    def add_stream(self, stream_name: str):
+        self.streams.add(stream_name)
+        self._schedule_subscriptions_update()
+
+    def remove_stream(self, stream_name: str):
+        self.streams.discard(stream_name)
+        self._schedule_subscriptions_update()
+
+    def _schedule_subscriptions_update(self):
+        if self._update_subscriptions_task is None or self._update_subscriptions_task.done():
+            self._update_subscriptions_task = safe_ensure_future(self._update_subscriptions())
+
+    async def _update_subscriptions(self):
+        # Runs until the subscriptions match the streams, so the streams added or removed while the subscriptions are
+        # being sent are included in the next batch
+        while True:
+            await self._sleep(self.SUBSCRIPTIONS_UPDATE_DELAY)
+            if self._ws is None or self.streams == self._subscribed_streams:
+                break
+            try:
+                await self._send_subscriptions(self._ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error updating the {self._hub.connector_name} candles subscriptions.")
+                break
+
+    async def _send_subscriptions(self, ws: WSAssistant):
+        new_streams = sorted(self.streams - self._subscribed_streams)
+        removed_streams = sorted(self._subscribed_streams - self.streams)
+        if len(new_streams) > 0:
+            await ws.send(WSJSONRequest(
+                payload=self._reference_feed.ws_streams_subscription_payload(new_streams, subscribe=True)))
+            self._subscribed_streams.update(new_streams)
+        if len(removed_streams) > 0:
+            await ws.send(WSJSONRequest(
+                payload=self._reference_feed.ws_streams_subscription_payload(removed_streams, subscribe=False)))
+            self._subscribed_streams.difference_update(removed_streams)
+
+    async def _listen(self):
+        ws: Optional[WSAssistant] = None
+        while True:
+            try:
+                ws = await self._hub.api_factory.get_ws_assistant()
+                await ws.connect(ws_url=self._reference_feed.wss_url, ping_timeout=self._reference_feed._ping_timeout)
+                self._subscribed_streams = set()
+                await self._send_subscriptions(ws)
+                self._ws = ws
+                if self.streams != self._subscribed_streams:
+                    # Streams added or removed while subscribing
+                    self._schedule_subscriptions_update()
+                self.logger().info(f"Subscribed to {len(self._subscribed_streams)} {self._hub.connector_name} "
+                                   f"klines streams...")
+                await self._process_websocket_messages(ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                self._ws = None
+                ws and await ws.disconnect()
+                for stream_name in list(self.streams):
+                    feed = self._hub.get_feed(stream_name)
+                    if feed is not None:
+                        await feed._on_order_stream_interruption()
+
+    async def _process_websocket_messages(self, ws: WSAssistant):
+        async for ws_response in ws.iter_messages():
+            data = ws_response.data
+            stream_name = self._reference_feed.ws_stream_name_from_message(data)
+            feed = self._hub.get_feed(stream_name) if stream_name is not None else None
+            if feed is not None:
+                await feed._process_websocket_message(websocket_assistant=ws, data=data)
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay)
+
+
+class CandlesHub:
+    """
+    Shares the network resources of the candles feeds of one exchange. All the feeds use the same throttler, so the
+    REST requests of the feeds (e.g. the historical candles backfills) are rate limited together, and the same
+    connections pool. The feeds of exchanges that support it (see `CandlesBase.ws_max_streams_per_connection`) are
+    also multiplexed over shared websockets, each one subscribed to up to the maximum number of streams allowed by
+    the exchange.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connector_name: str):
+        self.connector_name = connector_name
+        self._api_factory: Optional[WebAssistantsFactory] = None
+        # Stream name -> feed
+        self._feeds: Dict[str, "CandlesBase"] = {}
+        self._connections: List[CandlesHubConnection] = []
+
+    @property
+    def api_factory(self) -> Optional[WebAssistantsFactory]:
+        return self._api_factory
+
+    @property
+    def num_connections(self) -> int:
+        return len(self._connections)
+
+    def add_feed(self, feed: "CandlesBase"):
+        """
+        Makes the feed use the network resources of the hub. Must be called before starting the feed.
+        """
+        feed.set_candles_hub(self)
+
+    def get_api_factory(self, rate_limits) -> WebAssistantsFactory:
+        if self._api_factory is None:
+            self._api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=rate_limits))
+        return self._api_factory
+
+    def get_feed(self, stream_name: str) -> Optional["CandlesBase"]:
+        return self._feeds.get(stream_name)
+
+    def subscribe(self, feed: "CandlesBase"):
+        """
+        Subscribes the feed to its stream on a shared websocket.
+        """
+        stream_name = feed.ws_stream_name
+        self._feeds[stream_name] = feed
+        if any(stream_name in connection.streams for connection in self._connections):
+            return
+        connection = next((connection for connection in self._connections if not connection.full), None)
+        if connection is None:
+            connection = CandlesHubConnection(self, feed, feed.ws_max_streams_per_connection)
+            self._connections.append(connection)
+            connection.start()
+        connection.add_stream(stream_name)
+
+    def unsubscribe(self, feed: "CandlesBase"):
+        stream_name = feed.ws_stream_name
+        if self._feeds.get(stream_name) is not feed:
+            return
+        del self._feeds[stream_name]
+        for connection in list(self._connections):
+            if stream_name in connection.streams:
+                connection.remove_stream(stream_name)
+                if len(connection.streams) == 0:
+                    connection.stop()
+                    self._connections.remove(connection)
+
+    def stop(self):
+        for connection in self._connections:
+            connection.stop()
+        self._connections.clear()
+        self._feeds.clear()
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -9,11 +11,15 @@ class CandlesConfig(BaseModel):
     - trading_pair: str
     - interval: str
     - max_records: int
+    - base_interval: Optional[str], if set the candles are resampled locally from the candles of this interval
+    - from_trades: bool, if True the live candles are built from the trades of the connector order book
     """
     connector: str
     trading_pair: str
     interval: str = "1m"
     max_records: int = 500
+    base_interval: Optional[str] = None
+    from_trades: bool = False
 
 
 class HistoricalCandlesConfig(BaseModel):
@@ -0,0 +1,127 @@
+from collections import deque
+from itertools import islice
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.trades_candles import SUB_MINUTE_INTERVALS
+
+# The weekly candles of the exchanges open on Monday, and 1970-01-01 was a Thursday
+INTERVAL_OFFSETS = {"1w": 4 * 24 * 60 * 60}
+
+
+class ResampledCandles:
+    """
+    Candles of an interval aggregated in memory from the candles of a smaller (base) interval feed of the same trading
+    pair, so that only the base interval candles are fetched from the exchange and all the intervals are consistent.
+
+    The candles are aggregated incrementally: each update only aggregates again the base candles of the last (still
+    open) candle, and the new base candles. The first candle is skipped when the base candles don't cover it fully.
+    """
+    columns = CandlesBase.columns
+
+    def __init__(self, base_feed: CandlesBase, interval: str, max_records: int = 150):
+        self.interval = interval
+        self.max_records = max_records
+        self._interval_in_seconds = self.get_interval_in_seconds(base_feed.interval, interval)
+        self._offset = INTERVAL_OFFSETS.get(interval, 0)
+        self._candles = deque(maxlen=max_records)
+        self.base_feed = base_feed
+
+    @staticmethod
+    def _seconds(interval: str) -> Optional[int]:
+        return SUB_MINUTE_INTERVALS.get(interval, CandlesBase.interval_to_seconds.get(interval))
+
+    @classmethod
+    def get_interval_in_seconds(cls, base_interval: str, interval: str) -> int:
+        base_seconds = cls._seconds(base_interval)
+        seconds = cls._seconds(interval)
+        # The monthly candles are calendar months, they can't be aggregated as fixed periods
+        if (base_seconds is None or seconds is None or interval == "1M" or seconds <= base_seconds
+                or seconds % base_seconds != 0):
+            raise ValueError(f"The {interval} candles can't be resampled from {base_interval} candles.")
+        return seconds
+
+    @classmethod
+    def base_max_records(cls, base_interval: str, interval: str, max_records: int) -> int:
+        """
+        Number of base candles required to aggregate max_records candles, including an incomplete first candle.
+        """
+        ratio = cls.get_interval_in_seconds(base_interval, interval) // cls._seconds(base_interval)
+        return (max_records + 1) * ratio
+
+    @property
+    def name(self) -> str:
+        return self.base_feed.name
+
+    @property
+    def interval_in_seconds(self) -> int:
+        return self._interval_in_seconds
+
+    @property
+    def ready(self) -> bool:
+        self.update()
+        return len(self._candles) == self._candles.maxlen
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        self.update()
+        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+
+    def set_base_feed(self, base_feed: CandlesBase):
+        if base_feed.interval != self.base_feed.interval:
+            raise ValueError(f"The base feed interval must be {self.base_feed.interval}.")
+        self.base_feed = base_feed
+        self._candles.clear()
+
+    def start(self):
+        """
+        The base feed is started (and stopped) by its owner, the resampled candles have no network activity.
+        """
+        pass
+
+    def stop(self):
+        pass
+
+    def update(self):
+        base_candles = self.base_feed._candles
+        if len(base_candles) == 0:
+            self._candles.clear()
+            return
+        first_base_timestamp = base_candles[0][0]
+        last_base_timestamp = base_candles[-1][0]
+        if len(self._candles) > 0 and first_base_timestamp <= self._candles[-1][0] <= last_base_timestamp:
+            # The last candle may be still open, so it is aggregated again
+            start_timestamp = self._candles.pop()[0]
+        else:
+            self._candles.clear()
+            start_timestamp = self._bucket_start(first_base_timestamp)
+            if start_timestamp < first_base_timestamp:
+                start_timestamp += self._interval_in_seconds
+
+        start_index = len(base_candles)
+        while start_index > 0 and base_candles[start_index - 1][0] >= start_timestamp:
+            start_index -= 1
+        if start_index == len(base_candles):
+            return
+        rows = np.array(list(islice(base_candles, start_index, None)), dtype=float)
+        self._candles.extend(self._aggregate(rows))
+
+    def _bucket_start(self, timestamp: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        return (timestamp - self._offset) // self._interval_in_seconds * self._interval_in_seconds + self._offset
+
+    def _aggregate(self, rows: np.ndarray) -> np.ndarray:
+        buckets = self._bucket_start(rows[:, 0])
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(rows)] - 1
+        aggregated = np.empty((len(starts), rows.shape[1]), dtype=float)
+        aggregated[:, 0] = buckets[starts]
+        aggregated[:, 1] = rows[starts, 1]
+        aggregated[:, 2] = np.maximum.reduceat(rows[:, 2], starts)
+        aggregated[:, 3] = np.minimum.reduceat(rows[:, 3], starts)
+        aggregated[:, 4] = rows[ends, 4]
+        # Volume, quote asset volume, number of trades and taker volumes
+        aggregated[:, 5:] = np.add.reduceat(rows[:, 5:], starts, axis=0)
+        return aggregated
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.logger import HummingbotLogger
+
+# Intervals shorter than a minute, not offered by the candles endpoints of most exchanges
+SUB_MINUTE_INTERVALS = {"1s": 1, "5s": 5, "10s": 10, "15s": 15, "30s": 30}
+
+
+class TradesCandles:
+    """
+    Live candles built from the public trades received by the order book tracker of a connector, instead of opening a
+    klines websocket. Any interval is supported, including the sub-minute intervals most exchanges don't offer.
+
+    The history before the first live candle is fetched with the REST API of a candles feed of the same interval
+    (history_feed), when the exchange supports the interval. The first live candle only includes the trades received
+    since the feed started. Intervals without trades get a candle without volume at the last close price.
+    """
+    columns = CandlesBase.columns
+    ORDER_BOOK_CHECK_INTERVAL = 1.0
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 connector: ConnectorBase,
+                 trading_pair: str,
+                 interval: str = "1s",
+                 max_records: int = 150,
+                 history_feed: Optional[CandlesBase] = None):
+        self._interval_in_seconds = self.get_interval_in_seconds(interval)
+        if history_feed is not None and history_feed.interval != interval:
+            raise ValueError(f"The history feed interval must be {interval}.")
+        self._connector = connector
+        self._trading_pair = trading_pair
+        self.interval = interval
+        self.max_records = max_records
+        self._history_feed = history_feed
+        self._candles = deque(maxlen=max_records)
+        self._order_book: Optional[OrderBook] = None
+        self._trade_forwarder = EventForwarder(self._process_trade)
+        self._start_task: Optional[asyncio.Task] = None
+        self._history_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def get_interval_in_seconds(interval: str) -> int:
+        seconds = SUB_MINUTE_INTERVALS.get(interval, CandlesBase.interval_to_seconds.get(interval))
+        # The monthly candles are calendar months, they can't be built as fixed periods
+        if seconds is None or interval == "1M":
+            raise ValueError(f"The {interval} candles can't be built from trades.")
+        return seconds
+
+    @property
+    def name(self) -> str:
+        return f"{self._connector.name}_{self._trading_pair}_trades"
+
+    @property
+    def interval_in_seconds(self) -> int:
+        return self._interval_in_seconds
+
+    @property
+    def ready(self) -> bool:
+        return len(self._candles) == self._candles.maxlen
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        if len(self._candles) > 0:
+            self._add_empty_candles_until(self._bucket_start(self._time()))
+        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+
+    def start(self):
+        if self._start_task is None:
+            self._start_task = safe_ensure_future(self._listen_to_order_book())
+
+    def stop(self):
+        for task in (self._start_task, self._history_task):
+            if task is not None:
+                task.cancel()
+        self._start_task = None
+        self._history_task = None
+        if self._order_book is not None:
+            self._order_book.remove_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
+            self._order_book = None
+
+    async def _listen_to_order_book(self):
+        # The order books are created by the tracker of the connector once it is started
+        order_book = self._connector.order_books.get(self._trading_pair)
+        while order_book is None:
+            await self._sleep(self.ORDER_BOOK_CHECK_INTERVAL)
+            order_book = self._connector.order_books.get(self._trading_pair)
+        self._order_book = order_book
+        order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
+
+    def _process_trade(self, trade: OrderBookTradeEvent):
+        if trade.trading_pair != self._trading_pair:
+            return
+        timestamp = self._bucket_start(trade.timestamp)
+        if len(self._candles) > 0 and timestamp < self._candles[-1][0]:
+            # Late trades of the closed candles are discarded
+            return
+        price = float(trade.price)
+        amount = float(trade.amount)
+        if len(self._candles) == 0 or self._candles[-1][0] < timestamp:
+            if len(self._candles) > 0:
+                self._add_empty_candles_until(timestamp - self._interval_in_seconds)
+            else:
+                self._start_history_fill(timestamp)
+            self._candles.append(np.array([timestamp, price, price, price, price, 0, 0, 0, 0, 0], dtype=float))
+        candle = self._candles[-1]
+        candle[2] = max(candle[2], price)
+        candle[3] = min(candle[3], price)
+        candle[4] = price
+        candle[5] += amount
+        candle[6] += amount * price
+        candle[7] += 1
+        if trade.type == TradeType.BUY:
+            candle[8] += amount
+            candle[9] += amount * price
+
+    def _add_empty_candles_until(self, timestamp: float):
+        last_candle = self._candles[-1]
+        missing_candles = int((timestamp - last_candle[0]) // self._interval_in_seconds)
+        close = last_candle[4]
+        # Only the candles that fit in the deque are added
+        for i in range(max(1, missing_candles - self._candles.maxlen + 1), missing_candles + 1):
+            self._candles.append(np.array([last_candle[0] + i * self._interval_in_seconds, close, close, close, close,
+                                           0, 0, 0, 0, 0], dtype=float))
+
+    def _start_history_fill(self, first_live_timestamp: float):
+        if self._history_feed is not None and self._history_task is None:
+            self._history_task = safe_ensure_future(self._fill_history(first_live_timestamp))
+
+    async def _fill_history(self, first_live_timestamp: float):
+        """
+        Fills the candles before the first live candle with the REST API of the history feed.
+        """
+        end_time = first_live_timestamp
+        while not self.ready:
+            try:
+                candles = await self._history_feed.fetch_candles(
+                    end_time=int(end_time), limit=self._candles.maxlen - len(self._candles))
+                candles = candles[candles[:, 0] < end_time] if candles.size > 0 else candles
+                # Live candles may have been added while fetching
+                missing_records = self._candles.maxlen - len(self._candles)
+                if len(candles) == 0 or missing_records == 0:
+                    break
+                records_to_add = min(missing_records, len(candles))
+                self._candles.extendleft(candles[-records_to_add:][::-1])
+                end_time = candles[-records_to_add][0]
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error fetching the {self.interval} candles history of {self._trading_pair}. "
+                    f"Retrying in 1 seconds...")
+                await self._sleep(1.0)
+
+    def _bucket_start(self, timestamp: float) -> float:
+        return timestamp // self._interval_in_seconds * self._interval_in_seconds
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
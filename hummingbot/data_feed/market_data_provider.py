@@ -8,18 +8,25 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.resampled_candles import ResampledCandles
+from hummingbot.data_feed.candles_feed.trades_candles import TradesCandles
 
 
 class MarketDataProvider:
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self.candles_hubs: Dict[str, CandlesHub] = {}  # Network resources shared by the candle feeds of each exchange
         self.connectors = connectors  # Stores instances of connectors
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
             candle_feed.stop()
         self.candles_feeds.clear()
+        for candles_hub in self.candles_hubs.values():
+            candles_hub.stop()
+        self.candles_hubs.clear()
 
     @property
     def ready(self) -> bool:
@@ -50,6 +57,9 @@ class MarketDataProvider:
         """
         Retrieves or creates and starts a candle feed based on the given configuration.
         If an existing feed has a higher or equal max_records, it is reused.
+        The feeds of each exchange share the throttler, connections and websockets of the exchange candles hub.
+        If the config has a base interval, the candles are resampled from the feed of the base interval, and if it is
+        from trades, the candles are built from the trades of the connector.
         :param config: CandlesConfig
         :return: Candle feed instance.
         """
@@ -59,13 +69,65 @@ class MarketDataProvider:
         if existing_feed and existing_feed.max_records >= config.max_records:
             # Existing feed is sufficient, return it
             return existing_feed
+        # Create a new feed or restart the existing one with updated max_records
+        if existing_feed and hasattr(existing_feed, 'stop'):
+            existing_feed.stop()
+        if config.base_interval is not None and config.base_interval != config.interval:
+            candle_feed = self._create_resampled_candles_feed(config)
+        elif config.from_trades:
+            candle_feed = self._create_trades_candles_feed(config)
         else:
-            # Create a new feed or restart the existing one with updated max_records
             candle_feed = CandlesFactory.get_candle(config)
-            self.candles_feeds[key] = candle_feed
-            if hasattr(candle_feed, 'start'):
-                candle_feed.start()
-            return candle_feed
+            self._get_candles_hub(config.connector).add_feed(candle_feed)
+        self.candles_feeds[key] = candle_feed
+        if hasattr(candle_feed, 'start'):
+            candle_feed.start()
+        # The resampled feeds of the replaced feed are moved to the new one
+        for feed in self.candles_feeds.values():
+            if isinstance(feed, ResampledCandles) and feed.base_feed is existing_feed:
+                feed.set_base_feed(candle_feed)
+        return candle_feed
+
+    def _create_resampled_candles_feed(self, config: CandlesConfig) -> ResampledCandles:
+        base_interval = config.base_interval
+        base_feed = self.candles_feeds.get(self._generate_candle_feed_key(
+            CandlesConfig(connector=config.connector, trading_pair=config.trading_pair, interval=base_interval)))
+        if isinstance(base_feed, ResampledCandles):
+            # Resampled from the feed the base interval candles are resampled from
+            base_interval = base_feed.base_feed.interval
+        base_feed = self.get_candles_feed(CandlesConfig(
+            connector=config.connector,
+            trading_pair=config.trading_pair,
+            interval=base_interval,
+            max_records=ResampledCandles.base_max_records(base_interval, config.interval, config.max_records),
+            from_trades=config.from_trades,
+        ))
+        return ResampledCandles(base_feed, config.interval, config.max_records)
+
+    def _create_trades_candles_feed(self, config: CandlesConfig) -> TradesCandles:
+        connector = self.get_connector(config.connector)
+        # The history is fetched from the exchange when it has candles with the interval, otherwise the candles are
+        # only built from the trades received from now on
+        try:
+            history_feed = CandlesFactory.get_candle(CandlesConfig(
+                connector=config.connector,
+                trading_pair=config.trading_pair,
+                interval=config.interval,
+                max_records=config.max_records,
+            ))
+        except Exception:
+            # Connectors without candles feed, or intervals not supported by the candles feed of the connector
+            history_feed = None
+        if history_feed is not None:
+            self._get_candles_hub(config.connector).add_feed(history_feed)
+        return TradesCandles(connector, config.trading_pair, config.interval, config.max_records, history_feed)
+
+    def _get_candles_hub(self, connector_name: str) -> CandlesHub:
+        candles_hub = self.candles_hubs.get(connector_name)
+        if candles_hub is None:
+            candles_hub = CandlesHub(connector_name)
+            self.candles_hubs[connector_name] = candles_hub
+        return candles_hub
 
     @staticmethod
     def _generate_candle_feed_key(config: CandlesConfig) -> str:
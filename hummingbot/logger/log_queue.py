@@ -0,0 +1,236 @@
+import atexit
+import copy
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from hummingbot.logger import NETWORK
+
+_exception_formatter = logging.Formatter()
+
+
+class LogQueueStats:
+    """
+    Counters of the log records that were not written. They are updated without locking from the logging threads, so
+    they are approximate under contention.
+    """
+
+    def __init__(self):
+        self.dropped: int = 0
+        self.rate_limited: Dict[str, int] = {}
+        self.deduplicated: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.dropped + sum(self.rate_limited.values()) + self.deduplicated
+
+    def __repr__(self) -> str:
+        return f"LogQueueStats(dropped={self.dropped}, rate_limited={sum(self.rate_limited.values())}, " \
+               f"deduplicated={self.deduplicated})"
+
+
+class LogRecordThrottle:
+    """
+    Decides which records are queued:
+    - Records of each logger are rate limited with a token bucket, except errors and structured (event) records.
+    - Repeated network records, warnings and errors (same logger, level, message, arguments and exception type) are
+    only let through once per `dedup_interval`, with the number of repetitions suppressed since the last one.
+    """
+    MAX_TRACKED_MESSAGES = 1000
+
+    def __init__(self, stats: LogQueueStats, rate_limit: float, burst: int, dedup_interval: float):
+        self._stats = stats
+        self._rate_limit = rate_limit
+        self._burst = burst
+        self._dedup_interval = dedup_interval
+        # Logger name -> (tokens, last update time)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        # (logger name, level, message, arguments, exception type) -> [last emission time, suppressed count]
+        self._last_messages: Dict[Tuple[str, int, str, str, Optional[type]], List] = {}
+
+    def allow(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        return self._allow_repeated(record, now) and self._allow_rate(record, now)
+
+    def _allow_rate(self, record: logging.LogRecord, now: float) -> bool:
+        if self._rate_limit <= 0 or record.levelno >= logging.ERROR or "dict_msg" in record.__dict__:
+            return True
+        tokens, last_update = self._buckets.get(record.name, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - last_update) * self._rate_limit)
+        if tokens < 1:
+            self._buckets[record.name] = (tokens, now)
+            self._stats.rate_limited[record.name] = self._stats.rate_limited.get(record.name, 0) + 1
+            return False
+        self._buckets[record.name] = (tokens - 1, now)
+        return True
+
+    def _allow_repeated(self, record: logging.LogRecord, now: float) -> bool:
+        if self._dedup_interval <= 0 or (record.levelno != NETWORK and record.levelno < logging.WARNING):
+            return True
+        # Records with different arguments or exceptions are different messages, even with the same format string
+        exception_type = record.exc_info[0] if isinstance(record.exc_info, tuple) else None
+        key = (record.name, record.levelno, str(record.msg), str(record.args), exception_type)
+        last_message = self._last_messages.get(key)
+        if last_message is not None and now - last_message[0] < self._dedup_interval:
+            last_message[1] += 1
+            self._stats.deduplicated += 1
+            return False
+        if last_message is not None and last_message[1] > 0:
+            record.suppressed_count = last_message[1]
+        if len(self._last_messages) >= self.MAX_TRACKED_MESSAGES:
+            self._last_messages = {key: value for key, value in self._last_messages.items()
+                                   if now - value[0] < self._dedup_interval}
+        self._last_messages[key] = [now, 0]
+        return True
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Queues the records for the handlers of a logger, to be written by the listener thread. The handler never blocks:
+    the records are dropped (and counted) when the queue is full.
+    """
+
+    def __init__(self,
+                 log_queue: queue.Queue,
+                 handlers: Sequence[logging.Handler],
+                 throttle: LogRecordThrottle,
+                 stats: LogQueueStats):
+        super().__init__(log_queue)
+        self.handlers = tuple(handlers)
+        self._throttle = throttle
+        self._stats = stats
+
+    def emit(self, record: logging.LogRecord):
+        if self._throttle.allow(record):
+            super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The message is merged here, since the arguments may change before the listener writes the record. The
+        # exception info is kept for the handlers that only note that there is a stack trace (e.g. the CLI).
+        message = record.getMessage()
+        suppressed_count = getattr(record, "suppressed_count", 0)
+        if suppressed_count > 0:
+            message = f"{message} ({suppressed_count} similar messages suppressed)"
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait((record, self.handlers))
+        except queue.Full:
+            self._stats.dropped += 1
+
+
+class LogQueueListener(QueueListener):
+    """
+    Writes the queued records with the handlers of the loggers they were logged to, and reports the records that were
+    not written every `report_interval` seconds.
+    """
+    SENTINEL_TIMEOUT = 1.0
+
+    def __init__(self, log_queue: queue.Queue, stats: LogQueueStats, report_interval: float):
+        super().__init__(log_queue)
+        self.stats = stats
+        self._report_interval = report_interval
+        self._reported_total = 0
+        self._last_report_time = time.monotonic()
+
+    def enqueue_sentinel(self):
+        # The queue is full when records are being dropped. The thread only exits when it gets the sentinel, so the
+        # oldest queued records are dropped to make room for it if the thread does not take any in time.
+        while True:
+            try:
+                self.queue.put(self._sentinel, timeout=self.SENTINEL_TIMEOUT)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.stats.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def handle(self, item: Tuple[logging.LogRecord, Sequence[logging.Handler]]):
+        record, handlers = item
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        self._report_not_written_records(handlers)
+
+    def _report_not_written_records(self, handlers: Sequence[logging.Handler]):
+        now = time.monotonic()
+        if now - self._last_report_time < self._report_interval or self.stats.total == self._reported_total:
+            return
+        self._last_report_time = now
+        self._reported_total = self.stats.total
+        record = logging.getLogger(__name__).makeRecord(
+            __name__, logging.WARNING, __file__, 0,
+            f"Log records not written: {self.stats.dropped} dropped (queue full), "
+            f"{sum(self.stats.rate_limited.values())} rate limited, {self.stats.deduplicated} repeated.",
+            None, None)
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+_log_queue_listener: Optional[LogQueueListener] = None
+_atexit_registered = False
+_lock = threading.Lock()
+
+
+def install_log_queue(logger_names: Sequence[str],
+                      queue_size: int = 10000,
+                      rate_limit: float = 20,
+                      rate_limit_burst: int = 100,
+                      dedup_interval: float = 60,
+                      report_interval: float = 60) -> LogQueueListener:
+    """
+    Moves the handlers of the root logger and of the given loggers to a listener thread. Each logger gets a queue
+    handler that queues its records for its former handlers, so logging from the event loop never does blocking IO.
+    """
+    global _log_queue_listener, _atexit_registered
+    with _lock:
+        _stop_log_queue()
+        log_queue = queue.Queue(maxsize=queue_size)
+        stats = LogQueueStats()
+        throttle = LogRecordThrottle(stats, rate_limit=rate_limit, burst=rate_limit_burst, dedup_interval=dedup_interval)
+        for logger in [logging.getLogger()] + [logging.getLogger(name) for name in logger_names]:
+            handlers = [handler for handler in logger.handlers if not isinstance(handler, LogQueueHandler)]
+            if len(handlers) == 0:
+                continue
+            for handler in handlers:
+                logger.removeHandler(handler)
+            logger.addHandler(LogQueueHandler(log_queue, handlers, throttle, stats))
+        _log_queue_listener = LogQueueListener(log_queue, stats, report_interval)
+        _log_queue_listener.start()
+        if not _atexit_registered:
+            atexit.register(stop_log_queue)
+            _atexit_registered = True
+        return _log_queue_listener
+
+
+def stop_log_queue():
+    """
+    Writes the queued records and stops the listener thread. The queue handlers stay installed until the logging is
+    configured again.
+    """
+    with _lock:
+        _stop_log_queue()
+
+
+def _stop_log_queue():
+    global _log_queue_listener
+    if _log_queue_listener is not None:
+        listener, _log_queue_listener = _log_queue_listener, None
+        listener.stop()
+
+
+def log_queue_stats() -> Optional[LogQueueStats]:
+    return _log_queue_listener.stats if _log_queue_listener is not None else None
@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, TypeDecorator
+from sqlalchemy import BigInteger, Text, TypeDecorator
 
 
 class SqliteDecimal(TypeDecorator):
@@ -9,6 +9,7 @@ class SqliteDecimal(TypeDecorator):
     stored in Sqlite database.
     """
     impl = BigInteger
+    cache_ok = True
 
     def __init__(self, scale):
         """
@@ -36,3 +37,25 @@ class SqliteDecimal(TypeDecorator):
 
     def _convert_decimal(self, value: Decimal) -> int:
         return int(Decimal(value) * self.multiplier_int) if value is not None else value
+
+
+class TextDecimal(TypeDecorator):
+    """
+    This TypeDecorator use Sqlalchemy Text as impl. It stores Decimals as their string representation, keeping all
+    their digits, e.g. for running totals that must not lose precision when they are updated many times.
+    """
+    impl = Text
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return Decimal
+
+    def process_bind_param(self, value, dialect):
+        return str(value) if value is not None else value
+
+    def process_result_value(self, value, dialect):
+        return Decimal(value) if value is not None else value
+
+    def process_literal_param(self, value, dialect):
+        return f"'{value}'"
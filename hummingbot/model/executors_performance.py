@@ -0,0 +1,68 @@
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import JSON, Column, Integer, Text
+
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import TextDecimal
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import PerformanceReport
+
+s_decimal_0 = Decimal("0")
+
+
+class ExecutorsPerformance(HummingbotBase):
+    """
+    Aggregated performance of the stored executors of a controller, updated as the executors are stored, so that the
+    executor orchestrator does not need to load all the executors to initialize its cached performance.
+    """
+    __tablename__ = "ExecutorsPerformance"
+
+    # The executors without controller are aggregated under an empty controller id
+    controller_id = Column(Text, primary_key=True)
+    num_executors = Column(Integer, nullable=False)
+    realized_pnl_quote = Column(TextDecimal, nullable=False)
+    volume_traded = Column(TextDecimal, nullable=False)
+    # Close type value -> number of executors
+    close_type_counts = Column(JSON, nullable=False)
+
+    @staticmethod
+    def key(controller_id: Optional[str]) -> str:
+        return controller_id or ""
+
+    @classmethod
+    def new(cls, controller_id: Optional[str]) -> "ExecutorsPerformance":
+        return ExecutorsPerformance(
+            controller_id=cls.key(controller_id),
+            num_executors=0,
+            realized_pnl_quote=s_decimal_0,
+            volume_traded=s_decimal_0,
+            close_type_counts={},
+        )
+
+    def add_executor(self,
+                     net_pnl_quote: float,
+                     filled_amount_quote: float,
+                     close_type: Optional[int],
+                     sign: int = 1):
+        """
+        Adds the values of a stored executor to the aggregates, or removes them if `sign` is -1 (when an executor is
+        updated)
+        """
+        self.num_executors += sign
+        # The executors columns are floats, converted through str to keep their shortest representation
+        self.realized_pnl_quote += sign * Decimal(str(net_pnl_quote))
+        self.volume_traded += sign * Decimal(str(filled_amount_quote))
+        if close_type:
+            close_type_counts = dict(self.close_type_counts)
+            close_type_counts[str(close_type)] = close_type_counts.get(str(close_type), 0) + sign
+            # JSON columns are not tracked for in place changes
+            self.close_type_counts = close_type_counts
+
+    def to_performance_report(self) -> PerformanceReport:
+        return PerformanceReport(
+            realized_pnl_quote=self.realized_pnl_quote,
+            volume_traded=self.volume_traded,
+            close_type_counts={CloseType(int(close_type)): count
+                               for close_type, count in self.close_type_counts.items() if count > 0},
+        )
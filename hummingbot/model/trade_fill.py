@@ -1,9 +1,11 @@
+import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy
 import pandas as pd
-from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text
+from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text, and_, or_
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session, relationship
 
 from hummingbot.core.event.events import PositionAction
@@ -61,8 +63,11 @@ class TradeFill(HummingbotBase):
                    order_type: str = None,
                    start_time: int = None,
                    end_time: int = None,
+                   config_file_path: str = None,
                    ) -> Optional[List["TradeFill"]]:
         filters = []
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path == config_file_path)
         if strategy is not None:
             filters.append(TradeFill.strategy == strategy)
         if market is not None:
@@ -89,6 +94,81 @@ class TradeFill(HummingbotBase):
                                              .all())
         return trades
 
+    @staticmethod
+    def _config_fills_query(sql_session: Session, config_file_path: str, start_time: int):
+        # Equality on the config file path and a range on the timestamp, so the query is served by
+        # tf_config_timestamp_index. Only the columns are queried, without building ORM objects.
+        return (sql_session
+                .query(*[getattr(TradeFill, column) for column in TradeFill.fill_column_names()])
+                .filter(TradeFill.config_file_path == config_file_path,
+                        TradeFill.timestamp >= start_time))
+
+    @staticmethod
+    def iter_config_fills(sql_session: Session,
+                          config_file_path: str,
+                          start_time: int,
+                          page_size: int = 1000) -> Iterator[Row]:
+        """
+        Streams the fills of a config file from `start_time` (in milliseconds) in ascending timestamp order, as
+        rows of the `fill_column_names` columns, fetching them from the DB `page_size` rows at a time
+        """
+        query = (TradeFill._config_fills_query(sql_session, config_file_path, start_time)
+                 .order_by(TradeFill.timestamp.asc())
+                 .yield_per(page_size))
+        yield from query
+
+    @staticmethod
+    def get_config_fills_page(sql_session: Session,
+                              config_file_path: str,
+                              start_time: int,
+                              limit: int,
+                              cursor: Optional[str] = None) -> Tuple[List[Row], Optional[str]]:
+        """
+        Returns up to `limit` fills of a config file from `start_time` (in milliseconds), in ascending timestamp order,
+        and the cursor to pass to get the next page (None if there are no more fills). The pages are delimited by
+        the last fill returned (keyset pagination), so getting a page does not scan the previous ones.
+        """
+        query = TradeFill._config_fills_query(sql_session, config_file_path, start_time)
+        if cursor is not None:
+            timestamp, market, order_id, exchange_trade_id = json.loads(cursor)
+            query = query.filter(or_(
+                TradeFill.timestamp > timestamp,
+                and_(TradeFill.timestamp == timestamp, TradeFill.market > market),
+                and_(TradeFill.timestamp == timestamp, TradeFill.market == market, TradeFill.order_id > order_id),
+                and_(TradeFill.timestamp == timestamp, TradeFill.market == market, TradeFill.order_id == order_id,
+                     TradeFill.exchange_trade_id > exchange_trade_id),
+            ))
+        fills = (query
+                 .order_by(TradeFill.timestamp.asc(),
+                           TradeFill.market.asc(),
+                           TradeFill.order_id.asc(),
+                           TradeFill.exchange_trade_id.asc())
+                 .limit(limit + 1)
+                 .all())
+        next_cursor = None
+        if len(fills) > limit:
+            fills = fills[:limit]
+            last_fill = fills[-1]
+            next_cursor = json.dumps(
+                [last_fill.timestamp, last_fill.market, last_fill.order_id, last_fill.exchange_trade_id])
+        return fills, next_cursor
+
+    @staticmethod
+    def fill_column_names() -> List[str]:
+        return [
+            "market",
+            "symbol",
+            "base_asset",
+            "quote_asset",
+            "timestamp",
+            "order_id",
+            "exchange_trade_id",
+            "trade_type",
+            "price",
+            "amount",
+            "trade_fee",
+            "position", ]
+
     @classmethod
     def to_pandas(cls, trades: List):
         columns: List[str] = ["Id",
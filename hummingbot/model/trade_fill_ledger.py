@@ -0,0 +1,220 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, BigInteger, Boolean, Column, Integer, Text
+from sqlalchemy.orm import Session
+
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import TextDecimal
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+
+class TradeFillLedger(HummingbotBase):
+    """
+    Running totals of the trade fills of a config file for one market and trading pair, since a start timestamp
+    (the start of the bot session), from which the performance metrics are calculated without loading the fills.
+
+    The totals are accumulated exactly as `PerformanceMetrics` does from the list of fills. The ledgers are updated by
+    the markets recorder in the same transaction as each new fill, and `catch_up` folds in the fills recorded while
+    no ledger existed, reading only the fills after the last one already folded.
+    """
+    __tablename__ = "TradeFillLedger"
+
+    config_file_path = Column(Text, primary_key=True, nullable=False)
+    start_timestamp = Column(BigInteger, primary_key=True, nullable=False)
+    market = Column(Text, primary_key=True, nullable=False)
+    symbol = Column(Text, primary_key=True, nullable=False)
+    first_timestamp = Column(BigInteger, nullable=False)
+    last_timestamp = Column(BigInteger, nullable=False)
+    # The [order_id, exchange_trade_id] of the fills folded at last_timestamp
+    last_fill_ids = Column(JSON, nullable=False)
+    num_buys = Column(Integer, nullable=False)
+    num_sells = Column(Integer, nullable=False)
+    b_vol_base = Column(TextDecimal, nullable=False)
+    b_vol_quote = Column(TextDecimal, nullable=False)
+    s_vol_base = Column(TextDecimal, nullable=False)
+    s_vol_quote = Column(TextDecimal, nullable=False)
+    # Token -> total fee amount paid in that token, as strings
+    fees = Column(JSON, nullable=False)
+    first_price = Column(TextDecimal, nullable=False)
+    last_price = Column(TextDecimal, nullable=False)
+    nil_position_buys = Column(Boolean, nullable=False)
+    nil_position_sells = Column(Boolean, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TradeFillLedger(config_file_path='{self.config_file_path}', " \
+               f"start_timestamp={self.start_timestamp}, market='{self.market}', symbol='{self.symbol}', " \
+               f"last_timestamp={self.last_timestamp}, num_buys={self.num_buys}, num_sells={self.num_sells})"
+
+    @classmethod
+    def new(cls, config_file_path: str, start_timestamp: int, market: str, symbol: str) -> "TradeFillLedger":
+        return TradeFillLedger(
+            config_file_path=config_file_path,
+            start_timestamp=start_timestamp,
+            market=market,
+            symbol=symbol,
+            first_timestamp=-1,
+            last_timestamp=-1,
+            last_fill_ids=[],
+            num_buys=0,
+            num_sells=0,
+            b_vol_base=s_decimal_0,
+            b_vol_quote=s_decimal_0,
+            s_vol_base=s_decimal_0,
+            s_vol_quote=s_decimal_0,
+            fees={},
+            first_price=s_decimal_0,
+            last_price=s_decimal_0,
+            nil_position_buys=False,
+            nil_position_sells=False,
+        )
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def fee_amounts(self) -> Dict[str, Decimal]:
+        return {token: Decimal(amount) for token, amount in self.fees.items()}
+
+    @property
+    def are_derivatives(self) -> bool:
+        """
+        True if all the buys or all the sells have a position action, in which case the PnL is calculated by pairing
+        the open and close orders, and needs the list of fills
+        """
+        return (self.num_buys > 0 and not self.nil_position_buys) or (self.num_sells > 0 and not self.nil_position_sells)
+
+    def has_folded(self, timestamp: int, order_id: str, exchange_trade_id: str) -> bool:
+        return (timestamp < self.last_timestamp
+                or (timestamp == self.last_timestamp and [order_id, exchange_trade_id] in self.last_fill_ids))
+
+    def add_fill(self,
+                 timestamp: int,
+                 order_id: str,
+                 exchange_trade_id: str,
+                 trade_type: str,
+                 price: Decimal,
+                 amount: Decimal,
+                 trade_fee: Dict[str, Any],
+                 position: Optional[str]):
+        price = Decimal(str(price))
+        amount = Decimal(str(amount))
+        if trade_type.upper() == TradeType.BUY.name.upper():
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+            self.nil_position_buys = self.nil_position_buys or position == PositionAction.NIL.value
+        elif trade_type.upper() == TradeType.SELL.name.upper():
+            self.num_sells += 1
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+            self.nil_position_sells = self.nil_position_sells or position == PositionAction.NIL.value
+
+        fees = self.fee_amounts
+        if trade_fee.get("percent") is not None:
+            fee_percent = Decimal(str(trade_fee["percent"]))
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote += amount * price * Decimal(trade_fee["percent"]) * Decimal("-1")
+            quote = split_hb_trading_pair(self.symbol)[1]
+            fees[quote] = fees.get(quote, s_decimal_0) + price * amount * fee_percent
+        for flat_fee in trade_fee.get("flat_fees", []):
+            fees[flat_fee["token"]] = fees.get(flat_fee["token"], s_decimal_0) + Decimal(flat_fee["amount"])
+        # JSON columns are not tracked for in place changes
+        self.fees = {token: str(amount) for token, amount in fees.items()}
+
+        if self.first_timestamp < 0 or timestamp < self.first_timestamp:
+            self.first_timestamp = timestamp
+            self.first_price = price
+        if timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
+            self.last_price = price
+            self.last_fill_ids = [[order_id, exchange_trade_id]]
+        elif timestamp == self.last_timestamp:
+            self.last_price = price
+            self.last_fill_ids = self.last_fill_ids + [[order_id, exchange_trade_id]]
+
+    @classmethod
+    def catch_up(cls,
+                 sql_session: Session,
+                 config_file_path: str,
+                 start_timestamp: int,
+                 persist: bool = True) -> List["TradeFillLedger"]:
+        """
+        Returns the ledgers of the config file since `start_timestamp` (in milliseconds), after folding in the fills
+        that are not included yet.
+
+        :param persist: if True the ledgers are saved in the session (the caller commits them) and the ledgers of the
+        config file for other start timestamps are deleted, since the markets recorder would keep updating them.
+        If False the ledgers are built from the fills in memory (e.g. for a custom time range)
+        """
+        ledgers: Dict[tuple, TradeFillLedger] = {}
+        if persist:
+            ledgers = {
+                (ledger.market, ledger.symbol): ledger
+                for ledger in sql_session.query(cls).filter(cls.config_file_path == config_file_path,
+                                                            cls.start_timestamp == start_timestamp)
+            }
+        # All the fills before the oldest ledger position have been folded in
+        from_timestamp = min([ledger.last_timestamp for ledger in ledgers.values()], default=start_timestamp)
+
+        for fill in TradeFill.iter_config_fills(sql_session, config_file_path, from_timestamp):
+            ledger = ledgers.get((fill.market, fill.symbol))
+            if ledger is None:
+                ledger = ledgers[(fill.market, fill.symbol)] = cls.new(
+                    config_file_path, start_timestamp, fill.market, fill.symbol)
+            elif ledger.has_folded(fill.timestamp, fill.order_id, fill.exchange_trade_id):
+                continue
+            ledger.add_fill(timestamp=fill.timestamp,
+                            order_id=fill.order_id,
+                            exchange_trade_id=fill.exchange_trade_id,
+                            trade_type=fill.trade_type,
+                            price=fill.price,
+                            amount=fill.amount,
+                            trade_fee=fill.trade_fee,
+                            position=fill.position)
+
+        if persist:
+            (sql_session.query(cls)
+             .filter(cls.config_file_path == config_file_path, cls.start_timestamp != start_timestamp)
+             .delete(synchronize_session=False))
+            sql_session.add_all(ledgers.values())
+        return list(ledgers.values())
+
+    @classmethod
+    def record_fill(cls, sql_session: Session, trade_fill: TradeFill):
+        """
+        Folds a new fill in the ledgers of its config file. Ledgers are only created here for new markets of a config
+        file that already has ledgers, the others are created by `catch_up`.
+        """
+        start_timestamps = [
+            start_timestamp for (start_timestamp,) in (
+                sql_session.query(cls.start_timestamp)
+                .filter(cls.config_file_path == trade_fill.config_file_path,
+                        cls.start_timestamp <= trade_fill.timestamp)
+                .distinct())
+        ]
+        for start_timestamp in start_timestamps:
+            ledger = sql_session.get(
+                cls, (trade_fill.config_file_path, start_timestamp, trade_fill.market, trade_fill.symbol))
+            if ledger is None:
+                ledger = cls.new(trade_fill.config_file_path, start_timestamp, trade_fill.market, trade_fill.symbol)
+                sql_session.add(ledger)
+            ledger.add_fill(timestamp=trade_fill.timestamp,
+                            order_id=trade_fill.order_id,
+                            exchange_trade_id=trade_fill.exchange_trade_id,
+                            trade_type=trade_fill.trade_type,
+                            # Use the values as they are stored in the DB, to fold the same values as `catch_up`
+                            price=cls._stored_value(TradeFill.price, trade_fill.price),
+                            amount=cls._stored_value(TradeFill.amount, trade_fill.amount),
+                            trade_fee=trade_fill.trade_fee,
+                            position=trade_fill.position)
+
+    @staticmethod
+    def _stored_value(column, value: Any) -> Any:
+        return column.type.process_result_value(column.type.process_bind_param(value, None), None)
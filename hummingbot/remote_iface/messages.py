@@ -75,6 +75,16 @@ class ConfigCommandMessage(RPCMessage):
         msg: Optional[str] = ''
 
 
+class ControllerConfigCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        configs: Optional[List[Dict[str, Any]]] = []
+
+    class Response(RPCMessage.Response):
+        updated: Optional[List[str]] = []
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+
+
 class CommandShortcutMessage(RPCMessage):
     class Request(RPCMessage.Request):
         params: Optional[List[List[Any]]] = []
@@ -110,11 +120,24 @@ class HistoryCommandMessage(RPCMessage):
         verbose: Optional[bool] = False
         precision: Optional[int] = None
         async_backend: Optional[bool] = True
+        limit: Optional[int] = None  # trades per page, all the trades are returned if None
+        cursor: Optional[str] = None  # the next_cursor of the previous page
 
     class Response(RPCMessage.Response):
         status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
         msg: Optional[str] = ''
         trades: Optional[List[Any]] = []
+        next_cursor: Optional[str] = None
+
+
+class LatencyCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        option: Optional[str] = None
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        data: Optional[List[Dict[str, Any]]] = []
 
 
 class BalanceLimitCommandMessage(RPCMessage):
@@ -29,6 +29,7 @@ from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.core.utils.latency_tracer import LatencyTracer
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
@@ -36,10 +37,12 @@ from hummingbot.remote_iface.messages import (
     BalancePaperCommandMessage,
     CommandShortcutMessage,
     ConfigCommandMessage,
+    ControllerConfigCommandMessage,
     ExternalEventMessage,
     HistoryCommandMessage,
     ImportCommandMessage,
     InternalEventMessage,
+    LatencyCommandMessage,
     LogMessage,
     NotifyMessage,
     StartCommandMessage,
@@ -55,9 +58,11 @@ class CommandTopicSpecs:
     START: str = '/start'
     STOP: str = '/stop'
     CONFIG: str = '/config'
+    CONTROLLER_CONFIG: str = '/controller_config'
     IMPORT: str = '/import'
     STATUS: str = '/status'
     HISTORY: str = '/history'
+    LATENCY: str = '/latency'
     BALANCE_LIMIT: str = '/balance/limit'
     BALANCE_PAPER: str = '/balance/paper'
     COMMAND_SHORTCUT: str = '/command_shortcuts'
@@ -94,9 +99,11 @@ class MQTTCommands:
         self._start_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.START}'
         self._stop_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.STOP}'
         self._config_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.CONFIG}'
+        self._controller_config_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.CONTROLLER_CONFIG}'
         self._import_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.IMPORT}'
         self._status_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.STATUS}'
         self._history_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.HISTORY}'
+        self._latency_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.LATENCY}'
         self._balance_limit_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_LIMIT}'
         self._balance_paper_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_PAPER}'
         self._shortcuts_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.COMMAND_SHORTCUT}'
@@ -119,6 +126,11 @@ class MQTTCommands:
             msg_type=ConfigCommandMessage,
             on_request=self._on_cmd_config
         )
+        self._node.create_rpc(
+            rpc_name=self._controller_config_uri,
+            msg_type=ControllerConfigCommandMessage,
+            on_request=self._on_cmd_controller_config
+        )
         self._node.create_rpc(
             rpc_name=self._import_uri,
             msg_type=ImportCommandMessage,
@@ -134,6 +146,11 @@ class MQTTCommands:
             msg_type=HistoryCommandMessage,
             on_request=self._on_cmd_history
         )
+        self._node.create_rpc(
+            rpc_name=self._latency_uri,
+            msg_type=LatencyCommandMessage,
+            on_request=self._on_cmd_latency
+        )
         self._node.create_rpc(
             rpc_name=self._balance_limit_uri,
             msg_type=BalanceLimitCommandMessage,
@@ -258,6 +275,22 @@ class MQTTCommands:
             self._hb_app.logger().error(e)
         return response
 
+    def _on_cmd_controller_config(self, msg: ControllerConfigCommandMessage.Request):
+        response = ControllerConfigCommandMessage.Response()
+        try:
+            strategy = self._hb_app.strategy
+            if strategy is None or not hasattr(strategy, "apply_controllers_configs"):
+                raise Exception('No V2 strategy is currently running!')
+            # The configs are validated here, so the event loop only applies them
+            controllers_configs = [strategy.config.parse_controller_config(config_data)
+                                   for config_data in msg.configs]
+            self._ev_loop.call_soon_threadsafe(strategy.apply_controllers_configs, controllers_configs)
+            response.updated = [controller_config.id for controller_config in controllers_configs]
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
     def _on_cmd_import(self, msg: ImportCommandMessage.Request):
         response = ImportCommandMessage.Response()
         timeout = 30  # seconds
@@ -314,6 +347,10 @@ class MQTTCommands:
         try:
             if msg.async_backend:
                 self._hb_app.history(msg.days, msg.verbose, msg.precision)
+            elif msg.limit is not None:
+                trades, response.next_cursor = self._hb_app.get_history_trades_page(
+                    limit=msg.limit, cursor=msg.cursor, days=msg.days)
+                response.trades = trades
             else:
                 trades = self._hb_app.get_history_trades_json(msg.days)
                 if trades:
@@ -323,6 +360,24 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    def _on_cmd_latency(self, msg: LatencyCommandMessage.Request):
+        response = LatencyCommandMessage.Response()
+        try:
+            tracer = LatencyTracer.get_instance()
+            if msg.option == 'enable':
+                tracer.enable()
+            elif msg.option == 'disable':
+                tracer.disable()
+            elif msg.option == 'reset':
+                tracer.reset()
+            elif msg.option is not None:
+                raise ValueError(f'Invalid latency option {msg.option}')
+            response.data = tracer.summary()
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
     def _on_cmd_balance_limit(self, msg: BalanceLimitCommandMessage.Request):
         response = BalanceLimitCommandMessage.Response()
         try:
@@ -13,16 +13,23 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _samples_timestamps
+        dict _price_levels_amounts
+        dict _price_levels_counts
+        bint _is_fit_outdated
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        list _quotes_timestamps
+        list _quotes_prices
         int _sampling_length
         int _samples_length
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_sample(self, object timestamp, double price_level, double amount)
+    cdef c_remove_oldest_trade_sample(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
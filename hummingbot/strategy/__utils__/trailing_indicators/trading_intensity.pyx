@@ -2,6 +2,7 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
+from bisect import bisect_left, insort
 from decimal import Decimal
 from typing import Tuple
 
@@ -26,11 +27,25 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
+    """
+    Estimates the trading intensity parameters (alpha, kappa) of lambda(delta) = alpha * exp(-kappa * delta), where
+    lambda is the traded amount at a distance delta from the mid price, over the last sampling_length samples.
+
+    The samples are kept incrementally: the trades are matched to the mid price quotes with a binary search, and the
+    traded amount of each price level is updated in place when a sample is added or evicted. The curve is only fitted
+    again when the samples change, starting from the last estimate (or from a log-linear fit on the first estimate).
+    """
 
     def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
         self._alpha = 0
         self._kappa = 0
+        # Sample timestamp -> list of (price level, amount), and the sample timestamps in ascending order
         self._trade_samples = {}
+        self._samples_timestamps = []
+        # Traded amount (and number of trades) of every price level over all the samples
+        self._price_levels_amounts = {}
+        self._price_levels_counts = {}
+        self._is_fit_outdated = False
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +53,9 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        # Ascending order of price-timestamp quotes
+        self._quotes_timestamps = []
+        self._quotes_prices = []
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +65,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -66,54 +83,50 @@ cdef class TradingIntensityIndicator:
 
     @property
     def last_quotes(self) -> list:
-        """A helper method to be used in unit tests"""
-        return self._last_quotes
+        """A helper method to be used in unit tests (quotes in descending order)"""
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quotes_timestamps), reversed(self._quotes_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
-        """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        """A helper method to be used in unit tests (quotes in descending order)"""
+        self._quotes_timestamps = [quote["timestamp"] for quote in reversed(value)]
+        self._quotes_prices = [quote["price"] for quote in reversed(value)]
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int quote_idx
+            int latest_processed_quote_idx = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._quotes_timestamps.append(timestamp)
+        self._quotes_prices.append(price)
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
+            # Latest quote before the trade
+            quote_idx = bisect_left(self._quotes_timestamps, trade.timestamp) - 1
+            if quote_idx < 0:
+                continue
+            latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+            self.c_add_trade_sample(self._quotes_timestamps[quote_idx] + 1,
+                                    abs(float(trade.price) - float(self._quotes_prices[quote_idx])),
+                                    trade.amount)
+
+        # There are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+        if latest_processed_quote_idx > 0:
+            del self._quotes_timestamps[:latest_processed_quote_idx]
+            del self._quotes_prices[:latest_processed_quote_idx]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        while len(self._samples_timestamps) > self._sampling_length:
+            self.c_remove_oldest_trade_sample()
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        if self.is_sampling_buffer_full and self._is_fit_outdated:
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,40 +136,52 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_sample(self, object timestamp, double price_level, double amount):
+        sample = self._trade_samples.get(timestamp)
+        if sample is None:
+            sample = []
+            self._trade_samples[timestamp] = sample
+            insort(self._samples_timestamps, timestamp)
+        sample.append((price_level, amount))
+        self._price_levels_amounts[price_level] = self._price_levels_amounts.get(price_level, 0) + amount
+        self._price_levels_counts[price_level] = self._price_levels_counts.get(price_level, 0) + 1
+        self._is_fit_outdated = True
+
+    cdef c_remove_oldest_trade_sample(self):
+        timestamp = self._samples_timestamps.pop(0)
+        for price_level, amount in self._trade_samples.pop(timestamp):
+            # The price level is removed with its last trade, to leave no rounding residues
+            if self._price_levels_counts[price_level] == 1:
+                del self._price_levels_counts[price_level]
+                del self._price_levels_amounts[price_level]
+            else:
+                self._price_levels_counts[price_level] -= 1
+                self._price_levels_amounts[price_level] -= amount
+        self._is_fit_outdated = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
             list price_levels
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
-
+        self._is_fit_outdated = False
+        price_levels = sorted(self._price_levels_amounts, reverse=True)
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = np.array([self._price_levels_amounts[price_level] for price_level in price_levels], dtype=float)
+        lambdas_adj[lambdas_adj <= 0] = 10**-10
+
+        if self._alpha == 0 and self._kappa == 0 and len(price_levels) > 1:
+            # Closed form fit of log(lambda) = log(alpha) - kappa * delta, weighted to reduce the bias of the log
+            slope, intercept = np.polyfit(price_levels, np.log(lambdas_adj), 1, w=np.sqrt(lambdas_adj))
+            initial_values = (np.exp(intercept), max(-slope, 0))
+        else:
+            initial_values = (self._alpha, self._kappa)
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
             params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
                                price_levels,
                                lambdas_adj,
-                               p0=(self._alpha, self._kappa),
+                               p0=initial_values,
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
 
@@ -2,9 +2,9 @@ import logging
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
-from functools import lru_cache
+from functools import lru_cache, partial
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -15,6 +15,7 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book_wake_trigger import OrderBookWakeTrigger
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -69,6 +70,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
     SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION = 60.0 * 15
     CANCEL_EXPIRY_DURATION = 60.0
+    TAKER_BOOK_MIN_WAKE_INTERVAL = 0.1
 
     @classmethod
     def logger(cls):
@@ -126,6 +128,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         self._last_conv_rates_logged = 0
         self._hb_app_notification = hb_app_notification
+        self._taker_book_wake_trigger: Optional[OrderBookWakeTrigger] = None
 
         # Holds active maker orders, all its taker orders ever created
         self._maker_to_taker_order_ids = {}
@@ -146,6 +149,11 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def min_profitability(self):
         return self._config_map.min_profitability / Decimal("100")
 
+    @property
+    def taker_book_wake_threshold(self) -> Optional[Decimal]:
+        threshold = self._config_map.taker_book_wake_threshold
+        return threshold / Decimal("100") if threshold is not None else None
+
     @property
     def order_size_taker_volume_factor(self):
         return self._config_map.order_size_taker_volume_factor / Decimal("100")
@@ -362,6 +370,27 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def start(self, clock: Clock, timestamp: float):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
+        if self.taker_book_wake_threshold is not None:
+            # Re-evaluate the maker orders as soon as the taker top of book moves, instead of waiting for the next tick
+            clock.register_event_driven_iterator(self, min_wake_interval=self.TAKER_BOOK_MIN_WAKE_INTERVAL)
+            self._taker_book_wake_trigger = OrderBookWakeTrigger(
+                wake_function=partial(clock.wake_iterator, self),
+                top_of_book_threshold=float(self.taker_book_wake_threshold),
+            )
+
+    def stop(self, clock: Clock):
+        if self._taker_book_wake_trigger is not None:
+            self._taker_book_wake_trigger.unwatch_all()
+            self._taker_book_wake_trigger = None
+            clock.unregister_event_driven_iterator(self)
+        super().stop(clock)
+
+    def watch_taker_order_books(self):
+        if self._taker_book_wake_trigger is None:
+            return
+        for market_pair in self._market_pairs.values():
+            if not self.is_gateway_market(market_pair.taker):
+                self._taker_book_wake_trigger.watch(market_pair.taker.order_book)
 
     def tick(self, timestamp: float):
         """
@@ -392,6 +421,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 # Markets are ready, ok to proceed.
                 if LogOption.STATUS_REPORT:
                     self.logger().info("Markets are ready.")
+                self.watch_taker_order_books()
 
         if not self._conversions_ready:
             for market_pair in self._market_pairs.values():
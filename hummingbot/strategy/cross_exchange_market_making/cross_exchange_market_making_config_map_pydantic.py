@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, root_validator, validator
 
@@ -337,6 +337,18 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
         ),
     )
 
+    taker_book_wake_threshold: Optional[Decimal] = Field(
+        default=None,
+        description="Move of the taker top of book (in percentage) that triggers an immediate strategy tick.",
+        ge=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "How much should the taker top of book move to immediately re-evaluate the orders? "
+                "Enter 0.01 to indicate 0.01%, or leave empty to only evaluate them at every clock tick"
+            ),
+        ),
+    )
+
     debug_price_shim: bool = Field(
         default=False,
         description="Usd the debug price shim to mock gateway price.",
@@ -15,6 +15,7 @@ from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import PositionMode
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.exceptions import InvalidController
@@ -33,6 +34,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StoreExecutorAction,
 )
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.utils.controllers_config_watcher import ControllersConfigWatcher
 
 
 class StrategyV2ConfigBase(BaseClientModel):
@@ -70,7 +72,7 @@ class StrategyV2ConfigBase(BaseClientModel):
         gt=0,
         client_data=ClientFieldData(
             prompt_on_new=False,
-            prompt=lambda mi: "Enter the config update interval in seconds (e.g. 60): ",
+            prompt=lambda mi: "Enter the interval in seconds to check the controller config files for changes (e.g. 60): ",
         )
     )
 
@@ -91,27 +93,36 @@ class StrategyV2ConfigBase(BaseClientModel):
             full_path = os.path.join(settings.CONTROLLERS_CONF_DIR_PATH, config_path)
             with open(full_path, 'r') as file:
                 config_data = yaml.safe_load(file)
+            loaded_configs.append(self.parse_controller_config(config_data, config_path))
 
-            controller_type = config_data.get('controller_type')
-            controller_name = config_data.get('controller_name')
+        return loaded_configs
 
-            if not controller_type or not controller_name:
-                raise ValueError(f"Missing controller_type or controller_name in {config_path}")
+    @staticmethod
+    def parse_controller_config(config_data: Dict, config_path: str = "") -> ControllerConfigBase:
+        """
+        Validates the data of a controller configuration with the configuration class of its controller.
 
-            module_path = f"{settings.CONTROLLERS_MODULE}.{controller_type}.{controller_name}"
-            module = importlib.import_module(module_path)
+        :param config_data: the configuration data, as loaded from the controller config file.
+        :param config_path: the path of the controller config file, used in the error messages.
+        """
+        controller_type = config_data.get('controller_type')
+        controller_name = config_data.get('controller_name')
 
-            config_class = next((member for member_name, member in inspect.getmembers(module)
-                                 if inspect.isclass(member) and member not in [ControllerConfigBase,
-                                                                               MarketMakingControllerConfigBase,
-                                                                               DirectionalTradingControllerConfigBase]
-                                 and (issubclass(member, ControllerConfigBase))), None)
-            if not config_class:
-                raise InvalidController(f"No configuration class found in the module {controller_name}.")
+        if not controller_type or not controller_name:
+            raise ValueError(f"Missing controller_type or controller_name in {config_path or config_data}")
 
-            loaded_configs.append(config_class(**config_data))
+        module_path = f"{settings.CONTROLLERS_MODULE}.{controller_type}.{controller_name}"
+        module = importlib.import_module(module_path)
 
-        return loaded_configs
+        config_class = next((member for member_name, member in inspect.getmembers(module)
+                             if inspect.isclass(member) and member not in [ControllerConfigBase,
+                                                                           MarketMakingControllerConfigBase,
+                                                                           DirectionalTradingControllerConfigBase]
+                             and (issubclass(member, ControllerConfigBase))), None)
+        if not config_class:
+            raise InvalidController(f"No configuration class found in the module {controller_name}.")
+
+        return config_class(**config_data)
 
     @validator('markets', pre=True)
     def parse_markets(cls, v) -> Dict[str, Set[str]]:
@@ -206,13 +217,15 @@ class StrategyV2Base(ScriptStrategyBase):
         self.market_data_provider = MarketDataProvider(connectors)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
         self.controllers: Dict[str, ControllerBase] = {}
+        self.controllers_config_watcher = ControllersConfigWatcher(config)
+        self._reload_controllers_configs_task: Optional[asyncio.Task] = None
         self.initialize_controllers()
 
     def initialize_controllers(self):
         """
         Initialize the controllers based on the provided configuration.
         """
-        controllers_configs = self.config.load_controller_configs()
+        controllers_configs = self.controllers_config_watcher.load_changed_configs(raise_errors=True)
         for controller_config in controllers_configs:
             self.add_controller(controller_config)
             MarketsRecorder.get_instance().store_controller_config(controller_config)
@@ -227,16 +240,32 @@ class StrategyV2Base(ScriptStrategyBase):
 
     def update_controllers_configs(self):
         """
-        Update the controllers configurations based on the provided configuration.
+        Check the controller config files for changes every config update interval. The files are checked and the
+        changed ones parsed in a worker thread, so the trading loop only applies the updated configurations.
         """
         if self._last_config_update_ts + self.config.config_update_interval < self.current_timestamp:
-            self._last_config_update_ts = self.current_timestamp
-            controllers_configs = self.config.load_controller_configs()
-            for controller_config in controllers_configs:
-                if controller_config.id in self.controllers:
-                    self.controllers[controller_config.id].update_config(controller_config)
-                else:
-                    self.add_controller(controller_config)
+            if self._reload_controllers_configs_task is None or self._reload_controllers_configs_task.done():
+                self._last_config_update_ts = self.current_timestamp
+                self._reload_controllers_configs_task = safe_ensure_future(self.reload_controllers_configs())
+
+    async def reload_controllers_configs(self):
+        """
+        Load the controller configurations whose files changed and apply them.
+        """
+        controllers_configs = await asyncio.get_running_loop().run_in_executor(
+            None, self.controllers_config_watcher.load_changed_configs)
+        self.apply_controllers_configs(controllers_configs)
+
+    def apply_controllers_configs(self, controllers_configs: List[ControllerConfigBase]):
+        """
+        Apply updated controller configurations, from the config files or pushed through the remote interface. All the
+        configurations are applied at once in the event loop, creating the controllers of the new ones.
+        """
+        for controller_config in controllers_configs:
+            if controller_config.id in self.controllers:
+                self.controllers[controller_config.id].update_config(controller_config)
+            else:
+                self.add_controller(controller_config)
 
     async def listen_to_executor_actions(self):
         """
@@ -274,6 +303,9 @@ class StrategyV2Base(ScriptStrategyBase):
         return "perpetual" in connector
 
     async def on_stop(self):
+        if self._reload_controllers_configs_task is not None:
+            self._reload_controllers_configs_task.cancel()
+            self._reload_controllers_configs_task = None
         self.executor_orchestrator.stop()
         self.market_data_provider.stop()
         self.listen_to_executor_actions_task.cancel()
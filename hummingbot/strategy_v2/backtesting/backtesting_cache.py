@@ -0,0 +1,156 @@
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import pickle
+import shutil
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerConfigBase,
+)
+from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
+
+logger = logging.getLogger(__name__)
+
+# Parquet needs one of the optional engines of pandas, without them the frames are pickled
+PARQUET_AVAILABLE = any(importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet"))
+
+
+class BacktestingCache:
+    """
+    Local store of the processed data of the controllers and of the backtesting results, to re-run backtests without
+    recomputing what didn't change.
+
+    The fields of the base controller configs (barriers, amounts, spreads, leverage...) are used by the controllers to
+    create the executors, while the fields added by each controller (indicator parameters) and the market data fields
+    (connector, trading pair and candles) define the features. The processed data is keyed by the feature fields, so
+    the runs that only change the execution fields reuse the features and only simulate the executors again. The
+    results are keyed by all the fields.
+
+    The entries are not invalidated when the code of a controller changes, clear() removes them.
+    """
+    MARKET_DATA_FIELDS = {"connector_name", "trading_pair", "candles_config", "controller_name", "controller_type"}
+    EXECUTION_FIELDS = (set(ControllerConfigBase.__fields__) | set(DirectionalTradingControllerConfigBase.__fields__) |
+                        set(MarketMakingControllerConfigBase.__fields__)) - MARKET_DATA_FIELDS
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        :param cache_dir: the directory of the cache, by default backtesting_cache in the data directory
+        """
+        self.cache_dir = cache_dir or os.path.join(data_path(), "backtesting_cache")
+        self._processed_data: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def features_key(cls, controller_config: ControllerConfigBase, start: int, end: int, data_source: str) -> str:
+        """
+        Returns the key of the processed data of the controller config in the backtesting period.
+        :param data_source: the name of the market data source, the features depend on it
+        """
+        config = controller_config.dict()
+        return cls._hash({
+            "controller": f"{type(controller_config).__module__}.{type(controller_config).__name__}",
+            "config": {field: value for field, value in config.items() if field not in cls.EXECUTION_FIELDS},
+            "start": start,
+            "end": end,
+            "data_source": data_source,
+        })
+
+    @classmethod
+    def results_key(cls, features_key: str, controller_config: ControllerConfigBase, engine: str,
+                    backtesting_resolution: str, trade_cost: float) -> str:
+        """
+        Returns the key of the results of the controller config, with the processed data of the features key.
+        """
+        config = controller_config.dict()
+        return cls._hash({
+            "features_key": features_key,
+            "config": {field: value for field, value in config.items() if field in cls.EXECUTION_FIELDS and
+                       field != "id"},
+            "engine": engine,
+            "backtesting_resolution": backtesting_resolution,
+            "trade_cost": trade_cost,
+        })
+
+    def get_processed_data(self, key: str) -> Optional[Dict[str, Any]]:
+        if key not in self._processed_data:
+            path = self._path("features", key)
+            # The values are written after the data frames, so the entry is complete when they exist
+            if not os.path.isfile(os.path.join(path, "processed_data.pkl")):
+                return None
+            logger.info(f"Loading the cached processed data from {path}")
+            processed_data = self._read_pickle(os.path.join(path, "processed_data.pkl"))
+            for file_name in sorted(os.listdir(path)):
+                name, extension = os.path.splitext(file_name)
+                if extension == ".parquet":
+                    processed_data[name] = pd.read_parquet(os.path.join(path, file_name))
+                elif extension == ".pkl" and name != "processed_data":
+                    processed_data[name] = pd.read_pickle(os.path.join(path, file_name))
+            self._processed_data[key] = processed_data
+        # The backtesting engine replaces the features of the processed data
+        return dict(self._processed_data[key])
+
+    def save_processed_data(self, key: str, processed_data: Dict[str, Any]):
+        """
+        Stores the data frames of the processed data in columnar files and the rest of the values in a pickle file.
+        """
+        path = self._path("features", key)
+        os.makedirs(path, exist_ok=True)
+        values = {}
+        for name, value in processed_data.items():
+            if isinstance(value, pd.DataFrame):
+                if PARQUET_AVAILABLE:
+                    value.to_parquet(os.path.join(path, f"{name}.parquet"))
+                else:
+                    value.to_pickle(os.path.join(path, f"{name}.pkl"))
+            else:
+                values[name] = value
+        self._write_pickle(os.path.join(path, "processed_data.pkl"), values)
+        self._processed_data[key] = dict(processed_data)
+
+    def get_results(self, key: str) -> Optional[Dict[str, Any]]:
+        if key not in self._results:
+            path = self._path("results", f"{key}.pkl")
+            if not os.path.isfile(path):
+                return None
+            self._results[key] = self._read_pickle(path)
+        return dict(self._results[key])
+
+    def save_results(self, key: str, results: Dict[str, Any]):
+        """
+        Stores the executors and the results of a backtest.
+        """
+        os.makedirs(self._path("results"), exist_ok=True)
+        self._write_pickle(self._path("results", f"{key}.pkl"), results)
+        self._results[key] = dict(results)
+
+    def clear(self):
+        self._processed_data.clear()
+        self._results.clear()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self.cache_dir, *parts)
+
+    @staticmethod
+    def _hash(values: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _read_pickle(path: str) -> Any:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+
+    @staticmethod
+    def _write_pickle(path: str, value: Any):
+        # Written to a temporary file first, so that interrupted runs don't leave corrupted entries
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            pickle.dump(value, file)
+        os.replace(temporary_path, path)
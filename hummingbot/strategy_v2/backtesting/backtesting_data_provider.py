@@ -69,6 +69,15 @@ class BacktestingDataProvider(MarketDataProvider):
     def time(self):
         return self._time
 
+    def update_time(self, timestamp: float):
+        self._time = timestamp
+
+    def get_data_source(self) -> str:
+        """
+        Returns the description of the market data source, that identifies the data of the backtests.
+        """
+        return type(self).__name__
+
     async def initialize_trading_rules(self, connector_name: str):
         if len(self.trading_rules.get(connector_name, {})) == 0:
             connector = self.connectors.get(connector_name)
@@ -10,18 +10,30 @@ import yaml
 
 from hummingbot.client import settings
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
+from hummingbot.strategy_v2.backtesting.backtesting_cache import BacktestingCache
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.executor_batch_simulator_base import BatchedExecutorSimulation, PriceArrays
 from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_batch_simulator import (
+    DCAExecutorBatchSimulator,
+)
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_batch_simulator import (
+    PositionExecutorBatchSimulator,
+)
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.tick_executor_simulator import TickExecutorSimulator
+from hummingbot.strategy_v2.backtesting.matching_engine import MatchingEngine
+from hummingbot.strategy_v2.backtesting.tick_data_provider import TickBacktestingDataProvider
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerConfigBase,
 )
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
-from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
@@ -30,12 +42,22 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class BacktestingEngineBase:
-    def __init__(self):
+    def __init__(self, backtesting_data_provider: Optional[BacktestingDataProvider] = None,
+                 backtesting_cache: Optional[BacktestingCache] = None):
+        """
+        :param backtesting_data_provider: the data provider, a TickBacktestingDataProvider runs the tick level
+        backtesting of the trading pairs with events files. By default, the candles of the exchanges are used.
+        :param backtesting_cache: if set, the processed data and the results are reused by the runs with the same
+        configuration, and the runs that only change the execution parameters reuse the processed data.
+        """
         self.controller = None
         self.backtesting_resolution = None
-        self.backtesting_data_provider = BacktestingDataProvider(connectors={})
+        self.backtesting_data_provider = backtesting_data_provider or BacktestingDataProvider(connectors={})
+        self.backtesting_cache = backtesting_cache
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
+        self.position_executor_batch_simulator = PositionExecutorBatchSimulator()
+        self.dca_executor_batch_simulator = DCAExecutorBatchSimulator()
 
     @classmethod
     def load_controller_config(cls,
@@ -81,7 +103,12 @@ class BacktestingEngineBase:
                               controller_config: ControllerConfigBase,
                               start: int, end: int,
                               backtesting_resolution: str = "1m",
-                              trade_cost=0.0006):
+                              trade_cost=0.0006,
+                              batch_simulation: bool = False):
+        """
+        :param batch_simulation: if True, the position and DCA executors created at each candle are simulated with the
+        batch simulators, over price arrays shared by the whole backtest.
+        """
         # Load historical candles
         controller_class = controller_config.get_controller_class()
         self.backtesting_data_provider.update_backtesting_time(start, end)
@@ -90,15 +117,51 @@ class BacktestingEngineBase:
                                            actions_queue=None)
         self.backtesting_resolution = backtesting_resolution
         await self.initialize_backtesting_data_provider()
-        await self.controller.update_processed_data()
-        executors_info = await self.simulate_execution(trade_cost=trade_cost)
-        results = self.summarize_results(executors_info, controller_config.total_amount_quote)
+        if self.backtesting_cache is None:
+            await self.controller.update_processed_data()
+            executors_info = await self.simulate_execution(trade_cost=trade_cost, batch_simulation=batch_simulation)
+            results = self.summarize_results(executors_info, controller_config.total_amount_quote)
+        else:
+            executors_info, results = await self.run_cached_backtesting(controller_config, start, end, trade_cost,
+                                                                        batch_simulation)
         return {
             "executors": executors_info,
             "results": results,
             "processed_data": self.controller.processed_data,
         }
 
+    async def run_cached_backtesting(self, controller_config: ControllerConfigBase, start: int, end: int,
+                                     trade_cost: float, batch_simulation: bool = False):
+        """
+        Runs the backtesting with the processed data and the results of the cache when they are available, and stores
+        the ones computed.
+
+        Returns:
+            Tuple[List[ExecutorInfo], Dict]: The executors info and the summary of the results.
+        """
+        features_key = self.backtesting_cache.features_key(
+            controller_config, start, end, data_source=self.backtesting_data_provider.get_data_source())
+        processed_data = self.backtesting_cache.get_processed_data(features_key)
+        if processed_data is None:
+            await self.controller.update_processed_data()
+            self.backtesting_cache.save_processed_data(features_key, self.controller.processed_data)
+        else:
+            self.controller.processed_data = processed_data
+        results_key = self.backtesting_cache.results_key(
+            features_key, controller_config,
+            engine=f"{type(self).__name__}_batch" if batch_simulation else type(self).__name__,
+            backtesting_resolution=self.backtesting_resolution, trade_cost=trade_cost)
+        cached_results = self.backtesting_cache.get_results(results_key)
+        if cached_results is not None:
+            # The processed data is prepared as in the simulation
+            self.prepare_market_data()
+            self.controller.executors_info = cached_results["executors"]
+            return cached_results["executors"], cached_results["results"]
+        executors_info = await self.simulate_execution(trade_cost=trade_cost, batch_simulation=batch_simulation)
+        results = self.summarize_results(executors_info, controller_config.total_amount_quote)
+        self.backtesting_cache.save_results(results_key, {"executors": executors_info, "results": results})
+        return executors_info, results
+
     async def initialize_backtesting_data_provider(self):
         backtesting_config = CandlesConfig(
             connector=self.controller.config.connector_name,
@@ -109,31 +172,87 @@ class BacktestingEngineBase:
         for config in self.controller.config.candles_config:
             await self.controller.market_data_provider.initialize_candles_feed(config)
 
-    async def simulate_execution(self, trade_cost: float) -> list:
+    async def simulate_execution(self, trade_cost: float, batch_simulation: bool = False) -> list:
         """
         Simulates market making strategy over historical data, considering trading costs.
 
         Args:
             trade_cost (float): The cost per trade.
+            batch_simulation (bool): If True, the executors created at each candle are simulated together with the
+                batch simulators, except the DCA executors in taker mode.
 
         Returns:
             List[ExecutorInfo]: List of executor information objects detailing the simulation results.
         """
+        if self.is_tick_level_backtesting():
+            return await self.simulate_tick_execution(trade_cost=trade_cost)
         processed_features = self.prepare_market_data()
-        self.active_executor_simulations: List[ExecutorSimulation] = []
+        prices = PriceArrays(processed_features) if batch_simulation else None
+        self.active_executor_simulations: List[Union[ExecutorSimulation, BatchedExecutorSimulation]] = []
         self.stopped_executors_info: List[ExecutorInfo] = []
         for i, row in processed_features.iterrows():
             self.update_market_data(row)
             await self.update_processed_data(row)
             self.update_executors_info(row["timestamp"])
+            batch_configs = []
             for action in self.controller.determine_executor_actions():
                 if isinstance(action, CreateExecutorAction):
+                    if prices is not None and self.supports_batch_simulation(action.executor_config):
+                        batch_configs.append(action.executor_config)
+                        continue
                     executor_simulation = self.simulate_executor(action.executor_config, processed_features.loc[i:], trade_cost)
                     if executor_simulation.close_type != CloseType.FAILED:
                         self.manage_active_executors(executor_simulation)
                 elif isinstance(action, StopExecutorAction):
                     self.handle_stop_action(action, row["timestamp"])
+            for executor_simulation in self.simulate_executors_batch(batch_configs, prices, trade_cost):
+                if executor_simulation.close_type != CloseType.FAILED:
+                    self.active_executor_simulations.append(executor_simulation)
+
+        return self.controller.executors_info
+
+    def is_tick_level_backtesting(self) -> bool:
+        provider = self.controller.market_data_provider
+        return isinstance(provider, TickBacktestingDataProvider) and provider.has_tick_events(
+            self.controller.config.connector_name, self.controller.config.trading_pair)
+
+    async def simulate_tick_execution(self, trade_cost: float) -> list:
+        """
+        Simulates the strategy replaying the order book diffs and trades of the trading pair, with the orders of the
+        executors matched in a simulated matching engine. The controller is updated when each candle of the
+        backtesting resolution closes.
+
+        Args:
+            trade_cost (float): The cost per trade (fees), for maker and taker fills.
 
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        processed_features = self.prepare_market_data()
+        provider = self.controller.market_data_provider
+        connector_name = self.controller.config.connector_name
+        trading_pair = self.controller.config.trading_pair
+        engine = MatchingEngine(provider.get_tick_events(connector_name, trading_pair))
+        simulator = TickExecutorSimulator(engine, trade_cost)
+        interval_in_seconds = CandlesBase.interval_to_seconds[self.backtesting_resolution]
+        self.controller.executors_info = []
+        for _, row in processed_features.iterrows():
+            # The candle is known when it closes
+            timestamp = row["timestamp"] + interval_in_seconds
+            simulator.advance_to(timestamp)
+            self.update_market_data(row)
+            mid_price = engine.mid_price
+            if not np.isnan(mid_price):
+                provider.prices[f"{connector_name}_{trading_pair}"] = Decimal(str(mid_price))
+            provider.update_time(timestamp)
+            await self.update_processed_data(row)
+            self.controller.executors_info = simulator.executors_info()
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    simulator.create_executor(action.executor_config)
+                elif isinstance(action, StopExecutorAction):
+                    simulator.stop_executor(action.executor_id)
+        self.controller.executors_info = simulator.executors_info()
         return self.controller.executors_info
 
     def update_executors_info(self, timestamp: float):
@@ -199,7 +318,7 @@ class BacktestingEngineBase:
         connector_name = self.controller.config.connector_name
         trading_pair = self.controller.config.trading_pair
         self.controller.market_data_provider.prices = {f"{connector_name}_{trading_pair}": Decimal(row["close_bt"])}
-        self.controller.market_data_provider._time = row["timestamp"]
+        self.controller.market_data_provider.update_time(row["timestamp"])
 
     def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], df: pd.DataFrame,
                           trade_cost: float) -> Optional[ExecutorSimulation]:
@@ -220,6 +339,34 @@ class BacktestingEngineBase:
             return self.position_executor_simulator.simulate(df, config, trade_cost)
         return None
 
+    @staticmethod
+    def supports_batch_simulation(config: Union[PositionExecutorConfig, DCAExecutorConfig]) -> bool:
+        if isinstance(config, DCAExecutorConfig):
+            return config.mode != DCAMode.TAKER
+        return isinstance(config, PositionExecutorConfig)
+
+    def simulate_executors_batch(self, configs: List[Union[PositionExecutorConfig, DCAExecutorConfig]],
+                                 prices: Optional[PriceArrays], trade_cost: float) -> List[BatchedExecutorSimulation]:
+        """
+        Simulates the executors created at the same candle with the batch simulators.
+
+        Args:
+            configs (List): The configurations of the executors, starting at their timestamp.
+            prices (PriceArrays): The market data of the whole backtest.
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[BatchedExecutorSimulation]: The simulations of the position executors, then of the DCA executors.
+        """
+        simulations = []
+        for simulator, config_type in ((self.position_executor_batch_simulator, PositionExecutorConfig),
+                                       (self.dca_executor_batch_simulator, DCAExecutorConfig)):
+            type_configs = [config for config in configs if isinstance(config, config_type)]
+            if len(type_configs) > 0:
+                simulations.extend(
+                    simulator.simulate_with_prices(prices, type_configs, trade_cost).executor_simulations())
+        return simulations
+
     def manage_active_executors(self, simulation: ExecutorSimulation):
         """
         Manages the list of active executors based on the simulation results.
@@ -0,0 +1,302 @@
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class PriceArrays:
+    """
+    Market data shared by the simulations of a batch of executors.
+
+    The first index of a range where a series crosses a threshold is found for all the executors at once, by binary
+    lifting over tables of the running maxima (and minima) of the series on windows of 2^j candles.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.timestamps = df["timestamp"].to_numpy(dtype=float)
+        self.series = {column: df[column].to_numpy(dtype=float) for column in ("open", "high", "low", "close")}
+        self._range_tables: Dict[str, List[np.ndarray]] = {}
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.series["close"]
+
+    def index_at_or_after(self, timestamps: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self.timestamps, timestamps, side="left")
+
+    def index_at_or_before(self, timestamps: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self.timestamps, timestamps, side="right") - 1
+
+    def _range_table(self, column: str, use_max: bool) -> List[np.ndarray]:
+        key = f"{column}_{'max' if use_max else 'min'}"
+        if key not in self._range_tables:
+            # The minima are stored as the maxima of the opposite series
+            table = [self.series[column] if use_max else -self.series[column]]
+            width = 1
+            while width * 2 <= len(self):
+                previous = table[-1]
+                table.append(np.maximum(previous[:-width], previous[width:]))
+                width *= 2
+            self._range_tables[key] = table
+        return self._range_tables[key]
+
+    def first_index(self, column: str, starts: np.ndarray, ends: np.ndarray, thresholds: np.ndarray,
+                    above: bool, strict: bool = False) -> np.ndarray:
+        """
+        Returns the first index in [start, end] where the column is above (>=) or below (<=) the threshold, for every
+        range, or -1 when the column doesn't cross the threshold in the range.
+
+        Args:
+            column (str): The series to check (open, high, low or close).
+            starts (np.ndarray): First index of the ranges.
+            ends (np.ndarray): Last index (included) of the ranges.
+            thresholds (np.ndarray): The threshold of every range.
+            above (bool): True to look for values above the threshold, False for values below it.
+            strict (bool): True to exclude the values equal to the threshold.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.minimum(np.asarray(ends, dtype=np.int64), len(self) - 1)
+        thresholds = np.asarray(thresholds, dtype=float)
+        if not above:
+            thresholds = -thresholds
+        if strict:
+            thresholds = np.nextafter(thresholds, np.inf)
+        table = self._range_table(column, use_max=above)
+        positions = starts.copy()
+        valid = (starts >= 0) & (starts <= ends)
+        for level in range(len(table) - 1, -1, -1):
+            width = 1 << level
+            # Skip the windows fully inside the range whose maximum doesn't reach the threshold
+            can_skip = valid & (positions + width - 1 <= ends)
+            candidates = np.flatnonzero(can_skip)
+            if len(candidates) == 0:
+                continue
+            skip = table[level][positions[candidates]] < thresholds[candidates]
+            positions[candidates[skip]] += width
+        return np.where(valid & (positions <= ends), positions, -1)
+
+
+class ExecutorBatchSimulation:
+    """
+    Results of the simulation of a batch of executors, stored as arrays instead of one DataFrame per executor.
+
+    The fills of an executor are kept per level (a single level for the position executors) as cumulative amounts, so
+    the state of any executor at any candle is computed from the shared close prices.
+    """
+
+    def __init__(self,
+                 configs: List[Union[PositionExecutorConfig, DCAExecutorConfig]],
+                 prices: PriceArrays,
+                 trade_cost: float,
+                 side_multipliers: np.ndarray,
+                 start_indices: np.ndarray,
+                 close_indices: np.ndarray,
+                 close_types: np.ndarray,
+                 entry_indices: np.ndarray,
+                 filled_amounts_quote: np.ndarray,
+                 filled_amounts_base: np.ndarray,
+                 average_prices: np.ndarray,
+                 initial_average_prices: np.ndarray):
+        self.configs = configs
+        self.prices = prices
+        self.trade_cost = trade_cost
+        self.side_multipliers = side_multipliers
+        self.start_indices = start_indices
+        self.close_indices = close_indices
+        # Values of the close types
+        self.close_types = close_types
+        # Arrays of shape (executors, levels), the levels not filled have an entry index equal to len(prices)
+        self.entry_indices = entry_indices
+        self.filled_amounts_quote = filled_amounts_quote
+        self.filled_amounts_base = filled_amounts_base
+        self.average_prices = average_prices
+        self.initial_average_prices = initial_average_prices
+
+    def __len__(self):
+        return len(self.configs)
+
+    def close_type(self, executor_index: int) -> CloseType:
+        return CloseType(self.close_types[executor_index])
+
+    def state_at_index(self, index: Union[int, np.ndarray], executor_indices: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Computes the state of the executors at a candle index (the state at the close candle after it is closed).
+
+        Returns:
+            Dict[str, np.ndarray]: filled_amount_quote, net_pnl_quote, net_pnl_pct, cum_fees_quote and
+            current_position_average_price of every executor.
+        """
+        if executor_indices is None:
+            executor_indices = np.arange(len(self))
+        indices = np.minimum(index, self.close_indices[executor_indices])
+        filled_levels = (self.entry_indices[executor_indices] <= indices[:, None]).sum(axis=1)
+        last_level = np.maximum(filled_levels - 1, 0)
+        is_filled = filled_levels > 0
+        filled_quote = np.where(is_filled, self.filled_amounts_quote[executor_indices, last_level], 0.0)
+        filled_base = np.where(is_filled, self.filled_amounts_base[executor_indices, last_level], 0.0)
+        close = self.prices.close[np.clip(indices, 0, len(self.prices) - 1)]
+        net_pnl_quote = self.side_multipliers[executor_indices] * (close * filled_base - filled_quote) - \
+            self.trade_cost * filled_quote
+        net_pnl_pct = np.divide(net_pnl_quote, filled_quote, out=np.zeros_like(net_pnl_quote), where=is_filled)
+        return {
+            "filled_amount_quote": filled_quote,
+            "net_pnl_quote": net_pnl_quote,
+            "net_pnl_pct": net_pnl_pct,
+            "cum_fees_quote": self.trade_cost * filled_quote,
+            "current_position_average_price": np.where(
+                is_filled, self.average_prices[executor_indices, last_level],
+                self.initial_average_prices[executor_indices]),
+        }
+
+    def get_executor_info_at_timestamp(self, executor_index: int, timestamp: float) -> ExecutorInfo:
+        config = self.configs[executor_index]
+        index = int(self.prices.index_at_or_before(timestamp))
+        if index < self.start_indices[executor_index]:
+            return ExecutorInfo(
+                id=config.id,
+                timestamp=config.timestamp,
+                type=config.type,
+                status=RunnableStatus.TERMINATED,
+                config=config,
+                net_pnl_pct=Decimal(0),
+                net_pnl_quote=Decimal(0),
+                cum_fees_quote=Decimal(0),
+                filled_amount_quote=Decimal(0),
+                is_active=False,
+                is_trading=False,
+                custom_info={}
+            )
+
+        close_index = self.close_indices[executor_index]
+        is_active = index < close_index
+        index = min(index, close_index)
+        state = {key: value[0] for key, value in self.state_at_index(index, np.array([executor_index])).items()}
+        # The close candle includes the amount of the closing order
+        filled_amount_quote = state["filled_amount_quote"] * (1 if is_active else 2)
+        return ExecutorInfo(
+            id=config.id,
+            timestamp=config.timestamp,
+            type=config.type,
+            close_timestamp=None if is_active else float(self.prices.timestamps[index]),
+            close_type=None if is_active else self.close_type(executor_index),
+            status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED,
+            config=config,
+            net_pnl_pct=Decimal(state["net_pnl_pct"]),
+            net_pnl_quote=Decimal(state["net_pnl_quote"]),
+            cum_fees_quote=Decimal(state["cum_fees_quote"]),
+            filled_amount_quote=Decimal(filled_amount_quote),
+            is_active=is_active,
+            is_trading=filled_amount_quote > 0 and is_active,
+            custom_info={
+                "close_price": self.prices.close[index],
+                "level_id": config.level_id,
+                "side": config.side,
+                "current_position_average_price": state["current_position_average_price"],
+            }
+        )
+
+    def executor_simulations(self) -> List["BatchedExecutorSimulation"]:
+        return [BatchedExecutorSimulation(self, executor_index) for executor_index in range(len(self))]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns one row per executor with its final state.
+        """
+        state = self.state_at_index(self.close_indices)
+        return pd.DataFrame({
+            "id": [config.id for config in self.configs],
+            "timestamp": [config.timestamp for config in self.configs],
+            "close_timestamp": self.prices.timestamps[self.close_indices],
+            "close_type": [self.close_type(i) for i in range(len(self))],
+            "filled_levels": (self.entry_indices < len(self.prices)).sum(axis=1),
+            "net_pnl_pct": state["net_pnl_pct"],
+            "net_pnl_quote": state["net_pnl_quote"],
+            "cum_fees_quote": state["cum_fees_quote"],
+            "filled_amount_quote": state["filled_amount_quote"] * 2,
+        })
+
+
+class BatchedExecutorSimulation:
+    """
+    Simulation of one executor of a batch, with the interface of the ExecutorSimulation used by the backtesting engine.
+    """
+
+    def __init__(self, batch: ExecutorBatchSimulation, executor_index: int):
+        self.batch = batch
+        self.executor_index = executor_index
+
+    @property
+    def config(self) -> Union[PositionExecutorConfig, DCAExecutorConfig]:
+        return self.batch.configs[self.executor_index]
+
+    @property
+    def close_type(self) -> CloseType:
+        return self.batch.close_type(self.executor_index)
+
+    def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
+        return self.batch.get_executor_info_at_timestamp(self.executor_index, timestamp)
+
+
+class ExecutorBatchSimulatorBase:
+    """Base class for the simulators of a batch of executors of the same type."""
+
+    def simulate(self, df: pd.DataFrame, configs: List, trade_cost: float) -> ExecutorBatchSimulation:
+        """Simulates all the executors over the same market data."""
+        return self.simulate_with_prices(PriceArrays(df), configs, trade_cost)
+
+    def simulate_with_prices(self, prices: PriceArrays, configs: List, trade_cost: float) -> ExecutorBatchSimulation:
+        raise NotImplementedError
+
+    @staticmethod
+    def time_limit_indices(prices: PriceArrays, configs: List, time_limits: List[Optional[int]]) -> np.ndarray:
+        """
+        Returns the index of the last candle before the time limit of every executor.
+        """
+        last_timestamp = prices.timestamps[-1]
+        tl_timestamps = np.array([config.timestamp + time_limit if time_limit else last_timestamp
+                                  for config, time_limit in zip(configs, time_limits)], dtype=float)
+        return prices.index_at_or_before(tl_timestamps)
+
+    @staticmethod
+    def first_cross_indices(prices: PriceArrays, mask: np.ndarray, is_buy: np.ndarray, starts: np.ndarray,
+                            ends: np.ndarray, thresholds: np.ndarray, above_when_buy: bool,
+                            columns: Tuple[str, str] = ("close", "close"), strict: bool = False) -> np.ndarray:
+        """
+        Returns the first index where the price crosses the threshold of every executor in the mask (or -1), in the
+        direction given for the buy executors and in the opposite direction for the sell executors.
+
+        Args:
+            columns (Tuple[str, str]): The price series checked for the buy and for the sell executors.
+        """
+        indices = np.full(len(mask), -1, dtype=np.int64)
+        for side_mask, column, above in ((mask & is_buy, columns[0], above_when_buy),
+                                         (mask & ~is_buy, columns[1], not above_when_buy)):
+            executors = np.flatnonzero(side_mask)
+            if len(executors) > 0:
+                indices[executors] = prices.first_index(column, starts[executors], ends[executors],
+                                                        thresholds[executors], above=above, strict=strict)
+        return indices
+
+    @staticmethod
+    def earliest_close(ends: np.ndarray, barriers: List[Tuple[int, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the close index and the close type of every executor, given the hit indices (-1 if not hit) of the
+        barriers in order of priority. The executors that don't hit any barrier are closed at the time limit.
+        """
+        close_indices = ends.copy()
+        for _, hit_indices in barriers:
+            close_indices = np.where((hit_indices >= 0) & (hit_indices < close_indices), hit_indices, close_indices)
+        close_types = np.full(len(ends), CloseType.TIME_LIMIT.value, dtype=np.int8)
+        for close_type, hit_indices in reversed(barriers):
+            close_types[hit_indices == close_indices] = close_type
+        return close_indices, close_types
@@ -0,0 +1,141 @@
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_batch_simulator_base import (
+    ExecutorBatchSimulation,
+    ExecutorBatchSimulatorBase,
+    PriceArrays,
+)
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
+from hummingbot.strategy_v2.models.executors import CloseType
+
+# Close type code of the levels closed by the fill of the next level
+NEXT_LEVEL = 0
+
+
+class DCAExecutorBatchSimulator(ExecutorBatchSimulatorBase):
+    """
+    Simulates a batch of DCA executors over the same market data, with the same levels and barriers as the
+    DCAExecutorSimulator. The levels are processed in order for all the executors at once, and the break even prices
+    are computed with prefix sums of the level amounts.
+    """
+
+    def simulate_with_prices(self, prices: PriceArrays, configs: List[DCAExecutorConfig],
+                             trade_cost: float) -> ExecutorBatchSimulation:
+        if any(config.mode == DCAMode.TAKER for config in configs):
+            raise NotImplementedError("Taker mode is not supported in DCAExecutorBatchSimulator")
+        n_executors = len(configs)
+        n_levels = max([len(config.prices) for config in configs], default=0)
+        last_index = len(prices) - 1
+        is_buy = np.array([config.side == TradeType.BUY for config in configs], dtype=bool)
+        side_multipliers = np.where(is_buy, 1, -1)
+        starts = np.minimum(prices.index_at_or_after(np.array([config.timestamp for config in configs], dtype=float)),
+                            last_index)
+        ends = np.maximum(self.time_limit_indices(prices, configs, [config.time_limit for config in configs]), starts)
+
+        levels = np.array([len(config.prices) for config in configs], dtype=np.int64)
+        level_prices = np.full((n_executors, n_levels), np.nan)
+        level_amounts = np.zeros((n_executors, n_levels))
+        for i, config in enumerate(configs):
+            level_prices[i, :levels[i]] = [float(price) for price in config.prices]
+            level_amounts[i, :levels[i]] = [float(amount) for amount in config.amounts_quote]
+        cum_amounts_quote = np.cumsum(level_amounts, axis=1)
+        break_even_prices = np.divide(np.nancumsum(level_prices * level_amounts, axis=1), cum_amounts_quote,
+                                      out=np.full_like(cum_amounts_quote, np.nan), where=cum_amounts_quote > 0)
+
+        take_profits = self._config_values([config.take_profit for config in configs])
+        stop_losses = self._config_values([config.stop_loss for config in configs])
+        close_indices = ends.copy()
+        close_types = np.full(n_executors, CloseType.TIME_LIMIT.value, dtype=np.int8)
+        entry_indices = np.full((n_executors, max(n_levels, 1)), len(prices), dtype=np.int64)
+        is_open = np.ones(n_executors, dtype=bool)
+
+        for level in range(n_levels):
+            in_level = is_open & (levels > level)
+            entries = self.first_cross_indices(prices, in_level, is_buy, starts, ends, level_prices[:, level],
+                                               above_when_buy=False)
+            # Without fills at the first level the executor expires, and it fails if a next level is not filled
+            not_filled = in_level & (entries < 0)
+            close_types[not_filled] = CloseType.TIME_LIMIT.value if level == 0 else CloseType.FAILED.value
+            is_open &= ~not_filled
+            is_filled = in_level & (entries >= 0)
+            entry_indices[is_filled, level] = entries[is_filled]
+
+            break_even = break_even_prices[:, level]
+            is_last_level = levels == level + 1
+            take_profit_indices = self.first_cross_indices(
+                prices, is_filled & ~np.isnan(take_profits), is_buy, entries, ends,
+                break_even * (1 + take_profits * side_multipliers), above_when_buy=True)
+            stop_loss_indices = self.first_cross_indices(
+                prices, is_filled & is_last_level & ~np.isnan(stop_losses), is_buy, entries, ends,
+                break_even * (1 - stop_losses * side_multipliers), above_when_buy=False, columns=("low", "high"))
+            next_level_indices = np.full(n_executors, -1, dtype=np.int64)
+            if level + 1 < n_levels:
+                next_level_indices = self.first_cross_indices(
+                    prices, is_filled & ~is_last_level, is_buy, entries, ends, level_prices[:, level + 1],
+                    above_when_buy=False)
+            trailing_stop_indices = np.full(n_executors, -1, dtype=np.int64)
+            for i in np.flatnonzero(is_filled):
+                trailing_stop = configs[i].trailing_stop
+                if trailing_stop is not None:
+                    index = self._trailing_stop_index(
+                        prices.close[entries[i]:ends[i] + 1], break_even[i], bool(is_buy[i]),
+                        float(trailing_stop.activation_price), float(trailing_stop.trailing_delta))
+                    trailing_stop_indices[i] = entries[i] + index if index >= 0 else -1
+
+            level_close_indices, level_close_types = self.earliest_close(ends, [
+                (CloseType.TAKE_PROFIT.value, take_profit_indices),
+                (CloseType.STOP_LOSS.value, stop_loss_indices),
+                (CloseType.TRAILING_STOP.value, trailing_stop_indices),
+                (NEXT_LEVEL, next_level_indices),
+            ])
+            is_closed = is_filled & (level_close_types != NEXT_LEVEL)
+            close_indices[is_closed] = level_close_indices[is_closed]
+            close_types[is_closed] = level_close_types[is_closed]
+            is_open &= ~is_closed
+
+        is_level_filled = entry_indices < len(prices)
+        entry_close = np.where(is_level_filled, prices.close[np.minimum(entry_indices, last_index)], np.inf)
+        amounts_quote = np.zeros_like(entry_close)
+        amounts_quote[:, :n_levels] = level_amounts
+        return ExecutorBatchSimulation(
+            configs=configs,
+            prices=prices,
+            trade_cost=trade_cost,
+            side_multipliers=side_multipliers,
+            start_indices=starts,
+            close_indices=close_indices,
+            close_types=close_types,
+            entry_indices=entry_indices,
+            filled_amounts_quote=np.cumsum(np.where(is_level_filled, amounts_quote, 0), axis=1),
+            filled_amounts_base=np.cumsum(np.where(is_level_filled, amounts_quote / entry_close, 0), axis=1),
+            average_prices=np.pad(break_even_prices, ((0, 0), (0, entry_indices.shape[1] - n_levels))),
+            initial_average_prices=level_prices[:, 0] if n_levels > 0 else np.full(n_executors, np.nan),
+        )
+
+    @staticmethod
+    def _config_values(values: List) -> np.ndarray:
+        return np.array([float(value) if value else np.nan for value in values], dtype=float)
+
+    @staticmethod
+    def _trailing_stop_index(close: np.ndarray, break_even_price: float, is_buy: bool, activation_pct: float,
+                             trailing_delta_pct: float) -> int:
+        """
+        Returns the first index where the close price retraces more than the trailing delta from its best price, once
+        it has reached the activation price, or -1.
+        """
+        if is_buy:
+            is_activated = close >= break_even_price * (1 + activation_pct)
+        else:
+            is_activated = close <= break_even_price * (1 - activation_pct)
+        if not is_activated.any():
+            return -1
+        activation = int(np.argmax(is_activated))
+        close = close[activation:]
+        if is_buy:
+            hits = np.flatnonzero(close <= np.maximum.accumulate(close * (1 - trailing_delta_pct)))
+        else:
+            hits = np.flatnonzero(close >= np.minimum.accumulate(close * (1 + trailing_delta_pct)))
+        return activation + int(hits[0]) if len(hits) > 0 else -1
@@ -0,0 +1,99 @@
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_batch_simulator_base import (
+    ExecutorBatchSimulation,
+    ExecutorBatchSimulatorBase,
+    PriceArrays,
+)
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class PositionExecutorBatchSimulator(ExecutorBatchSimulatorBase):
+    """
+    Simulates a batch of position executors over the same market data, with the same barriers as the
+    PositionExecutorSimulator. The barriers are checked from the entry candle of each executor.
+    """
+
+    def simulate_with_prices(self, prices: PriceArrays, configs: List[PositionExecutorConfig],
+                             trade_cost: float) -> ExecutorBatchSimulation:
+        last_index = len(prices) - 1
+        barriers = [config.triple_barrier_config for config in configs]
+        is_buy = np.array([config.side == TradeType.BUY for config in configs], dtype=bool)
+        side_multipliers = np.where(is_buy, 1, -1)
+        starts = np.minimum(prices.index_at_or_after(np.array([config.timestamp for config in configs], dtype=float)),
+                            last_index)
+        ends = np.maximum(self.time_limit_indices(prices, configs, [barrier.time_limit for barrier in barriers]), starts)
+
+        # The limit orders are filled when the close price crosses the entry price, the market orders at the start
+        is_limit = np.array([barrier.open_order_type.is_limit_type() for barrier in barriers], dtype=bool)
+        config_entry_prices = np.array([float(config.entry_price) if config.entry_price is not None else np.nan
+                                        for config in configs], dtype=float)
+        entries = starts.copy()
+        entries[is_limit] = self.first_cross_indices(
+            prices, is_limit, is_buy, starts, np.full(len(configs), last_index), config_entry_prices,
+            above_when_buy=False)[is_limit]
+        is_filled = (entries >= 0) & (entries <= ends)
+        entry_prices = np.where(is_filled, prices.close[np.maximum(entries, 0)], np.nan)
+
+        take_profits = self._barrier_values([barrier.take_profit for barrier in barriers])
+        stop_losses = self._barrier_values([barrier.stop_loss for barrier in barriers])
+        # The net pnl pct includes the trade cost, so the take profit price is moved by it
+        take_profit_indices = self.first_cross_indices(
+            prices, is_filled & ~np.isnan(take_profits), is_buy, entries, ends,
+            entry_prices * (1 + (take_profits + trade_cost) * side_multipliers), above_when_buy=True, strict=True)
+        stop_loss_indices = self.first_cross_indices(
+            prices, is_filled & ~np.isnan(stop_losses), is_buy, entries, ends,
+            entry_prices * (1 - stop_losses * side_multipliers), above_when_buy=False, columns=("low", "high"))
+        trailing_stop_indices = np.full(len(configs), -1, dtype=np.int64)
+        for i in np.flatnonzero(is_filled):
+            trailing_stop = barriers[i].trailing_stop
+            if trailing_stop is not None:
+                trailing_stop_indices[i] = self._trailing_stop_index(
+                    prices.close[entries[i]:ends[i] + 1], entry_prices[i], side_multipliers[i], trade_cost,
+                    float(trailing_stop.activation_price), float(trailing_stop.trailing_delta))
+        trailing_stop_indices = np.where(trailing_stop_indices >= 0, entries + trailing_stop_indices, -1)
+
+        close_indices, close_types = self.earliest_close(ends, [
+            (CloseType.TAKE_PROFIT.value, take_profit_indices),
+            (CloseType.STOP_LOSS.value, stop_loss_indices),
+            (CloseType.TRAILING_STOP.value, trailing_stop_indices),
+        ])
+        amounts = np.array([float(config.amount) for config in configs], dtype=float)
+        return ExecutorBatchSimulation(
+            configs=configs,
+            prices=prices,
+            trade_cost=trade_cost,
+            side_multipliers=side_multipliers,
+            start_indices=starts,
+            close_indices=close_indices,
+            close_types=close_types,
+            entry_indices=np.where(is_filled, entries, len(prices))[:, None],
+            filled_amounts_quote=np.nan_to_num(amounts * entry_prices)[:, None],
+            filled_amounts_base=amounts[:, None],
+            average_prices=np.where(np.isnan(config_entry_prices), entry_prices, config_entry_prices)[:, None],
+            initial_average_prices=config_entry_prices,
+        )
+
+    @staticmethod
+    def _barrier_values(values: List) -> np.ndarray:
+        return np.array([float(value) if value else np.nan for value in values], dtype=float)
+
+    @staticmethod
+    def _trailing_stop_index(close: np.ndarray, entry_price: float, side_multiplier: int, trade_cost: float,
+                             activation_pct: float, trailing_delta_pct: float) -> int:
+        """
+        Returns the first index where the net pnl pct falls more than the trailing delta from its maximum, once it has
+        exceeded the activation pct, or -1.
+        """
+        net_pnl_pct = (close / entry_price - 1) * side_multiplier - trade_cost
+        is_activated = net_pnl_pct > activation_pct
+        if not is_activated.any():
+            return -1
+        activation = int(np.argmax(is_activated))
+        net_pnl_pct = net_pnl_pct[activation:]
+        hits = np.flatnonzero(net_pnl_pct < np.maximum.accumulate(net_pnl_pct) - trailing_delta_pct)
+        return activation + int(hits[0]) if len(hits) > 0 else -1
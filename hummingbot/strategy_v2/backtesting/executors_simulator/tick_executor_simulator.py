@@ -0,0 +1,286 @@
+import logging
+import math
+from decimal import Decimal
+from typing import Dict, List, Optional, Union
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.matching_engine import MatchingEngine, SimulatedOrder
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+logger = logging.getLogger(__name__)
+
+
+class TickExecutorSimulation:
+    """
+    Simulation of a position or DCA executor with the orders of the executor in a matching engine. The barriers are
+    controlled as in the executors, with the net pnl computed at the best price of the closing side.
+    """
+
+    def __init__(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], engine: MatchingEngine,
+                 trade_cost: float):
+        self.config = config
+        self.engine = engine
+        self.trade_cost = trade_cost
+        self.is_buy = config.side == TradeType.BUY
+        self.side_multiplier = 1 if self.is_buy else -1
+        if isinstance(config, DCAExecutorConfig):
+            if config.mode == DCAMode.TAKER:
+                raise NotImplementedError("Taker mode is not supported in TickExecutorSimulation")
+            self.is_dca = True
+            self.levels = [(float(price), float(amount_quote / price))
+                           for price, amount_quote in zip(config.prices, config.amounts_quote)]
+            self.take_profit = float(config.take_profit) if config.take_profit else None
+            self.stop_loss = float(config.stop_loss) if config.stop_loss else None
+            self.time_limit = config.time_limit
+            self.trailing_stop = config.trailing_stop
+            self.take_profit_is_limit = False
+            is_limit_entry = True
+        else:
+            barriers = config.triple_barrier_config
+            self.is_dca = False
+            is_limit_entry = barriers.open_order_type.is_limit_type() and config.entry_price is not None
+            self.levels = [(float(config.entry_price) if is_limit_entry else math.nan, float(config.amount))]
+            self.take_profit = float(barriers.take_profit) if barriers.take_profit else None
+            self.stop_loss = float(barriers.stop_loss) if barriers.stop_loss else None
+            self.time_limit = barriers.time_limit
+            self.trailing_stop = barriers.trailing_stop
+            self.take_profit_is_limit = self.take_profit is not None and \
+                barriers.take_profit_order_type.is_limit_type()
+
+        self.status = RunnableStatus.RUNNING
+        self.close_type: Optional[CloseType] = None
+        self.close_timestamp: Optional[float] = None
+        self.open_filled_amount = 0.0
+        self.open_filled_amount_quote = 0.0
+        self.close_filled_amount = 0.0
+        self.close_filled_amount_quote = 0.0
+        self.cum_fees_quote = 0.0
+        self._trailing_stop_trigger_pct: Optional[float] = None
+        self._take_profit_order: Optional[SimulatedOrder] = None
+        self._close_order: Optional[SimulatedOrder] = None
+        self._terminated_info: Optional[ExecutorInfo] = None
+        self._open_orders: List[SimulatedOrder] = []
+        for price, amount in self.levels:
+            if is_limit_entry:
+                self._open_orders.append(engine.place_limit_order(self.is_buy, price, amount, self))
+            else:
+                self._open_orders.append(engine.place_market_order(self.is_buy, amount, self))
+
+    @property
+    def is_active(self) -> bool:
+        return self.status != RunnableStatus.TERMINATED
+
+    @property
+    def position_amount(self) -> float:
+        return self.open_filled_amount - self.close_filled_amount
+
+    @property
+    def all_open_orders_filled(self) -> bool:
+        return all(not order.is_open for order in self._open_orders) and \
+            all(order.executed_amount > 0 for order in self._open_orders)
+
+    @property
+    def average_entry_price(self) -> float:
+        return self.open_filled_amount_quote / self.open_filled_amount if self.open_filled_amount > 0 else math.nan
+
+    @property
+    def current_market_price(self) -> float:
+        price = self.engine.best_bid if self.is_buy else self.engine.best_ask
+        return price if math.isfinite(price) else self.engine.mid_price
+
+    @property
+    def close_price(self) -> float:
+        if not self.is_active and self.close_filled_amount > 0:
+            return self.close_filled_amount_quote / self.close_filled_amount
+        return self.current_market_price
+
+    @property
+    def net_pnl_quote(self) -> float:
+        if self.open_filled_amount <= 0:
+            return 0.0
+        average_entry_price = self.average_entry_price
+        close_price = self.close_price
+        if math.isnan(close_price):
+            close_price = average_entry_price
+        trade_pnl_pct = (close_price - average_entry_price) / average_entry_price * self.side_multiplier
+        return trade_pnl_pct * self.open_filled_amount_quote - self.cum_fees_quote
+
+    @property
+    def net_pnl_pct(self) -> float:
+        return self.net_pnl_quote / self.open_filled_amount_quote if self.open_filled_amount_quote > 0 else 0.0
+
+    def process_fill(self, order: SimulatedOrder, amount: float, price: float, is_taker: bool):
+        self.cum_fees_quote += amount * price * self.trade_cost
+        if order.is_buy == self.is_buy:
+            self.open_filled_amount += amount
+            self.open_filled_amount_quote += amount * price
+            if self.take_profit_is_limit and self.is_active and self.all_open_orders_filled:
+                self._place_take_profit_order()
+            self.control_barriers()
+        else:
+            self.close_filled_amount += amount
+            self.close_filled_amount_quote += amount * price
+            if order is self._take_profit_order and not order.is_open:
+                self.close(CloseType.TAKE_PROFIT)
+
+    def control_barriers(self):
+        if not self.is_active or self.position_amount <= 0:
+            return
+        # The position executors control the barriers once the open order is filled
+        if not self.is_dca and not self.all_open_orders_filled:
+            return
+        net_pnl_pct = self.net_pnl_pct
+        if self.stop_loss is not None and net_pnl_pct <= -self.stop_loss and \
+                (not self.is_dca or self.all_open_orders_filled):
+            self.close(CloseType.STOP_LOSS)
+        elif self.trailing_stop is not None and self._control_trailing_stop(net_pnl_pct):
+            self.close(CloseType.TRAILING_STOP)
+        elif self.take_profit is not None and not self.take_profit_is_limit and (
+                net_pnl_pct > self.take_profit if self.is_dca else net_pnl_pct >= self.take_profit):
+            self.close(CloseType.TAKE_PROFIT)
+
+    @property
+    def time_limit_timestamp(self) -> Optional[float]:
+        return self.config.timestamp + self.time_limit if self.time_limit else None
+
+    def control_time_limit(self, timestamp: float):
+        if self.is_active and self.time_limit and timestamp >= self.time_limit_timestamp:
+            self.close(CloseType.TIME_LIMIT)
+
+    def close(self, close_type: CloseType):
+        """
+        Cancels the open orders and closes the position with a market order.
+        """
+        if not self.is_active:
+            return
+        self.status = RunnableStatus.TERMINATED
+        self.close_type = close_type
+        self.close_timestamp = self.engine.timestamp
+        for order in self._open_orders:
+            self.engine.cancel_order(order)
+        if self._take_profit_order is not None:
+            self.engine.cancel_order(self._take_profit_order)
+        if self.position_amount > self.open_filled_amount * 1e-9:
+            self._close_order = self.engine.place_market_order(not self.is_buy, self.position_amount, self)
+
+    def executor_info(self) -> ExecutorInfo:
+        if self._terminated_info is not None:
+            return self._terminated_info
+        average_price = self.average_entry_price
+        info = ExecutorInfo(
+            id=self.config.id,
+            timestamp=self.config.timestamp,
+            type=self.config.type,
+            close_timestamp=self.close_timestamp,
+            close_type=self.close_type,
+            status=self.status,
+            config=self.config,
+            net_pnl_pct=Decimal(str(self.net_pnl_pct)),
+            net_pnl_quote=Decimal(str(self.net_pnl_quote)),
+            cum_fees_quote=Decimal(str(self.cum_fees_quote)),
+            filled_amount_quote=Decimal(str(self.open_filled_amount_quote + self.close_filled_amount_quote)),
+            is_active=self.is_active,
+            is_trading=self.is_active and self.open_filled_amount > 0,
+            custom_info={
+                "close_price": self.close_price,
+                "level_id": self.config.level_id,
+                "side": self.config.side,
+                "current_position_average_price": None if math.isnan(average_price) else average_price,
+            }
+        )
+        if not self.is_active:
+            self._terminated_info = info
+        return info
+
+    def _place_take_profit_order(self):
+        """
+        Places the take profit limit order for the amount filled, replacing the previous one.
+        """
+        if self._take_profit_order is not None:
+            self.engine.cancel_order(self._take_profit_order)
+        price = self.average_entry_price * (1 + self.take_profit * self.side_multiplier)
+        self._take_profit_order = self.engine.place_limit_order(not self.is_buy, price, self.position_amount, self)
+
+    def _control_trailing_stop(self, net_pnl_pct: float) -> bool:
+        activation_pct = float(self.trailing_stop.activation_price)
+        trailing_delta = float(self.trailing_stop.trailing_delta)
+        if self._trailing_stop_trigger_pct is None:
+            if net_pnl_pct > activation_pct:
+                self._trailing_stop_trigger_pct = net_pnl_pct - trailing_delta
+        else:
+            if net_pnl_pct < self._trailing_stop_trigger_pct:
+                return True
+            if net_pnl_pct - trailing_delta > self._trailing_stop_trigger_pct:
+                self._trailing_stop_trigger_pct = net_pnl_pct - trailing_delta
+        return False
+
+
+class TickExecutorSimulator:
+    """
+    Runs the simulations of the executors created during a tick level backtest on the same matching engine. The
+    barriers are controlled every time the top of the order book changes, and the time limits when they expire.
+    """
+
+    def __init__(self, engine: MatchingEngine, trade_cost: float):
+        self.engine = engine
+        self.trade_cost = trade_cost
+        self.simulations: Dict[str, TickExecutorSimulation] = {}
+        self._active_simulations: List[TickExecutorSimulation] = []
+        engine.top_of_book_listener = self.control_barriers
+
+    def create_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig]) -> \
+            Optional[TickExecutorSimulation]:
+        if not isinstance(config, (PositionExecutorConfig, DCAExecutorConfig)):
+            logger.warning(f"The {config.type} executors are not supported in tick level backtesting.")
+            return None
+        if isinstance(config, DCAExecutorConfig) and config.mode == DCAMode.TAKER:
+            logger.warning("The DCA executors in taker mode are not supported in tick level backtesting.")
+            return None
+        simulation = TickExecutorSimulation(config, self.engine, self.trade_cost)
+        self.simulations[config.id] = simulation
+        if simulation.is_active:
+            self._active_simulations.append(simulation)
+        return simulation
+
+    def stop_executor(self, executor_id: str):
+        simulation = self.simulations.get(executor_id)
+        if simulation is not None:
+            simulation.close(CloseType.EARLY_STOP)
+        self._remove_terminated()
+
+    def control_barriers(self):
+        for simulation in self._active_simulations:
+            simulation.control_barriers()
+        self._remove_terminated()
+
+    def advance_to(self, timestamp: float):
+        """
+        Processes the events of the matching engine until the timestamp (included), closing the executors at the
+        expiration of their time limits.
+        """
+        expiration = self._next_time_limit_timestamp()
+        while expiration is not None and expiration <= timestamp:
+            self.engine.advance_to(expiration)
+            self.control_time_limits(expiration)
+            expiration = self._next_time_limit_timestamp()
+        self.engine.advance_to(timestamp)
+
+    def control_time_limits(self, timestamp: float):
+        for simulation in self._active_simulations:
+            simulation.control_time_limit(timestamp)
+        self._remove_terminated()
+
+    def executors_info(self) -> List[ExecutorInfo]:
+        return [simulation.executor_info() for simulation in self.simulations.values()]
+
+    def _next_time_limit_timestamp(self) -> Optional[float]:
+        return min((simulation.time_limit_timestamp for simulation in self._active_simulations
+                    if simulation.time_limit), default=None)
+
+    def _remove_terminated(self):
+        if any(not simulation.is_active for simulation in self._active_simulations):
+            self._active_simulations = [simulation for simulation in self._active_simulations if simulation.is_active]
@@ -0,0 +1,251 @@
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hummingbot.strategy_v2.backtesting.tick_data_provider import TickEvents
+
+
+class SimulatedOrder:
+    """
+    An order of the simulated executors. The owner is notified of the fills with process_fill(order, amount, price,
+    is_taker).
+    """
+    __slots__ = ("order_id", "is_buy", "price", "amount", "executed_amount", "executed_amount_quote", "queue_ahead",
+                 "is_open", "owner")
+
+    def __init__(self, order_id: int, is_buy: bool, price: float, amount: float, owner):
+        self.order_id = order_id
+        self.is_buy = is_buy
+        self.price = price
+        self.amount = amount
+        self.executed_amount = 0.0
+        self.executed_amount_quote = 0.0
+        # Amount of the order book level ahead of the order, that has to be traded before the order is filled
+        self.queue_ahead = 0.0
+        self.is_open = True
+        self.owner = owner
+
+    @property
+    def remaining_amount(self) -> float:
+        return self.amount - self.executed_amount
+
+    @property
+    def average_executed_price(self) -> float:
+        return self.executed_amount_quote / self.executed_amount if self.executed_amount > 0 else math.nan
+
+
+class MatchingEngine:
+    """
+    Replays the order book diffs and the trades of a trading pair, and matches the simulated orders against them.
+
+    The recorded order book isn't modified by the simulated orders. The queue position of a resting order is
+    approximated conservatively: the order joins the end of its price level, the amount ahead of it is reduced by the
+    trades at its price and it can't be larger than the level amount (cancellations are assumed to be ahead of it).
+    An order is filled when the trades at its price exceed the amount ahead of it, or fully when the market trades
+    (or quotes) through its price.
+    """
+
+    def __init__(self, events: TickEvents):
+        self._timestamps = events.timestamps.tolist()
+        self._is_trade = events.is_trade.tolist()
+        self._is_buy = events.is_buy.tolist()
+        self._prices = events.prices.tolist()
+        self._amounts = events.amounts.tolist()
+        self._next_event = 0
+        self.timestamp = self._timestamps[0] if self._timestamps else 0.0
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+        self.best_bid = -math.inf
+        self.best_ask = math.inf
+        self.last_trade_price = math.nan
+        # Resting simulated orders by price, and the best prices of the resting orders
+        self._buy_orders: Dict[float, List[SimulatedOrder]] = {}
+        self._sell_orders: Dict[float, List[SimulatedOrder]] = {}
+        self._max_buy_price = -math.inf
+        self._min_sell_price = math.inf
+        self._order_ids = 0
+        # Called after the events that change the best bid or the best ask
+        self.top_of_book_listener: Optional[Callable[[], None]] = None
+
+    @property
+    def mid_price(self) -> float:
+        if self.best_bid > -math.inf and self.best_ask < math.inf:
+            return (self.best_bid + self.best_ask) / 2
+        return self.last_trade_price
+
+    @property
+    def is_finished(self) -> bool:
+        return self._next_event >= len(self._timestamps)
+
+    def advance_to(self, timestamp: float) -> int:
+        """
+        Processes the events until the timestamp (included), and returns the number of events processed.
+        """
+        timestamps = self._timestamps
+        is_trade = self._is_trade
+        is_buy = self._is_buy
+        prices = self._prices
+        amounts = self._amounts
+        bids = self.bids
+        asks = self.asks
+        first_event = index = self._next_event
+        n_events = len(timestamps)
+        while index < n_events and timestamps[index] <= timestamp:
+            self.timestamp = timestamps[index]
+            price = prices[index]
+            amount = amounts[index]
+            if is_trade[index]:
+                self.last_trade_price = price
+                # A taker buy trades with the asks, a taker sell with the bids
+                if is_buy[index]:
+                    if price >= self._min_sell_price:
+                        self._match_trade(self._sell_orders, False, price, amount)
+                elif price <= self._max_buy_price:
+                    self._match_trade(self._buy_orders, True, price, amount)
+            else:
+                top_of_book_changed = False
+                if is_buy[index]:
+                    if amount > 0:
+                        bids[price] = amount
+                        if price > self.best_bid:
+                            self.best_bid = price
+                            top_of_book_changed = True
+                    elif bids.pop(price, None) is not None and price == self.best_bid:
+                        self.best_bid = max(bids) if bids else -math.inf
+                        top_of_book_changed = True
+                    if price in self._buy_orders:
+                        self._update_queues(self._buy_orders[price], amount)
+                    if amount > 0 and price >= self._min_sell_price:
+                        self._match_crossing_quote(self._sell_orders, False, price)
+                else:
+                    if amount > 0:
+                        asks[price] = amount
+                        if price < self.best_ask:
+                            self.best_ask = price
+                            top_of_book_changed = True
+                    elif asks.pop(price, None) is not None and price == self.best_ask:
+                        self.best_ask = min(asks) if asks else math.inf
+                        top_of_book_changed = True
+                    if price in self._sell_orders:
+                        self._update_queues(self._sell_orders[price], amount)
+                    if amount > 0 and price <= self._max_buy_price:
+                        self._match_crossing_quote(self._buy_orders, True, price)
+                if top_of_book_changed and self.top_of_book_listener is not None:
+                    self._next_event = index + 1
+                    self.top_of_book_listener()
+            index += 1
+        self._next_event = index
+        self.timestamp = max(self.timestamp, timestamp)
+        return index - first_event
+
+    def place_limit_order(self, is_buy: bool, price: float, amount: float, owner) -> SimulatedOrder:
+        """
+        Places a limit order, the part that crosses the order book is filled as taker and the rest rests in the book.
+        """
+        order = self._new_order(is_buy, price, amount, owner)
+        if (is_buy and price >= self.best_ask) or (not is_buy and price <= self.best_bid):
+            self._fill_as_taker(order, price)
+        if order.is_open:
+            order.queue_ahead = (self.bids if is_buy else self.asks).get(price, 0.0)
+            orders = self._buy_orders if is_buy else self._sell_orders
+            orders.setdefault(price, []).append(order)
+            self._update_best_order_prices()
+        return order
+
+    def place_market_order(self, is_buy: bool, amount: float, owner) -> SimulatedOrder:
+        order = self._new_order(is_buy, math.nan, amount, owner)
+        self._fill_as_taker(order, None)
+        if order.is_open:
+            # Without enough liquidity in the order book, the rest is filled at the last price
+            last_price = self.mid_price
+            if not math.isnan(last_price):
+                self._fill(order, order.remaining_amount, last_price, True)
+        return order
+
+    def cancel_order(self, order: SimulatedOrder):
+        if not order.is_open:
+            return
+        order.is_open = False
+        self._remove_resting_order(order)
+
+    def _new_order(self, is_buy: bool, price: float, amount: float, owner) -> SimulatedOrder:
+        self._order_ids += 1
+        return SimulatedOrder(self._order_ids, is_buy, price, amount, owner)
+
+    def _fill(self, order: SimulatedOrder, amount: float, price: float, is_taker: bool):
+        amount = min(amount, order.remaining_amount)
+        if amount <= 0 or not order.is_open:
+            return
+        order.executed_amount += amount
+        order.executed_amount_quote += amount * price
+        if order.remaining_amount <= order.amount * 1e-12:
+            order.is_open = False
+            self._remove_resting_order(order)
+        order.owner.process_fill(order, amount, price, is_taker)
+
+    def _fill_as_taker(self, order: SimulatedOrder, limit_price: Optional[float]):
+        """
+        Fills the order with the opposite side levels, from the best price to the limit price.
+        """
+        levels: List[Tuple[float, float]] = sorted(self.asks.items()) if order.is_buy \
+            else sorted(self.bids.items(), reverse=True)
+        remaining = order.remaining_amount
+        amount_quote = 0.0
+        for price, amount in levels:
+            if remaining <= 0 or (limit_price is not None and
+                                  (price > limit_price if order.is_buy else price < limit_price)):
+                break
+            traded = min(amount, remaining)
+            remaining -= traded
+            amount_quote += traded * price
+        traded = order.remaining_amount - remaining
+        if traded > 0:
+            self._fill(order, traded, amount_quote / traded, True)
+
+    def _match_trade(self, orders_by_price: Dict[float, List[SimulatedOrder]], is_buy: bool, trade_price: float,
+                     trade_amount: float):
+        for price in list(orders_by_price):
+            traded_through = price > trade_price if is_buy else price < trade_price
+            if traded_through:
+                for order in list(orders_by_price.get(price, [])):
+                    self._fill(order, order.remaining_amount, price, False)
+            elif price == trade_price:
+                remaining_trade = trade_amount
+                for order in list(orders_by_price.get(price, [])):
+                    # The trade fills the amount ahead of the order first
+                    consumed = min(order.queue_ahead, remaining_trade)
+                    order.queue_ahead -= consumed
+                    remaining_trade -= consumed
+                    if remaining_trade <= 0:
+                        break
+                    filled = min(order.remaining_amount, remaining_trade)
+                    remaining_trade -= filled
+                    self._fill(order, filled, price, False)
+
+    def _match_crossing_quote(self, orders_by_price: Dict[float, List[SimulatedOrder]], is_buy: bool,
+                              quote_price: float):
+        """
+        Fills the resting orders crossed by a new quote of the opposite side, that would have traded with them.
+        """
+        for price in list(orders_by_price):
+            if (price >= quote_price) if is_buy else (price <= quote_price):
+                for order in list(orders_by_price.get(price, [])):
+                    self._fill(order, order.remaining_amount, price, False)
+
+    @staticmethod
+    def _update_queues(orders: List[SimulatedOrder], level_amount: float):
+        for order in orders:
+            if order.queue_ahead > level_amount:
+                order.queue_ahead = level_amount
+
+    def _remove_resting_order(self, order: SimulatedOrder):
+        orders_by_price = self._buy_orders if order.is_buy else self._sell_orders
+        orders = orders_by_price.get(order.price)
+        if orders is not None and order in orders:
+            orders.remove(order)
+            if len(orders) == 0:
+                del orders_by_price[order.price]
+            self._update_best_order_prices()
+
+    def _update_best_order_prices(self):
+        self._max_buy_price = max(self._buy_orders) if self._buy_orders else -math.inf
+        self._min_sell_price = min(self._sell_orders) if self._sell_orders else math.inf
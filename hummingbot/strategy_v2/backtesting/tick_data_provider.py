@@ -0,0 +1,154 @@
+import logging
+import os
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.trades_candles import TradesCandles
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+logger = logging.getLogger(__name__)
+
+
+class TickEvents:
+    """
+    Recorded market events of a trading pair, sorted by timestamp:
+    - diff: the new amount of a price level of the order book (0 removes the level), side is buy for the bids.
+    - trade: a public trade, side is the side of the taker.
+
+    The events files are CSV files (optionally compressed) with the columns timestamp, event_type, side, price and
+    amount, where event_type is diff or trade and side is buy or sell.
+    """
+    COLUMNS = ["timestamp", "event_type", "side", "price", "amount"]
+
+    def __init__(self, timestamps: np.ndarray, is_trade: np.ndarray, is_buy: np.ndarray, prices: np.ndarray,
+                 amounts: np.ndarray):
+        self.timestamps = timestamps
+        self.is_trade = is_trade
+        self.is_buy = is_buy
+        self.prices = prices
+        self.amounts = amounts
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "TickEvents":
+        missing_columns = set(cls.COLUMNS) - set(df.columns)
+        if missing_columns:
+            raise ValueError(f"The events are missing the columns {sorted(missing_columns)}.")
+        df = df.sort_values("timestamp", kind="stable")
+        event_types = df["event_type"].str.lower()
+        if not event_types.isin(["diff", "trade"]).all():
+            raise ValueError("The event types must be diff or trade.")
+        return cls(timestamps=df["timestamp"].to_numpy(dtype=float),
+                   is_trade=(event_types == "trade").to_numpy(),
+                   is_buy=(df["side"].str.lower() == "buy").to_numpy(),
+                   prices=df["price"].to_numpy(dtype=float),
+                   amounts=df["amount"].to_numpy(dtype=float))
+
+    @classmethod
+    def from_file(cls, path: str) -> "TickEvents":
+        return cls.from_dataframe(pd.read_csv(path, dtype={"event_type": str, "side": str}))
+
+    def between(self, start_time: float, end_time: float) -> "TickEvents":
+        """
+        Returns the events until the end time. The order book diffs before the start time are kept, since they build
+        the order book at the start time.
+        """
+        end = np.searchsorted(self.timestamps, end_time, side="right")
+        start = np.searchsorted(self.timestamps, start_time, side="left")
+        keep = np.ones(end, dtype=bool)
+        keep[:start] = ~self.is_trade[:start]
+        return TickEvents(self.timestamps[:end][keep], self.is_trade[:end][keep], self.is_buy[:end][keep],
+                          self.prices[:end][keep], self.amounts[:end][keep])
+
+    def trades_candles(self, interval: str, start_time: float, end_time: float) -> pd.DataFrame:
+        """
+        Builds the candles of the interval from the trades. The intervals without trades get a candle without volume
+        at the last close price.
+        """
+        interval_in_seconds = TradesCandles.get_interval_in_seconds(interval)
+        is_trade = self.is_trade & (self.timestamps >= start_time) & (self.timestamps <= end_time)
+        timestamps = self.timestamps[is_trade]
+        if len(timestamps) == 0:
+            return pd.DataFrame(columns=CandlesBase.columns, dtype=float)
+        prices = self.prices[is_trade]
+        amounts = self.amounts[is_trade]
+        taker_buy_amounts = np.where(self.is_buy[is_trade], amounts, 0.0)
+        buckets = timestamps // interval_in_seconds * interval_in_seconds
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(timestamps)] - 1
+        candles = pd.DataFrame({
+            "timestamp": buckets[starts],
+            "open": prices[starts],
+            "high": np.maximum.reduceat(prices, starts),
+            "low": np.minimum.reduceat(prices, starts),
+            "close": prices[ends],
+            "volume": np.add.reduceat(amounts, starts),
+            "quote_asset_volume": np.add.reduceat(amounts * prices, starts),
+            "n_trades": np.diff(np.r_[starts, len(timestamps)]).astype(float),
+            "taker_buy_base_volume": np.add.reduceat(taker_buy_amounts, starts),
+            "taker_buy_quote_volume": np.add.reduceat(taker_buy_amounts * prices, starts),
+        })
+        all_timestamps = np.arange(buckets[0], buckets[-1] + interval_in_seconds, interval_in_seconds, dtype=float)
+        candles = candles.set_index("timestamp").reindex(all_timestamps)
+        candles["close"] = candles["close"].ffill()
+        for column in ("open", "high", "low"):
+            candles[column] = candles[column].fillna(candles["close"])
+        candles = candles.fillna(0.0)
+        candles.index.name = "timestamp"
+        return candles.reset_index()[CandlesBase.columns]
+
+
+class TickBacktestingDataProvider(BacktestingDataProvider):
+    """
+    Data provider of the tick level backtesting: the order book diffs and the trades of the trading pairs are loaded
+    from local files and replayed through a simulated matching engine, and the candles are built from the trades.
+    The trading pairs without events files use the candles of the exchange.
+
+    The trading rules can be set in trading_rules to run without network access.
+    """
+
+    def __init__(self, connectors: Dict[str, ConnectorBase], events_files: Dict[str, str]):
+        """
+        :param connectors: the connectors, as in BacktestingDataProvider
+        :param events_files: the path of the events file of every trading pair, by {connector_name}_{trading_pair}
+        """
+        super().__init__(connectors)
+        self.events_files = events_files
+        self._tick_events: Dict[str, TickEvents] = {}
+
+    def has_tick_events(self, connector_name: str, trading_pair: str) -> bool:
+        return f"{connector_name}_{trading_pair}" in self.events_files
+
+    def get_data_source(self) -> str:
+        """
+        Includes the path, modification time and size of the events files, so that the data is identified by them.
+        """
+        files = []
+        for key, path in sorted(self.events_files.items()):
+            stat = os.stat(path)
+            files.append(f"{key}={os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}")
+        return f"{super().get_data_source()}({','.join(files)})"
+
+    def get_tick_events(self, connector_name: str, trading_pair: str) -> Optional[TickEvents]:
+        key = f"{connector_name}_{trading_pair}"
+        if key not in self.events_files:
+            return None
+        if key not in self._tick_events:
+            logger.info(f"Loading the events of {trading_pair} from {self.events_files[key]}")
+            self._tick_events[key] = TickEvents.from_file(self.events_files[key])
+        return self._tick_events[key].between(self.start_time, self.end_time)
+
+    async def get_candles_feed(self, config: CandlesConfig):
+        if not self.has_tick_events(config.connector, config.trading_pair):
+            return await super().get_candles_feed(config)
+        events = self.get_tick_events(config.connector, config.trading_pair)
+        candles_df = events.trades_candles(config.interval, self.start_time, self.end_time)
+        self.candles_feeds[self._generate_candle_feed_key(config)] = candles_df
+        return candles_df
@@ -157,12 +157,18 @@ class ControllerBase(RunnableBase):
     def update_config(self, new_config: ControllerConfigBase):
         """
         Update the controller configuration. With the variables that in the client_data have the is_updatable flag set
-        to True. This will be only available for those variables that don't interrupt the bot operation.
+        to True. This will be only available for those variables that don't interrupt the bot operation. Only the
+        values that changed are set.
         """
+        changes = {}
         for field in self.config.__fields__.values():
             client_data = field.field_info.extra.get("client_data")
             if client_data and client_data.is_updatable:
-                setattr(self.config, field.name, getattr(new_config, field.name))
+                new_value = getattr(new_config, field.name)
+                if new_value != getattr(self.config, field.name):
+                    changes[field.name] = new_value
+        for field_name, value in changes.items():
+            setattr(self.config, field_name, value)
 
     async def control_task(self):
         if self.market_data_provider.ready and self.executors_update_event.is_set():
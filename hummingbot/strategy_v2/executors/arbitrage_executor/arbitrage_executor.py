@@ -5,6 +5,7 @@ from typing import Union
 
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_wake_trigger import OrderBookWakeTrigger
 from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketOrderFailureEvent, SellOrderCreatedEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
@@ -70,6 +71,22 @@ class ArbitrageExecutor(ExecutorBase):
         self._last_tx_cost = Decimal("1")
         self._cumulative_failures = 0
 
+        self._order_book_wake_trigger = OrderBookWakeTrigger(wake_function=self.wake)
+        if config.order_book_update_min_interval is not None:
+            self.enable_event_driven_updates(min_wake_interval=config.order_book_update_min_interval)
+
+    def on_start(self):
+        super().on_start()
+        if self.config.order_book_update_min_interval is not None:
+            for market in (self.buying_market, self.selling_market):
+                if not self.is_amm_connector(exchange=market.connector_name):
+                    self._order_book_wake_trigger.watch(
+                        self.connectors[market.connector_name].get_order_book(market.trading_pair))
+
+    def on_stop(self):
+        super().on_stop()
+        self._order_book_wake_trigger.unwatch_all()
+
     def validate_sufficient_balance(self):
         # TODO: Implement this method checking balances in the two exchanges
         pass
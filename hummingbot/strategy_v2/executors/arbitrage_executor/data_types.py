@@ -1,5 +1,6 @@
 from decimal import Decimal
 from enum import Enum
+from typing import Optional
 
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair, ExecutorConfigBase
 
@@ -11,6 +12,8 @@ class ArbitrageExecutorConfig(ExecutorConfigBase):
     order_amount: Decimal
     min_profitability: Decimal
     max_retries: int = 3
+    # When set, the order book updates of the markets wake up the executor, at most once per interval (in seconds)
+    order_book_update_min_interval: Optional[float] = None
 
 
 class ArbitrageExecutorStatus(Enum):
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -20,6 +20,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -47,14 +48,38 @@ class ExecutorBase(RunnableBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
+        # The executor info is built lazily and cached until the executor state changes
+        self._state_version = 0
+        self._state_listeners: List[Callable[["ExecutorBase"], None]] = []
+        self._executor_info_cache: Optional[Tuple[Tuple, ExecutorInfo]] = None
+
+        # Order event handlers, notifying the state change after processing the event
+        process_order_created_event = self._changing_state(self.process_order_created_event)
+        process_order_filled_event = self._changing_state(self.process_order_filled_event)
+        process_order_completed_event = self._changing_state(self.process_order_completed_event)
+        process_order_canceled_event = self._changing_state(self.process_order_canceled_event)
+        process_order_failed_event = self._changing_state(self.process_order_failed_event)
+        self._event_handlers: Dict[int, Callable[[int, ConnectorBase, any], None]] = {
+            MarketEvent.OrderCancelled.value: process_order_canceled_event,
+            MarketEvent.BuyOrderCreated.value: process_order_created_event,
+            MarketEvent.SellOrderCreated.value: process_order_created_event,
+            MarketEvent.OrderFilled.value: process_order_filled_event,
+            MarketEvent.BuyOrderCompleted.value: process_order_completed_event,
+            MarketEvent.SellOrderCompleted.value: process_order_completed_event,
+            MarketEvent.OrderFailure.value: process_order_failed_event,
+        }
+        # The events of the orders are routed to the executor by the router when it has one, otherwise the executor
+        # listens to all the events of its connectors
+        self._event_router: Optional[ExecutorEventRouter] = None
+
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(process_order_created_event)
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(process_order_created_event)
+        self._fill_order_forwarder = SourceInfoEventForwarder(process_order_filled_event)
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(process_order_completed_event)
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(process_order_completed_event)
+        self._cancel_order_forwarder = SourceInfoEventForwarder(process_order_canceled_event)
+        self._failed_order_forwarder = SourceInfoEventForwarder(process_order_failed_event)
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -102,10 +127,27 @@ class ExecutorBase(RunnableBase):
         """
         return self._status == RunnableStatus.TERMINATED
 
+    @property
+    def state_key(self) -> Tuple:
+        """
+        Returns a key that changes whenever the executor info may have changed: on order events and status changes,
+        and on every tick while the executor is not closed, since its PnL follows the market.
+        """
+        return (self._state_version, self._status, None if self.is_closed else self._strategy.current_timestamp)
+
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
+        Returns the executor info. It is built at most once per state key, and must not be modified by the callers.
+        """
+        state_key = self.state_key
+        if self._executor_info_cache is None or self._executor_info_cache[0] != state_key:
+            self._executor_info_cache = (state_key, self.build_executor_info())
+        return self._executor_info_cache[1]
+
+    def build_executor_info(self) -> ExecutorInfo:
+        """
+        Builds the executor info from the current state of the executor.
         """
         ei = ExecutorInfo(
             id=self.config.id,
@@ -130,6 +172,33 @@ class ExecutorBase(RunnableBase):
         ei.net_pnl_pct = ei.net_pnl_pct if not ei.net_pnl_pct.is_nan() else Decimal("0")
         return ei
 
+    def add_state_listener(self, listener: Callable[["ExecutorBase"], None]):
+        """
+        Adds a listener called with the executor when its state changes on an order event or a status change.
+        """
+        self._state_listeners.append(listener)
+
+    def remove_state_listener(self, listener: Callable[["ExecutorBase"], None]):
+        if listener in self._state_listeners:
+            self._state_listeners.remove(listener)
+
+    def notify_state_change(self):
+        """
+        Invalidates the cached executor info and notifies the state listeners.
+        """
+        self._state_version += 1
+        for listener in list(self._state_listeners):
+            listener(self)
+
+    def _changing_state(self, process_event: Callable[[int, ConnectorBase, any], None]):
+        """
+        Wraps an order event handler to notify the state change after processing the event.
+        """
+        def process_event_and_notify(event_tag: int, market: ConnectorBase, event: any):
+            process_event(event_tag, market, event)
+            self.notify_state_change()
+        return process_event_and_notify
+
     def get_custom_info(self) -> Dict:
         """
         Returns the custom info of the executor. Returns an empty dictionary by default, and can be reimplemented
@@ -160,6 +229,7 @@ class ExecutorBase(RunnableBase):
         """
         super().start()
         self.register_events()
+        self.notify_state_change()
 
     def stop(self):
         """
@@ -168,6 +238,7 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
         self.unregister_events()
+        self.notify_state_change()
 
     def on_start(self):
         """
@@ -242,22 +313,46 @@ class ExecutorBase(RunnableBase):
         """
         return self.connectors[connector_name]._order_tracker.fetch_order(client_order_id=order_id)
 
+    def set_event_router(self, event_router: ExecutorEventRouter):
+        """
+        Sets the router of the order events. It has to be set before the executor starts.
+        """
+        self._event_router = event_router
+
     def register_events(self):
         """
-        Registers the events with the connectors.
+        Registers the events with the connectors, or with the event router if the executor has one.
         """
+        if self._event_router is not None:
+            self._event_router.add_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.add_listener(event_pair[0], event_pair[1])
 
     def unregister_events(self):
         """
-        Unregisters the events from the connectors.
+        Unregisters the events from the connectors, or from the event router if the executor has one.
         """
+        if self._event_router is not None:
+            self._event_router.remove_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
 
+    def process_event(self, event_tag: int, market: ConnectorBase, event: any):
+        """
+        Processes an order event routed to the executor.
+
+        :param event_tag: The event tag.
+        :param market: The market where the event occurred.
+        :param event: The event.
+        """
+        handler = self._event_handlers.get(event_tag)
+        if handler is not None:
+            handler(event_tag, market, event)
+
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
         Adjusts the order candidates based on the budget checker of the specified exchange.
@@ -285,6 +380,21 @@ class ExecutorBase(RunnableBase):
         :param price: The price for the order.
         :return: The result of the order placement.
         """
+        if self._event_router is None:
+            return self._place_order(connector_name, trading_pair, order_type, side, amount, position_action, price)
+        with self._event_router.placing_order(self):
+            order_id = self._place_order(connector_name, trading_pair, order_type, side, amount, position_action, price)
+        self._event_router.register_order(order_id, self)
+        return order_id
+
+    def _place_order(self,
+                     connector_name: str,
+                     trading_pair: str,
+                     order_type: OrderType,
+                     side: TradeType,
+                     amount: Decimal,
+                     position_action: PositionAction,
+                     price: Decimal):
         if side == TradeType.BUY:
             return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
@@ -0,0 +1,93 @@
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+ROUTED_EVENTS = [
+    MarketEvent.OrderCancelled,
+    MarketEvent.BuyOrderCreated,
+    MarketEvent.SellOrderCreated,
+    MarketEvent.OrderFilled,
+    MarketEvent.BuyOrderCompleted,
+    MarketEvent.SellOrderCompleted,
+    MarketEvent.OrderFailure,
+]
+
+
+class ExecutorEventRouter:
+    """
+    Routes the order events of the connectors to the executor that placed each order.
+
+    The router listens once to each connector used by its executors, instead of every executor listening to every
+    event of its connectors, and dispatches each event with a lookup of the executor by client order id. The orders
+    are registered by the executors when they place them. The events triggered by the connector while an order is
+    being placed (before its id is returned) are routed to the executor placing it.
+    """
+
+    def __init__(self):
+        self._order_executors: Dict[str, "ExecutorBase"] = {}
+        self._executor_orders: Dict["ExecutorBase", Set[str]] = {}
+        # Connector -> number of executors using it
+        self._connectors: Dict[ConnectorBase, int] = {}
+        self._placing_executor: Optional["ExecutorBase"] = None
+        self._forwarder = SourceInfoEventForwarder(self._route_event)
+        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
+            (event, self._forwarder) for event in ROUTED_EVENTS
+        ]
+
+    @property
+    def num_orders(self) -> int:
+        return len(self._order_executors)
+
+    def add_executor(self, executor: "ExecutorBase"):
+        if executor in self._executor_orders:
+            return
+        self._executor_orders[executor] = set()
+        for connector in executor.connectors.values():
+            if self._connectors.get(connector, 0) == 0:
+                for event, forwarder in self._event_pairs:
+                    connector.add_listener(event, forwarder)
+            self._connectors[connector] = self._connectors.get(connector, 0) + 1
+
+    def remove_executor(self, executor: "ExecutorBase"):
+        order_ids = self._executor_orders.pop(executor, None)
+        if order_ids is None:
+            return
+        for order_id in order_ids:
+            self._order_executors.pop(order_id, None)
+        for connector in executor.connectors.values():
+            self._connectors[connector] -= 1
+            if self._connectors[connector] == 0:
+                del self._connectors[connector]
+                for event, forwarder in self._event_pairs:
+                    connector.remove_listener(event, forwarder)
+
+    def register_order(self, order_id: str, executor: "ExecutorBase"):
+        executor_orders = self._executor_orders.get(executor)
+        if executor_orders is None:
+            return
+        executor_orders.add(order_id)
+        self._order_executors[order_id] = executor
+
+    @contextmanager
+    def placing_order(self, executor: "ExecutorBase") -> Iterator[None]:
+        previous_executor = self._placing_executor
+        self._placing_executor = executor
+        try:
+            yield
+        finally:
+            self._placing_executor = previous_executor
+
+    def _route_event(self, event_tag: int, market: ConnectorBase, event):
+        order_id = getattr(event, "order_id", None)
+        executor = self._order_executors.get(order_id)
+        if executor is None and self._placing_executor is not None and order_id is not None:
+            executor = self._placing_executor
+            self.register_order(order_id, executor)
+        if executor is not None:
+            executor.process_event(event_tag, market, event)
@@ -1,16 +1,20 @@
+import asyncio
 import logging
-from copy import deepcopy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
+from hummingbot.strategy_v2.executors.executors_archive import ExecutorsArchive
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
@@ -23,7 +27,12 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StopExecutorAction,
     StoreExecutorAction,
 )
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, ExecutorSummary, PerformanceReport
+
+# Contribution of an active executor to the running totals of its controller, updated on its state changes:
+# (realized pnl, volume traded, inventory imbalance, open order volume)
+ExecutorContribution = Tuple[Decimal, Decimal, Decimal, Decimal]
+NO_CONTRIBUTION: ExecutorContribution = (Decimal(0), Decimal(0), Decimal(0), Decimal(0))
 
 
 class ExecutorOrchestrator:
@@ -38,24 +47,49 @@ class ExecutorOrchestrator:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
+    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0,
+                 max_archived_executors: int = 1000):
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.active_executors = {}
-        self.archived_executors = {}
+        # The summaries of the last stored executors of each controller, the rest are only in the database
+        self.max_archived_executors = max_archived_executors
+        self.archived_executors: Dict[str, ExecutorsArchive] = {}
         self.cached_performance = {}
+        # Routes the order events of the connectors to the executor of each order
+        self.event_router = ExecutorEventRouter()
+        self._check_cached_performance_task: Optional[asyncio.Task] = None
+        # The executors report is a snapshot kept until the next tick or the next change of the executors, which bumps
+        # the state version (actions and the order events and status changes of the executors)
+        self._state_version = 0
+        self._executors_report_snapshot: Optional[Tuple[Tuple, Dict[str, List[ExecutorInfo]]]] = None
+        # Running totals of the active executors of each controller, updated when the state of an executor changes
+        self._active_performance: Dict[str, PerformanceReport] = {}
+        self._executor_contributions: Dict[str, Dict[ExecutorBase, ExecutorContribution]] = {}
+        # Active executors with filled orders, the only ones whose PnL follows the market (used as ordered sets)
+        self._open_executors: Dict[str, Dict[ExecutorBase, None]] = {}
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
         """
-        Initialize cached performance by querying the database for stored executors.
+        Initialize cached performance from the aggregated performance of the stored executors, and check in the
+        background that the aggregates are consistent with the stored executors.
         """
-        db_executors = MarketsRecorder.get_instance().get_all_executors()
-        for executor in db_executors:
-            controller_id = executor.controller_id
-            if controller_id not in self.cached_performance:
-                self.cached_performance[controller_id] = PerformanceReport()
-            self._update_cached_performance(controller_id, executor)
+        markets_recorder = MarketsRecorder.get_instance()
+        self.cached_performance.update(markets_recorder.get_executors_performance())
+        self._check_cached_performance_task = safe_ensure_future(self._check_cached_performance(markets_recorder))
+
+    async def _check_cached_performance(self, markets_recorder: MarketsRecorder):
+        """
+        Rebuilds the aggregated performance of the stored executors if it is not consistent with them, and reloads the
+        cached performance of the controllers that have not executed actions yet.
+        """
+        rebuilt = await asyncio.get_running_loop().run_in_executor(
+            None, markets_recorder.check_executors_performance)
+        if rebuilt:
+            for controller_id, report in markets_recorder.get_executors_performance().items():
+                if controller_id not in self.active_executors:
+                    self.cached_performance[controller_id] = report
 
     def _update_cached_performance(self, controller_id: str, executor_info: ExecutorInfo):
         """
@@ -67,10 +101,24 @@ class ExecutorOrchestrator:
         if executor_info.close_type:
             report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
 
+    def _on_executor_state_change(self, executor: ExecutorBase):
+        """
+        Updates the running totals of the controller of the executor after an order event or a status change.
+        """
+        self._state_version += 1
+        self._update_contribution(executor.config.controller_id, executor)
+
+    @property
+    def _snapshot_key(self) -> Tuple:
+        return self.strategy.current_timestamp, self._state_version
+
     def stop(self):
         """
         Stop the orchestrator task and all active executors.
         """
+        if self._check_cached_performance_task is not None:
+            self._check_cached_performance_task.cancel()
+            self._check_cached_performance_task = None
         # first we stop all active executors
         for controller_id, executors_list in self.active_executors.items():
             for executor in executors_list:
@@ -87,9 +135,10 @@ class ExecutorOrchestrator:
         Execute the action and handle executors based on action type.
         """
         controller_id = action.controller_id
+        self._state_version += 1
         if controller_id not in self.active_executors:
             self.active_executors[controller_id] = []
-            self.archived_executors[controller_id] = []
+            self.archived_executors[controller_id] = ExecutorsArchive(controller_id, self.max_archived_executors)
             self.cached_performance[controller_id] = PerformanceReport()
 
         if isinstance(action, CreateExecutorAction):
@@ -130,6 +179,8 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.add_state_listener(self._on_executor_state_change)
+        executor.set_event_router(self.event_router)
         executor.start()
         self.active_executors[controller_id].append(executor)
         self.logger().debug(f"Created {type(executor).__name__} for controller {controller_id}")
@@ -164,49 +215,141 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor ID {executor_id} is still active.")
             return
         MarketsRecorder.get_instance().store_or_update_executor(executor)
-        self._update_cached_performance(controller_id, executor.executor_info)
+        executor_info = executor.executor_info
+        self._update_cached_performance(controller_id, executor_info)
+        executor.remove_state_listener(self._on_executor_state_change)
+        self._remove_contribution(controller_id, executor)
         self.active_executors[controller_id].remove(executor)
-        self.archived_executors[controller_id].append(executor.executor_info)
+        archive = self.archived_executors[controller_id]
+        archive.append(executor_info)
         del executor
+        if archive.total_archived % self.max_archived_executors == 0:
+            self.logger().info(
+                f"Archived {archive.total_archived} executors of controller {controller_id}, {len(archive)} in memory "
+                f"({archive.memory_usage() / 1024:.1f} KB).")
+
+    def get_archived_executors(self, controller_id: str, since: Optional[float] = None) -> List[ExecutorSummary]:
+        """
+        Returns the summaries of the last stored executors of the controller, optionally only the ones closed after
+        the timestamp.
+        """
+        archive = self.archived_executors.get(controller_id)
+        return archive.get_summaries(since) if archive is not None else []
+
+    def archived_executors_memory_usage(self) -> int:
+        """
+        Returns the approximate size in bytes of the archived executors in memory.
+        """
+        return sum(archive.memory_usage() for archive in self.archived_executors.values())
 
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
         Generate a report of all executors.
         """
-        report = {}
-        for controller_id, executors_list in self.active_executors.items():
-            report[controller_id] = [executor.executor_info for executor in executors_list if executor]
-        return report
+        snapshot_key = self._snapshot_key
+        if self._executors_report_snapshot is None or self._executors_report_snapshot[0] != snapshot_key:
+            report = {}
+            for controller_id, executors_list in self.active_executors.items():
+                report[controller_id] = [executor.executor_info for executor in executors_list if executor]
+            self._executors_report_snapshot = (snapshot_key, report)
+        return {controller_id: list(executors_info)
+                for controller_id, executors_info in self._executors_report_snapshot[1].items()}
 
-    def generate_performance_report(self, controller_id: str) -> PerformanceReport:
-        # Start with a deep copy of the cached performance for this controller
-        report = deepcopy(self.cached_performance.get(controller_id, PerformanceReport()))
+    @staticmethod
+    def _calculate_contribution(executor_info: ExecutorInfo) -> ExecutorContribution:
+        realized_pnl_quote = Decimal(0) if executor_info.is_active else executor_info.net_pnl_quote
+        inventory_imbalance = Decimal(0)
+        side = executor_info.custom_info.get("side", None)
+        if side:
+            inventory_imbalance = executor_info.filled_amount_quote if side == TradeType.BUY else -executor_info.filled_amount_quote
+        open_order_volume = Decimal(0)
+        if executor_info.type == "dca_executor":
+            open_order_volume = sum(executor_info.config.amounts_quote) - executor_info.filled_amount_quote
+        elif executor_info.type == "position_executor":
+            open_order_volume = (executor_info.config.amount * executor_info.config.entry_price) - executor_info.filled_amount_quote
+        return realized_pnl_quote, executor_info.filled_amount_quote, inventory_imbalance, open_order_volume
 
-        # Add data from active executors
-        active_executors = self.active_executors.get(controller_id, [])
+    def _add_contribution(self, controller_id: str, contribution: ExecutorContribution,
+                          previous_contribution: ExecutorContribution = NO_CONTRIBUTION):
+        report = self._active_performance.setdefault(controller_id, PerformanceReport())
+        realized_pnl_quote, volume_traded, inventory_imbalance, open_order_volume = contribution
+        report.realized_pnl_quote += realized_pnl_quote - previous_contribution[0]
+        report.volume_traded += volume_traded - previous_contribution[1]
+        report.inventory_imbalance += inventory_imbalance - previous_contribution[2]
+        report.open_order_volume += open_order_volume - previous_contribution[3]
+
+    def _update_contribution(self, controller_id: str, executor: ExecutorBase):
+        """
+        Replaces the contribution of the executor in the running totals of its controller with its current one.
+        """
+        executor_info = executor.executor_info
+        contribution = self._calculate_contribution(executor_info)
+        contributions = self._executor_contributions.setdefault(controller_id, {})
+        self._add_contribution(controller_id, contribution, contributions.get(executor, NO_CONTRIBUTION))
+        contributions[executor] = contribution
+        open_executors = self._open_executors.setdefault(controller_id, {})
+        if executor_info.is_active and executor_info.filled_amount_quote != 0:
+            open_executors[executor] = None
+        else:
+            open_executors.pop(executor, None)
+
+    def _remove_contribution(self, controller_id: str, executor: ExecutorBase):
+        contribution = self._executor_contributions.get(controller_id, {}).pop(executor, None)
+        if contribution is not None:
+            self._add_contribution(controller_id, NO_CONTRIBUTION, contribution)
+        self._open_executors.get(controller_id, {}).pop(executor, None)
+
+    def _sync_contributions(self, controller_id: str):
+        """
+        Adds the executors that were added to the active executors without notifying their state, and removes the
+        ones that are no longer active executors.
+        """
+        active_executors = [executor for executor in self.active_executors.get(controller_id, []) if executor]
+        contributions = self._executor_contributions.get(controller_id, {})
+        if len(contributions) == len(active_executors):
+            return
+        for executor in set(contributions) - set(active_executors):
+            self._remove_contribution(controller_id, executor)
         for executor in active_executors:
+            if executor not in contributions:
+                self._update_contribution(controller_id, executor)
+
+    def _unrealized_pnl(self, controller_id: str) -> Decimal:
+        unrealized_pnl_quote = Decimal(0)
+        for executor in list(self._open_executors.get(controller_id, {})):
             executor_info = executor.executor_info
             if executor_info.is_active:
-                report.unrealized_pnl_quote += executor_info.net_pnl_quote
+                unrealized_pnl_quote += executor_info.net_pnl_quote
             else:
-                report.realized_pnl_quote += executor_info.net_pnl_quote
-            report.volume_traded += executor_info.filled_amount_quote
-            side = executor_info.custom_info.get("side", None)
-            if side:
-                report.inventory_imbalance += executor_info.filled_amount_quote if side == TradeType.BUY else -executor_info.filled_amount_quote
-            if executor_info.type == "dca_executor":
-                report.open_order_volume += sum(executor_info.config.amounts_quote) - executor_info.filled_amount_quote
-            elif executor_info.type == "position_executor":
-                report.open_order_volume += (executor_info.config.amount * executor_info.config.entry_price) - executor_info.filled_amount_quote
-
-        # Calculate global PNL values
+                # The status changed without an order event, e.g. when the executor started shutting down
+                self._update_contribution(controller_id, executor)
+        return unrealized_pnl_quote
+
+    @staticmethod
+    def _set_pnl_percentages(report: PerformanceReport):
         report.global_pnl_quote = report.unrealized_pnl_quote + report.realized_pnl_quote
         report.global_pnl_pct = (report.global_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
-
-        # Calculate individual PNL percentages
         report.unrealized_pnl_pct = (report.unrealized_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
         report.realized_pnl_pct = (report.realized_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
 
+    def generate_performance_report(self, controller_id: str) -> PerformanceReport:
+        """
+        Generate the performance report of a controller, from its cached performance and the running totals of its
+        active executors. Only the PnL of the active executors with filled orders is read, since it follows the market.
+        """
+        self._sync_contributions(controller_id)
+        unrealized_pnl_quote = self._unrealized_pnl(controller_id)
+        cached_report = self.cached_performance.get(controller_id, PerformanceReport())
+        active_report = self._active_performance.get(controller_id, PerformanceReport())
+        report = PerformanceReport(
+            realized_pnl_quote=cached_report.realized_pnl_quote + active_report.realized_pnl_quote,
+            unrealized_pnl_quote=cached_report.unrealized_pnl_quote + unrealized_pnl_quote,
+            volume_traded=cached_report.volume_traded + active_report.volume_traded,
+            open_order_volume=cached_report.open_order_volume + active_report.open_order_volume,
+            inventory_imbalance=cached_report.inventory_imbalance + active_report.inventory_imbalance,
+            close_type_counts=dict(cached_report.close_type_counts),
+        )
+        self._set_pnl_percentages(report)
         return report
 
     def generate_global_performance_report(self) -> PerformanceReport:
@@ -223,9 +366,5 @@ class ExecutorOrchestrator:
             for close_type, count in report.close_type_counts.items():
                 global_report.close_type_counts[close_type] = global_report.close_type_counts.get(close_type, 0) + count
 
-        global_report.global_pnl_quote = global_report.realized_pnl_quote + global_report.unrealized_pnl_quote
-        global_report.global_pnl_pct = (global_report.global_pnl_quote / global_report.volume_traded) * 100 if global_report.volume_traded != 0 else Decimal(0)
-        global_report.realized_pnl_pct = (global_report.realized_pnl_quote / global_report.volume_traded) * 100 if global_report.volume_traded != 0 else Decimal(0)
-        global_report.unrealized_pnl_pct = (global_report.unrealized_pnl_quote / global_report.volume_traded) * 100 if global_report.volume_traded != 0 else Decimal(0)
-
+        self._set_pnl_percentages(global_report)
         return global_report
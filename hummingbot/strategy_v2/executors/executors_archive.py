@@ -0,0 +1,63 @@
+import sys
+from collections import deque
+from typing import Deque, Iterator, List, Optional
+
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, ExecutorSummary
+
+
+class ExecutorsArchive:
+    """
+    History of the finished executors of a controller. The executors are stored in the MarketsRecorder before they are
+    archived, so only the summaries of the most recent ones are kept in memory, and the full executors info is loaded
+    from the database when needed.
+    """
+
+    def __init__(self, controller_id: str, max_retained: int = 1000):
+        """
+        :param controller_id: the id of the controller of the executors
+        :param max_retained: the maximum number of executor summaries kept in memory
+        """
+        self.controller_id = controller_id
+        self.max_retained = max_retained
+        self.total_archived = 0
+        self._summaries: Deque[ExecutorSummary] = deque(maxlen=max_retained)
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def __iter__(self) -> Iterator[ExecutorSummary]:
+        return iter(self._summaries)
+
+    @property
+    def evicted(self) -> int:
+        """
+        Number of archived executors that are only in the database.
+        """
+        return self.total_archived - len(self._summaries)
+
+    def append(self, executor_info: ExecutorInfo):
+        self._summaries.append(ExecutorSummary.from_executor_info(executor_info))
+        self.total_archived += 1
+
+    def get_summaries(self, since: Optional[float] = None) -> List[ExecutorSummary]:
+        """
+        Returns the summaries of the executors in memory, from the oldest one, optionally only the ones closed after
+        the timestamp.
+        """
+        if since is None:
+            return list(self._summaries)
+        return [summary for summary in self._summaries
+                if summary.close_timestamp is not None and summary.close_timestamp > since]
+
+    def load_executors_info(self) -> List[ExecutorInfo]:
+        """
+        Loads the full info of all the archived executors of the controller from the database.
+        """
+        return MarketsRecorder.get_instance().get_executors_by_controller(self.controller_id)
+
+    def memory_usage(self) -> int:
+        """
+        Returns the approximate size in bytes of the summaries in memory.
+        """
+        return sys.getsizeof(self._summaries) + sum(summary.memory_usage() for summary in self._summaries)
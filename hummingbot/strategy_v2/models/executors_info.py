@@ -1,3 +1,4 @@
+import sys
 from decimal import Decimal
 from typing import Dict, Optional, Union
 
@@ -53,6 +54,60 @@ class ExecutorInfo(BaseModel):
         return base_dict
 
 
+class ExecutorSummary:
+    """
+    Compact view of a finished executor, without the config and the custom info of the ExecutorInfo and with the
+    amounts as floats. It's used to keep the history of the executors in memory.
+    """
+    __slots__ = ("id", "controller_id", "type", "timestamp", "close_timestamp", "close_type", "connector_name",
+                 "trading_pair", "side", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote", "filled_amount_quote")
+
+    def __init__(self, id: str, controller_id: Optional[str], type: str, timestamp: float,
+                 close_timestamp: Optional[float], close_type: Optional[CloseType], connector_name: Optional[str],
+                 trading_pair: Optional[str], side: Optional[TradeType], net_pnl_pct: float, net_pnl_quote: float,
+                 cum_fees_quote: float, filled_amount_quote: float):
+        self.id = id
+        self.controller_id = controller_id
+        self.type = type
+        self.timestamp = timestamp
+        self.close_timestamp = close_timestamp
+        self.close_type = close_type
+        self.connector_name = connector_name
+        self.trading_pair = trading_pair
+        self.side = side
+        self.net_pnl_pct = net_pnl_pct
+        self.net_pnl_quote = net_pnl_quote
+        self.cum_fees_quote = cum_fees_quote
+        self.filled_amount_quote = filled_amount_quote
+
+    @classmethod
+    def from_executor_info(cls, executor_info: ExecutorInfo) -> "ExecutorSummary":
+        return cls(
+            id=executor_info.id,
+            controller_id=executor_info.controller_id,
+            type=executor_info.type,
+            timestamp=executor_info.timestamp,
+            close_timestamp=executor_info.close_timestamp,
+            close_type=executor_info.close_type,
+            connector_name=getattr(executor_info.config, "connector_name", None),
+            trading_pair=getattr(executor_info.config, "trading_pair", None),
+            side=executor_info.side,
+            net_pnl_pct=float(executor_info.net_pnl_pct),
+            net_pnl_quote=float(executor_info.net_pnl_quote),
+            cum_fees_quote=float(executor_info.cum_fees_quote),
+            filled_amount_quote=float(executor_info.filled_amount_quote),
+        )
+
+    def memory_usage(self) -> int:
+        """
+        Returns the approximate size in bytes of the summary and its values.
+        """
+        return sys.getsizeof(self) + sum(sys.getsizeof(getattr(self, slot)) for slot in self.__slots__)
+
+    def to_dict(self) -> Dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
 class ExecutorHandlerInfo(BaseModel):
     controller_id: str
     timestamp: float
@@ -1,6 +1,8 @@
 import asyncio
 import logging
+import time
 from abc import ABC
+from typing import Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
@@ -29,6 +31,8 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        self._wake_event: Optional[asyncio.Event] = None
+        self._min_wake_interval: float = 0.0
 
     @property
     def status(self):
@@ -58,6 +62,25 @@ class RunnableBase(ABC):
             self._status = RunnableStatus.TERMINATED
             self.terminated.set()
 
+    def enable_event_driven_updates(self, min_wake_interval: float = 0.1):
+        """
+        Allows `wake` to run the control task before the end of the update interval.
+
+        :param min_wake_interval: minimum time in seconds between two executions of the control task. Wake up
+        requests received in the meantime are coalesced.
+        """
+        self._min_wake_interval = min_wake_interval
+        if self._wake_event is None:
+            self._wake_event = asyncio.Event()
+
+    def wake(self):
+        """
+        Requests an execution of the control task as soon as possible. Does nothing unless event driven updates are
+        enabled.
+        """
+        if self._wake_event is not None:
+            self._wake_event.set()
+
     async def control_loop(self):
         """
         The main control loop of the smart component.
@@ -70,9 +93,24 @@ class RunnableBase(ABC):
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
-                await asyncio.sleep(self.update_interval)
+                await self._wait_for_next_update()
         self.on_stop()
 
+    async def _wait_for_next_update(self):
+        if self._wake_event is None:
+            await asyncio.sleep(self.update_interval)
+            return
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=self.update_interval)
+        except asyncio.TimeoutError:
+            return
+        # Wake up requests received from now on trigger the next execution
+        self._wake_event.clear()
+        remaining_min_interval = self._min_wake_interval - (time.perf_counter() - start)
+        if remaining_min_interval > 0:
+            await asyncio.sleep(remaining_min_interval)
+
     def on_stop(self):
         """
         Method to be executed when the control loop is stopped.
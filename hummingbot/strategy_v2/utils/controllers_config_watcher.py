@@ -0,0 +1,77 @@
+import hashlib
+import logging
+import os
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional
+
+import yaml
+
+from hummingbot.client import settings
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.strategy.strategy_v2_base import StrategyV2ConfigBase
+
+
+class ConfigFileState(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+class ControllersConfigWatcher:
+    """
+    Watches the controller config files of a strategy and loads only the configurations that changed.
+
+    A file is only read again when its modification time or size changes, and only parsed and validated when the hash
+    of its content changes, so checking unchanged files costs a `stat` per file. The checks do blocking file IO and
+    should run in a worker thread.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, config: "StrategyV2ConfigBase"):
+        self._config = config
+        self._file_states: Dict[str, ConfigFileState] = {}
+
+    def load_changed_configs(self, raise_errors: bool = False) -> List[ControllerConfigBase]:
+        """
+        Returns the configurations of the controller config files that changed since the last check (all of them in
+        the first check).
+
+        :param raise_errors: if False the files that can't be loaded are logged and skipped until they change again.
+        """
+        changed_configs = []
+        for config_path in list(self._config.controllers_config):
+            try:
+                controller_config = self._load_if_changed(config_path)
+            except Exception as e:
+                if raise_errors:
+                    raise
+                self.logger().error(f"Error loading the controller config {config_path}: {e}", exc_info=True)
+                continue
+            if controller_config is not None:
+                changed_configs.append(controller_config)
+        return changed_configs
+
+    def _load_if_changed(self, config_path: str) -> Optional[ControllerConfigBase]:
+        full_path = os.path.join(settings.CONTROLLERS_CONF_DIR_PATH, config_path)
+        stat = os.stat(full_path)
+        previous_state = self._file_states.get(config_path)
+        if previous_state is not None and (previous_state.mtime_ns, previous_state.size) == (stat.st_mtime_ns,
+                                                                                             stat.st_size):
+            return None
+
+        with open(full_path, "rb") as file:
+            content = file.read()
+        state = ConfigFileState(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=hashlib.sha256(content).hexdigest())
+        # The state is updated before parsing, so an invalid file is not parsed again until it changes
+        self._file_states[config_path] = state
+        if previous_state is not None and previous_state.digest == state.digest:
+            return None
+        return self._config.parse_controller_config(yaml.safe_load(content), config_path)
@@ -85,6 +85,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
                            "    | ∟ gateway_api_port                | 15888                |\n"
+                           "    | ∟ gateway_quote_ttls              | {}                   |\n"
                            "    | rate_oracle_source                | binance              |\n"
                            "    | global_token                      |                      |\n"
                            "    | ∟ global_token_name               | USDT                 |\n"
@@ -93,6 +94,16 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | commands_timeout                  |                      |\n"
                            "    | ∟ create_command_timeout          | 10                   |\n"
                            "    | ∟ other_commands_timeout          | 30                   |\n"
+                           "    | connection_pool                   |                      |\n"
+                           "    | ∟ max_connections                 | 100                  |\n"
+                           "    | ∟ max_connections_per_host        | 0                    |\n"
+                           "    | ∟ keepalive_timeout               | 30                   |\n"
+                           "    | ∟ dns_cache_ttl                   | 300                  |\n"
+                           "    | ∟ connector_overrides             | {}                   |\n"
+                           "    | ∟ host_overrides                  | {}                   |\n"
+                           "    | order_book_workers                |                      |\n"
+                           "    | ∟ order_book_workers_enabled      | False                |\n"
+                           "    | ∟ order_book_workers_depth        | 20                   |\n"
                            "    | tables_format                     | psql                 |\n"
                            "    | tick_size                         | 1.0                  |\n"
                            "    | market_data_collection            |                      |\n"
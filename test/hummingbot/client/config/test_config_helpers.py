@@ -14,6 +14,7 @@ from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger
 from hummingbot.client.config.config_data_types import BaseClientModel, BaseConnectorConfigMap, ClientFieldData
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
+    ConfigValidationError,
     ReadOnlyClientConfigAdapter,
     get_connector_config_yml_path,
     get_strategy_config_map,
@@ -167,6 +168,30 @@ strategy: pure_market_making
 
         self.assertEqual(secret_value, instance.sub_model.secret_attr.get_secret_value())
 
+    def test_connection_pool_overrides_of_the_connectors_and_hosts(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+        config_map.connection_pool.connector_overrides = '{"binance": {"max_connections": 20}}'
+        config_map.connection_pool.host_overrides = {"api.binance.com": {"max_connections_per_host": 10}}
+
+        default_pool_config = config_map.connection_pool.build_pool_config("kucoin")
+        connector_pool_config = config_map.connection_pool.build_pool_config("binance")
+        host_pool_configs = config_map.connection_pool.build_host_pool_configs("binance")
+
+        self.assertEqual(100, default_pool_config.limit)
+        self.assertEqual(20, connector_pool_config.limit)
+        self.assertEqual(0, connector_pool_config.limit_per_host)
+        self.assertEqual(["api.binance.com"], list(host_pool_configs))
+        self.assertEqual(20, host_pool_configs["api.binance.com"].limit)
+        self.assertEqual(10, host_pool_configs["api.binance.com"].limit_per_host)
+
+    def test_connection_pool_overrides_reject_invalid_settings(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+
+        with self.assertRaises(ConfigValidationError):
+            config_map.connection_pool.connector_overrides = {"binance": {"max_sockets": 20}}
+        with self.assertRaises(ConfigValidationError):
+            config_map.connection_pool.host_overrides = {"api.binance.com": {"keepalive_timeout": -1}}
+
 
 class ReadOnlyClientAdapterTest(unittest.TestCase):
 
@@ -3,6 +3,7 @@ import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -77,6 +78,7 @@ class SecurityTest(unittest.TestCase):
         Security.__instance = None
         Security.secrets_manager = None
         Security._secure_configs = {}
+        Security._encrypted_config_files = {}
         Security._decryption_done = asyncio.Event()
 
     def test_password_process(self):
@@ -150,3 +152,57 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_decrypt_all_decrypts_connector_configs_lazily(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+
+        Security.secrets_manager = ETHKeyFileSecretManger(password)
+        with patch("hummingbot.client.config.config_crypt._derive_key", wraps=config_crypt._derive_key) as derive_mock:
+            Security.decrypt_all()
+            self.assertEqual(1, derive_mock.call_count)  # all the values encrypted in a session share their key
+
+            self.assertTrue(Security.is_decryption_done())
+            self.assertTrue(Security.any_secure_configs())
+            self.assertEqual({}, Security._secure_configs)
+
+            self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+            self.assertEqual(1, derive_mock.call_count)
+        self.assertEqual({}, Security._encrypted_config_files)
+        self.assertIn(self.connector, Security.all_decrypted_values())
+
+    def test_secrets_manager_reuses_derived_keys(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+
+        with patch("hummingbot.client.config.config_crypt._derive_key", wraps=config_crypt._derive_key) as derive_mock:
+            first_value = secrets_manager.encrypt_secret_value("first", "first-secret")
+            second_value = secrets_manager.encrypt_secret_value("second", "second-secret")
+
+            self.assertNotEqual(first_value, secrets_manager.encrypt_secret_value("first", "first-secret"))
+            self.assertEqual("first-secret", secrets_manager.decrypt_secret_value("first", first_value))
+            self.assertEqual("second-secret", secrets_manager.decrypt_secret_value("second", second_value))
+            self.assertEqual(1, derive_mock.call_count)
+
+        another_session_manager = ETHKeyFileSecretManger("som-password")
+        another_session_manager.derive_keys([first_value, second_value, "not-a-secret"])
+        self.assertEqual("second-secret", another_session_manager.decrypt_secret_value("second", second_value))
+
+        with self.assertRaises(ValueError):
+            ETHKeyFileSecretManger("another-password").decrypt_secret_value("first", first_value)
+
+    def test_decrypt_all_registers_configs_by_file_name(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        self.store_binance_config()
+        (config_helpers.CONNECTORS_CONF_DIR_PATH / "another_exchange.yml").write_text("some_key: some_value\n")
+
+        Security.decrypt_all()
+
+        self.assertTrue(Security.is_decryption_done())
+        self.assertEqual({self.connector, "another_exchange"}, set(Security._encrypted_config_files))
+        self.assertEqual(self.api_key, Security.api_keys(self.connector)["binance_api_key"])
+        self.assertNotIn(self.connector, Security._encrypted_config_files)
@@ -48,7 +48,7 @@ class HyperliquidPerpetualAuthTests(TestCase):
         timestamp = self._get_timestamp()
         ts_mock.return_value = timestamp
 
-        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+        request = self.async_run_with_timeout(self.auth.rest_authenticate(request))
         # raw_signature = f'/linear/v1/orders&one=1&timestamp={int(self._get_timestamp() * 1e3)}'
         # expected_signature = hmac.new(bytes(self.secret_key.encode("utf-8")),
         #                               raw_signature.encode("utf-8"),
@@ -58,3 +58,52 @@ class HyperliquidPerpetualAuthTests(TestCase):
         self.assertEqual(4, len(params))
         self.assertEqual(None, params.get("vaultAddress"))
         self.assertEqual("order", params.get("action")["type"])
+
+    @patch(
+        "hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_auth.HyperliquidPerpetualAuth._get_timestamp")
+    def test_nonces_follow_the_order_of_the_requests(self, ts_mock: MagicMock):
+        ts_mock.return_value = self._get_timestamp()
+        requests = [
+            RESTRequest(
+                method=RESTMethod.POST,
+                url="https://test.url/exchange",
+                data=json.dumps({"type": "cancel", "cancels": {"asset": 4, "cloid": f"0x{index:032x}"}}),
+                is_auth_required=True,
+            )
+            for index in range(5)
+        ]
+
+        requests = self.async_run_with_timeout(
+            asyncio.gather(*[self.auth.rest_authenticate(request) for request in requests]))
+
+        nonces = [json.loads(request.data)["nonce"] for request in requests]
+        expected_nonce = int(self._get_timestamp() * 1e3)
+        self.assertEqual(list(range(expected_nonce, expected_nonce + 5)), nonces)
+
+    @patch("hummingbot.core.utils.signing_service.SigningService.sign_batch", autospec=True)
+    @patch(
+        "hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_auth.HyperliquidPerpetualAuth._get_timestamp")
+    def test_concurrent_requests_are_signed_in_one_batch(self, ts_mock: MagicMock, sign_batch_mock: MagicMock):
+        ts_mock.return_value = self._get_timestamp()
+
+        async def sign_batch(service, calls, connector="", return_exceptions=False):
+            return [function(*args) for function, args in calls]
+
+        sign_batch_mock.side_effect = sign_batch
+        requests = [
+            RESTRequest(
+                method=RESTMethod.POST,
+                url="https://test.url/exchange",
+                data=json.dumps({"type": "cancel", "cancels": {"asset": 4, "cloid": f"0x{index:032x}"}}),
+                is_auth_required=True,
+            )
+            for index in range(3)
+        ]
+
+        requests = self.async_run_with_timeout(
+            asyncio.gather(*[self.auth.rest_authenticate(request) for request in requests]))
+
+        sign_batch_mock.assert_called_once()
+        self.assertEqual(3, len(sign_batch_mock.call_args.args[1]))
+        cloids = [json.loads(request.data)["action"]["cancels"][0]["cloid"] for request in requests]
+        self.assertEqual([f"0x{index:032x}" for index in range(3)], cloids)
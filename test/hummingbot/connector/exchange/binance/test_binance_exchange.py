@@ -14,9 +14,11 @@ from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.utils import ConnectorOrderBookDataSourceFactory, get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.multi_process_order_book_tracker import MultiProcessOrderBookTracker
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -731,6 +733,52 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             asyncio.CancelledError,
             self.async_run_with_timeout, self.exchange._update_time_synchronizer())
 
+    @aioresponses()
+    def test_warm_up_connections_requests_the_ping_endpoint_through_the_throttler(self, mock_api):
+        url = web_utils.public_rest_url(CONSTANTS.PING_PATH_URL, domain=self.exchange._domain)
+        mock_api.get(url, body=json.dumps({}))
+
+        self.async_run_with_timeout(self.exchange._warm_up_connections())
+
+        self.assertEqual(1, len(mock_api.requests))
+        self.assertIn(CONSTANTS.PING_PATH_URL,
+                      [task.rate_limit.limit_id for task in self.exchange._throttler._task_logs])
+
+    @aioresponses()
+    def test_warm_up_connections_ignores_errors(self, mock_api):
+        url = web_utils.public_rest_url(CONSTANTS.PING_PATH_URL, domain=self.exchange._domain)
+        mock_api.get(url, status=500)
+
+        self.async_run_with_timeout(self.exchange._warm_up_connections())
+
+        self.assertEqual(1, len(mock_api.requests))
+
+    def test_order_books_maintained_by_worker_processes_when_enabled(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.order_book_workers.order_book_workers_enabled = True
+        client_config_map.order_book_workers.order_book_workers_depth = 5
+
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertIsInstance(exchange.order_book_tracker, MultiProcessOrderBookTracker)
+        self.assertEqual(5, exchange.order_book_tracker._depth)
+        self.assertIsInstance(exchange.order_book_tracker._data_source_factory, ConnectorOrderBookDataSourceFactory)
+        self.assertIsInstance(self.exchange.order_book_tracker, OrderBookTracker)
+
+    def test_stop_network_cancels_the_connections_warm_up(self):
+        warm_up_task = asyncio.get_event_loop().create_task(asyncio.sleep(10))
+        self.exchange._connections_warm_up_task = warm_up_task
+
+        self.async_run_with_timeout(self.exchange.stop_network())
+        self.assertRaises(asyncio.CancelledError, self.async_run_with_timeout, warm_up_task)
+
+        self.assertIsNone(self.exchange._connections_warm_up_task)
+
     @aioresponses()
     def test_update_order_fills_from_trades_triggers_filled_event(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -50,7 +50,7 @@ class KucoinAuthTests(TestCase):
             throttler_limit_id="/api/endpoint"
         )
 
-        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+        request = self.async_run_with_timeout(self.auth.rest_authenticate(request))
 
         self.assertEqual(self.api_key, request.headers["KC-API-KEY"])
         self.assertEqual("1000000", request.headers["KC-API-TIMESTAMP"])
@@ -74,7 +74,7 @@ class KucoinAuthTests(TestCase):
             throttler_limit_id="/api/endpoint"
         )
 
-        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+        request = self.async_run_with_timeout(self.auth.rest_authenticate(request))
 
         self.assertEqual(self.api_key, request.headers["KC-API-KEY"])
         self.assertEqual("1000000", request.headers["KC-API-TIMESTAMP"])
@@ -100,7 +100,7 @@ class KucoinAuthTests(TestCase):
             throttler_limit_id="/api/endpoint"
         )
 
-        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+        request = self.async_run_with_timeout(self.auth.rest_authenticate(request))
 
         self.assertEqual(self.api_key, request.headers["KC-API-KEY"])
         self.assertEqual("1000000", request.headers["KC-API-TIMESTAMP"])
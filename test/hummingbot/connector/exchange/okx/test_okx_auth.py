@@ -53,7 +53,7 @@ class OkxAuthTests(TestCase):
             throttler_limit_id="/api/endpoint"
         )
 
-        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+        request = self.async_run_with_timeout(self.auth.rest_authenticate(request))
 
         expected_timestamp = self._format_timestamp(timestamp=1000)
         self.assertEqual(self.api_key, request.headers["OK-ACCESS-KEY"])
@@ -72,7 +72,7 @@ class OkxAuthTests(TestCase):
             throttler_limit_id="/api/endpoint"
         )
 
-        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+        request = self.async_run_with_timeout(self.auth.rest_authenticate(request))
 
         expected_timestamp = self._format_timestamp(timestamp=1000)
         self.assertEqual(self.api_key, request.headers["OK-ACCESS-KEY"])
@@ -92,7 +92,7 @@ class OkxAuthTests(TestCase):
             throttler_limit_id="/api/endpoint"
         )
 
-        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+        request = self.async_run_with_timeout(self.auth.rest_authenticate(request))
 
         expected_timestamp = self._format_timestamp(timestamp=1000)
         self.assertEqual(self.api_key, request.headers["OK-ACCESS-KEY"])
@@ -0,0 +1,176 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import patch
+
+from xrpl.models import AccountInfo, Response
+from xrpl.models.response import ResponseStatus
+
+from hummingbot.connector.exchange.xrpl.xrpl_client_pool import XRPLClientPool
+
+
+class FakeXRPLClient:
+    unreachable_urls = set()
+
+    def __init__(self, url: str):
+        self.url = url
+        self.opened = False
+        self.open_count = 0
+        self.requests = []
+        self._messages = None
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    async def open(self):
+        if self.url in self.unreachable_urls:
+            raise ConnectionRefusedError(f"Cannot connect to {self.url}")
+        await asyncio.sleep(0)
+        self.opened = True
+        self.open_count += 1
+        self._messages = asyncio.Queue()
+
+    async def close(self):
+        self.opened = False
+
+    async def __aiter__(self):
+        while self.is_open():
+            yield await self._messages.get()
+
+    async def request(self, request):
+        if self.url in self.unreachable_urls:
+            raise ConnectionResetError(f"Connection to {self.url} lost")
+        self.requests.append(request)
+        await asyncio.sleep(0.01)
+        self._messages.put_nowait({"id": request.id})
+        return Response(status=ResponseStatus.SUCCESS, result={"url": self.url})
+
+
+@patch("hummingbot.connector.exchange.xrpl.xrpl_client_pool.AsyncWebsocketClient", FakeXRPLClient)
+class XRPLClientPoolTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        FakeXRPLClient.unreachable_urls = set()
+        self.pool = XRPLClientPool(node_urls=["wss://node1", "wss://node2", "wss://node1"], request_timeout=1)
+        self.request = AccountInfo(account="r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK")  # noqa: mock
+
+    async def asyncTearDown(self):
+        await self.pool.stop()
+        await super().asyncTearDown()
+
+    async def test_node_urls_deduplicated(self):
+        self.assertEqual(["wss://node1", "wss://node2"], self.pool.node_urls)
+        self.assertEqual(2, len(self.pool.clients))
+
+    async def test_connections_reused_across_requests(self):
+        for _ in range(3):
+            response = await self.pool.request(self.request, url="wss://node1")
+            self.assertEqual("wss://node1", response.result["url"])
+
+        node1_client = self.pool.clients[0].client
+        self.assertEqual(1, node1_client.open_count)
+        self.assertEqual(3, len(node1_client.requests))
+
+        async with self.pool.client("wss://node1") as client:
+            self.assertIs(node1_client, client)
+        self.assertTrue(node1_client.is_open())
+        self.assertEqual(1, node1_client.open_count)
+
+    async def test_concurrent_requests_spread_across_nodes(self):
+        responses = await asyncio.gather(*[self.pool.request(self.request) for _ in range(4)])
+
+        self.assertEqual({"wss://node1", "wss://node2"}, {response.result["url"] for response in responses})
+
+    async def test_failover_to_other_node(self):
+        FakeXRPLClient.unreachable_urls = {"wss://node1"}
+
+        response = await self.pool.request(self.request, url="wss://node1")
+
+        self.assertEqual("wss://node2", response.result["url"])
+        self.assertFalse(self.pool.clients[0].healthy)
+
+        async with self.pool.client("wss://node1") as client:
+            self.assertEqual("wss://node2", client.url)
+
+    async def test_all_nodes_down_raises(self):
+        FakeXRPLClient.unreachable_urls = {"wss://node1", "wss://node2"}
+
+        with self.assertRaises(ConnectionError):
+            await self.pool.request(self.request)
+        with self.assertRaises(ConnectionError):
+            async with self.pool.client():
+                pass
+
+    async def test_connection_error_in_context_marks_client_unhealthy(self):
+        with self.assertRaises(ConnectionResetError):
+            async with self.pool.client("wss://node1"):
+                raise ConnectionResetError()
+        self.assertFalse(self.pool.clients[0].healthy)
+        self.assertFalse(self.pool.clients[0].client.is_open())
+
+        with self.assertRaises(asyncio.TimeoutError):
+            async with self.pool.client("wss://node2"):
+                raise asyncio.TimeoutError()
+        self.assertTrue(self.pool.clients[1].healthy)
+
+    async def test_health_check_reopens_unhealthy_clients(self):
+        await self.pool.request(self.request, url="wss://node1")
+        pooled_client = self.pool.clients[0]
+        await self.pool._mark_unhealthy(pooled_client)
+
+        await self.pool._check_client(pooled_client)
+
+        self.assertTrue(pooled_client.healthy)
+        self.assertTrue(pooled_client.client.is_open())
+        self.assertEqual(2, pooled_client.client.open_count)
+        self.assertEqual("ping", pooled_client.client.requests[-1].method)
+
+    async def test_concurrent_opens_of_a_client_open_one_connection(self):
+        pool = XRPLClientPool(node_urls=["wss://node1"], request_timeout=1)
+        pooled_client = pool.clients[0]
+
+        async def use_client():
+            async with pool.client():
+                pass
+
+        await asyncio.gather(pool.request(self.request), use_client(), pool._check_client(pooled_client))
+
+        self.assertTrue(pooled_client.client.is_open())
+        self.assertEqual(1, pooled_client.client.open_count)
+        await pool.stop()
+
+    async def test_recycle_skipped_when_a_request_starts_using_the_client(self):
+        pool = XRPLClientPool(node_urls=["wss://node1"], recycle_interval=0, request_timeout=1)
+        pooled_client = pool.clients[0]
+        await pool._open(pooled_client)
+
+        async with pooled_client.lock:
+            check_task = asyncio.ensure_future(pool._check_client(pooled_client))
+            await asyncio.sleep(0)
+            # A request acquires the client while the check waits for the lock
+            pooled_client.in_flight += 1
+        await check_task
+
+        self.assertTrue(pooled_client.client.is_open())
+        self.assertEqual(1, pooled_client.client.open_count)
+        pooled_client.in_flight -= 1
+        await pool.stop()
+
+    async def test_unread_messages_are_discarded(self):
+        await asyncio.gather(*[self.pool.request(self.request, url="wss://node1") for _ in range(3)])
+        await asyncio.sleep(0)
+
+        self.assertEqual(0, self.pool.clients[0].client._messages.qsize())
+
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool._sleep")
+    async def test_request_retries_when_all_nodes_fail(self, sleep_mock):
+        FakeXRPLClient.unreachable_urls = {"wss://node1", "wss://node2"}
+
+        async def recover(_):
+            FakeXRPLClient.unreachable_urls = set()
+
+        sleep_mock.side_effect = recover
+
+        response = await self.pool.request(self.request, url="wss://node1", max_retries=2)
+
+        self.assertEqual("wss://node1", response.result["url"])
+        sleep_mock.assert_called_once()
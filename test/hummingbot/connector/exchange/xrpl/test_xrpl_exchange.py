@@ -959,7 +959,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(0.22452700389932698, asks[0].price)
         self.assertEqual(91.846106, asks[0].amount)
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
@@ -972,11 +972,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         sign_mock,
         autofill_mock,
         verify_transaction_result_mock,
-        mock_async_websocket_client
+        mock_pool_client
     ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = True, {}
@@ -1056,7 +1056,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertTrue(autofill_mock.called)
         self.assertTrue(sign_mock.called)
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
@@ -1069,11 +1069,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         sign_mock,
         autofill_mock,
         verify_transaction_result_mock,
-        mock_async_websocket_client
+        mock_pool_client
     ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = True, {}
@@ -1166,13 +1166,13 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         # Verify the exception was raised and contains the expected message
         self.assertTrue("Market NOT_FOUND not found in markets list" in str(context.exception))
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.autofill", new_callable=MagicMock)
     # @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.submit", new_callable=MagicMock)
-    def test_place_order_exception_handling_autofill(self, autofill_mock, mock_async_websocket_client):
+    def test_place_order_exception_handling_autofill(self, autofill_mock, mock_pool_client):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         # Simulate an exception during the autofill operation
         autofill_mock.side_effect = Exception("Test exception during autofill")
@@ -1194,7 +1194,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "Order None (test_order) creation failed: Test exception during autofill" in str(context.exception)
         )
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._sleep")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
@@ -1211,11 +1211,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         autofill_mock,
         verify_transaction_result_mock,
         sleep_mock,
-        mock_async_websocket_client
+        mock_pool_client
     ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = False, {}
@@ -1245,7 +1245,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             in str(context.exception)
         )
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._sleep")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
@@ -1262,11 +1262,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         autofill_mock,
         verify_transaction_result_mock,
         sleep_mock,
-        mock_async_websocket_client
+        mock_pool_client
     ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = False, None
@@ -1293,7 +1293,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         # # Verify the exception was raised and contains the expected message
         self.assertTrue("Order 1-1 (hbot) creation failed: Failed to place order hbot (1-1)" in str(context.exception))
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._sleep")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
@@ -1310,11 +1310,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         autofill_mock,
         verify_transaction_result_mock,
         sleep_mock,
-        mock_async_websocket_client
+        mock_pool_client
     ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = False, None
@@ -1341,7 +1341,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         # # Verify the exception was raised and contains the expected message
         self.assertTrue("Order 1-1 (hbot) creation failed: Failed to place order hbot (1-1)" in str(context.exception))
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
@@ -1350,11 +1350,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         submit_mock,
         sign_mock,
         autofill_mock,
-        mock_async_websocket_client,
+        mock_pool_client,
     ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         sign_mock.return_value = Transaction(
@@ -1380,7 +1380,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertTrue(autofill_mock.called)
         self.assertTrue(sign_mock.called)
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
@@ -1399,11 +1399,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         sign_mock,
         autofill_mock,
         verify_transaction_result_mock,
-        mock_async_websocket_client,
+        mock_pool_client,
     ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         request_order_status_mock.return_value = OrderUpdate(
             trading_pair=self.trading_pair,
@@ -1443,7 +1443,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertTrue(process_trade_fills_mock.called)
         self.assertEqual("1-1", exchange_order_id)
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.client')
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
@@ -1460,11 +1460,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         sign_mock,
         autofill_mock,
         verify_transaction_result_mock,
-        mock_async_websocket_client,
+        mock_pool_client,
     ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
-        mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
+        mock_pool_client.return_value.__aenter__.return_value = mock_client
 
         request_order_status_mock.return_value = OrderUpdate(
             trading_pair=self.trading_pair,
@@ -2914,11 +2914,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(trade_fills[0].fill_quote_amount, Decimal("1354.473138"))
 
     @patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.request_with_retry")
-    def test_fetch_account_transactions(self, request_with_retry_mock, get_account_mock):
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_client_pool.XRPLClientPool.request")
+    def test_fetch_account_transactions(self, pool_request_mock, get_account_mock):
 
         get_account_mock.return_value = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
-        request_with_retry_mock.return_value = Response(
+        pool_request_mock.return_value = Response(
             status=ResponseStatus.SUCCESS,
             result={"transactions": ["something"]},
             id="account_info_644216",
@@ -21,6 +21,7 @@ from hummingbot.core.event.events import (
     OrderCancelledEvent,
     OrderFilledEvent,
 )
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 
 
 class MockExchange(ExchangeBase):
@@ -307,6 +308,40 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
             )
         )
 
+    def test_first_update_latency_is_not_recorded_for_updates_created_locally(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        latency_tracer = LatencyTracer()
+        latency_tracer.enable()
+        latency_tracer.start_span(order.client_order_id)
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+
+        with patch.object(LatencyTracer, "get_instance", return_value=latency_tracer):
+            self.async_run_with_timeout(self.tracker.process_order_update(order_update, created_locally=True))
+
+            self.assertIsNone(latency_tracer.histogram(
+                LatencyStage.ORDER_CREATE_TO_FIRST_UPDATE, self.connector.name, self.trading_pair))
+
+            self.async_run_with_timeout(self.tracker.process_order_update(order_update))
+
+        histogram = latency_tracer.histogram(
+            LatencyStage.ORDER_CREATE_TO_FIRST_UPDATE, self.connector.name, self.trading_pair)
+        self.assertEqual(1, histogram.count)
+
     def test_process_order_update_trigger_order_creation_event(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
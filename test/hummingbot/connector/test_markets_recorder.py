@@ -22,11 +22,17 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.executors_performance import ExecutorsPerformance
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class MarketsRecorderTests(TestCase):
@@ -282,6 +288,164 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    def test_process_fill_updates_the_trade_fill_ledgers(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+        fill_events = [
+            OrderFilledEvent(
+                timestamp=1642020000 + i,
+                order_id=f"OID{i}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("1010.1234567"),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+                exchange_trade_id=f"TradeId{i}"
+            )
+            for i in range(2)
+        ]
+
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_events[0])
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                TradeFillLedger.catch_up(session, self.config_file_path, start_timestamp=0)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_events[1])
+
+        with self.manager.get_new_session() as session:
+            ledger = session.query(TradeFillLedger).one()
+            self.assertEqual(2, ledger.num_buys)
+            self.assertEqual(1642020001000, ledger.last_timestamp)
+            # The values are folded as they are stored in the DB
+            self.assertEqual(Decimal("-2020.246912"), ledger.b_vol_quote)
+
+    def executor_mock(self, executor_id: str, controller_id: str, net_pnl_quote: Decimal,
+                      close_type: CloseType = None) -> MagicMock:
+        config = PositionExecutorConfig(
+            id=executor_id, timestamp=1234, trading_pair=self.trading_pair, connector_name=self.display_name,
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        executor = MagicMock()
+        executor.config = config
+        executor.executor_info = ExecutorInfo(
+            id=executor_id, timestamp=1234, type="position_executor", close_type=close_type,
+            status=RunnableStatus.TERMINATED, config=config, filled_amount_quote=Decimal(100),
+            net_pnl_quote=net_pnl_quote, net_pnl_pct=Decimal(0), cum_fees_quote=Decimal(1),
+            is_trading=False, is_active=False, custom_info={}, controller_id=controller_id,
+        )
+        return executor
+
+    def test_store_executors_updates_the_executors_performance(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+        recorder.store_or_update_executor(self.executor_mock("E1", "controller_1", Decimal("1.5"), CloseType.TAKE_PROFIT))
+        recorder.store_or_update_executor(self.executor_mock("E2", "controller_1", Decimal("-0.5"), CloseType.STOP_LOSS))
+        recorder.store_or_update_executor(self.executor_mock("E3", None, Decimal("2")))
+        # Storing an executor again replaces its values
+        recorder.store_or_update_executor(self.executor_mock("E2", "controller_1", Decimal("-1"), CloseType.STOP_LOSS))
+
+        performance = recorder.get_executors_performance()
+
+        self.assertEqual({"controller_1", None}, set(performance.keys()))
+        self.assertEqual(Decimal("0.5"), performance["controller_1"].realized_pnl_quote)
+        self.assertEqual(Decimal("200"), performance["controller_1"].volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1, CloseType.STOP_LOSS: 1}, performance["controller_1"].close_type_counts)
+        self.assertEqual(Decimal("2"), performance[None].realized_pnl_quote)
+        self.assertFalse(recorder.check_executors_performance())
+
+    def test_check_executors_performance_rebuilds_missing_aggregates(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.store_or_update_executor(self.executor_mock("E1", "controller_1", Decimal("1.5"), CloseType.TAKE_PROFIT))
+        recorder.store_or_update_executor(self.executor_mock("E2", "controller_2", Decimal("3")))
+        # Executors stored before the aggregates existed
+        with self.manager.get_new_session() as session:
+            session.query(ExecutorsPerformance).delete()
+            session.commit()
+        recorder.store_or_update_executor(self.executor_mock("E3", "controller_1", Decimal("1"), CloseType.TAKE_PROFIT))
+
+        self.assertTrue(recorder.check_executors_performance())
+
+        performance = recorder.get_executors_performance()
+        self.assertEqual(Decimal("2.5"), performance["controller_1"].realized_pnl_quote)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2}, performance["controller_1"].close_type_counts)
+        self.assertEqual(Decimal("3"), performance["controller_2"].realized_pnl_quote)
+        self.assertFalse(recorder.check_executors_performance())
+
+    def test_executors_performance_aggregates_float_columns_without_noise(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.store_or_update_executor(self.executor_mock("E1", "controller_1", Decimal("0.1")))
+        recorder.store_or_update_executor(self.executor_mock("E2", "controller_1", Decimal("0.2")))
+
+        performance = recorder.get_executors_performance()
+
+        self.assertEqual(Decimal("0.3"), performance["controller_1"].realized_pnl_quote)
+        self.assertFalse(recorder.check_executors_performance())
+
+    def test_check_executors_performance_rebuilds_aggregates_with_wrong_totals(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.store_or_update_executor(self.executor_mock("E1", "controller_1", Decimal("1.5")))
+        # Same number of executors, but a different realized PnL
+        with self.manager.get_new_session() as session:
+            session.get(ExecutorsPerformance, "controller_1").realized_pnl_quote = Decimal("7")
+            session.commit()
+
+        self.assertTrue(recorder.check_executors_performance())
+
+        performance = recorder.get_executors_performance()
+        self.assertEqual(Decimal("1.5"), performance["controller_1"].realized_pnl_quote)
+        self.assertEqual(Decimal("100"), performance["controller_1"].volume_traded)
+        self.assertFalse(recorder.check_executors_performance())
+
     def test_trade_fee_in_quote_not_available(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -1,5 +1,6 @@
 import importlib
 import os
+import pickle
 import platform
 import unittest
 from hashlib import md5
@@ -14,7 +15,8 @@ from hummingbot import root_path
 from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.connector.utils import ConnectorOrderBookDataSourceFactory, get_new_client_order_id
 
 
 class UtilsTest(unittest.TestCase):
@@ -100,3 +102,13 @@ class UtilsTest(unittest.TestCase):
                         self.assertEqual(el.value, connector_dir.name)
                     elif el.client_field_data.is_secure:
                         self.assertEqual(el.type_, SecretStr)
+
+    def test_connector_order_book_data_source_factory_is_picklable_and_creates_the_data_source(self):
+        factory = pickle.loads(pickle.dumps(ConnectorOrderBookDataSourceFactory(
+            connector_name="binance", trading_pairs=[self.trading_pair])))
+
+        data_source = factory()
+
+        self.assertIsInstance(data_source, BinanceAPIOrderBookDataSource)
+        self.assertEqual([self.trading_pair], data_source._trading_pairs)
+        self.assertEqual("binance", data_source._connector.name)
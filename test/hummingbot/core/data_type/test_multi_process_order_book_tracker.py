@@ -0,0 +1,159 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.multi_process_order_book_tracker import MultiProcessOrderBookTracker, OrderBookPublisher
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.shared_order_book_buffer import SharedOrderBookBuffer
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+
+
+class MultiProcessOrderBookTrackerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.worker_order_book = OrderBook()
+        self.worker_tracker = MagicMock()
+        self.worker_tracker.order_books = {self.trading_pair: self.worker_order_book}
+
+        self.tracker = MultiProcessOrderBookTracker(
+            data_source_factory=MagicMock(), trading_pairs=[self.trading_pair], depth=2, trades_capacity=10)
+        self.tracker._buffer = SharedOrderBookBuffer(trading_pairs=[self.trading_pair], depth=2, trades_capacity=10)
+        self.publisher = OrderBookPublisher(tracker=self.worker_tracker, buffer=self.tracker._buffer)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_refresh_applies_published_top_of_book(self):
+        self.worker_order_book.apply_snapshot(
+            bids=[OrderBookRow(10, 1, 1), OrderBookRow(9, 1, 1), OrderBookRow(8, 1, 1)],
+            asks=[OrderBookRow(11, 2, 1)],
+            update_id=1)
+
+        self.publisher.publish()
+        self.tracker.refresh_order_books()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+        self.assertEqual([10, 9], [row.price for row in order_book.bid_entries()])
+        self.assertFalse(self.tracker.is_order_book_stale(self.trading_pair))
+
+        self.worker_order_book.apply_diffs(bids=[OrderBookRow(10, 0, 2)], asks=[], update_id=2)
+        self.publisher.publish()
+        self.tracker.refresh_order_books()
+
+        self.assertEqual(9, order_book.get_price(False))
+
+    def test_refresh_emits_published_trades(self):
+        self.worker_order_book.apply_snapshot(bids=[], asks=[], update_id=1)
+        self.publisher.publish()
+        trade_logger = EventLogger()
+        self.tracker.order_books[self.trading_pair].add_listener(OrderBookEvent.TradeEvent, trade_logger)
+
+        self.worker_order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=self.trading_pair, timestamp=1.0, type=TradeType.BUY, price=10.5, amount=3.0, trade_id="7"))
+        self.tracker.refresh_order_books()
+
+        self.assertEqual(1, len(trade_logger.event_log))
+        trade = trade_logger.event_log[0]
+        self.assertEqual(10.5, trade.price)
+        self.assertEqual(TradeType.BUY, trade.type)
+        self.assertEqual("7", trade.trade_id)
+        self.assertEqual(10.5, self.tracker.order_books[self.trading_pair].last_trade_price)
+
+    def test_refresh_reads_only_the_changed_order_books(self):
+        self.worker_order_book.apply_snapshot(bids=[OrderBookRow(10, 1, 1)], asks=[OrderBookRow(11, 2, 1)], update_id=1)
+        self.publisher.publish()
+        self.tracker.refresh_order_books()
+
+        with patch.object(self.tracker._buffer, "read_book", wraps=self.tracker._buffer.read_book) as read_book_mock, \
+                patch.object(self.tracker._buffer, "read_trades") as read_trades_mock:
+            self.publisher.publish()
+            self.tracker.refresh_order_books()
+
+            read_book_mock.assert_not_called()
+
+            self.worker_order_book.apply_diffs(bids=[OrderBookRow(10, 3, 2)], asks=[], update_id=2)
+            self.publisher.publish()
+            self.tracker.refresh_order_books()
+
+            read_book_mock.assert_called_once_with(self.trading_pair)
+            read_trades_mock.assert_not_called()
+        self.assertEqual(3, self.tracker.order_books[self.trading_pair].snapshot[0]["amount"].iloc[0])
+
+    def test_order_book_is_stale_when_not_refreshed(self):
+        self.assertTrue(self.tracker.is_order_book_stale(self.trading_pair))
+
+        self.tracker._last_refresh_timestamps[self.trading_pair] = 0
+
+        self.assertTrue(self.tracker.is_order_book_stale(self.trading_pair))
+
+    @patch("hummingbot.core.data_type.multi_process_order_book_tracker.MultiProcessOrderBookTracker._start_worker")
+    def test_dead_worker_is_restarted(self, start_worker_mock):
+        worker = MagicMock()
+        worker.is_alive.return_value = False
+        self.tracker._worker = worker
+
+        self.assertFalse(self.tracker._is_worker_healthy())
+        self.async_run_with_timeout(self.tracker._restart_worker())
+
+        worker.terminate.assert_not_called()
+        worker.join.assert_called_once_with(MultiProcessOrderBookTracker.WORKER_STOP_TIMEOUT)
+        start_worker_mock.assert_called_once()
+        self.assertEqual(1, self.tracker.worker_restarts)
+
+    @patch("hummingbot.core.data_type.multi_process_order_book_tracker.MultiProcessOrderBookTracker._start_worker")
+    def test_restart_after_a_write_interrupted_by_the_worker_termination(self, _):
+        self.worker_order_book.apply_snapshot(bids=[OrderBookRow(10, 1, 1)], asks=[OrderBookRow(11, 2, 1)], update_id=1)
+        self.publisher.publish()
+        self.tracker.refresh_order_books()
+        buffer = self.tracker._buffer
+        # The worker is terminated in the middle of a write: the sequence is odd and the levels are partially written
+        offset = buffer._book_offsets[self.trading_pair]
+        buffer._data[offset + SharedOrderBookBuffer._SEQUENCE] += 1
+        buffer._bids_view(offset)[0][0] = 5
+        buffer._data[SharedOrderBookBuffer._WRITES_COUNT] += 1
+        self.tracker._worker = MagicMock()
+        self.tracker._worker.is_alive.return_value = False
+
+        self.async_run_with_timeout(self.tracker._restart_worker())
+        self.tracker.refresh_order_books()
+
+        self.assertEqual(10, self.tracker.order_books[self.trading_pair].get_price(False))
+
+        new_worker_publisher = OrderBookPublisher(tracker=self.worker_tracker, buffer=buffer)
+        self.worker_order_book.apply_diffs(bids=[OrderBookRow(9, 1, 2)], asks=[], update_id=2)
+        new_worker_publisher.publish()
+        self.tracker.refresh_order_books()
+
+        self.assertEqual(0, buffer.book_sequence(self.trading_pair) % 2)
+        self.assertIsNotNone(buffer.read_book(self.trading_pair))
+        self.assertEqual([10, 9], [row.price for row in self.tracker.order_books[self.trading_pair].bid_entries()])
+
+    def test_worker_without_heartbeat_is_unhealthy(self):
+        self.tracker._worker = MagicMock()
+        self.tracker._worker.is_alive.return_value = True
+        self.tracker._worker_start_time = 0
+
+        self.assertFalse(self.tracker._is_worker_healthy())
+
+        self.tracker._buffer.beat()
+
+        self.assertTrue(self.tracker._is_worker_healthy())
+        self.tracker._worker = None
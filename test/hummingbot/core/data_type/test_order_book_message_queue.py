@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_queue import (
+    BoundedMessageQueue,
+    ConflatingOrderBookMessageQueue,
+    QueueOverflowPolicy,
+)
+
+
+class BoundedMessageQueueTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_drop_oldest_when_full(self):
+        dropped = []
+        queue = BoundedMessageQueue(maxsize=2, overflow_callback=dropped.append)
+
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        queue.put_nowait(3)
+
+        self.assertEqual(2, queue.qsize())
+        self.assertEqual([1], dropped)
+        self.assertEqual(1, queue.dropped_messages_count)
+        self.assertEqual(2, queue.get_nowait())
+        self.assertEqual(3, queue.get_nowait())
+
+    def test_drop_newest_when_full(self):
+        dropped = []
+        queue = BoundedMessageQueue(
+            maxsize=2, overflow_policy=QueueOverflowPolicy.DROP_NEWEST, overflow_callback=dropped.append
+        )
+
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        queue.put_nowait(3)
+
+        self.assertEqual([3], dropped)
+        self.assertEqual(1, queue.get_nowait())
+        self.assertEqual(2, queue.get_nowait())
+
+    def test_put_does_not_block_when_full(self):
+        queue = BoundedMessageQueue(maxsize=1)
+
+        self.async_run_with_timeout(queue.put(1))
+        self.async_run_with_timeout(queue.put(2))
+
+        self.assertEqual(1, queue.qsize())
+        self.assertEqual(2, self.async_run_with_timeout(queue.get()))
+
+
+class ConflatingOrderBookMessageQueueTests(unittest.TestCase):
+
+    @staticmethod
+    def _message(message_type: OrderBookMessageType, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=message_type,
+            content={"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": [], "asks": []},
+            timestamp=float(update_id),
+        )
+
+    def test_snapshot_conflates_older_diffs(self):
+        queue = ConflatingOrderBookMessageQueue(maxsize=10)
+        queue.put_nowait(self._message(OrderBookMessageType.DIFF, 1))
+        queue.put_nowait(self._message(OrderBookMessageType.DIFF, 2))
+        queue.put_nowait(self._message(OrderBookMessageType.DIFF, 4))
+
+        queue.put_nowait(self._message(OrderBookMessageType.SNAPSHOT, 3))
+
+        self.assertEqual(2, queue.qsize())
+        self.assertEqual(2, queue.conflated_messages_count)
+        self.assertEqual(4, queue.get_nowait().update_id)
+        snapshot = queue.get_nowait()
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+        self.assertEqual(3, snapshot.update_id)
+
+    def test_overflow_calls_callback(self):
+        dropped = []
+        queue = ConflatingOrderBookMessageQueue(maxsize=1, overflow_callback=dropped.append)
+        first_diff = self._message(OrderBookMessageType.DIFF, 1)
+
+        queue.put_nowait(first_diff)
+        queue.put_nowait(self._message(OrderBookMessageType.DIFF, 2))
+
+        self.assertEqual([first_diff], dropped)
+        self.assertEqual(2, queue.get_nowait().update_id)
@@ -0,0 +1,124 @@
+import asyncio
+import math
+import time
+import unittest
+from typing import Awaitable, Dict, List, Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class DummyOrderBookDataSource(OrderBookTrackerDataSource):
+    MESSAGE_QUEUE_MAX_SIZE = 2
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.requested_snapshots: List[str] = []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.requested_snapshots.append(trading_pair)
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": trading_pair, "update_id": 10, "bids": [], "asks": []},
+            timestamp=time.time(),
+        )
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = DummyOrderBookDataSource(trading_pairs=[self.trading_pair])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        self.tracker.TRACKING_QUEUE_MAX_SIZE = 2
+        self.tracker._order_books[self.trading_pair] = OrderBook()
+        self.tracker._tracking_message_queues[self.trading_pair] = self.tracker._create_tracking_message_queue(
+            self.trading_pair)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _diff(self, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": self.trading_pair, "update_id": update_id, "bids": [], "asks": []},
+            timestamp=time.time(),
+        )
+
+    def test_tracking_queue_overflow_requests_resync(self):
+        queue = self.tracker._tracking_message_queues[self.trading_pair]
+        for update_id in range(1, 4):
+            queue.put_nowait(self._diff(update_id))
+
+        self.async_run_with_timeout(self.tracker._resync_tasks[self.trading_pair])
+
+        self.assertEqual([self.trading_pair], self.data_source.requested_snapshots)
+        self.assertEqual(1, self.tracker._order_book_snapshot_stream.qsize())
+        self.assertEqual({self.trading_pair: 1}, self.tracker.dropped_messages_count)
+        self.assertEqual({self.trading_pair: 2}, self.tracker.queue_depths)
+
+    def test_data_source_diff_queue_overflow_requests_resync(self):
+        diff_queue = self.data_source._message_queue[self.data_source._diff_messages_queue_key]
+        for update_id in range(1, 4):
+            diff_queue.put_nowait({"u": update_id})
+
+        self.async_run_with_timeout(self.tracker._resync_tasks[self.trading_pair])
+
+        self.assertEqual([self.trading_pair], self.data_source.requested_snapshots)
+        self.assertEqual({self.data_source._diff_messages_queue_key: 1}, self.data_source.dropped_messages_count)
+
+    def test_trade_queue_overflow_does_not_request_resync(self):
+        trade_queue = self.data_source._message_queue[self.data_source._trade_messages_queue_key]
+        for trade_id in range(1, 4):
+            trade_queue.put_nowait({"t": trade_id})
+
+        self.assertEqual(0, len(self.tracker._resync_tasks))
+
+    def test_order_book_lag(self):
+        self.assertTrue(math.isnan(self.tracker.order_book_lag(self.trading_pair)))
+
+        self.tracker._last_applied_message_timestamps[self.trading_pair] = time.time() - 5
+
+        self.assertGreaterEqual(self.tracker.order_book_lag(self.trading_pair), 5)
+
+    def _trade(self, trading_pair: str, trade_id: int, price: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.TRADE,
+            content={"trading_pair": trading_pair, "trade_id": trade_id, "price": price, "amount": 1.0,
+                     "trade_type": 1.0},
+            timestamp=time.time(),
+        )
+
+    def test_queued_trades_are_applied_as_a_batch(self):
+        trade_logger = EventLogger()
+        order_book = self.tracker._order_books[self.trading_pair]
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        for trade_id, price in enumerate([10.0, 11.0, 12.0]):
+            self.tracker._order_book_trade_stream.put_nowait(self._trade(self.trading_pair, trade_id, price))
+        self.tracker._order_book_trade_stream.put_nowait(self._trade("UNKNOWN-PAIR", 4, 13.0))
+        self.tracker._order_books_initialized.set()
+
+        task = self.ev_loop.create_task(self.tracker._emit_trade_event_loop())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        task.cancel()
+
+        self.assertEqual([10.0, 11.0, 12.0], [event.price for event in trade_logger.event_log])
+        self.assertEqual(12.0, order_book.last_trade_price)
+        self.assertTrue(self.tracker._order_book_trade_stream.empty())
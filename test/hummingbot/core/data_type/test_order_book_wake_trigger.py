@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_wake_trigger import OrderBookWakeTrigger
+
+
+class OrderBookWakeTriggerTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.wake_ups = 0
+        self.order_book = OrderBook()
+
+    def wake(self):
+        self.wake_ups += 1
+
+    def apply_snapshot(self, best_bid: float, best_ask: float, update_id: int):
+        bids = np.array([[best_bid, 1, update_id], [best_bid - 1, 1, update_id]], dtype=np.float64)
+        asks = np.array([[best_ask, 1, update_id], [best_ask + 1, 1, update_id]], dtype=np.float64)
+        self.order_book.apply_numpy_snapshot(bids, asks)
+
+    def test_every_update_wakes_up_without_threshold(self):
+        trigger = OrderBookWakeTrigger(wake_function=self.wake)
+        trigger.watch(self.order_book)
+
+        self.apply_snapshot(best_bid=100, best_ask=101, update_id=1)
+        self.order_book.apply_numpy_diffs(
+            np.array([[98, 2, 2]], dtype=np.float64), np.array([], dtype=np.float64).reshape(0, 3)
+        )
+
+        self.assertEqual(2, self.wake_ups)
+
+    def test_only_top_of_book_moves_above_threshold_wake_up(self):
+        trigger = OrderBookWakeTrigger(wake_function=self.wake, top_of_book_threshold=0.001)
+        trigger.watch(self.order_book)
+
+        self.apply_snapshot(best_bid=100, best_ask=101, update_id=1)
+        self.assertEqual(1, self.wake_ups)
+
+        # Deeper levels change only
+        self.order_book.apply_numpy_diffs(
+            np.array([[98, 2, 2]], dtype=np.float64), np.array([], dtype=np.float64).reshape(0, 3)
+        )
+        self.assertEqual(1, self.wake_ups)
+
+        # Best bid moves by less than the threshold
+        self.apply_snapshot(best_bid=100.05, best_ask=101, update_id=3)
+        self.assertEqual(1, self.wake_ups)
+
+        # Best ask moves by more than the threshold
+        self.apply_snapshot(best_bid=100.05, best_ask=101.5, update_id=4)
+        self.assertEqual(2, self.wake_ups)
+
+    def test_unwatch_all(self):
+        trigger = OrderBookWakeTrigger(wake_function=self.wake)
+        trigger.watch(self.order_book)
+        trigger.watch(self.order_book)
+        self.assertEqual([self.order_book], trigger.watched_order_books)
+
+        trigger.unwatch_all()
+        self.apply_snapshot(best_bid=100, best_ask=101, update_id=1)
+
+        self.assertEqual([], trigger.watched_order_books)
+        self.assertEqual(0, self.wake_ups)
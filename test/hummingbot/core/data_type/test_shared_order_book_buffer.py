@@ -0,0 +1,128 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.shared_order_book_buffer import SharedOrderBookBuffer
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class SharedOrderBookBufferTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.buffer = SharedOrderBookBuffer(trading_pairs=[self.trading_pair, "BTC-USDT"], depth=2, trades_capacity=3)
+
+    def tearDown(self) -> None:
+        self.buffer.close()
+        self.buffer.unlink()
+        super().tearDown()
+
+    def _trade(self, trade_id: int) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair=self.trading_pair,
+            timestamp=1000.0 + trade_id,
+            type=TradeType.SELL,
+            price=10.0 + trade_id,
+            amount=1.0,
+            trade_id=str(trade_id),
+        )
+
+    def test_read_book_before_publication_returns_none(self):
+        self.assertIsNone(self.buffer.read_book(self.trading_pair))
+
+    def test_write_and_read_book_truncates_to_depth(self):
+        bids = np.array([[10.0, 1.0, 5], [9.0, 2.0, 5], [8.0, 3.0, 5]])
+        asks = np.array([[11.0, 1.5, 5]])
+
+        self.buffer.write_book(self.trading_pair, update_id=5, timestamp=1234.0, bids=bids, asks=asks)
+        state = self.buffer.read_book(self.trading_pair)
+
+        self.assertEqual(5, state.update_id)
+        self.assertEqual(1234.0, state.timestamp)
+        np.testing.assert_array_equal(bids[:2], state.bids)
+        np.testing.assert_array_equal(asks, state.asks)
+        self.assertIsNone(self.buffer.read_book("BTC-USDT"))
+
+    def test_writes_count_and_book_counters_change_on_writes(self):
+        self.assertEqual(0, self.buffer.writes_count)
+
+        self.buffer.write_book(
+            self.trading_pair, update_id=1, timestamp=1.0, bids=np.array([[10.0, 1.0, 1]]), asks=np.empty((0, 3)))
+        self.buffer.write_trade(self._trade(1))
+
+        self.assertEqual(2, self.buffer.writes_count)
+        self.assertEqual(2, self.buffer.book_sequence(self.trading_pair))
+        self.assertEqual(1, self.buffer.trades_count(self.trading_pair))
+        self.assertEqual(0, self.buffer.book_sequence("BTC-USDT"))
+        self.assertEqual(0, self.buffer.trades_count("BTC-USDT"))
+
+    def test_end_interrupted_writes_makes_the_sequences_even(self):
+        self.buffer.write_book(
+            self.trading_pair, update_id=1, timestamp=1.0, bids=np.array([[10.0, 1.0, 1]]), asks=np.empty((0, 3)))
+        offset = self.buffer._book_offsets[self.trading_pair]
+        self.buffer._data[offset + SharedOrderBookBuffer._SEQUENCE] += 1
+
+        self.assertIsNone(self.buffer.read_book(self.trading_pair))
+        self.assertEqual([self.trading_pair], self.buffer.end_interrupted_writes())
+        self.assertEqual(4, self.buffer.book_sequence(self.trading_pair))
+        self.assertEqual([], self.buffer.end_interrupted_writes())
+
+        self.buffer.write_book(
+            self.trading_pair, update_id=2, timestamp=2.0, bids=np.array([[9.0, 1.0, 2]]), asks=np.empty((0, 3)))
+
+        self.assertEqual(2, self.buffer.read_book(self.trading_pair).update_id)
+
+    def test_reader_attached_by_name_sees_writes(self):
+        reader = SharedOrderBookBuffer(
+            trading_pairs=[self.trading_pair, "BTC-USDT"], depth=2, trades_capacity=3, name=self.buffer.name,
+            create=False)
+        self.buffer.write_book(
+            self.trading_pair, update_id=1, timestamp=1.0, bids=np.array([[10.0, 1.0, 1]]), asks=np.empty((0, 3)))
+        self.buffer.beat(timestamp=42.0)
+
+        state = reader.read_book(self.trading_pair)
+
+        self.assertEqual(1, state.update_id)
+        self.assertEqual(0, len(state.asks))
+        self.assertEqual(42.0, reader.heartbeat)
+        reader.close()
+
+    def test_book_being_written_is_not_read(self):
+        self.buffer.write_book(
+            self.trading_pair, update_id=1, timestamp=1.0, bids=np.empty((0, 3)), asks=np.empty((0, 3)))
+        offset = self.buffer._book_offsets[self.trading_pair]
+        self.buffer._data[offset] += 1  # simulates a writer in the middle of an update
+
+        self.assertIsNone(self.buffer.read_book(self.trading_pair))
+
+    def test_trades_ring_buffer(self):
+        for trade_id in range(2):
+            self.buffer.write_trade(self._trade(trade_id))
+
+        count, trades = self.buffer.read_trades(self.trading_pair, since_count=0)
+
+        self.assertEqual(2, count)
+        self.assertEqual([self._trade(0), self._trade(1)], trades)
+
+        for trade_id in range(2, 7):
+            self.buffer.write_trade(self._trade(trade_id))
+
+        count, trades = self.buffer.read_trades(self.trading_pair, since_count=count)
+
+        self.assertEqual(7, count)
+        self.assertEqual([self._trade(4), self._trade(5), self._trade(6)], trades)
+
+    def test_trade_ids_are_not_limited_to_float_values(self):
+        trade_ids = ["18446744073709551615", "a1b2-c3d4", "x" * (SharedOrderBookBuffer.TRADE_ID_SIZE + 1)]
+        for trade_id in trade_ids:
+            self.buffer.write_trade(OrderBookTradeEvent(
+                trading_pair="BTC-USDT", timestamp=1.0, type=TradeType.BUY, price=1.0, amount=1.0, trade_id=trade_id))
+
+        count, trades = self.buffer.read_trades("BTC-USDT", since_count=0)
+
+        self.assertEqual(3, count)
+        self.assertEqual(["18446744073709551615", "a1b2-c3d4", None], [trade.trade_id for trade in trades])
+        _, trades = self.buffer.read_trades(self.trading_pair, since_count=0)
+        self.assertEqual([], trades)
@@ -0,0 +1,136 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.gateway.gateway_quote_cache import GatewayQuoteCache
+
+
+class GatewayQuoteCacheTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.now = 1000.0
+        self.cache = GatewayQuoteCache(time_function=lambda: self.now)
+        self.calls = 0
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"price": str(self.calls)}
+
+    async def get_quote(self, key="ETH-USDC-BUY-1", chain="ethereum", network="mainnet"):
+        return await self.cache.get(chain=chain, network=network, key=key, fetch=self.fetch)
+
+    async def test_concurrent_identical_requests_share_one_call(self):
+        results = await asyncio.gather(*[self.get_quote() for _ in range(5)])
+
+        self.assertEqual(1, self.calls)
+        self.assertTrue(all(result == {"price": "1"} for result in results))
+        stats = self.cache.stats["ethereum"]
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(4, stats.coalesced)
+        self.assertEqual(0.8, stats.hit_ratio)
+
+    async def test_different_requests_are_not_shared(self):
+        await asyncio.gather(self.get_quote(key="ETH-USDC-BUY-1"), self.get_quote(key="ETH-USDC-SELL-1"))
+
+        self.assertEqual(2, self.calls)
+
+    async def test_results_reused_until_ttl_expires(self):
+        self.cache.set_ttl("ethereum", 2.0)
+        await self.get_quote()
+        self.now += 1.9
+        result = await self.get_quote()
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual({"price": "1"}, result)
+        self.assertEqual(1, self.cache.stats["ethereum"].hits)
+
+        self.now += 0.2
+        result = await self.get_quote()
+
+        self.assertEqual(2, self.calls)
+        self.assertEqual({"price": "2"}, result)
+
+    async def test_zero_ttl_disables_cache(self):
+        self.cache.set_ttl("ethereum", 0)
+        await self.get_quote()
+        await self.get_quote()
+
+        self.assertEqual(2, self.calls)
+
+    async def test_new_block_invalidates_results_of_the_chain_network(self):
+        self.cache.update_block_number(chain="ethereum", network="mainnet", block_number=100)
+        await self.get_quote(chain="ethereum", network="mainnet")
+        await self.get_quote(key="other", chain="polygon", network="mainnet")
+
+        self.cache.update_block_number(chain="ethereum", network="mainnet", block_number=100)
+        await self.get_quote(chain="ethereum", network="mainnet")
+        self.assertEqual(2, self.calls)
+
+        self.cache.update_block_number(chain="ethereum", network="mainnet", block_number=101)
+        await self.get_quote(chain="ethereum", network="mainnet")
+        await self.get_quote(key="other", chain="polygon", network="mainnet")
+        self.assertEqual(3, self.calls)
+
+    async def test_failed_requests_are_not_cached(self):
+        async def failing_fetch():
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            raise IOError("Gateway error")
+
+        requests = [self.cache.get(chain="ethereum", network="mainnet", key="key", fetch=failing_fetch)
+                    for _ in range(2)]
+        results = await asyncio.gather(*requests, return_exceptions=True)
+
+        self.assertEqual(1, self.calls)
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+
+        async def empty_fetch():
+            self.calls += 1
+            return {}
+
+        await self.cache.get(chain="ethereum", network="mainnet", key="key", fetch=empty_fetch)
+        await self.cache.get(chain="ethereum", network="mainnet", key="key", fetch=empty_fetch)
+        self.assertEqual(3, self.calls)
+
+    async def test_configured_ttls_replace_the_default_ones(self):
+        cache = GatewayQuoteCache(chain_ttls={"ethereum": 5.0, "my-chain": 0.2})
+
+        self.assertEqual(5.0, cache.ttl("ethereum"))
+        self.assertEqual(0.2, cache.ttl("my-chain"))
+        self.assertEqual(GatewayQuoteCache.DEFAULT_CHAIN_TTLS["polygon"], cache.ttl("polygon"))
+        self.assertEqual(GatewayQuoteCache.DEFAULT_TTL, cache.ttl("unknown-chain"))
+
+    async def test_cancelling_the_first_request_does_not_cancel_the_others(self):
+        first_request = asyncio.ensure_future(self.get_quote())
+        await asyncio.sleep(0)
+        second_request = asyncio.ensure_future(self.get_quote())
+        await asyncio.sleep(0)
+
+        first_request.cancel()
+        result = await second_request
+
+        self.assertTrue(first_request.cancelled())
+        self.assertEqual({"price": "1"}, result)
+        self.assertEqual(1, self.calls)
+
+    async def test_cache_size_is_bounded(self):
+        async def fetch():
+            return {"price": "1"}
+
+        for index in range(GatewayQuoteCache.MAX_ENTRIES + 10):
+            await self.cache.get(chain="ethereum", network="mainnet", key=index, fetch=fetch)
+
+        self.assertEqual(GatewayQuoteCache.MAX_ENTRIES, len(self.cache._entries))
+        self.assertNotIn(0, self.cache._entries)
+        self.assertIn(GatewayQuoteCache.MAX_ENTRIES + 9, self.cache._entries)
+
+    async def test_requests_receive_copies_of_the_result(self):
+        results = await asyncio.gather(self.get_quote(), self.get_quote())
+        results[0]["price"] = "modified"
+
+        self.assertEqual({"price": "1"}, results[1])
+        cached_result = await self.get_quote()
+        cached_result["price"] = "modified"
+
+        self.assertEqual({"price": "1"}, await self.get_quote())
+        self.assertEqual(1, self.calls)
@@ -122,3 +122,88 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_tick_stats_recorded_per_iterator(self):
+        time_iterator: TimeIterator = TimeIterator()
+        self.clock_realtime.add_iterator(time_iterator)
+
+        with self.clock_realtime:
+            self.ev_loop.run_until_complete(self.clock_realtime.run_til(self.realtime_end_timestamp))
+
+        stats = self.clock_realtime.tick_stats[time_iterator]
+        self.assertGreater(stats.count, 0)
+        self.assertGreaterEqual(stats.max_duration, stats.average_duration)
+
+        self.clock_realtime.remove_iterator(time_iterator)
+        self.assertNotIn(time_iterator, self.clock_realtime.tick_stats)
+
+    def run_clock_with_wake_ups(self, clock: Clock, wake_ups, duration: float):
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(
+                asyncio.wait_for(clock.run(), timeout=duration),
+                wake_ups(),
+                return_exceptions=True,
+            ))
+
+    def ticks_count(self, clock: Clock, iterator: TimeIterator) -> int:
+        stats = clock.tick_stats.get(iterator)
+        return stats.count if stats is not None else 0
+
+    def test_wake_iterator_ticks_between_regular_ticks(self):
+        time_iterator: TimeIterator = TimeIterator()
+        other_iterator: TimeIterator = TimeIterator()
+        clock = Clock(ClockMode.REALTIME, tick_size=10.0)
+        clock.add_iterator(time_iterator)
+        clock.add_iterator(other_iterator)
+        clock.register_event_driven_iterator(time_iterator, min_wake_interval=0.05)
+
+        woken_timestamps = []
+
+        async def wake_ups():
+            await asyncio.sleep(0.1)
+            clock.wake_iterator(time_iterator)
+            clock.wake_iterator(other_iterator)  # not event driven, ignored
+            await asyncio.sleep(0.1)
+            woken_timestamps.append(time_iterator.current_timestamp)
+
+        self.run_clock_with_wake_ups(clock, wake_ups, duration=0.3)
+
+        self.assertEqual(self.ticks_count(clock, other_iterator) + 1, self.ticks_count(clock, time_iterator))
+        # The woken tick receives the timestamp of the last regular tick
+        self.assertEqual(1, len(woken_timestamps))
+        self.assertEqual(0, woken_timestamps[0] % 10.0)
+
+    def test_wake_ups_coalesced_within_min_interval(self):
+        time_iterator: TimeIterator = TimeIterator()
+        other_iterator: TimeIterator = TimeIterator()
+        clock = Clock(ClockMode.REALTIME, tick_size=10.0)
+        clock.add_iterator(time_iterator)
+        clock.add_iterator(other_iterator)
+        clock.register_event_driven_iterator(time_iterator, min_wake_interval=0.2)
+
+        async def wake_ups():
+            for _ in range(10):
+                clock.wake_iterator(time_iterator)
+                await asyncio.sleep(0.03)
+
+        self.run_clock_with_wake_ups(clock, wake_ups, duration=0.35)
+
+        # One wake up at the first request, the following ones coalesced into a second wake up 0.2s later
+        self.assertEqual(self.ticks_count(clock, other_iterator) + 2, self.ticks_count(clock, time_iterator))
+
+    def test_unregistered_iterator_is_not_woken(self):
+        time_iterator: TimeIterator = TimeIterator()
+        other_iterator: TimeIterator = TimeIterator()
+        clock = Clock(ClockMode.REALTIME, tick_size=10.0)
+        clock.add_iterator(time_iterator)
+        clock.add_iterator(other_iterator)
+        clock.register_event_driven_iterator(time_iterator)
+        clock.unregister_event_driven_iterator(time_iterator)
+
+        async def wake_ups():
+            await asyncio.sleep(0.05)
+            clock.wake_iterator(time_iterator)
+
+        self.run_clock_with_wake_ups(clock, wake_ups, duration=0.2)
+
+        self.assertEqual(self.ticks_count(clock, other_iterator), self.ticks_count(clock, time_iterator))
@@ -1,11 +1,13 @@
-import unittest
 import gc
+import os
+import time
+import unittest
 import weakref
+from test.mock.mock_events import MockEvent, MockEventType
 
-from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
-
-from test.mock.mock_events import MockEventType, MockEvent
+from hummingbot.core.pubsub import PubSub
 
 
 class PubSubTest(unittest.TestCase):
@@ -89,6 +91,143 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_removed_when_collected(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+        self.assertEqual([self.event], self.listener_one.event_log)
+
+    def test_pubsub_collected_before_its_listeners(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        pubsub_weakref = weakref.ref(self.pubsub)
+        self.pubsub = None
+        gc.collect()
+        self.assertIsNone(pubsub_weakref())
+
+        # The callback of the listener weak reference must not fail without the pubsub
+        self.listener_zero = None
+        gc.collect()
+
+    def test_trigger_events(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        events = [MockEvent(payload=i) for i in range(3)]
+
+        self.pubsub.trigger_events(self.event_tag_zero, events)
+        self.pubsub.trigger_events(self.event_tag_one, events)
+
+        self.assertEqual(events, self.listener_zero.event_log)
+        self.assertEqual(events, self.listener_one.event_log)
+
+    def test_listener_removed_while_triggering(self):
+        pubsub = self.pubsub
+        listener_one = self.listener_one
+
+        class RemovingListener(EventListener):
+            def __call__(self, arg):
+                pubsub.remove_listener(MockEventType.EVENT_ZERO, listener_one)
+
+        removing_listener = RemovingListener()
+        self.pubsub.add_listener(self.event_tag_zero, removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        # The listeners removed while triggering an event stop receiving events from the next trigger
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual([self.event], self.listener_one.event_log)
+        self.assertEqual([removing_listener], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listener_errors_are_logged(self):
+        class FailingListener(EventListener):
+            def __call__(self, arg):
+                raise ValueError("Test error")
+
+        failing_listener = FailingListener()
+        self.pubsub.add_listener(self.event_tag_zero, failing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        with self.assertLogs(PubSub.logger().name, level="ERROR"):
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual([self.event], self.listener_zero.event_log)
+
+    def test_event_info_is_reset_after_each_event(self):
+        pubsub = self.pubsub
+        event_infos = []
+
+        class RecordingListener(EventListener):
+            def __call__(self, arg):
+                event_infos.append((self.current_event_tag, self.current_event_caller))
+
+        listener = RecordingListener()
+        self.pubsub.add_listener(self.event_tag_zero, listener)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_events(self.event_tag_zero, [self.event, self.event])
+
+        self.assertEqual([(self.event_tag_zero.value, pubsub)] * 3, event_infos)
+        self.assertEqual(0, listener.current_event_tag)
+        self.assertIsNone(listener.current_event_caller)
+
+        # The listeners don't keep the PubSub alive
+        pubsub_weakref = weakref.ref(pubsub)
+        pubsub = self.pubsub = None
+        event_infos.clear()
+        gc.collect()
+        self.assertIsNone(pubsub_weakref())
+
+    def test_trigger_event_reads_each_listener_once(self):
+        class CountingListener(EventListener):
+            def __init__(self):
+                super().__init__()
+                self.count = 0
+
+            def __call__(self, arg):
+                self.count += 1
+
+        listeners = [CountingListener() for _ in range(1000)]
+        for listener in listeners:
+            self.pubsub.add_listener(self.event_tag_zero, listener)
+
+        for _ in range(10):
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual([10] * 1000, [listener.count for listener in listeners])
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_RUN_BENCHMARKS"), "Set HUMMINGBOT_RUN_BENCHMARKS to run benchmarks")
+    def test_trigger_event_benchmark(self):
+        """
+        Reports the triggers (and listener calls) per second with 1, 10 and 1,000 listeners. The rates depend on the
+        machine, so they are only printed (run with `pytest -s`) and not checked.
+        """
+        class CountingListener(EventListener):
+            def __init__(self):
+                super().__init__()
+                self.count = 0
+
+            def __call__(self, arg):
+                self.count += 1
+
+        for listeners_count in (1, 10, 1000):
+            pubsub = PubSub()
+            listeners = [CountingListener() for _ in range(listeners_count)]
+            for listener in listeners:
+                pubsub.add_listener(self.event_tag_zero, listener)
+            triggers = max(100, 100000 // listeners_count)
+
+            start = time.perf_counter()
+            for _ in range(triggers):
+                pubsub.trigger_event(self.event_tag_zero, self.event)
+            elapsed = time.perf_counter() - start
+
+            self.assertEqual(triggers, listeners[-1].count)
+            print(f"PubSub with {listeners_count} listeners: {triggers / elapsed:,.0f} triggers/s, "
+                  f"{triggers * listeners_count / elapsed:,.0f} listener calls/s")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.utils.latency_tracer import LatencyHistogram, LatencyStage, LatencyTracer
+
+
+class LatencyHistogramTests(unittest.TestCase):
+
+    def test_percentiles_within_relative_error(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 100001):
+            histogram.record(value * 1000)
+
+        self.assertEqual(100000, histogram.count)
+        self.assertEqual(1000, histogram.min)
+        self.assertEqual(100000000, histogram.max)
+        self.assertAlmostEqual(50000500, histogram.mean)
+        for percentile in (50, 90, 99):
+            expected = percentile * 1000000
+            self.assertAlmostEqual(expected, histogram.percentile(percentile), delta=expected * 0.04)
+        self.assertEqual(100000000, histogram.percentile(100))
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for value in (0, 1, 2, 3, 10):
+            histogram.record(value)
+
+        self.assertEqual(2, histogram.percentile(50))
+        self.assertEqual(10, histogram.percentile(100))
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.percentile(50))
+        self.assertEqual(0.0, histogram.mean)
+
+
+class LatencyTracerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracer = LatencyTracer()
+
+    def test_tracer_is_disabled_by_default(self):
+        self.assertFalse(LatencyTracer().enabled)
+
+    def test_record_by_stage_connector_and_pair(self):
+        self.tracer.record(LatencyStage.BOOK_APPLY, 2000000, connector="binance", trading_pair="BTC-USDT")
+        self.tracer.record(LatencyStage.BOOK_APPLY, 4000000, connector="binance", trading_pair="BTC-USDT")
+        self.tracer.record(LatencyStage.BOOK_APPLY, 1000000, connector="binance", trading_pair="ETH-USDT")
+
+        summary = self.tracer.summary()
+
+        self.assertEqual(2, len(summary))
+        self.assertEqual("BTC-USDT", summary[0]["trading_pair"])
+        self.assertEqual(2, summary[0]["count"])
+        self.assertAlmostEqual(3.0, summary[0]["mean_ms"])
+        self.assertAlmostEqual(4.0, summary[0]["max_ms"])
+        self.assertEqual(1, self.tracer.histogram(LatencyStage.BOOK_APPLY, "binance", "ETH-USDT").count)
+
+    @patch("hummingbot.core.utils.latency_tracer.time.perf_counter_ns")
+    def test_spans(self, perf_counter_mock):
+        perf_counter_mock.side_effect = [1000, 3000, 7000]
+        self.tracer.start_span("OID1")
+        self.tracer.record_span("OID1", LatencyStage.ORDER_CREATE_TO_PLACED, connector="binance")
+        self.tracer.record_span("OID1", LatencyStage.ORDER_CREATE_TO_FIRST_UPDATE, connector="binance", finish=True)
+        self.tracer.record_span("OID1", LatencyStage.ORDER_CREATE_TO_FIRST_UPDATE, connector="binance", finish=True)
+
+        self.assertEqual(2000, self.tracer.histogram(LatencyStage.ORDER_CREATE_TO_PLACED, "binance").max)
+        first_update = self.tracer.histogram(LatencyStage.ORDER_CREATE_TO_FIRST_UPDATE, "binance")
+        self.assertEqual(1, first_update.count)
+        self.assertEqual(6000, first_update.max)
+
+    def test_open_spans_are_bounded(self):
+        self.tracer.MAX_OPEN_SPANS = 2
+        for span_id in ("OID1", "OID2", "OID3"):
+            self.tracer.start_span(span_id)
+
+        self.tracer.record_span("OID1", LatencyStage.ORDER_CREATE_TO_PLACED)
+        self.tracer.record_span("OID3", LatencyStage.ORDER_CREATE_TO_PLACED)
+
+        self.assertEqual(1, self.tracer.histogram(LatencyStage.ORDER_CREATE_TO_PLACED).count)
+
+    def test_reset(self):
+        self.tracer.record(LatencyStage.CLOCK_TICK, 1000)
+        self.tracer.reset()
+
+        self.assertEqual([], self.tracer.summary())
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
+from hummingbot.core.utils.signing_service import SigningService
+
+
+class SigningServiceTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.service = SigningService(max_workers=2)
+        self.tracer = LatencyTracer.get_instance()
+
+    def tearDown(self) -> None:
+        self.service.shutdown()
+        self.tracer.disable()
+        self.tracer.reset()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_sign_runs_out_of_the_event_loop_thread(self):
+        def sign(payload: str):
+            return f"{payload}-signed", threading.current_thread().name
+
+        signature, thread_name = self.async_run_with_timeout(self.service.sign(sign, "payload"))
+
+        self.assertEqual("payload-signed", signature)
+        self.assertNotEqual(threading.current_thread().name, thread_name)
+        self.assertTrue(thread_name.startswith("signing"))
+        self.assertEqual(1, self.service.signatures_count)
+
+    def test_concurrent_signatures_return_their_own_results(self):
+        results = self.async_run_with_timeout(asyncio.gather(
+            *[self.service.sign(lambda payload: payload * 2, value) for value in range(5)]))
+
+        self.assertEqual([0, 2, 4, 6, 8], results)
+        self.assertEqual(5, self.service.signatures_count)
+
+    def test_sign_batch_runs_the_calls_in_one_job_and_keeps_their_order(self):
+        def sign(payload: int):
+            return payload * 2, threading.current_thread().name
+
+        results = self.async_run_with_timeout(self.service.sign_batch([(sign, (value,)) for value in range(5)]))
+
+        self.assertEqual([0, 2, 4, 6, 8], [signature for signature, _ in results])
+        self.assertEqual(1, len({thread_name for _, thread_name in results}))
+        self.assertEqual(5, self.service.signatures_count)
+        self.assertEqual([], self.async_run_with_timeout(self.service.sign_batch([])))
+
+    def test_sign_batch_errors(self):
+        def sign(payload: int):
+            if payload == 1:
+                raise ValueError("Invalid key")
+            return payload
+
+        calls = [(sign, (value,)) for value in range(3)]
+        results = self.async_run_with_timeout(self.service.sign_batch(calls, return_exceptions=True))
+
+        self.assertEqual(0, results[0])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(2, results[2])
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.service.sign_batch(calls))
+
+    def test_sign_raises_signing_errors(self):
+        def sign():
+            raise ValueError("Invalid key")
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.service.sign(sign))
+
+    def test_signing_latency_is_reported_when_tracing(self):
+        self.tracer.enable()
+        self.async_run_with_timeout(asyncio.gather(
+            *[self.service.sign(str, value, connector="test_exchange") for value in range(3)]))
+
+        self.assertEqual(3, self.tracer.histogram(LatencyStage.SIGNING, "test_exchange").count)
+
+        self.async_run_with_timeout(
+            self.service.sign_batch([(str, (value,)) for value in range(3)], connector="test_exchange"))
+
+        self.assertEqual(6, self.tracer.histogram(LatencyStage.SIGNING, "test_exchange").count)
@@ -1,13 +1,11 @@
 import asyncio
 import unittest
 from typing import Awaitable
+from unittest.mock import MagicMock
 
-from hummingbot.core.web_assistant.connections.connections_factory import (
-    ConnectionsFactory
-)
-from hummingbot.core.web_assistant.connections.rest_connection import (
-    RESTConnection
-)
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -34,3 +32,68 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_shared_client_uses_pool_config(self):
+        pool_config = ConnectionPoolConfig(limit=7, limit_per_host=3, keepalive_timeout=12, ttl_dns_cache=60)
+        factory = ConnectionsFactory(pool_config=pool_config)
+
+        client = self.async_run_with_timeout(factory._get_shared_client())
+
+        self.assertEqual(7, client.connector.limit)
+        self.assertEqual(3, client.connector.limit_per_host)
+        self.assertEqual(7, factory.pool_stats().limit)
+        self.async_run_with_timeout(client.close())
+
+    def test_set_pool_config_before_the_client_is_created(self):
+        factory = ConnectionsFactory()
+        factory.set_pool_config(ConnectionPoolConfig(limit=5, limit_per_host=2))
+
+        client = self.async_run_with_timeout(factory._get_shared_client())
+
+        self.assertEqual(5, client.connector.limit)
+        self.assertEqual(2, client.connector.limit_per_host)
+        self.assertEqual(5, factory.pool_stats().limit)
+        self.async_run_with_timeout(client.close())
+
+    def test_pool_stats_are_updated_by_the_trace_callbacks(self):
+        factory = ConnectionsFactory(pool_config=ConnectionPoolConfig(limit=4))
+        trace_config = factory._trace_config()
+        session, context, params = MagicMock(), MagicMock(), MagicMock()
+
+        for callback in (trace_config.on_request_start[0], trace_config.on_request_start[0],
+                         trace_config.on_connection_create_end[0], trace_config.on_connection_reuseconn[0],
+                         trace_config.on_connection_reuseconn[0], trace_config.on_connection_queued_start[0],
+                         trace_config.on_request_end[0]):
+            self.async_run_with_timeout(callback(session, context, params))
+
+        stats = factory.pool_stats()
+        self.assertEqual(1, stats.connections_created)
+        self.assertEqual(2, stats.connections_reused)
+        self.assertEqual(1, stats.requests_queued)
+        self.assertEqual(1, stats.requests_in_flight)
+        self.assertAlmostEqual(2 / 3, stats.reuse_ratio)
+        self.assertEqual(0.25, stats.saturation)
+
+    def test_rest_connection_uses_the_pools_of_the_hosts(self):
+        factory = ConnectionsFactory(
+            pool_config=ConnectionPoolConfig(limit=7),
+            host_pool_configs={"api.test.com": ConnectionPoolConfig(limit=3, limit_per_host=2)},
+        )
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+
+        host_client = rest_connection._host_client_sessions["api.test.com"]
+        self.assertIsNot(rest_connection._client_session, host_client)
+        self.assertEqual(3, host_client.connector.limit)
+        self.assertEqual(2, host_client.connector.limit_per_host)
+        self.assertEqual(10, factory.pool_stats().limit)
+        self.async_run_with_timeout(rest_connection._client_session.close())
+        self.async_run_with_timeout(host_client.close())
+
+    def test_rest_connection_without_host_pools_uses_the_shared_client_only(self):
+        factory = ConnectionsFactory()
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+
+        self.assertIsNone(rest_connection._host_client_sessions)
+        self.async_run_with_timeout(rest_connection._client_session.close())
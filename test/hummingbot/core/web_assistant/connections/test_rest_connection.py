@@ -2,6 +2,7 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable
+from unittest.mock import patch
 
 import aiohttp
 from aioresponses import aioresponses
@@ -39,3 +40,22 @@ class RESTConnectionTest(unittest.TestCase):
         j = self.async_run_with_timeout(ret.json())
 
         self.assertEqual(resp, j)
+
+    @aioresponses()
+    def test_rest_connection_call_uses_the_session_of_the_host(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({}).encode())
+
+        client_session = aiohttp.ClientSession(loop=self.ev_loop)
+        host_client_session = aiohttp.ClientSession(loop=self.ev_loop)
+        connection = RESTConnection(client_session, host_client_sessions={"www.test.com": host_client_session})
+        request = RESTRequest(method=RESTMethod.GET, url=url)
+
+        with patch.object(client_session, "request", wraps=client_session.request) as request_mock, \
+                patch.object(host_client_session, "request", wraps=host_client_session.request) as host_request_mock:
+            self.async_run_with_timeout(connection.call(request))
+
+        request_mock.assert_not_called()
+        host_request_mock.assert_called_once()
+        self.async_run_with_timeout(client_session.close())
+        self.async_run_with_timeout(host_client_session.close())
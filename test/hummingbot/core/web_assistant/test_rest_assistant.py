@@ -2,16 +2,17 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable, Optional
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
-from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.core.web_assistant.rest_assistant import _DEFAULT_HEADERS, RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
@@ -100,3 +101,180 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_call_does_not_modify_original_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_requests = []
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.headers["authenticated"] = "true"
+                request.params["signature"] = "sig"
+                request.data["params"]["signature"] = "sig"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        req = RESTRequest(method=RESTMethod.GET, url=url, params={"one": "1"}, headers={"h": "1"})
+        auth_req = RESTRequest(
+            method=RESTMethod.POST, url=url, params={"one": "1"}, headers={"h": "1"}, data={"params": {"one": 1}},
+            is_auth_required=True
+        )
+
+        self.async_run_with_timeout(assistant.call(req))
+        self.async_run_with_timeout(assistant.call(auth_req))
+
+        self.assertIs(req, call_requests[0])
+        self.assertIsNot(auth_req, call_requests[1])
+        self.assertEqual({"h": "1"}, auth_req.headers)
+        self.assertEqual({"one": "1"}, auth_req.params)
+        self.assertEqual({"params": {"one": 1}}, auth_req.data)
+        self.assertEqual({"params": {"one": 1, "signature": "sig"}}, call_requests[1].data)
+        self.assertEqual({"h": "1", "authenticated": "true"}, call_requests[1].headers)
+        self.assertEqual({"one": "1", "signature": "sig"}, call_requests[1].params)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_does_not_copy_requests_for_copy_on_write_processors(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_requests = []
+        processed_requests = []
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class PreProcessor(RESTPreProcessorBase):
+            modifies_requests_in_place = False
+
+            async def pre_process(self, request: RESTRequest) -> RESTRequest:
+                processed_requests.append(request)
+                return request
+
+        class AuthDummy(AuthBase):
+            modifies_requests_in_place = False
+
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                return request.replace(headers={**request.headers, "authenticated": "true"})
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(
+            connection, throttler=AsyncThrottler(rate_limits=[]), rest_pre_processors=[PreProcessor()],
+            auth=AuthDummy())
+        req = RESTRequest(method=RESTMethod.GET, url=url, params={"one": "1"}, headers={"h": "1"},
+                          is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertIs(req, processed_requests[0])
+        self.assertEqual({"h": "1"}, req.headers)
+        self.assertEqual({"h": "1", "authenticated": "true"}, call_requests[0].headers)
+        self.assertIs(req.params, call_requests[0].params)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_execute_request_does_not_modify_the_params_of_the_caller(self, mocked_call):
+        call_requests = []
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            response = MagicMock()
+            response.status = 200
+            return response
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "sig"
+                request.headers["authenticated"] = "true"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="limit", limit=100, time_interval=1)])
+        assistant = RESTAssistant(connection, throttler=throttler, auth=AuthDummy())
+        params = {"one": "1"}
+
+        for _ in range(2):
+            self.async_run_with_timeout(assistant.execute_request_and_get_response(
+                url="https://www.test.com/url", throttler_limit_id="limit", params=params, is_auth_required=True))
+
+        self.assertEqual({"one": "1"}, params)
+        self.assertEqual({"one": "1", "signature": "sig"}, call_requests[1].params)
+        self.assertEqual({"Content-Type": "application/x-www-form-urlencoded", "authenticated": "true"},
+                         call_requests[1].headers)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_execute_request_reuses_the_headers_template_of_the_endpoint(self, mocked_call):
+        call_requests = []
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            response = MagicMock()
+            response.status = 200
+            return response
+
+        mocked_call.side_effect = register_request_and_return
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="limit", limit=100, time_interval=1),
+                                                RateLimit(limit_id="other", limit=100, time_interval=1)])
+        assistant = RESTAssistant(connection, throttler=throttler)
+
+        for headers in ({"h": "1"}, {"h": "1"}, {"h": "2"}):
+            self.async_run_with_timeout(assistant.execute_request_and_get_response(
+                url="https://www.test.com/url", throttler_limit_id="limit", method=RESTMethod.POST, data={},
+                headers=headers))
+        self.async_run_with_timeout(assistant.execute_request_and_get_response(
+            url="https://www.test.com/url", throttler_limit_id="other", method=RESTMethod.POST, data={},
+            headers={"h": "2"}))
+
+        self.assertIs(call_requests[0].headers, call_requests[1].headers)
+        self.assertEqual({"Content-Type": "application/json", "h": "2"}, call_requests[2].headers)
+        self.assertIsNot(call_requests[2].headers, call_requests[3].headers)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_execute_request_builds_headers_from_method_template(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_requests = []
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            response = MagicMock()
+            response.status = 200
+            return response
+
+        mocked_call.side_effect = register_request_and_return
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="limit", limit=100, time_interval=1)])
+        assistant = RESTAssistant(connection, throttler=throttler)
+
+        self.async_run_with_timeout(assistant.execute_request_and_get_response(
+            url=url, throttler_limit_id="limit", method=RESTMethod.POST, data={"one": 1}, headers={"h": "1"}))
+        self.async_run_with_timeout(assistant.execute_request_and_get_response(
+            url=url, throttler_limit_id="limit", method=RESTMethod.GET))
+        self.async_run_with_timeout(assistant.execute_request_and_get_response(
+            url=url, throttler_limit_id="limit", method=RESTMethod.POST, data="one"))
+
+        self.assertEqual({"Content-Type": "application/json", "h": "1"}, call_requests[0].headers)
+        self.assertEqual(json.dumps({"one": 1}), call_requests[0].data)
+        self.assertEqual({"Content-Type": "application/x-www-form-urlencoded"}, call_requests[1].headers)
+        self.assertEqual(json.dumps("one"), call_requests[2].data)
+        self.assertEqual({"Content-Type": "application/json"}, _DEFAULT_HEADERS[RESTMethod.POST])
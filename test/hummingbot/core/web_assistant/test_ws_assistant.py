@@ -68,7 +68,7 @@ class WSAssistantTest(unittest.TestCase):
 
         sent_request = sent_requests[0]
 
-        self.assertNotEqual(id(request), id(sent_request))  # has been cloned
+        self.assertIs(request, sent_request)  # not copied, since no processor or auth runs on it
         self.assertEqual(request, sent_request)
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
@@ -106,7 +106,7 @@ class WSAssistantTest(unittest.TestCase):
 
         sent_request = sent_requests[0]
 
-        self.assertNotEqual(id(request), id(sent_request))  # has been cloned
+        self.assertIs(request, sent_request)  # not copied, since no processor or auth runs on it
         self.assertEqual(request, sent_request)
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
@@ -137,6 +137,55 @@ class WSAssistantTest(unittest.TestCase):
         self.assertEqual(expected, sent_request.payload)
         self.assertEqual(auth_expected, auth_sent_request.payload)
 
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_send_does_not_modify_original_request(self, send_mock):
+        class Auth(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                pass
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                request.payload["authenticated"] = True
+                request.payload["params"]["signature"] = "sig"
+                return request
+
+        ws_assistant = WSAssistant(connection=self.ws_connection, auth=Auth())
+        sent_requests = []
+        send_mock.side_effect = lambda r: sent_requests.append(r)
+        req = WSJSONRequest({"one": 1})
+        auth_req = WSJSONRequest({"one": 1, "params": {"key": "value"}}, is_auth_required=True)
+
+        self.async_run_with_timeout(ws_assistant.send(req))
+        self.async_run_with_timeout(ws_assistant.send(auth_req))
+
+        self.assertIs(req, sent_requests[0])
+        self.assertIsNot(auth_req, sent_requests[1])
+        self.assertEqual({"one": 1, "params": {"key": "value"}}, auth_req.payload)
+        self.assertEqual({"one": 1, "authenticated": True, "params": {"key": "value", "signature": "sig"}},
+                         sent_requests[1].payload)
+
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_send_does_not_copy_requests_for_copy_on_write_auth(self, send_mock):
+        class Auth(AuthBase):
+            modifies_requests_in_place = False
+
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                pass
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                return request.replace(payload={**request.payload, "authenticated": True})
+
+        ws_assistant = WSAssistant(connection=self.ws_connection, auth=Auth())
+        sent_requests = []
+        send_mock.side_effect = lambda r: sent_requests.append(r)
+        params = {"key": "value"}
+        auth_req = WSJSONRequest({"one": 1, "params": params}, is_auth_required=True)
+
+        self.async_run_with_timeout(ws_assistant.send(auth_req))
+
+        self.assertEqual({"one": 1, "params": {"key": "value"}}, auth_req.payload)
+        self.assertEqual({"one": 1, "params": {"key": "value"}, "authenticated": True}, sent_requests[0].payload)
+        self.assertIs(params, sent_requests[0].payload["params"])
+
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.receive")
     def test_receive(self, receive_mock):
         data = {"one": 1}
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub, CandlesHubConnection
+from hummingbot.data_feed.candles_feed.okx_spot_candles.okx_spot_candles import OKXSpotCandles
+
+
+class CandlesHubTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.hub = CandlesHub("binance")
+        self.ws_mock = self.mocking_assistant.configure_web_assistants_factory(
+            self.hub.get_api_factory(CONSTANTS.RATE_LIMITS))
+        for patcher in (patch.object(CandlesHubConnection, "SUBSCRIPTIONS_UPDATE_DELAY", 0.05),
+                        patch.object(BinanceSpotCandles, "fill_historical_candles", AsyncMock())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.hub.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def create_feed(self, trading_pair: str, interval: str = "1m") -> BinanceSpotCandles:
+        feed = BinanceSpotCandles(trading_pair=trading_pair, interval=interval)
+        self.hub.add_feed(feed)
+        return feed
+
+    @staticmethod
+    def kline_message(ex_trading_pair: str, interval: str, timestamp: int, close: str):
+        return {
+            "e": "kline", "E": timestamp + 1, "s": ex_trading_pair,
+            "k": {"t": timestamp * 1000, "T": timestamp * 1000 + 59999, "s": ex_trading_pair, "i": interval,
+                  "o": "100", "c": close, "h": "110", "l": "90", "v": "10", "n": 5, "x": False, "q": "1000",
+                  "V": "5", "Q": "500", "B": "0"}
+        }
+
+    def sent_subscriptions(self, ws_mock):
+        return [(message["method"], message["params"])
+                for message in self.mocking_assistant.json_messages_sent_through_websocket(websocket_mock=ws_mock)]
+
+    def test_feeds_share_one_websocket_and_receive_their_candles(self):
+        btc_feed = self.create_feed("BTC-USDT")
+        eth_feed = self.create_feed("ETH-USDT", "5m")
+        self.async_run_with_timeout(asyncio.gather(btc_feed.start_network(), eth_feed.start_network()))
+
+        for message in (self.kline_message("BTCUSDT", "1m", 1700000040, "101"),
+                        self.kline_message("ETHUSDT", "5m", 1700000100, "102"),
+                        self.kline_message("ETHUSDT", "1m", 1700000040, "103")):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=self.ws_mock, message=json.dumps(message))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(self.ws_mock)
+
+        self.assertEqual(1, self.hub.num_connections)
+        self.assertEqual([("SUBSCRIBE", ["btcusdt@kline_1m", "ethusdt@kline_5m"])],
+                         self.sent_subscriptions(self.ws_mock))
+        self.assertEqual([101.0], [candle[4] for candle in btc_feed._candles])
+        self.assertEqual([102.0], [candle[4] for candle in eth_feed._candles])
+        self.assertIs(btc_feed._api_factory, eth_feed._api_factory)
+        self.assertIs(self.hub.api_factory, btc_feed._api_factory)
+
+    def test_streams_added_and_removed_while_connected_are_updated_in_batches(self):
+        btc_feed = self.create_feed("BTC-USDT")
+        self.async_run_with_timeout(btc_feed.start_network())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        eth_feed = self.create_feed("ETH-USDT")
+        sol_feed = self.create_feed("SOL-USDT")
+        self.async_run_with_timeout(eth_feed.start_network())
+        self.async_run_with_timeout(sol_feed.start_network())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.async_run_with_timeout(btc_feed.stop_network())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual([("SUBSCRIBE", ["btcusdt@kline_1m"]),
+                          ("SUBSCRIBE", ["ethusdt@kline_1m", "solusdt@kline_1m"]),
+                          ("UNSUBSCRIBE", ["btcusdt@kline_1m"])],
+                         self.sent_subscriptions(self.ws_mock))
+        self.assertIsNone(self.hub.get_feed(btc_feed.ws_stream_name))
+
+        self.async_run_with_timeout(eth_feed.stop_network())
+        self.async_run_with_timeout(sol_feed.stop_network())
+        self.assertEqual(0, self.hub.num_connections)
+
+    def test_streams_added_while_sending_the_subscriptions_are_subscribed(self):
+        btc_feed = self.create_feed("BTC-USDT")
+        self.async_run_with_timeout(btc_feed.start_network())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        connection = self.hub._connections[0]
+        send_subscriptions = connection._send_subscriptions
+        sol_feed = self.create_feed("SOL-USDT")
+
+        async def send_and_add_stream(ws):
+            connection._send_subscriptions = send_subscriptions
+            await send_subscriptions(ws)
+            # The stream is added while the update task is sending the subscriptions
+            await sol_feed.start_network()
+
+        connection._send_subscriptions = send_and_add_stream
+        eth_feed = self.create_feed("ETH-USDT")
+        self.async_run_with_timeout(eth_feed.start_network())
+        self.async_run_with_timeout(asyncio.sleep(0.2))
+
+        self.assertEqual([("SUBSCRIBE", ["btcusdt@kline_1m"]),
+                          ("SUBSCRIBE", ["ethusdt@kline_1m"]),
+                          ("SUBSCRIBE", ["solusdt@kline_1m"])],
+                         self.sent_subscriptions(self.ws_mock))
+
+    def test_new_connection_when_the_connections_are_full(self):
+        with patch("hummingbot.data_feed.candles_feed.binance_spot_candles.constants.MAX_STREAMS_PER_CONNECTION", 2):
+            feeds = [self.create_feed(trading_pair) for trading_pair in ("BTC-USDT", "ETH-USDT", "SOL-USDT")]
+            for feed in feeds:
+                self.async_run_with_timeout(feed.start_network())
+
+        self.assertEqual(2, self.hub.num_connections)
+
+    def test_feeds_without_shared_websockets_support_share_the_throttler(self):
+        hub = CandlesHub("okx")
+        feeds = [OKXSpotCandles(trading_pair=trading_pair) for trading_pair in ("BTC-USDT", "ETH-USDT")]
+        for feed in feeds:
+            hub.add_feed(feed)
+
+        self.assertFalse(feeds[0]._uses_shared_websocket)
+        self.assertIs(feeds[0]._api_factory, feeds[1]._api_factory)
+        self.assertIs(feeds[0]._api_factory.throttler, hub.api_factory.throttler)
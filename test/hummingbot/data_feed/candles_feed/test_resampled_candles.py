@@ -0,0 +1,97 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.resampled_candles import ResampledCandles
+
+
+class ResampledCandlesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.base_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=1000)
+        self.start_timestamp = 1700000040  # 1 minute before a 5 minutes candle opens
+
+    def base_candle(self, timestamp: float) -> np.ndarray:
+        index = (timestamp - self.start_timestamp) / 60
+        close = 100 + np.sin(index)
+        return np.array([timestamp, close - 0.5, close + 1 + index % 3, close - 1 - index % 2, close, 1 + index,
+                         100 + index, 10 + index, 0.5 + index, 50 + index], dtype=float)
+
+    def add_base_candles(self, count: int):
+        next_timestamp = self.base_feed._candles[-1][0] + 60 if len(self.base_feed._candles) > 0 \
+            else self.start_timestamp
+        for i in range(count):
+            self.base_feed._candles.append(self.base_candle(next_timestamp + i * 60))
+
+    def expected_candles(self, rule: str) -> pd.DataFrame:
+        base_df = self.base_feed.candles_df
+        base_df.index = pd.to_datetime(base_df["timestamp"], unit="s")
+        df = base_df.resample(rule).agg({
+            "open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum",
+            "quote_asset_volume": "sum", "n_trades": "sum", "taker_buy_base_volume": "sum",
+            "taker_buy_quote_volume": "sum"})
+        df.insert(0, "timestamp", df.index.astype("int64") // 10 ** 9)
+        # The first candle is not complete
+        return df.iloc[1:].reset_index(drop=True).astype(float)
+
+    def test_candles_are_aggregated_from_the_base_candles(self):
+        self.add_base_candles(33)
+        resampled = ResampledCandles(self.base_feed, "5m", max_records=10)
+
+        pd.testing.assert_frame_equal(self.expected_candles("5min"), resampled.candles_df)
+
+    def test_candles_are_aggregated_incrementally(self):
+        resampled = ResampledCandles(self.base_feed, "15m", max_records=100)
+        self.add_base_candles(20)
+        resampled.update()
+
+        # The last base candle is updated while open, and new base candles arrive
+        last_candle = self.base_feed._candles[-1].copy()
+        last_candle[2] += 10
+        last_candle[4] += 5
+        last_candle[5] += 3
+        self.base_feed._candles[-1] = last_candle
+        self.add_base_candles(25)
+
+        pd.testing.assert_frame_equal(self.expected_candles("15min"), resampled.candles_df)
+
+    def test_only_the_last_max_records_candles_are_kept(self):
+        self.add_base_candles(63)
+        resampled = ResampledCandles(self.base_feed, "5m", max_records=4)
+
+        self.assertTrue(resampled.ready)
+        pd.testing.assert_frame_equal(self.expected_candles("5min").iloc[-4:].reset_index(drop=True),
+                                      resampled.candles_df)
+
+    def test_candles_are_reset_with_the_base_candles(self):
+        self.add_base_candles(20)
+        resampled = ResampledCandles(self.base_feed, "5m", max_records=10)
+        resampled.update()
+
+        self.base_feed._candles.clear()
+        self.assertEqual(0, len(resampled.candles_df))
+        self.assertFalse(resampled.ready)
+
+    def test_weekly_candles_open_on_monday(self):
+        base_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1d", max_records=30)
+        # 2023-12-31 (Sunday) to 2024-01-14
+        for day in range(15):
+            base_feed._candles.append(np.array([1703980800 + day * 86400, 1, 2, 0.5, 1, 1, 1, 1, 1, 1], dtype=float))
+        resampled = ResampledCandles(base_feed, "1w", max_records=5)
+
+        self.assertEqual([1704067200, 1704672000], resampled.candles_df["timestamp"].tolist())
+        self.assertEqual([7, 7], resampled.candles_df["volume"].tolist())
+
+    def test_invalid_intervals(self):
+        for interval in ("1m", "30s", "1M"):
+            with self.assertRaises(ValueError):
+                ResampledCandles(self.base_feed, interval)
+        five_minutes_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="5m")
+        with self.assertRaises(ValueError):
+            ResampledCandles(five_minutes_feed, "3m")
+
+    def test_base_max_records(self):
+        self.assertEqual(65, ResampledCandles.base_max_records("1m", "5m", 12))
+        self.assertEqual(8, ResampledCandles.base_max_records("1h", "4h", 1))
@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.data_feed.candles_feed.trades_candles import TradesCandles
+
+
+class TradesCandlesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "BTC-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector = MagicMock()
+        self.connector.name = "binance"
+        self.connector.order_books = {}
+        self.order_book = OrderBook()
+        self.candles = TradesCandles(self.connector, self.trading_pair, interval="5s", max_records=10)
+
+    def tearDown(self) -> None:
+        self.candles.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def trade(self, timestamp: float, price: str, amount: str, trade_type: TradeType = TradeType.BUY,
+              trading_pair: str = None):
+        return OrderBookTradeEvent(trading_pair=trading_pair or self.trading_pair, timestamp=timestamp,
+                                   type=trade_type, price=Decimal(price), amount=Decimal(amount))
+
+    def start_listening(self):
+        with patch.object(TradesCandles, "_sleep", AsyncMock(side_effect=lambda _: self.connector.order_books.update(
+                {self.trading_pair: self.order_book}))):
+            self.candles.start()
+            self.async_run_with_timeout(self.candles._start_task)
+
+    def test_candles_are_built_from_the_order_book_trades(self):
+        self.start_listening()
+        self.order_book.apply_trades([
+            self.trade(1700000000.5, "100", "1"),
+            self.trade(1700000002, "105", "2", TradeType.SELL),
+            self.trade(1700000004.9, "95", "1"),
+            self.trade(1700000006, "101", "3", TradeType.SELL),
+            self.trade(1700000006, "200", "1", trading_pair="ETH-USDT"),
+            # Late trades of closed candles are discarded
+            self.trade(1700000004, "1", "1"),
+        ])
+
+        with patch.object(TradesCandles, "_time", return_value=1700000006):
+            candles = self.candles.candles_df.values
+
+        self.assertTrue(np.array_equal(
+            [[1700000000, 100, 105, 95, 95, 4, 405, 3, 2, 195],
+             [1700000005, 101, 101, 101, 101, 3, 303, 1, 0, 0]],
+            candles))
+
+    def test_intervals_without_trades_have_empty_candles(self):
+        self.start_listening()
+        self.order_book.apply_trade(self.trade(1700000001, "100", "1"))
+        self.order_book.apply_trade(self.trade(1700000012, "110", "1"))
+
+        with patch.object(TradesCandles, "_time", return_value=1700000021):
+            candles = self.candles.candles_df
+
+        self.assertEqual([1700000000, 1700000005, 1700000010, 1700000015, 1700000020],
+                         candles["timestamp"].tolist())
+        self.assertEqual([100, 100, 110, 110, 110], candles["close"].tolist())
+        self.assertEqual([1, 0, 1, 0, 0], candles["volume"].tolist())
+
+    def test_stop_removes_the_order_book_listener(self):
+        self.start_listening()
+        self.assertEqual(1, len(self.order_book.get_listeners(OrderBookEvent.TradeEvent)))
+
+        self.candles.stop()
+
+        self.assertEqual(0, len(self.order_book.get_listeners(OrderBookEvent.TradeEvent)))
+
+    def test_history_is_fetched_before_the_first_live_candle(self):
+        history_feed = MagicMock()
+        history_feed.interval = "1m"
+        history_feed.fetch_candles = AsyncMock(return_value=np.array(
+            [[1699999800 + i * 60] + [1] * 9 for i in range(5)], dtype=float))
+        self.candles = TradesCandles(self.connector, self.trading_pair, interval="1m", max_records=4,
+                                     history_feed=history_feed)
+        self.start_listening()
+
+        self.order_book.apply_trade(self.trade(1700000061, "100", "1"))
+        self.async_run_with_timeout(self.candles._history_task)
+
+        history_feed.fetch_candles.assert_awaited_once_with(end_time=1700000040, limit=3)
+        self.assertEqual([1699999860, 1699999920, 1699999980, 1700000040],
+                         [candle[0] for candle in self.candles._candles])
+        self.assertTrue(self.candles.ready)
+
+    def test_invalid_intervals(self):
+        for interval in ("7s", "1M"):
+            with self.assertRaises(ValueError):
+                TradesCandles(self.connector, self.trading_pair, interval=interval)
+        history_feed = MagicMock()
+        history_feed.interval = "1m"
+        with self.assertRaises(ValueError):
+            TradesCandles(self.connector, self.trading_pair, interval="5m", history_feed=history_feed)
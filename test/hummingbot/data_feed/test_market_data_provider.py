@@ -9,6 +9,8 @@ from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.resampled_candles import ResampledCandles
+from hummingbot.data_feed.candles_feed.trades_candles import TradesCandles
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
 
 
@@ -49,6 +51,80 @@ class TestMarketDataProvider(unittest.TestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    @patch.object(CandlesBase, "stop", MagicMock())
+    def test_candles_feeds_of_an_exchange_share_the_candles_hub(self):
+        btc_feed = self.provider.get_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100))
+        eth_feed = self.provider.get_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="ETH-USDT", interval="1m", max_records=100))
+        okx_feed = self.provider.get_candles_feed(
+            CandlesConfig(connector="okx", trading_pair="BTC-USDT", interval="1m", max_records=100))
+
+        self.assertEqual({"binance", "okx"}, set(self.provider.candles_hubs.keys()))
+        self.assertIs(btc_feed._api_factory, eth_feed._api_factory)
+        self.assertIsNot(btc_feed._api_factory, okx_feed._api_factory)
+
+        # A feed replaced by one with more records is stopped
+        new_btc_feed = self.provider.get_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=200))
+        self.assertIsNot(btc_feed, new_btc_feed)
+        CandlesBase.stop.assert_called_once()
+
+    @patch.object(CandlesBase, "start", MagicMock())
+    @patch.object(CandlesBase, "stop", MagicMock())
+    def test_candles_feed_resampled_from_base_interval(self):
+        five_minutes_feed = self.provider.get_candles_feed(CandlesConfig(
+            connector="binance", trading_pair="BTC-USDT", interval="5m", max_records=10, base_interval="1m"))
+        hour_feed = self.provider.get_candles_feed(CandlesConfig(
+            connector="binance", trading_pair="BTC-USDT", interval="1h", max_records=2, base_interval="5m"))
+
+        base_feed = self.provider.candles_feeds["binance_BTC-USDT_1m"]
+        self.assertIsInstance(five_minutes_feed, ResampledCandles)
+        self.assertIsInstance(hour_feed, ResampledCandles)
+        # Both are resampled from the 1m feed, replaced by one that keeps enough records for the two of them
+        self.assertIs(base_feed, hour_feed.base_feed)
+        self.assertEqual(180, base_feed.max_records)
+        self.assertIs(base_feed, five_minutes_feed.base_feed)
+        self.assertEqual(2, CandlesBase.start.call_count)
+        self.assertEqual(1, CandlesBase.stop.call_count)
+        self.assertIs(hour_feed, self.provider.get_candles_feed(CandlesConfig(
+            connector="binance", trading_pair="BTC-USDT", interval="1h", max_records=2)))
+
+    @patch.object(TradesCandles, "start", MagicMock())
+    def test_candles_feed_built_from_trades(self):
+        self.connectors["binance"] = self.mock_connector
+        minute_feed = self.provider.get_candles_feed(CandlesConfig(
+            connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=10, from_trades=True))
+        seconds_feed = self.provider.get_candles_feed(CandlesConfig(
+            connector="binance", trading_pair="BTC-USDT", interval="5s", max_records=10, from_trades=True))
+        resampled_feed = self.provider.get_candles_feed(CandlesConfig(
+            connector="binance", trading_pair="BTC-USDT", interval="15s", max_records=10, from_trades=True,
+            base_interval="5s"))
+
+        self.assertIsInstance(minute_feed, TradesCandles)
+        # The history is fetched from the exchange only for the intervals it supports
+        self.assertEqual("1m", minute_feed._history_feed.interval)
+        self.assertIsNone(seconds_feed._history_feed)
+        # The 5s feed is replaced by one that keeps enough records to resample the 15s candles
+        self.assertIs(self.provider.candles_feeds["binance_BTC-USDT_5s"], resampled_feed.base_feed)
+        self.assertEqual(33, resampled_feed.base_feed.max_records)
+        self.assertEqual(3, TradesCandles.start.call_count)
+
+        with self.assertRaises(ValueError):
+            self.provider.get_candles_feed(CandlesConfig(
+                connector="unknown", trading_pair="BTC-USDT", interval="1m", from_trades=True))
+
+    @patch.object(TradesCandles, "start", MagicMock())
+    def test_candles_feed_built_from_trades_without_exchange_interval(self):
+        self.connectors["gate_io"] = self.mock_connector
+        # Gate.io has no 1s candles, even though other exchanges do
+        feed = self.provider.get_candles_feed(CandlesConfig(
+            connector="gate_io", trading_pair="BTC-USDT", interval="1s", max_records=10, from_trades=True))
+
+        self.assertIsInstance(feed, TradesCandles)
+        self.assertIsNone(feed._history_feed)
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
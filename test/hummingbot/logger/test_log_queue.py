@@ -0,0 +1,199 @@
+import logging
+import queue
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+from hummingbot.logger import NETWORK
+from hummingbot.logger.log_queue import (
+    LogQueueHandler,
+    LogQueueListener,
+    LogQueueStats,
+    LogRecordThrottle,
+    install_log_queue,
+    log_queue_stats,
+    stop_log_queue,
+)
+from hummingbot.logger.struct_logger import StructLogRecord
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class LogQueueTests(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.stats = LogQueueStats()
+        self.time = 1000.0
+        time_patcher = patch("hummingbot.logger.log_queue.time.monotonic", side_effect=lambda: self.time)
+        time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+    @staticmethod
+    def record(msg: str, level: int = logging.INFO, name: str = "test_logger", args=None, exc_info=None):
+        return logging.LogRecord(name, level, __file__, 1, msg, args, exc_info)
+
+    def test_throttle_rate_limits_each_logger(self):
+        throttle = LogRecordThrottle(self.stats, rate_limit=1, burst=2, dedup_interval=0)
+
+        self.assertTrue(throttle.allow(self.record("1")))
+        self.assertTrue(throttle.allow(self.record("2")))
+        self.assertFalse(throttle.allow(self.record("3")))
+        self.assertTrue(throttle.allow(self.record("1", name="other_logger")))
+        # Errors are never rate limited
+        self.assertTrue(throttle.allow(self.record("4", level=logging.ERROR)))
+
+        self.time += 1
+        self.assertTrue(throttle.allow(self.record("5")))
+        self.assertEqual({"test_logger": 1}, self.stats.rate_limited)
+
+    def test_throttle_does_not_rate_limit_structured_records(self):
+        throttle = LogRecordThrottle(self.stats, rate_limit=1, burst=1, dedup_interval=0)
+        throttle.allow(self.record("1"))
+        record = self.record("")
+        record.dict_msg = {"event": 1}
+
+        self.assertTrue(throttle.allow(record))
+
+    def test_throttle_deduplicates_repeated_network_errors(self):
+        throttle = LogRecordThrottle(self.stats, rate_limit=0, burst=0, dedup_interval=60)
+
+        self.assertTrue(throttle.allow(self.record("Connection error", level=NETWORK)))
+        self.assertFalse(throttle.allow(self.record("Connection error", level=NETWORK)))
+        self.assertFalse(throttle.allow(self.record("Connection error", level=NETWORK)))
+        self.assertTrue(throttle.allow(self.record("Other error", level=NETWORK)))
+        # Info records are not deduplicated
+        self.assertTrue(throttle.allow(self.record("Connection error")))
+        self.assertTrue(throttle.allow(self.record("Connection error")))
+
+        self.time += 61
+        record = self.record("Connection error", level=NETWORK)
+        self.assertTrue(throttle.allow(record))
+        self.assertEqual(2, record.suppressed_count)
+        self.assertEqual(2, self.stats.deduplicated)
+
+    def test_throttle_deduplicates_only_records_with_the_same_arguments_and_exception(self):
+        throttle = LogRecordThrottle(self.stats, rate_limit=0, burst=0, dedup_interval=60)
+
+        self.assertTrue(throttle.allow(self.record("Order %s failed", level=logging.WARNING, args=("OID1",))))
+        self.assertTrue(throttle.allow(self.record("Order %s failed", level=logging.WARNING, args=("OID2",))))
+        self.assertFalse(throttle.allow(self.record("Order %s failed", level=logging.WARNING, args=("OID1",))))
+
+        try:
+            raise ValueError("Test")
+        except ValueError:
+            value_error = sys.exc_info()
+        try:
+            raise KeyError("Test")
+        except KeyError:
+            key_error = sys.exc_info()
+        self.assertTrue(throttle.allow(self.record("Unexpected error", level=logging.ERROR, exc_info=value_error)))
+        self.assertTrue(throttle.allow(self.record("Unexpected error", level=logging.ERROR, exc_info=key_error)))
+        self.assertFalse(throttle.allow(self.record("Unexpected error", level=logging.ERROR, exc_info=value_error)))
+        self.assertEqual(2, self.stats.deduplicated)
+
+    def test_handler_prepares_and_queues_the_records(self):
+        log_queue = queue.Queue(maxsize=1)
+        target = RecordingHandler()
+        throttle = LogRecordThrottle(self.stats, rate_limit=0, burst=0, dedup_interval=0)
+        handler = LogQueueHandler(log_queue, [target], throttle, self.stats)
+        try:
+            raise ValueError("Test error")
+        except ValueError:
+            record = self.record("Value %s", level=logging.ERROR, args=(1,), exc_info=sys.exc_info())
+
+        handler.handle(record)
+        handler.handle(self.record("Dropped"))
+
+        queued_record, handlers = log_queue.get_nowait()
+        self.assertEqual("Value 1", queued_record.getMessage())
+        self.assertIn("ValueError: Test error", queued_record.exc_text)
+        self.assertEqual((target,), handlers)
+        self.assertEqual(1, self.stats.dropped)
+
+    def test_handler_prepares_structured_records(self):
+        log_queue = queue.Queue()
+        throttle = LogRecordThrottle(self.stats, rate_limit=0, burst=0, dedup_interval=0)
+        handler = LogQueueHandler(log_queue, [RecordingHandler()], throttle, self.stats)
+        record = StructLogRecord("test_logger", 15, __file__, 1, "", None, None)
+        record.dict_msg = {"event": "fill", "amount": 1}
+
+        handler.handle(record)
+
+        queued_record, _ = log_queue.get_nowait()
+        self.assertEqual('{"event": "fill", "amount": 1}', queued_record.getMessage())
+
+    def test_listener_writes_with_the_handlers_of_the_record_and_reports_drops(self):
+        log_queue = queue.Queue()
+        info_handler = RecordingHandler()
+        error_handler = RecordingHandler(level=logging.ERROR)
+        listener = LogQueueListener(log_queue, self.stats, report_interval=60)
+
+        listener.handle((self.record("Info"), (info_handler, error_handler)))
+        self.stats.dropped = 3
+        self.time += 61
+        listener.handle((self.record("Error", level=logging.ERROR), (info_handler, error_handler)))
+
+        self.assertEqual(["Info", "Error", "Log records not written: 3 dropped (queue full), 0 rate limited, "
+                                           "0 repeated."],
+                         [record.getMessage() for record in info_handler.records])
+        self.assertEqual(["Error"], [record.getMessage() for record in error_handler.records])
+
+    @patch("hummingbot.logger.log_queue.LogQueueListener.SENTINEL_TIMEOUT", 0.1)
+    def test_listener_stops_with_a_full_queue(self):
+        log_queue = queue.Queue(maxsize=2)
+        release = threading.Event()
+        handling = threading.Event()
+
+        class BlockingHandler(RecordingHandler):
+            def emit(self, record):
+                handling.set()
+                release.wait()
+                super().emit(record)
+
+        target = BlockingHandler()
+        listener = LogQueueListener(log_queue, self.stats, report_interval=60)
+        listener.start()
+        log_queue.put_nowait((self.record("1"), (target,)))
+        handling.wait(1)
+        log_queue.put_nowait((self.record("2"), (target,)))
+        log_queue.put_nowait((self.record("3"), (target,)))
+        # Released after the sentinel timed out, while stop waits for the thread
+        threading.Timer(0.3, release.set).start()
+
+        listener.stop()
+
+        self.assertIsNone(listener._thread)
+        self.assertEqual(1, self.stats.dropped)
+        self.assertEqual(["1", "3"], [record.getMessage() for record in target.records])
+
+    def test_install_log_queue_moves_the_handlers_to_the_listener(self):
+        logger = logging.getLogger("test_log_queue_logger")
+        logger.propagate = False
+        target = RecordingHandler()
+        logger.addHandler(target)
+        root_handlers = list(logging.getLogger().handlers)
+        self.addCleanup(logger.handlers.clear)
+
+        def restore_root_handlers():
+            for handler in list(logging.getLogger().handlers):
+                logging.getLogger().removeHandler(handler)
+            for handler in root_handlers:
+                logging.getLogger().addHandler(handler)
+        self.addCleanup(restore_root_handlers)
+
+        install_log_queue(["test_log_queue_logger"], rate_limit=0, dedup_interval=0)
+        self.assertIsInstance(logger.handlers[0], LogQueueHandler)
+        self.assertIsNotNone(log_queue_stats())
+        logger.warning("Queued warning")
+        stop_log_queue()
+
+        self.assertEqual(["Queued warning"], [record.getMessage() for record in target.records])
+        self.assertIsNone(log_queue_stats())
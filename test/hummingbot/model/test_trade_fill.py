@@ -1,5 +1,14 @@
+import json
+from decimal import Decimal
 from unittest import TestCase
+from unittest.mock import patch
 
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
 
@@ -37,3 +46,59 @@ class TradeFillTests(TestCase):
             "position", ]
 
         self.assertEqual(expected_attributes, TradeFill.attribute_names_for_file_export())
+
+    def add_trade_fills(self, manager: SQLConnectionManager, timestamps):
+        with manager.get_new_session() as session:
+            with session.begin():
+                for i, timestamp in enumerate(timestamps):
+                    session.add(TradeFill(
+                        config_file_path=self.config_file_path,
+                        strategy=self.strategy_name,
+                        market=self.display_name,
+                        symbol=self.trading_pair,
+                        base_asset=self.base,
+                        quote_asset=self.quote,
+                        timestamp=timestamp,
+                        order_id=f"OID{i}",
+                        trade_type="BUY",
+                        order_type="LIMIT",
+                        price=Decimal("10"),
+                        amount=Decimal("1"),
+                        trade_fee=AddedToCostTradeFee().to_json(),
+                        exchange_trade_id=f"EOID{i}"))
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_iter_config_fills(self, engine_mock):
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.add_trade_fills(manager, [3000, 1000, 2000])
+
+        with manager.get_new_session() as session:
+            fills = list(TradeFill.iter_config_fills(session, self.config_file_path, start_time=2000, page_size=1))
+            other_config_fills = list(TradeFill.iter_config_fills(session, "other_config", start_time=0))
+
+        self.assertEqual([2000, 3000], [fill.timestamp for fill in fills])
+        self.assertEqual(Decimal("10"), fills[0].price)
+        self.assertEqual(AddedToCostTradeFee().to_json(), fills[0].trade_fee)
+        self.assertEqual([], other_config_fills)
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_get_config_fills_page(self, engine_mock):
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.add_trade_fills(manager, [1000, 2000, 2000, 3000, 4000])
+
+        with manager.get_new_session() as session:
+            first_page, cursor = TradeFill.get_config_fills_page(session, self.config_file_path, 0, limit=2)
+            second_page, cursor = TradeFill.get_config_fills_page(session, self.config_file_path, 0, 2, cursor)
+            last_page, last_cursor = TradeFill.get_config_fills_page(session, self.config_file_path, 0, 2, cursor)
+
+        self.assertEqual(["OID0", "OID1"], [fill.order_id for fill in first_page])
+        self.assertEqual(["OID2", "OID3"], [fill.order_id for fill in second_page])
+        self.assertEqual([3000, self.display_name, "OID3", "EOID3"], json.loads(cursor))
+        self.assertEqual(["OID4"], [fill.order_id for fill in last_page])
+        self.assertIsNone(last_cursor)
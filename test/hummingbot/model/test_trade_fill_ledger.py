@@ -0,0 +1,203 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
+
+
+class TradeFillLedgerTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.config_file_path = "test_config.yml"
+        self.market = "binance"
+        self.trading_pair = "COINALPHA-HBOT"
+
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+
+        rate_oracle = RateOracle()
+        rate_oracle._prices[self.trading_pair] = Decimal("11")
+        rate_oracle._prices["USDT-HBOT"] = Decimal("0.5")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def trade_fill(self,
+                   index: int,
+                   timestamp: int,
+                   trade_type: str,
+                   price: str,
+                   amount: str,
+                   trade_fee=None,
+                   market: str = None,
+                   position: str = PositionAction.NIL.value) -> TradeFill:
+        trade_fee = trade_fee or AddedToCostTradeFee(percent=Decimal("0.001"))
+        return TradeFill(
+            config_file_path=self.config_file_path,
+            strategy="pure_market_making",
+            market=market or self.market,
+            symbol=self.trading_pair,
+            base_asset="COINALPHA",
+            quote_asset="HBOT",
+            timestamp=timestamp,
+            order_id=f"OID{index}",
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"EOID{index}",
+            position=position,
+        )
+
+    def sample_fills(self) -> List[TradeFill]:
+        return [
+            self.trade_fill(1, 1000, "BUY", "10.123456", "1.5"),
+            self.trade_fill(2, 2000, "SELL", "10.5", "0.7",
+                            trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.002"))),
+            self.trade_fill(3, 2000, "BUY", "9.8", "2",
+                            trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount("USDT", Decimal("0.3"))])),
+            self.trade_fill(4, 3000, "SELL", "10.9", "2.1"),
+        ]
+
+    def add_fills(self, fills: List[TradeFill]):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add_all(fills)
+
+    def catch_up(self, start_timestamp: int, persist: bool = True) -> List[TradeFillLedger]:
+        with self.manager.get_new_session() as session:
+            session.expire_on_commit = False
+            with session.begin():
+                return TradeFillLedger.catch_up(session, self.config_file_path, start_timestamp, persist)
+
+    def metrics_from_fills(self) -> PerformanceMetrics:
+        with self.manager.get_new_session() as session:
+            fills = TradeFill.get_trades(session, config_file_path=self.config_file_path)
+            return self.async_run_with_timeout(
+                PerformanceMetrics.create(self.trading_pair, fills, {"COINALPHA": Decimal("10"), "HBOT": Decimal("100")}))
+
+    def metrics_from_ledger(self, ledger: TradeFillLedger) -> PerformanceMetrics:
+        return self.async_run_with_timeout(PerformanceMetrics.create_from_ledger(
+            self.trading_pair, ledger, {"COINALPHA": Decimal("10"), "HBOT": Decimal("100")}))
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, actual: PerformanceMetrics):
+        self.assertEqual(expected.num_buys, actual.num_buys)
+        self.assertEqual(expected.num_sells, actual.num_sells)
+        self.assertEqual(expected.b_vol_base, actual.b_vol_base)
+        self.assertEqual(expected.b_vol_quote, actual.b_vol_quote)
+        self.assertEqual(expected.s_vol_base, actual.s_vol_base)
+        self.assertEqual(expected.s_vol_quote, actual.s_vol_quote)
+        self.assertEqual(expected.avg_tot_price, actual.avg_tot_price)
+        self.assertEqual(expected.start_price, actual.start_price)
+        self.assertEqual(dict(expected.fees), dict(actual.fees))
+        self.assertEqual(expected.fee_in_quote, actual.fee_in_quote)
+        self.assertEqual(expected.trade_pnl, actual.trade_pnl)
+        self.assertEqual(expected.return_pct, actual.return_pct)
+
+    def test_catch_up_gives_the_same_metrics_as_the_fills(self):
+        self.add_fills(self.sample_fills())
+
+        ledgers = self.catch_up(start_timestamp=0)
+
+        self.assertEqual(1, len(ledgers))
+        self.assertEqual(4, ledgers[0].num_trades)
+        self.assertEqual(3000, ledgers[0].last_timestamp)
+        self.assertEqual([["OID4", "EOID4"]], ledgers[0].last_fill_ids)
+        self.assertFalse(ledgers[0].are_derivatives)
+        self.assert_same_metrics(self.metrics_from_fills(), self.metrics_from_ledger(ledgers[0]))
+
+    def test_catch_up_only_folds_new_fills(self):
+        fills = self.sample_fills()
+        self.add_fills(fills[:2])
+        self.catch_up(start_timestamp=0)
+        self.add_fills(fills[2:])
+
+        with patch.object(TradeFill, "iter_config_fills", wraps=TradeFill.iter_config_fills) as iter_mock:
+            ledgers = self.catch_up(start_timestamp=0)
+            self.assertEqual(2000, iter_mock.call_args[0][2])
+        self.assertEqual(4, ledgers[0].num_trades)
+        self.assert_same_metrics(self.metrics_from_fills(), self.metrics_from_ledger(ledgers[0]))
+
+        ledgers = self.catch_up(start_timestamp=0)
+        self.assertEqual(4, ledgers[0].num_trades)
+
+    def test_record_fill_updates_the_existing_ledgers(self):
+        fills = self.sample_fills()
+        self.add_fills(fills[:1])
+        self.catch_up(start_timestamp=0)
+
+        for fill in fills[1:] + [self.trade_fill(5, 3000, "BUY", "1", "1", market="kucoin")]:
+            with self.manager.get_new_session() as session:
+                with session.begin():
+                    session.add(fill)
+                    TradeFillLedger.record_fill(session, fill)
+
+        ledgers = {ledger.market: ledger for ledger in self.catch_up(start_timestamp=0)}
+        self.assertEqual(4, ledgers[self.market].num_trades)
+        self.assertEqual(1, ledgers["kucoin"].num_trades)
+        with self.manager.get_new_session() as session:
+            fills = TradeFill.get_trades(session, market=self.market, config_file_path=self.config_file_path)
+            expected = self.async_run_with_timeout(PerformanceMetrics.create(
+                self.trading_pair, fills, {"COINALPHA": Decimal("10"), "HBOT": Decimal("100")}))
+        self.assert_same_metrics(expected, self.metrics_from_ledger(ledgers[self.market]))
+
+    def test_record_fill_without_ledgers_does_not_create_them(self):
+        fill = self.sample_fills()[0]
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(fill)
+                TradeFillLedger.record_fill(session, fill)
+            self.assertEqual(0, session.query(TradeFillLedger).count())
+
+    def test_catch_up_for_a_new_start_deletes_the_previous_ledgers(self):
+        self.add_fills(self.sample_fills())
+        self.catch_up(start_timestamp=0)
+
+        ledgers = self.catch_up(start_timestamp=2000)
+
+        self.assertEqual(3, ledgers[0].num_trades)
+        with self.manager.get_new_session() as session:
+            self.assertEqual([2000], [ledger.start_timestamp for ledger in session.query(TradeFillLedger)])
+
+    def test_catch_up_without_persisting(self):
+        self.add_fills(self.sample_fills())
+
+        ledgers = self.catch_up(start_timestamp=2000, persist=False)
+
+        self.assertEqual(3, ledgers[0].num_trades)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(TradeFillLedger).count())
+
+    def test_ledger_of_derivatives(self):
+        self.add_fills([
+            self.trade_fill(1, 1000, "BUY", "10", "1", position=PositionAction.OPEN.value),
+            self.trade_fill(2, 2000, "SELL", "11", "1", position=PositionAction.CLOSE.value),
+        ])
+
+        ledgers = self.catch_up(start_timestamp=0)
+
+        self.assertTrue(ledgers[0].are_derivatives)
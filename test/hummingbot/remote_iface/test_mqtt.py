@@ -15,6 +15,7 @@ from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderExpiredEvent, SellOrderCreatedEvent
 from hummingbot.core.mock_api.mock_mqtt_server import FakeMQTTBroker
+from hummingbot.core.utils.latency_tracer import LatencyTracer
 from hummingbot.model.order import Order
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder
@@ -36,9 +37,11 @@ class RemoteIfaceMQTTTests(TestCase):
             'start',
             'stop',
             'config',
+            'controller_config',
             'import',
             'status',
             'history',
+            'latency',
             'balance/limit',
             'balance/paper',
             'command_shortcuts',
@@ -46,9 +49,11 @@ class RemoteIfaceMQTTTests(TestCase):
         cls.START_URI = 'hbot/$instance_id/start'
         cls.STOP_URI = 'hbot/$instance_id/stop'
         cls.CONFIG_URI = 'hbot/$instance_id/config'
+        cls.CONTROLLER_CONFIG_URI = 'hbot/$instance_id/controller_config'
         cls.IMPORT_URI = 'hbot/$instance_id/import'
         cls.STATUS_URI = 'hbot/$instance_id/status'
         cls.HISTORY_URI = 'hbot/$instance_id/history'
+        cls.LATENCY_URI = 'hbot/$instance_id/latency'
         cls.BALANCE_LIMIT_URI = 'hbot/$instance_id/balance/limit'
         cls.BALANCE_PAPER_URI = 'hbot/$instance_id/balance/paper'
         cls.COMMAND_SHORTCUT_URI = 'hbot/$instance_id/command_shortcuts'
@@ -555,7 +560,7 @@ class RemoteIfaceMQTTTests(TestCase):
             {"async_backend": 0}
         )
         history_topic = f"test_reply/hbot/{self.instance_id}/history"
-        history_msg = {'status': 200, 'msg': '', 'trades': fake_trades}
+        history_msg = {'status': 200, 'msg': '', 'trades': fake_trades, 'next_cursor': None}
         self.async_run_with_timeout(self.wait_for_rcv(history_topic, history_msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(history_topic, history_msg, msg_key='data'))
 
@@ -568,10 +573,29 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(notify_topic, notify_msg), timeout=10)
         self.assertTrue(self.is_msg_received(notify_topic, notify_msg))
         history_topic = f"test_reply/hbot/{self.instance_id}/history"
-        history_msg = {'status': 200, 'msg': '', 'trades': []}
+        history_msg = {'status': 200, 'msg': '', 'trades': [], 'next_cursor': None}
         self.async_run_with_timeout(self.wait_for_rcv(history_topic, history_msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(history_topic, history_msg, msg_key='data'))
 
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_history_trades_page")
+    def test_mqtt_command_history_page(
+        self,
+        get_history_trades_page_mock: MagicMock
+    ):
+        fake_trades = self.build_fake_trades()
+        get_history_trades_page_mock.return_value = (fake_trades, "next-cursor")
+        self.start_mqtt()
+
+        self.fake_mqtt_broker.publish_to_subscription(
+            self.get_topic_for(self.HISTORY_URI),
+            {"async_backend": 0, "limit": 10, "cursor": "cursor"}
+        )
+        history_topic = f"test_reply/hbot/{self.instance_id}/history"
+        history_msg = {'status': 200, 'msg': '', 'trades': fake_trades, 'next_cursor': "next-cursor"}
+        self.async_run_with_timeout(self.wait_for_rcv(history_topic, history_msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(history_topic, history_msg, msg_key='data'))
+        get_history_trades_page_mock.assert_called_once_with(limit=10, cursor="cursor", days=0)
+
     @patch("hummingbot.client.command.history_command.HistoryCommand.history")
     def test_mqtt_command_history_failure(
         self,
@@ -585,7 +609,31 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.resume_test_event.wait())
 
         topic = f"test_reply/hbot/{self.instance_id}/history"
-        msg = {'status': 400, 'msg': self.fake_err_msg, 'trades': []}
+        msg = {'status': 400, 'msg': self.fake_err_msg, 'trades': [], 'next_cursor': None}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+
+    def test_mqtt_command_latency(self):
+        self.start_mqtt()
+        tracer = LatencyTracer.get_instance()
+        self.addCleanup(tracer.disable)
+        self.addCleanup(tracer.reset)
+
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.LATENCY_URI), {"option": "enable"})
+
+        topic = f"test_reply/hbot/{self.instance_id}/latency"
+        msg = {'status': 200, 'msg': '', 'data': []}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+        self.assertTrue(tracer.enabled)
+
+    def test_mqtt_command_latency_invalid_option(self):
+        self.start_mqtt()
+
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.LATENCY_URI), {"option": "invalid"})
+
+        topic = f"test_reply/hbot/{self.instance_id}/latency"
+        msg = {'status': 400, 'msg': 'Invalid latency option invalid', 'data': []}
         self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
 
@@ -809,6 +857,35 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
 
+    def test_mqtt_command_controller_config_without_v2_strategy(self):
+        self.start_mqtt()
+        self.fake_mqtt_broker.publish_to_subscription(
+            self.get_topic_for(self.CONTROLLER_CONFIG_URI),
+            {'configs': [{'id': 'controller_1'}]}
+        )
+        topic = f"test_reply/hbot/{self.instance_id}/controller_config"
+        msg = {'updated': [], 'status': 400, 'msg': 'No V2 strategy is currently running!'}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+
+    def test_mqtt_command_controller_config_pushes_configs(self):
+        strategy = MagicMock()
+        strategy.config.parse_controller_config.side_effect = lambda config_data: MagicMock(id=config_data["id"])
+        self.hbapp.strategy = strategy
+        self.start_mqtt()
+        self.fake_mqtt_broker.publish_to_subscription(
+            self.get_topic_for(self.CONTROLLER_CONFIG_URI),
+            {'configs': [{'id': 'controller_1'}, {'id': 'controller_2'}]}
+        )
+        topic = f"test_reply/hbot/{self.instance_id}/controller_config"
+        msg = {'updated': ['controller_1', 'controller_2'], 'status': 200, 'msg': ''}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        applied_configs = strategy.apply_controllers_configs.call_args[0][0]
+        self.assertEqual(['controller_1', 'controller_2'], [config.id for config in applied_configs])
+        self.hbapp.strategy = None
+
     @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
     def test_mqtt_command_status_async(
         self,
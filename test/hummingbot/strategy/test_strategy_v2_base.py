@@ -165,6 +165,32 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         # Since no actions are returned, execute_action should not be called
         mock_execute_action.assert_not_called()
 
+    async def test_update_controllers_configs_reloads_in_background(self):
+        self.strategy.controllers_config_watcher = MagicMock()
+        self.strategy.controllers_config_watcher.load_changed_configs.return_value = []
+        self.strategy._last_config_update_ts = 0
+        self.strategy.config.config_update_interval = 60
+
+        with patch.object(self.strategy, "apply_controllers_configs") as apply_mock:
+            with patch.object(StrategyV2Base, "current_timestamp", new_callable=PropertyMock, return_value=100):
+                self.strategy.update_controllers_configs()
+                # A new check is not scheduled before the interval
+                self.strategy.update_controllers_configs()
+            await self.strategy._reload_controllers_configs_task
+
+        self.strategy.controllers_config_watcher.load_changed_configs.assert_called_once()
+        apply_mock.assert_called_once_with([])
+
+    def test_apply_controllers_configs(self):
+        existing_config = MagicMock(id="controller_1")
+        new_config = MagicMock(id="controller_3")
+
+        with patch.object(self.strategy, "add_controller") as add_controller_mock:
+            self.strategy.apply_controllers_configs([existing_config, new_config])
+
+        self.strategy.controllers["controller_1"].update_config.assert_called_once_with(existing_config)
+        add_controller_mock.assert_called_once_with(new_config)
+
     async def test_on_stop(self):
         await self.strategy.on_stop()
 
@@ -1,6 +1,7 @@
 import math
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -259,3 +260,50 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_evicted_samples_are_removed_from_the_estimate(self):
+        def curve_fn(t_, a_, b_):
+            return a_ * np.exp(-b_ * t_)
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        timestamp = self.start_timestamp
+        # The price delegate mid price is 100
+        for a, b in ((5, 0.5), (2, 0.1)):
+            trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 100}]
+            for price_level in [1, 2, 3, 4]:
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp + 1,
+                    price=100 + price_level,
+                    amount=curve_fn(price_level, a, b),
+                    type=TradeType.BUY,
+                ))
+            trading_intensity_indicator.calculate(timestamp + 1)
+            timestamp += 2
+
+        alpha, kappa = trading_intensity_indicator.current_value
+
+        # Only the last sample is used
+        self.assertTrue(trading_intensity_indicator.is_sampling_buffer_full)
+        self.assertAlmostEqual(2, alpha, 8)
+        self.assertAlmostEqual(0.1, kappa, 8)
+
+    def test_intensity_is_not_estimated_again_without_new_samples(self):
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        trading_intensity_indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 100}]
+        for price_level, amount in ((1, 2), (2, 1)):
+            trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=self.start_timestamp + 1,
+                price=100 - price_level,
+                amount=amount,
+                type=TradeType.SELL,
+            ))
+
+        with patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.curve_fit",
+                   return_value=([2, 0.5], None)) as curve_fit_mock:
+            for i in range(1, 4):
+                trading_intensity_indicator.calculate(self.start_timestamp + i)
+
+        curve_fit_mock.assert_called_once()
+        self.assertEqual((2, 0.5), trading_intensity_indicator.current_value)
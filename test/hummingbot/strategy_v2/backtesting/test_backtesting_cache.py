@@ -0,0 +1,123 @@
+import asyncio
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.strategy_v2.backtesting.backtesting_cache import BacktestingCache
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.controllers_backtesting.directional_trading_backtesting import (
+    DirectionalTradingBacktesting,
+)
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+
+
+class SMAControllerConfig(DirectionalTradingControllerConfigBase):
+    controller_name = "sma"
+    sma_length: int = 3
+
+
+class SMAController(DirectionalTradingControllerBase):
+    processed_data_updates = 0
+
+    async def update_processed_data(self):
+        SMAController.processed_data_updates += 1
+        df = self.market_data_provider.get_candles_df(self.config.connector_name, self.config.trading_pair, "1m")
+        sma = df["close"].rolling(self.config.sma_length).mean()
+        df["signal"] = np.where(df["close"] > sma, 1, np.where(df["close"] < sma, -1, 0))
+        self.processed_data["features"] = df
+
+
+class BacktestingCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        SMAController.processed_data_updates = 0
+        timestamps = np.arange(0, 60 * 100, 60, dtype=float)
+        close = 100 + 5 * np.sin(timestamps / 600)
+        self.candles = pd.DataFrame({"timestamp": timestamps, "open": close, "high": close + 0.5, "low": close - 0.5,
+                                     "close": close, "volume": 1.0})
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def get_engine(self, cache: BacktestingCache) -> DirectionalTradingBacktesting:
+        with patch.object(AllConnectorSettings, "get_connector_settings", return_value={}):
+            provider = BacktestingDataProvider(connectors={})
+        provider.trading_rules = {"binance_perpetual": {"BTC-USDT": MagicMock()}}
+        provider.candles_feeds = {"binance_perpetual_BTC-USDT_1m": self.candles}
+        return DirectionalTradingBacktesting(backtesting_data_provider=provider, backtesting_cache=cache)
+
+    def run_backtesting(self, cache: BacktestingCache, **config_fields):
+        config = SMAControllerConfig(connector_name="binance_perpetual", trading_pair="BTC-USDT", candles_config=[],
+                                     total_amount_quote=Decimal("1000"), **config_fields)
+        return self.async_run_with_timeout(self.get_engine(cache).run_backtesting(config, start=0, end=60 * 99))
+
+    def test_feature_and_execution_fields(self):
+        self.assertIn("take_profit", BacktestingCache.EXECUTION_FIELDS)
+        self.assertIn("buy_spreads", BacktestingCache.EXECUTION_FIELDS)
+        self.assertIn("id", BacktestingCache.EXECUTION_FIELDS)
+        self.assertNotIn("trading_pair", BacktestingCache.EXECUTION_FIELDS)
+        self.assertNotIn("candles_config", BacktestingCache.EXECUTION_FIELDS)
+
+        config = SMAControllerConfig(trading_pair="BTC-USDT", candles_config=[])
+        key = BacktestingCache.features_key(config, 0, 100, "BacktestingDataProvider")
+        self.assertEqual(key, BacktestingCache.features_key(
+            SMAControllerConfig(trading_pair="BTC-USDT", candles_config=[], take_profit=Decimal("0.5"), id="other"),
+            0, 100, "BacktestingDataProvider"))
+        self.assertNotEqual(key, BacktestingCache.features_key(
+            SMAControllerConfig(trading_pair="BTC-USDT", candles_config=[], sma_length=5),
+            0, 100, "BacktestingDataProvider"))
+        self.assertNotEqual(key, BacktestingCache.features_key(config, 0, 200, "BacktestingDataProvider"))
+        self.assertNotEqual(
+            BacktestingCache.results_key(key, config, "DirectionalTradingBacktesting", "1m", 0.0006),
+            BacktestingCache.results_key(key, config, "DirectionalTradingBacktesting", "1m", 0.001))
+
+    def test_execution_changes_reuse_the_processed_data(self):
+        cache = BacktestingCache(self.temp_dir.name)
+        uncached = self.run_backtesting(None, take_profit=Decimal("0.01"))
+        first_run = self.run_backtesting(cache, take_profit=Decimal("0.01"))
+        self.assertEqual(2, SMAController.processed_data_updates)
+        self.assertGreater(len(first_run["executors"]), 0)
+        self.assertEqual(uncached["results"], first_run["results"])
+
+        other_barriers = self.run_backtesting(cache, take_profit=Decimal("0.03"), stop_loss=Decimal("0.01"))
+        self.assertEqual(2, SMAController.processed_data_updates)
+        self.assertNotEqual(first_run["results"], other_barriers["results"])
+
+        other_features = self.run_backtesting(cache, take_profit=Decimal("0.01"), sma_length=10)
+        self.assertEqual(3, SMAController.processed_data_updates)
+        self.assertNotEqual(first_run["results"], other_features["results"])
+
+    def test_results_are_reused_from_the_cache_directory(self):
+        first_run = self.run_backtesting(BacktestingCache(self.temp_dir.name))
+
+        cache = BacktestingCache(self.temp_dir.name)
+        with patch.object(DirectionalTradingBacktesting, "simulate_execution") as simulate_execution_mock:
+            second_run = self.run_backtesting(cache)
+
+        simulate_execution_mock.assert_not_called()
+        self.assertEqual(1, SMAController.processed_data_updates)
+        self.assertEqual(first_run["results"], second_run["results"])
+        self.assertEqual([executor.id for executor in first_run["executors"]],
+                         [executor.id for executor in second_run["executors"]])
+        pd.testing.assert_frame_equal(first_run["processed_data"]["features"],
+                                      second_run["processed_data"]["features"])
+
+        cache.clear()
+        self.assertIsNone(cache.get_results(BacktestingCache.results_key(
+            "features", SMAControllerConfig(candles_config=[]), "DirectionalTradingBacktesting", "1m", 0.0006)))
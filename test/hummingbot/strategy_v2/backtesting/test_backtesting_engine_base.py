@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.controllers_backtesting.directional_trading_backtesting import (
+    DirectionalTradingBacktesting,
+)
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+
+
+class SMAControllerConfig(DirectionalTradingControllerConfigBase):
+    controller_name = "sma"
+    sma_length: int = 3
+
+
+class SMAController(DirectionalTradingControllerBase):
+    async def update_processed_data(self):
+        df = self.market_data_provider.get_candles_df(self.config.connector_name, self.config.trading_pair, "1m")
+        sma = df["close"].rolling(self.config.sma_length).mean()
+        df["signal"] = np.where(df["close"] > sma, 1, np.where(df["close"] < sma, -1, 0))
+        self.processed_data["features"] = df
+
+
+class BacktestingEngineBaseTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        random = np.random.default_rng(7)
+        timestamps = np.arange(0, 60 * 300, 60, dtype=float)
+        close = 100 * np.exp(np.cumsum(random.normal(0, 0.003, len(timestamps))))
+        self.candles = pd.DataFrame({"timestamp": timestamps, "open": np.r_[close[0], close[:-1]],
+                                     "high": close * 1.001, "low": close * 0.999, "close": close, "volume": 1.0})
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 10):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def run_backtesting(self, batch_simulation: bool):
+        with patch.object(AllConnectorSettings, "get_connector_settings", return_value={}):
+            provider = BacktestingDataProvider(connectors={})
+        provider.trading_rules = {"binance_perpetual": {"BTC-USDT": MagicMock()}}
+        provider.candles_feeds = {"binance_perpetual_BTC-USDT_1m": self.candles}
+        engine = DirectionalTradingBacktesting(backtesting_data_provider=provider)
+        config = SMAControllerConfig(connector_name="binance_perpetual", trading_pair="BTC-USDT", candles_config=[],
+                                     total_amount_quote=Decimal("1000"), take_profit=Decimal("0.005"),
+                                     stop_loss=Decimal("0.005"), time_limit=1800, cooldown_time=60)
+        return self.async_run_with_timeout(engine.run_backtesting(config, start=0, end=60 * 299,
+                                                                  batch_simulation=batch_simulation))
+
+    def test_batch_simulation_matches_the_executor_simulators(self):
+        expected = self.run_backtesting(batch_simulation=False)
+        batch = self.run_backtesting(batch_simulation=True)
+
+        self.assertGreater(len(expected["executors"]), 1)
+        self.assertEqual(len(expected["executors"]), len(batch["executors"]))
+        for expected_info, info in zip(expected["executors"], batch["executors"]):
+            self.assertEqual(expected_info.timestamp, info.timestamp)
+            self.assertEqual(expected_info.close_type, info.close_type)
+            self.assertEqual(expected_info.close_timestamp, info.close_timestamp)
+            self.assertAlmostEqual(float(expected_info.net_pnl_quote), float(info.net_pnl_quote), 6)
+        self.assertEqual(expected["results"]["close_types"], batch["results"]["close_types"])
@@ -0,0 +1,179 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.executor_batch_simulator_base import PriceArrays
+from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_batch_simulator import (
+    DCAExecutorBatchSimulator,
+)
+from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_batch_simulator import (
+    PositionExecutorBatchSimulator,
+)
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+
+
+class ExecutorBatchSimulatorsTest(unittest.TestCase):
+    TRADE_COST = 0.0006
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.random = np.random.default_rng(42)
+        close = 100 * np.exp(np.cumsum(self.random.normal(0, 0.004, 600)))
+        self.df = pd.DataFrame({
+            "timestamp": 1700000000 + 60 * np.arange(len(close), dtype=float),
+            "open": np.r_[close[0], close[:-1]],
+            "high": close * (1 + self.random.uniform(0, 0.003, len(close))),
+            "low": close * (1 - self.random.uniform(0, 0.003, len(close))),
+            "close": close,
+        })
+
+    def assert_same_simulation(self, expected_simulation, batch_simulation, executor_index: int):
+        expected_df = expected_simulation.executor_simulation
+        self.assertEqual(expected_simulation.close_type, batch_simulation.close_type(executor_index))
+        self.assertEqual(expected_df["timestamp"].iloc[-1],
+                         batch_simulation.prices.timestamps[batch_simulation.close_indices[executor_index]])
+        # The state is checked while the executor is active and once closed
+        for timestamp in (expected_df["timestamp"].iloc[len(expected_df) // 2], self.df["timestamp"].iloc[-1]):
+            expected_info = expected_simulation.get_executor_info_at_timestamp(timestamp)
+            info = batch_simulation.get_executor_info_at_timestamp(executor_index, timestamp)
+            self.assertEqual(expected_info.is_active, info.is_active)
+            self.assertEqual(expected_info.close_type, info.close_type)
+            for field in ("net_pnl_quote", "net_pnl_pct", "filled_amount_quote", "cum_fees_quote"):
+                self.assertAlmostEqual(float(getattr(expected_info, field)), float(getattr(info, field)), 6)
+
+    def test_position_executors_match_the_position_executor_simulator(self):
+        configs = []
+        for i in range(60):
+            start = int(self.random.integers(0, 500))
+            configs.append(PositionExecutorConfig(
+                id=f"position_{i}",
+                timestamp=self.df["timestamp"].iloc[start],
+                trading_pair="BTC-USDT",
+                connector_name="binance",
+                side=TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+                entry_price=Decimal(str(self.df["close"].iloc[start])),
+                amount=Decimal("1"),
+                triple_barrier_config=TripleBarrierConfig(
+                    take_profit=Decimal(str(self.random.choice([0.005, 0.01, 0.03]))),
+                    stop_loss=Decimal(str(self.random.choice([0.005, 0.01, 0.03]))),
+                    time_limit=int(self.random.choice([600, 3600, 36000])),
+                    trailing_stop=TrailingStop(activation_price=Decimal("0.004"), trailing_delta=Decimal("0.002"))
+                    if i % 3 == 0 else None,
+                    open_order_type=OrderType.MARKET,
+                ),
+            ))
+
+        batch_simulation = PositionExecutorBatchSimulator().simulate(self.df, configs, self.TRADE_COST)
+
+        simulator = PositionExecutorSimulator()
+        for i, config in enumerate(configs):
+            start = self.df.index[self.df["timestamp"] == config.timestamp][0]
+            expected = simulator.simulate(self.df.loc[start:], config, self.TRADE_COST)
+            self.assert_same_simulation(expected, batch_simulation, i)
+
+    def test_position_executors_with_limit_entries_match_the_position_executor_simulator(self):
+        configs = []
+        # Entries close to the price are filled within the time limit, the far ones are never filled
+        entry_offsets = [0.001, 0.005, 0.05]
+        for i in range(60):
+            start = int(self.random.integers(0, 500))
+            side = TradeType.BUY if i % 2 == 0 else TradeType.SELL
+            side_multiplier = 1 if side == TradeType.BUY else -1
+            configs.append(PositionExecutorConfig(
+                id=f"position_{i}",
+                timestamp=self.df["timestamp"].iloc[start],
+                trading_pair="BTC-USDT",
+                connector_name="binance",
+                side=side,
+                entry_price=Decimal(str(self.df["close"].iloc[start] * (1 - side_multiplier * entry_offsets[i % 3]))),
+                amount=Decimal("1"),
+                triple_barrier_config=TripleBarrierConfig(
+                    take_profit=Decimal(str(self.random.choice([0.005, 0.01, 0.03]))),
+                    stop_loss=Decimal(str(self.random.choice([0.005, 0.01, 0.03]))),
+                    time_limit=None if i % 3 == 2 else 36000,
+                    trailing_stop=TrailingStop(activation_price=Decimal("0.004"), trailing_delta=Decimal("0.002"))
+                    if i % 4 == 0 else None,
+                    open_order_type=OrderType.LIMIT,
+                ),
+            ))
+
+        batch_simulation = PositionExecutorBatchSimulator().simulate(self.df, configs, self.TRADE_COST)
+
+        filled = batch_simulation.entry_indices[:, 0] < len(batch_simulation.prices)
+        self.assertTrue(filled.any())
+        self.assertFalse(filled.all())
+        simulator = PositionExecutorSimulator()
+        for i, config in enumerate(configs):
+            start = self.df.index[self.df["timestamp"] == config.timestamp][0]
+            expected = simulator.simulate(self.df.loc[start:], config, self.TRADE_COST)
+            self.assert_same_simulation(expected, batch_simulation, i)
+
+    def test_dca_executors_match_the_dca_executor_simulator(self):
+        configs = []
+        for i in range(60):
+            start = int(self.random.integers(0, 500))
+            side = TradeType.BUY if i % 2 == 0 else TradeType.SELL
+            side_multiplier = 1 if side == TradeType.BUY else -1
+            first_price = self.df["close"].iloc[start] * (1 - side_multiplier * 0.001)
+            step = float(self.random.choice([0.003, 0.006]))
+            configs.append(DCAExecutorConfig(
+                id=f"dca_{i}",
+                timestamp=self.df["timestamp"].iloc[start],
+                connector_name="binance",
+                trading_pair="BTC-USDT",
+                side=side,
+                prices=[Decimal(str(first_price * (1 - side_multiplier * step * level))) for level in range(3)],
+                amounts_quote=[Decimal("10"), Decimal("20"), Decimal("40")],
+                take_profit=Decimal(str(self.random.choice([0.003, 0.01]))),
+                stop_loss=Decimal(str(self.random.choice([0.005, 0.02]))),
+                trailing_stop=TrailingStop(activation_price=Decimal("0.004"), trailing_delta=Decimal("0.002"))
+                if i % 3 == 0 else None,
+                time_limit=int(self.random.choice([1800, 36000])),
+            ))
+
+        batch_simulation = DCAExecutorBatchSimulator().simulate(self.df, configs, self.TRADE_COST)
+
+        simulator = DCAExecutorSimulator()
+        for i, config in enumerate(configs):
+            start = self.df.index[self.df["timestamp"] == config.timestamp][0]
+            expected = simulator.simulate(self.df.loc[start:], config, self.TRADE_COST)
+            self.assert_same_simulation(expected, batch_simulation, i)
+
+    def test_first_index_finds_the_first_crossing_in_each_range(self):
+        prices = PriceArrays(self.df)
+        close = self.df["close"].to_numpy()
+        starts = self.random.integers(0, 600, 200)
+        ends = np.minimum(starts + self.random.integers(0, 300, 200), 599)
+        thresholds = close[starts] * self.random.uniform(0.97, 1.03, 200)
+
+        for above in (True, False):
+            indices = prices.first_index("close", starts, ends, thresholds, above=above)
+            for start, end, threshold, index in zip(starts, ends, thresholds, indices):
+                window = close[start:end + 1]
+                hits = np.flatnonzero(window >= threshold if above else window <= threshold)
+                self.assertEqual(start + hits[0] if len(hits) > 0 else -1, index)
+
+    def test_summary_has_one_row_per_executor(self):
+        config = PositionExecutorConfig(
+            id="position", timestamp=self.df["timestamp"].iloc[0], trading_pair="BTC-USDT", connector_name="binance",
+            side=TradeType.BUY, entry_price=Decimal("1"), amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.01"), stop_loss=Decimal("0.01"),
+                                                      time_limit=None, trailing_stop=None))
+
+        summary = PositionExecutorBatchSimulator().simulate(self.df, [config], self.TRADE_COST).to_dataframe()
+
+        # The limit order is never filled
+        self.assertEqual(["position"], summary["id"].tolist())
+        self.assertEqual([0], summary["filled_levels"].tolist())
+        self.assertEqual([self.df["timestamp"].iloc[-1]], summary["close_timestamp"].tolist())
+        self.assertEqual([0], summary["net_pnl_quote"].tolist())
@@ -0,0 +1,132 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy_v2.backtesting.matching_engine import MatchingEngine
+from hummingbot.strategy_v2.backtesting.tick_data_provider import TickEvents
+
+
+class MatchingEngineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.owner = MagicMock()
+
+    @staticmethod
+    def events(rows) -> TickEvents:
+        return TickEvents.from_dataframe(pd.DataFrame(rows, columns=TickEvents.COLUMNS))
+
+    def book_events(self, timestamp: float = 1):
+        return [
+            (timestamp, "diff", "buy", 99, 5),
+            (timestamp, "diff", "buy", 98, 10),
+            (timestamp, "diff", "sell", 101, 4),
+            (timestamp, "diff", "sell", 102, 8),
+        ]
+
+    def fills(self):
+        return [(call.args[1], call.args[2], call.args[3]) for call in self.owner.process_fill.call_args_list]
+
+    def test_order_book_is_built_from_the_diffs(self):
+        engine = MatchingEngine(self.events(self.book_events() + [
+            (2, "diff", "buy", 99, 0),
+            (3, "diff", "sell", 100.5, 1),
+        ]))
+        listener = MagicMock()
+        engine.top_of_book_listener = listener
+
+        self.assertEqual(4, engine.advance_to(1))
+        self.assertEqual((99, 101, 100), (engine.best_bid, engine.best_ask, engine.mid_price))
+        engine.advance_to(3)
+
+        self.assertEqual((98, 100.5), (engine.best_bid, engine.best_ask))
+        self.assertEqual({98: 10}, engine.bids)
+        self.assertEqual(4, listener.call_count)
+        self.assertTrue(engine.is_finished)
+
+    def test_resting_order_is_filled_after_the_queue_ahead(self):
+        engine = MatchingEngine(self.events(self.book_events() + [
+            (2, "trade", "sell", 99, 3),
+            # Cancellations are assumed to be ahead of the order
+            (3, "diff", "buy", 99, 1),
+            (4, "trade", "sell", 99, 1.5),
+            (5, "trade", "sell", 99, 2),
+        ]))
+        engine.advance_to(1)
+        order = engine.place_limit_order(True, 99, 1, self.owner)
+        self.assertEqual(5, order.queue_ahead)
+
+        engine.advance_to(2)
+        self.assertEqual(2, order.queue_ahead)
+        engine.advance_to(3)
+        self.assertEqual(1, order.queue_ahead)
+        engine.advance_to(4)
+
+        self.assertEqual([(0.5, 99, False)], self.fills())
+        self.assertTrue(order.is_open)
+        engine.advance_to(5)
+        self.assertEqual([(0.5, 99, False), (0.5, 99, False)], self.fills())
+        self.assertFalse(order.is_open)
+
+    def test_orders_are_filled_when_the_market_trades_or_quotes_through_them(self):
+        engine = MatchingEngine(self.events(self.book_events() + [
+            (2, "trade", "buy", 102, 1),
+            (3, "diff", "buy", 98.5, 3),
+        ]))
+        engine.advance_to(1)
+        sell_order = engine.place_limit_order(False, 101.5, 2, self.owner)
+        buy_order = engine.place_limit_order(True, 98.5, 1, self.owner)
+
+        engine.advance_to(2)
+        self.assertEqual([(2, 101.5, False)], self.fills())
+        self.assertFalse(sell_order.is_open)
+        engine.advance_to(3)
+        # A new bid at the same price doesn't fill the order, it is behind it in the queue
+        self.assertTrue(buy_order.is_open)
+        self.assertEqual(0, buy_order.queue_ahead)
+
+    def test_crossing_orders_are_filled_as_taker(self):
+        engine = MatchingEngine(self.events(self.book_events()))
+        engine.advance_to(1)
+
+        limit_order = engine.place_limit_order(True, 101.5, 6, self.owner)
+        market_order = engine.place_market_order(False, 12, self.owner)
+
+        self.assertEqual([(4, 101, True), (12, (5 * 99 + 7 * 98) / 12, True)], self.fills())
+        self.assertTrue(limit_order.is_open)
+        self.assertEqual(2, limit_order.remaining_amount)
+        self.assertFalse(market_order.is_open)
+
+    def test_cancelled_orders_are_not_filled(self):
+        engine = MatchingEngine(self.events(self.book_events() + [(2, "trade", "sell", 90, 100)]))
+        engine.advance_to(1)
+        order = engine.place_limit_order(True, 99, 1, self.owner)
+        engine.cancel_order(order)
+
+        engine.advance_to(2)
+
+        self.owner.process_fill.assert_not_called()
+
+    def test_events_throughput(self):
+        n_events = 200000
+        random = np.random.default_rng(1)
+        is_trade = random.random(n_events) < 0.2
+        is_buy = random.random(n_events) < 0.5
+        prices = 100 + np.round(random.normal(0, 0.2, n_events), 2) + np.where(is_buy, -0.5, 0.5)
+        amounts = np.where(random.random(n_events) < 0.3, 0, random.uniform(0.1, 5, n_events))
+        amounts[is_trade] += 0.1
+        events = TickEvents(np.arange(n_events) / 100, is_trade, is_buy, prices, amounts)
+        engine = MatchingEngine(events)
+        engine.top_of_book_listener = lambda: None
+        engine.advance_to(1)
+        engine.place_limit_order(True, 99.5, 1, self.owner)
+        engine.place_limit_order(False, 100.5, 1, self.owner)
+
+        start = time.perf_counter()
+        engine.advance_to(n_events)
+        elapsed = time.perf_counter() - start
+
+        # At least 1M events per minute
+        self.assertLess(elapsed, n_events / 1e6 * 60)
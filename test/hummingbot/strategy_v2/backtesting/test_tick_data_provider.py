@@ -0,0 +1,107 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.controllers_backtesting.market_making_backtesting import MarketMakingBacktesting
+from hummingbot.strategy_v2.backtesting.tick_data_provider import TickBacktestingDataProvider, TickEvents
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TickBacktestingDataProviderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.events_file = os.path.join(self.temp_dir.name, "binance_BTC-USDT.csv")
+        pd.DataFrame([
+            (990, "diff", "buy", 99, 5),
+            (990, "diff", "sell", 101, 5),
+            (995, "trade", "buy", 101, 1),
+            (1010, "trade", "buy", 101, 1),
+            (1030, "trade", "sell", 99, 2),
+            (1080, "diff", "sell", 101, 0),
+            (1080, "diff", "sell", 103, 5),
+            (1100, "trade", "buy", 102, 0.5),
+            (1160, "trade", "sell", 100, 3),
+            (1200, "diff", "buy", 102, 3),
+            (1230, "trade", "buy", 104, 1),
+        ], columns=TickEvents.COLUMNS).to_csv(self.events_file, index=False)
+        with patch.object(AllConnectorSettings, "get_connector_settings", return_value={}):
+            self.provider = TickBacktestingDataProvider(connectors={},
+                                                        events_files={"binance_BTC-USDT": self.events_file})
+        self.provider.update_backtesting_time(1000, 1250)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_events_before_the_start_time_only_include_the_order_book(self):
+        events = self.provider.get_tick_events("binance", "BTC-USDT")
+
+        self.assertEqual([990, 990, 1010], events.timestamps[:3].tolist())
+        self.assertIsNone(self.provider.get_tick_events("binance", "ETH-USDT"))
+
+    def test_candles_are_built_from_the_trades(self):
+        candles = self.async_run_with_timeout(self.provider.get_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m")))
+
+        self.assertEqual([960, 1020, 1080, 1140, 1200], candles["timestamp"].tolist())
+        self.assertEqual([101, 99, 102, 100, 104], candles["close"].tolist())
+        self.assertEqual([1, 2, 0.5, 3, 1], candles["volume"].tolist())
+        self.assertEqual([1, 0, 0.5, 0, 1], candles["taker_buy_base_volume"].tolist())
+        self.assertEqual([1020, 1080, 1140, 1200],
+                         self.provider.get_candles_df("binance", "BTC-USDT", "1m")["timestamp"].tolist())
+
+    def test_data_source_changes_with_the_events_files(self):
+        data_source = self.provider.get_data_source()
+        self.assertTrue(data_source.startswith("TickBacktestingDataProvider("))
+        self.assertIn(self.events_file, data_source)
+
+        with open(self.events_file, "a") as file:
+            file.write("1240,trade,sell,103,1\n")
+
+        self.assertNotEqual(data_source, self.provider.get_data_source())
+
+    def test_market_making_backtesting_with_tick_events(self):
+        backtesting = MarketMakingBacktesting(backtesting_data_provider=self.provider)
+        backtesting.backtesting_resolution = "1m"
+        self.async_run_with_timeout(self.provider.get_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m")))
+        controller = MagicMock()
+        controller.config.connector_name = "binance"
+        controller.config.trading_pair = "BTC-USDT"
+        controller.market_data_provider = self.provider
+        controller.processed_data = {}
+        executor_config = PositionExecutorConfig(
+            id="position", timestamp=1080, trading_pair="BTC-USDT", connector_name="binance", side=TradeType.BUY,
+            entry_price=Decimal("100"), amount=Decimal("2"),
+            triple_barrier_config=TripleBarrierConfig(stop_loss=None, take_profit=Decimal("0.02"), time_limit=None,
+                                                      trailing_stop=None, take_profit_order_type=OrderType.LIMIT))
+        controller.determine_executor_actions.side_effect = [[], [CreateExecutorAction(executor_config=executor_config)],
+                                                             [], [], []]
+        backtesting.controller = controller
+
+        executors_info = self.async_run_with_timeout(backtesting.simulate_execution(trade_cost=0.0))
+
+        # The buy order at 100 is filled by the sell trade at 1160, and the take profit by the bid at 102 at 1200
+        self.assertEqual(1, len(executors_info))
+        self.assertEqual(CloseType.TAKE_PROFIT, executors_info[0].close_type)
+        self.assertEqual(1200, executors_info[0].close_timestamp)
+        self.assertAlmostEqual(4, float(executors_info[0].net_pnl_quote))
+        # The mid price of the order book is used as the price
+        self.assertEqual(Decimal("102.5"), self.provider.get_price_by_type("binance", "BTC-USDT", None))
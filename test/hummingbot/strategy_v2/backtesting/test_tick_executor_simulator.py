@@ -0,0 +1,141 @@
+import unittest
+from decimal import Decimal
+
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.executors_simulator.tick_executor_simulator import TickExecutorSimulator
+from hummingbot.strategy_v2.backtesting.matching_engine import MatchingEngine
+from hummingbot.strategy_v2.backtesting.tick_data_provider import TickEvents
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TickExecutorSimulatorTest(unittest.TestCase):
+    TRADE_COST = 0.001
+
+    def simulator(self, rows) -> TickExecutorSimulator:
+        book = [(1, "diff", "buy", 99, 5), (1, "diff", "sell", 101, 5)]
+        engine = MatchingEngine(TickEvents.from_dataframe(pd.DataFrame(book + rows, columns=TickEvents.COLUMNS)))
+        engine.advance_to(1)
+        return TickExecutorSimulator(engine, self.TRADE_COST)
+
+    @staticmethod
+    def position_config(**barriers) -> PositionExecutorConfig:
+        return PositionExecutorConfig(
+            id="position", timestamp=1, trading_pair="BTC-USDT", connector_name="binance", side=TradeType.BUY,
+            entry_price=Decimal("100"), amount=Decimal("2"),
+            triple_barrier_config=TripleBarrierConfig(**{"stop_loss": None, "take_profit": None, "time_limit": None,
+                                                         "trailing_stop": None, **barriers}))
+
+    def test_position_is_opened_and_closed_by_the_take_profit_limit_order(self):
+        simulator = self.simulator([
+            (2, "diff", "buy", 100, 1),
+            (3, "trade", "sell", 100, 3),
+            (4, "trade", "buy", 102, 2),
+        ])
+        simulation = simulator.create_executor(self.position_config(
+            take_profit=Decimal("0.01"), take_profit_order_type=OrderType.LIMIT))
+
+        simulator.engine.advance_to(3)
+        self.assertEqual(2, simulation.open_filled_amount)
+        self.assertTrue(simulation.is_active)
+        simulator.engine.advance_to(4)
+
+        info = simulator.executors_info()[0]
+        self.assertEqual(CloseType.TAKE_PROFIT, info.close_type)
+        self.assertEqual(RunnableStatus.TERMINATED, info.status)
+        self.assertEqual(4, info.close_timestamp)
+        # 2 * 1 of profit, minus the fees of 200 and 202 of volume
+        self.assertAlmostEqual(2 - 0.402, float(info.net_pnl_quote))
+        self.assertAlmostEqual(402, float(info.filled_amount_quote))
+
+    def test_stop_loss_closes_at_the_best_bid(self):
+        simulator = self.simulator([
+            (2, "trade", "sell", 99.5, 2),
+            (3, "diff", "buy", 99, 0),
+            (3, "diff", "buy", 97, 5),
+        ])
+        config = self.position_config(stop_loss=Decimal("0.02"))
+        config.entry_price = Decimal("99.5")
+        simulation = simulator.create_executor(config)
+
+        simulator.engine.advance_to(3)
+
+        self.assertEqual(CloseType.STOP_LOSS, simulation.close_type)
+        self.assertEqual(97, simulation.close_price)
+        self.assertAlmostEqual((97 - 99.5) * 2 - (99.5 + 97) * 2 * self.TRADE_COST, simulation.net_pnl_quote)
+
+    def test_time_limit_and_early_stop(self):
+        simulator = self.simulator([])
+        expiring = simulator.create_executor(self.position_config(time_limit=10))
+        config = self.position_config(trailing_stop=TrailingStop(activation_price=Decimal("0.01"),
+                                                                 trailing_delta=Decimal("0.005")))
+        config.id = "stopped"
+        stopped = simulator.create_executor(config)
+
+        simulator.control_time_limits(11)
+        simulator.stop_executor("stopped")
+
+        self.assertEqual(CloseType.TIME_LIMIT, expiring.close_type)
+        self.assertEqual(CloseType.EARLY_STOP, stopped.close_type)
+        # The open orders were not filled
+        self.assertEqual([0, 0], [float(info.filled_amount_quote) for info in simulator.executors_info()])
+
+    def test_time_limit_closes_at_its_expiration_between_the_events(self):
+        simulator = self.simulator([
+            (2, "trade", "sell", 100, 3),
+            (5, "diff", "buy", 99, 0),
+            (5, "diff", "buy", 90, 5),
+        ])
+        simulation = simulator.create_executor(self.position_config(time_limit=3))
+
+        simulator.advance_to(10)
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(4, simulation.close_timestamp)
+        # The position was closed at the best bid before it dropped
+        self.assertEqual(99, simulation.close_price)
+        self.assertEqual(10, simulator.engine.timestamp)
+
+    def test_taker_dca_executors_are_skipped(self):
+        simulator = self.simulator([(2, "trade", "sell", 98, 1)])
+
+        with self.assertLogs(
+                "hummingbot.strategy_v2.backtesting.executors_simulator.tick_executor_simulator", level="WARNING"):
+            simulation = simulator.create_executor(DCAExecutorConfig(
+                id="dca", timestamp=1, connector_name="binance", trading_pair="BTC-USDT", side=TradeType.BUY,
+                prices=[Decimal("98"), Decimal("97")], amounts_quote=[Decimal("98"), Decimal("97")],
+                mode=DCAMode.TAKER))
+
+        self.assertIsNone(simulation)
+        self.assertEqual({}, simulator.simulations)
+        self.assertEqual([], simulator.executors_info())
+
+    def test_dca_levels_are_filled_and_closed_by_the_take_profit(self):
+        simulator = self.simulator([
+            (2, "trade", "sell", 98, 1),
+            (3, "trade", "sell", 96, 1),
+            (4, "diff", "buy", 99.5, 5),
+        ])
+        simulation = simulator.create_executor(DCAExecutorConfig(
+            id="dca", timestamp=1, connector_name="binance", trading_pair="BTC-USDT", side=TradeType.BUY,
+            prices=[Decimal("98"), Decimal("97"), Decimal("95")],
+            amounts_quote=[Decimal("98"), Decimal("194"), Decimal("380")],
+            take_profit=Decimal("0.02")))
+
+        simulator.engine.advance_to(3)
+        self.assertEqual(3, simulation.open_filled_amount)
+        self.assertTrue(simulation.is_active)
+        simulator.engine.advance_to(4)
+
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        # The last level was not filled, and the position was sold at the best bid
+        self.assertAlmostEqual(292 / 3, simulation.average_entry_price)
+        self.assertAlmostEqual(99.5, simulation.close_price)
@@ -3,8 +3,12 @@ from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCa
 from test.logger_mixin_for_test import LoggerMixinForTest
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
+import numpy as np
+
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.event.events import MarketOrderFailureEvent
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
@@ -26,6 +30,7 @@ class TestArbitrageExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.arbitrage_config.min_profitability = Decimal('0.01')
         self.arbitrage_config.order_amount = Decimal('1')
         self.arbitrage_config.max_retries = 3
+        self.arbitrage_config.order_book_update_min_interval = None
         self.update_interval = 0.5
         self.executor = ArbitrageExecutor(self.strategy, self.arbitrage_config, self.update_interval)
         self.set_loggers(loggers=[self.executor.logger()])
@@ -47,6 +52,25 @@ class TestArbitrageExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         }
         return strategy
 
+    @patch.object(ArbitrageExecutor, "is_amm_connector")
+    def test_order_book_updates_wake_up_executor(self, is_amm_connector_mock):
+        is_amm_connector_mock.side_effect = lambda exchange: exchange != "binance"
+        order_book = OrderBook()
+        self.strategy.connectors["binance"] = MagicMock(spec=ExchangeBase)
+        self.strategy.connectors["binance"].get_order_book.return_value = order_book
+        self.arbitrage_config.order_book_update_min_interval = 0.05
+        executor = ArbitrageExecutor(self.strategy, self.arbitrage_config, self.update_interval)
+
+        executor.on_start()
+        self.assertFalse(executor._wake_event.is_set())
+        order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 1]], dtype=np.float64), np.array([[101, 1, 1]], dtype=np.float64)
+        )
+        self.assertTrue(executor._wake_event.is_set())
+
+        executor.on_stop()
+        self.assertEqual([], executor._order_book_wake_trigger.watched_order_books)
+
     def test_is_arbitrage_valid(self):
         self.assertTrue(self.executor.is_arbitrage_valid('ETH-USDT', 'ETH-USDT'))
         self.assertTrue(self.executor.is_arbitrage_valid('ETH-BUSD', 'ETH-USDT'))
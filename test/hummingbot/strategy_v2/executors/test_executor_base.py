@@ -162,6 +162,40 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         executor_info = self.component.executor_info
         self.assertEqual(executor_info.id, "test")
 
+    @patch.object(ExecutorBase, "get_net_pnl_pct", return_value=Decimal("0.01"))
+    @patch.object(ExecutorBase, "get_net_pnl_quote", return_value=Decimal("1.0"))
+    @patch.object(ExecutorBase, "get_cum_fees_quote", return_value=Decimal("0.1"))
+    def test_executor_info_is_cached_until_the_state_changes(self, *_):
+        listener = MagicMock()
+        self.component.add_state_listener(listener)
+        self.strategy.current_timestamp = 1000
+
+        executor_info = self.component.executor_info
+        self.assertIs(executor_info, self.component.executor_info)
+
+        event = MarketOrderFailureEvent(timestamp=1000, order_id="OID-BUY-1", order_type=OrderType.LIMIT)
+        self.component._failed_order_forwarder(event)
+        listener.assert_called_once_with(self.component)
+        executor_info_after_event = self.component.executor_info
+        self.assertIsNot(executor_info, executor_info_after_event)
+
+        # The PnL of an open executor follows the market, so its info is built again on the next tick
+        self.strategy.current_timestamp = 1001
+        self.assertIsNot(executor_info_after_event, self.component.executor_info)
+
+    @patch.object(ExecutorBase, "get_net_pnl_pct", return_value=Decimal("0.01"))
+    @patch.object(ExecutorBase, "get_net_pnl_quote", return_value=Decimal("1.0"))
+    @patch.object(ExecutorBase, "get_cum_fees_quote", return_value=Decimal("0.1"))
+    async def test_executor_info_of_closed_executor_is_kept(self, *_):
+        self.strategy.current_timestamp = 1000
+        self.component.start()
+        self.component.stop()
+        executor_info = self.component.executor_info
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+
+        self.strategy.current_timestamp = 1001
+        self.assertIs(executor_info, self.component.executor_info)
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
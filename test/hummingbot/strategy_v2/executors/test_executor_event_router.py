@@ -0,0 +1,107 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
+
+
+class RecordingExecutor(ExecutorBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    def process_order_created_event(self, event_tag, market, event):
+        self.events.append(event)
+
+    def process_order_filled_event(self, event_tag, market, event):
+        self.events.append(event)
+
+
+class TestExecutorEventRouter(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.connector = PubSub()
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.connectors = {"connector1": self.connector}
+        self.router = ExecutorEventRouter()
+
+    def create_executor(self, executor_id: str) -> RecordingExecutor:
+        executor = RecordingExecutor(strategy=self.strategy, connectors=["connector1"],
+                                     config=ExecutorConfigBase(id=executor_id, type="test", timestamp=1234))
+        executor.set_event_router(self.router)
+        executor.register_events()
+        return executor
+
+    def place_buy_order(self, executor: ExecutorBase) -> str:
+        return executor.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                    side=TradeType.BUY, amount=Decimal("1"), price=Decimal("1000"))
+
+    def trigger_fill(self, order_id: str) -> OrderFilledEvent:
+        event = OrderFilledEvent(
+            timestamp=1234, order_id=order_id, trading_pair="ETH-USDT", trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT, price=Decimal("1000"), amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+        )
+        self.connector.trigger_event(MarketEvent.OrderFilled, event)
+        return event
+
+    def test_events_are_routed_only_to_the_executor_of_the_order(self):
+        executors = [self.create_executor(f"executor_{i}") for i in range(3)]
+        self.strategy.buy.side_effect = ["OID-1", "OID-2"]
+        self.place_buy_order(executors[0])
+        self.place_buy_order(executors[1])
+
+        event = self.trigger_fill("OID-2")
+        self.trigger_fill("OID-UNKNOWN")
+
+        self.assertEqual([], executors[0].events)
+        self.assertEqual([event], executors[1].events)
+        self.assertEqual([], executors[2].events)
+        # The router listens once to the connector for all the executors
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+    def test_events_triggered_while_placing_the_order_are_routed_to_the_placing_executor(self):
+        executor = self.create_executor("executor_1")
+        created_event = BuyOrderCreatedEvent(timestamp=1234, type=OrderType.LIMIT, trading_pair="ETH-USDT",
+                                             amount=Decimal("1"), price=Decimal("1000"), order_id="OID-1",
+                                             creation_timestamp=1234)
+
+        def buy(*args, **kwargs):
+            self.connector.trigger_event(MarketEvent.BuyOrderCreated, created_event)
+            return "OID-1"
+        self.strategy.buy.side_effect = buy
+        self.place_buy_order(executor)
+        fill_event = self.trigger_fill("OID-1")
+
+        self.assertEqual([created_event, fill_event], executor.events)
+
+    def test_removed_executors_do_not_receive_events(self):
+        executors = [self.create_executor(f"executor_{i}") for i in range(2)]
+        self.strategy.buy.side_effect = ["OID-1", "OID-2"]
+        self.place_buy_order(executors[0])
+        self.place_buy_order(executors[1])
+
+        executors[0].unregister_events()
+        self.trigger_fill("OID-1")
+        self.assertEqual([], executors[0].events)
+        self.assertEqual(1, self.router.num_orders)
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+        executors[1].unregister_events()
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+    def test_executor_without_router_listens_to_the_connector(self):
+        executor = RecordingExecutor(strategy=self.strategy, connectors=["connector1"],
+                                     config=ExecutorConfigBase(id="executor", type="test", timestamp=1234))
+        executor.register_events()
+
+        event = self.trigger_fill("OID-OTHER")
+
+        self.assertEqual([event], executor.events)
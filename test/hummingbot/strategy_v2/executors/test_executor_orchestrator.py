@@ -1,5 +1,7 @@
+import asyncio
 import unittest
 from decimal import Decimal
+from typing import Awaitable
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from hummingbot.connector.exchange_py_base import ExchangePyBase
@@ -13,6 +15,7 @@ from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
 from hummingbot.strategy_v2.executors.executor_orchestrator import ExecutorOrchestrator
+from hummingbot.strategy_v2.executors.executors_archive import ExecutorsArchive
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
@@ -28,11 +31,17 @@ class TestExecutorOrchestrator(unittest.TestCase):
     @patch.object(MarketsRecorder, "get_instance")
     def setUp(self, markets_recorder: MagicMock):
         markets_recorder.return_value = MagicMock(spec=MarketsRecorder)
-        markets_recorder.get_all_executors = MagicMock(return_value=[])
+        markets_recorder.return_value.get_executors_performance.return_value = {}
+        markets_recorder.return_value.check_executors_performance.return_value = False
         markets_recorder.store_or_update_executor = MagicMock(return_value=None)
         self.mock_strategy = self.create_mock_strategy()
         self.orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy)
 
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
     @staticmethod
     def create_mock_strategy():
         market = MagicMock()
@@ -78,6 +87,8 @@ class TestExecutorOrchestrator(unittest.TestCase):
         ]
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 4)
+        for executor in self.orchestrator.active_executors["test"]:
+            self.assertIs(self.orchestrator.event_router, executor._event_router)
 
     def test_execute_actions_store_executor_active(self):
         position_executor = MagicMock(spec=PositionExecutor)
@@ -102,11 +113,54 @@ class TestExecutorOrchestrator(unittest.TestCase):
         config_mock.controller_id = "test"
         position_executor.config = config_mock
         self.orchestrator.active_executors["test"] = [position_executor]
-        self.orchestrator.archived_executors["test"] = []
+        self.orchestrator.archived_executors["test"] = ExecutorsArchive("test")
         self.orchestrator.cached_performance["test"] = PerformanceReport()
         actions = [StoreExecutorAction(executor_id="test", controller_id="test")]
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 0)
+        self.assertEqual(1, len(self.orchestrator.get_archived_executors("test")))
+        self.assertEqual([], self.orchestrator.get_archived_executors("other"))
+
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_initialize_cached_performance_from_aggregates(self, markets_recorder_mock):
+        markets_recorder_mock.return_value = MagicMock(spec=MarketsRecorder)
+        markets_recorder_mock.return_value.get_executors_performance.return_value = {
+            "controller_1": PerformanceReport(realized_pnl_quote=Decimal(5), volume_traded=Decimal(100),
+                                              close_type_counts={CloseType.TAKE_PROFIT: 2}),
+        }
+
+        orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy)
+        orchestrator.stop()
+
+        report = orchestrator.generate_performance_report("controller_1")
+        self.assertEqual(Decimal(5), report.realized_pnl_quote)
+        self.assertEqual(Decimal(100), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2}, report.close_type_counts)
+        markets_recorder_mock.return_value.get_all_executors.assert_not_called()
+
+    def test_check_cached_performance_reloads_rebuilt_aggregates(self):
+        markets_recorder = MagicMock(spec=MarketsRecorder)
+        markets_recorder.check_executors_performance.return_value = True
+        markets_recorder.get_executors_performance.return_value = {
+            "controller_1": PerformanceReport(realized_pnl_quote=Decimal(5)),
+            "controller_2": PerformanceReport(realized_pnl_quote=Decimal(7)),
+        }
+        self.orchestrator.active_executors["controller_2"] = []
+        self.orchestrator.cached_performance["controller_2"] = PerformanceReport(realized_pnl_quote=Decimal(1))
+
+        self.async_run_with_timeout(self.orchestrator._check_cached_performance(markets_recorder))
+
+        self.assertEqual(Decimal(5), self.orchestrator.cached_performance["controller_1"].realized_pnl_quote)
+        # The performance of the controllers that already executed actions is only tracked in memory
+        self.assertEqual(Decimal(1), self.orchestrator.cached_performance["controller_2"].realized_pnl_quote)
+
+    def test_check_cached_performance_keeps_consistent_aggregates(self):
+        markets_recorder = MagicMock(spec=MarketsRecorder)
+        markets_recorder.check_executors_performance.return_value = False
+
+        self.async_run_with_timeout(self.orchestrator._check_cached_performance(markets_recorder))
+
+        markets_recorder.get_executors_performance.assert_not_called()
 
     @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
     def test_generate_performance_report(self, mock_get_instance):
@@ -154,6 +208,54 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(report.realized_pnl_quote, Decimal(10))
         self.assertEqual(report.unrealized_pnl_quote, Decimal(10))
 
+    def test_performance_report_is_updated_on_executor_state_changes(self):
+        self.mock_strategy.current_timestamp = 1000
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100), controller_id="test",
+        )
+
+        def executor_info(status: RunnableStatus, filled_amount_quote: Decimal, net_pnl_quote: Decimal):
+            return ExecutorInfo(
+                id="123", timestamp=1234, type="position_executor", status=status, config=config,
+                filled_amount_quote=filled_amount_quote, net_pnl_quote=net_pnl_quote, net_pnl_pct=Decimal(0),
+                cum_fees_quote=Decimal(0), is_trading=filled_amount_quote > 0,
+                is_active=status == RunnableStatus.RUNNING, custom_info={"side": TradeType.BUY},
+            )
+
+        executor = MagicMock(spec=PositionExecutor)
+        executor.config = config
+        executor_info_mock = PropertyMock(return_value=executor_info(RunnableStatus.RUNNING, Decimal(0), Decimal(0)))
+        type(executor).executor_info = executor_info_mock
+        self.orchestrator.active_executors["test"] = [executor]
+        self.orchestrator._on_executor_state_change(executor)
+
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.mock_strategy.current_timestamp = 1001
+        self.orchestrator.generate_global_performance_report()
+        self.assertEqual(Decimal(1000), report.open_order_volume)
+        # The executor without filled orders is not read again until its state changes
+        self.assertEqual(1, executor_info_mock.call_count)
+
+        executor_info_mock.return_value = executor_info(RunnableStatus.RUNNING, Decimal(100), Decimal(10))
+        self.orchestrator._on_executor_state_change(executor)
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(10), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(100), report.volume_traded)
+        self.assertEqual(Decimal(100), report.inventory_imbalance)
+        self.assertEqual(Decimal(900), report.open_order_volume)
+
+        # The executor stopped without an order event, its PnL is now realized
+        executor_info_mock.return_value = executor_info(RunnableStatus.SHUTTING_DOWN, Decimal(100), Decimal(12))
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(0), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(12), report.realized_pnl_quote)
+        self.assertEqual(Decimal(100), report.volume_traded)
+
+        executors_report = self.orchestrator.get_executors_report()
+        executors_report["test"].clear()
+        self.assertEqual(1, len(self.orchestrator.get_executors_report()["test"]))
+
     @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
     def test_generate_global_performance_report(self, mock_get_instance):
         # Mock MarketsRecorder and its get_executors_by_controller method
@@ -0,0 +1,64 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.executors.executors_archive import ExecutorsArchive
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, ExecutorSummary
+
+
+class ExecutorsArchiveTest(unittest.TestCase):
+    @staticmethod
+    def get_executor_info(executor_id: str, close_timestamp: float) -> ExecutorInfo:
+        config = PositionExecutorConfig(id=executor_id, timestamp=close_timestamp - 10, trading_pair="ETH-USDT",
+                                        connector_name="binance", side=TradeType.SELL, entry_price=Decimal("100"),
+                                        amount=Decimal("1"), triple_barrier_config=TripleBarrierConfig())
+        return ExecutorInfo(id=executor_id, timestamp=config.timestamp, type="position_executor",
+                            close_timestamp=close_timestamp, close_type=CloseType.TAKE_PROFIT,
+                            status=RunnableStatus.TERMINATED, config=config, net_pnl_pct=Decimal("0.01"),
+                            net_pnl_quote=Decimal("1"), cum_fees_quote=Decimal("0.1"),
+                            filled_amount_quote=Decimal("200"), is_active=False, is_trading=False,
+                            custom_info={"side": TradeType.SELL}, controller_id="controller")
+
+    def test_summary_from_executor_info(self):
+        summary = ExecutorSummary.from_executor_info(self.get_executor_info("executor", 100))
+
+        self.assertEqual("executor", summary.id)
+        self.assertEqual("controller", summary.controller_id)
+        self.assertEqual(CloseType.TAKE_PROFIT, summary.close_type)
+        self.assertEqual(("binance", "ETH-USDT"), (summary.connector_name, summary.trading_pair))
+        self.assertEqual(TradeType.SELL, summary.side)
+        self.assertEqual(200.0, summary.filled_amount_quote)
+        self.assertEqual(1.0, summary.to_dict()["net_pnl_quote"])
+        self.assertFalse(hasattr(summary, "__dict__"))
+
+    def test_retention_is_bounded(self):
+        archive = ExecutorsArchive("controller", max_retained=3)
+        for i in range(5):
+            archive.append(self.get_executor_info(f"executor_{i}", 100 + i))
+
+        self.assertEqual(3, len(archive))
+        self.assertEqual(5, archive.total_archived)
+        self.assertEqual(2, archive.evicted)
+        self.assertEqual(["executor_2", "executor_3", "executor_4"], [summary.id for summary in archive])
+        self.assertEqual(["executor_4"], [summary.id for summary in archive.get_summaries(since=103)])
+        memory_usage = archive.memory_usage()
+        self.assertGreater(memory_usage, 0)
+
+        archive.append(self.get_executor_info("executor_5", 105))
+        self.assertAlmostEqual(memory_usage, archive.memory_usage(), delta=memory_usage * 0.1)
+
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_load_executors_info_from_the_database(self, markets_recorder_mock):
+        executor_info = self.get_executor_info("executor", 100)
+        markets_recorder_mock.return_value = MagicMock(spec=MarketsRecorder)
+        markets_recorder_mock.return_value.get_executors_by_controller.return_value = [executor_info]
+
+        archive = ExecutorsArchive("controller")
+
+        self.assertEqual([executor_info], archive.load_executors_info())
+        markets_recorder_mock.return_value.get_executors_by_controller.assert_called_once_with("controller")
@@ -25,3 +25,41 @@ class TestRunnableBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.start()
         await asyncio.sleep(0.05)
         self.is_logged("Test", "error")
+
+    async def test_wake_runs_control_task_before_update_interval(self):
+        executions = []
+
+        async def control_task():
+            executions.append(asyncio.get_running_loop().time())
+
+        component = RunnableBase(update_interval=10)
+        component.control_task = control_task
+        component.enable_event_driven_updates(min_wake_interval=0.05)
+        component.start()
+        await asyncio.sleep(0.01)
+        self.assertEqual(1, len(executions))
+
+        for _ in range(5):
+            component.wake()
+        await asyncio.sleep(0.1)
+        component.stop()
+
+        # The wake up requests are coalesced in a single execution, after the minimum interval
+        self.assertEqual(2, len(executions))
+        self.assertGreaterEqual(executions[1] - executions[0], 0.05)
+
+    async def test_wake_ignored_without_event_driven_updates(self):
+        executions = []
+
+        async def control_task():
+            executions.append(asyncio.get_running_loop().time())
+
+        component = RunnableBase(update_interval=10)
+        component.control_task = control_task
+        component.start()
+        await asyncio.sleep(0.01)
+        component.wake()
+        await asyncio.sleep(0.05)
+        component.stop()
+
+        self.assertEqual(1, len(executions))
@@ -0,0 +1,71 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from hummingbot.strategy_v2.utils.controllers_config_watcher import ControllersConfigWatcher
+
+
+class TestControllersConfigWatcher(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        conf_dir_patcher = patch("hummingbot.client.settings.CONTROLLERS_CONF_DIR_PATH", self.temp_dir.name)
+        conf_dir_patcher.start()
+        self.addCleanup(conf_dir_patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.config = MagicMock()
+        self.config.controllers_config = ["controller_1.yml", "controller_2.yml"]
+        self.config.parse_controller_config.side_effect = lambda config_data, config_path: config_data
+        self.write_config("controller_1.yml", "id: controller_1\nvalue: 1\n")
+        self.write_config("controller_2.yml", "id: controller_2\nvalue: 2\n")
+        self.watcher = ControllersConfigWatcher(self.config)
+
+    def write_config(self, config_path: str, content: str, mtime_ns: int = None):
+        full_path = os.path.join(self.temp_dir.name, config_path)
+        with open(full_path, "w") as file:
+            file.write(content)
+        if mtime_ns is not None:
+            os.utime(full_path, ns=(mtime_ns, mtime_ns))
+
+    def test_first_check_loads_all_the_configs(self):
+        configs = self.watcher.load_changed_configs()
+
+        self.assertEqual([{"id": "controller_1", "value": 1}, {"id": "controller_2", "value": 2}], configs)
+
+    def test_unchanged_files_are_not_parsed_again(self):
+        self.watcher.load_changed_configs()
+        self.config.parse_controller_config.reset_mock()
+
+        self.assertEqual([], self.watcher.load_changed_configs())
+        # A new modification time with the same content is not parsed either
+        self.write_config("controller_1.yml", "id: controller_1\nvalue: 1\n", mtime_ns=10 ** 18)
+        self.assertEqual([], self.watcher.load_changed_configs())
+        self.config.parse_controller_config.assert_not_called()
+
+    def test_only_the_changed_files_are_loaded(self):
+        self.watcher.load_changed_configs()
+
+        self.write_config("controller_2.yml", "id: controller_2\nvalue: 20\n", mtime_ns=10 ** 18)
+
+        self.assertEqual([{"id": "controller_2", "value": 20}], self.watcher.load_changed_configs())
+
+    def test_invalid_files_are_skipped_until_they_change(self):
+        self.watcher.load_changed_configs()
+        self.config.parse_controller_config.reset_mock()
+        self.config.parse_controller_config.side_effect = ValueError("Invalid config")
+        self.write_config("controller_1.yml", "id: controller_1\nvalue: 10\n", mtime_ns=10 ** 18)
+
+        with self.assertLogs(ControllersConfigWatcher.logger().name, level="ERROR"):
+            self.assertEqual([], self.watcher.load_changed_configs())
+        self.assertEqual(1, self.config.parse_controller_config.call_count)
+
+        self.assertEqual([], self.watcher.load_changed_configs())
+        self.assertEqual(1, self.config.parse_controller_config.call_count)
+
+    def test_errors_are_raised_when_requested(self):
+        self.config.controllers_config.append("missing.yml")
+
+        with self.assertRaises(FileNotFoundError):
+            self.watcher.load_changed_configs(raise_errors=True)